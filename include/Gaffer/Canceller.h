@@ -0,0 +1,110 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFER_CANCELLER_H
+#define GAFFER_CANCELLER_H
+
+#include "boost/noncopyable.hpp"
+
+#include "tbb/atomic.h"
+
+#include "IECore/Exception.h"
+
+namespace Gaffer
+{
+
+/// Exception thrown by Canceller::check() to abandon a computation
+/// which has been cancelled.
+class Cancelled : public IECore::Exception
+{
+
+	public :
+
+		Cancelled()
+			:	IECore::Exception( "Cancelled" )
+		{
+		}
+
+};
+
+/// Used to request the cancellation of computations which are no
+/// longer needed, for instance because the user has moved on to a
+/// different frame in the UI. A Canceller is passed to computations
+/// via the Context (see Context::canceller()), and cancellation is
+/// cooperative : ValuePlug checks for it before each hash and compute,
+/// and long running loops should call check() periodically.
+///
+/// \threading cancel() may be called from any thread while
+/// computations are being performed on others.
+class Canceller : boost::noncopyable
+{
+
+	public :
+
+		Canceller()
+		{
+			m_cancelled = false;
+		}
+
+		void cancel()
+		{
+			m_cancelled = true;
+		}
+
+		bool cancelled() const
+		{
+			return m_cancelled;
+		}
+
+		/// Throws Cancelled if canceller is non-null and has
+		/// been cancelled.
+		static void check( const Canceller *canceller )
+		{
+			if( canceller && canceller->cancelled() )
+			{
+				throw Cancelled();
+			}
+		}
+
+	private :
+
+		tbb::atomic<bool> m_cancelled;
+
+};
+
+} // namespace Gaffer
+
+#endif // GAFFER_CANCELLER_H
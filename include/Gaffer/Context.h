@@ -44,6 +44,8 @@
 #include "IECore/Data.h"
 #include "IECore/MurmurHash.h"
 
+#include "Gaffer/Canceller.h"
+
 namespace Gaffer
 {
 
@@ -105,6 +107,12 @@ class Context : public IECore::RefCounted
 		/// context is const and outlives the temporary context, the constraints
 		/// required of client code are met with little effort.
 		Context( const Context &other, Ownership ownership = Copied );
+		/// Copy constructor for creating a cancellable context. Values are
+		/// copied from other, and the canceller is referenced so that
+		/// computations performed in the new context may be cancelled by
+		/// calling canceller.cancel(). The canceller must remain alive for
+		/// as long as the context is in use.
+		Context( const Context &other, const Canceller &canceller );
 		~Context();
 
 		IE_CORE_DECLAREMEMBERPTR( Context )
@@ -147,6 +155,13 @@ class Context : public IECore::RefCounted
 		/// A signal emitted when an element of the context is changed.
 		ChangedSignal &changedSignal();
 
+		/// Returns the canceller for computations performed in this
+		/// context, or NULL if they are not cancellable. The canceller
+		/// is inherited by copies of the context, so it is available to
+		/// all the upstream computations, and it is not considered by
+		/// hash() or the comparison operators.
+		const Canceller *canceller() const;
+
 		IECore::MurmurHash hash() const;
 
 		bool operator == ( const Context &other ) const;
@@ -183,6 +198,10 @@ class Context : public IECore::RefCounted
 
 	private :
 
+		// Adjusts the entries of a freshly copied m_map
+		// to reflect the requested ownership.
+		void copyStorage( Ownership ownership );
+
 		void substituteInternal( const char *s, std::string &result, const int recursionDepth ) const;
 
 		// Storage for each entry.
@@ -201,6 +220,7 @@ class Context : public IECore::RefCounted
 
 		Map m_map;
 		ChangedSignal *m_changedSignal;
+		const Canceller *m_canceller;
 		mutable IECore::MurmurHash m_hash;
 		mutable bool m_hashValid;
 
@@ -38,6 +38,9 @@
 #ifndef GAFFER_DEPENDENCYNODE_H
 #define GAFFER_DEPENDENCYNODE_H
 
+#include "boost/noncopyable.hpp"
+#include "boost/unordered_map.hpp"
+
 #include "Gaffer/Node.h"
 
 namespace Gaffer
@@ -66,6 +69,12 @@ class DependencyNode : public Node
 		/// for input or to place one in outputs as computations are always performed on the
 		/// leaf level plugs only. Implementations of this method should call the base class
 		/// implementation first.
+		///
+		/// \note The results of affects() are cached for use in dirty propagation.
+		/// The cache is invalidated whenever a plug on the node is set, and whenever
+		/// any connection or plug hierarchy changes anywhere, so implementations
+		/// may depend on the plugs connected upstream of the node. They must not
+		/// depend on any other state.
 		virtual void affects( const Plug *input, AffectedPlugsContainer &outputs ) const = 0;
 
 		/// @name Enable/Disable Behaviour
@@ -89,8 +98,47 @@ class DependencyNode : public Node
 
 		friend class Plug;
 		friend class ValuePlug;
+		friend class DirtyPropagationScope;
+
+		class DirtyPlugs;
 
 		static void propagateDirtiness( Plug *plugToDirty );
+		static DirtyPlugs &dirtyPlugs();
+
+		// Returns the result of affects( input ), computing it only if it is
+		// not already held in m_affectsCache.
+		const AffectedPlugsContainer &cachedAffects( const Plug *input ) const;
+		void invalidateAffectsCache();
+		void plugChanged( Plug *plug );
+		// Invalidates the caches of all nodes. Called by Plug whenever a connection
+		// or the plug hierarchy changes, because implementations of affects() may
+		// depend on the sources of their input plugs, and a change to the source
+		// may be made on another node entirely (upstream of a Dot or a Box for
+		// instance).
+		static void invalidateAllAffectsCaches();
+
+		typedef boost::unordered_map<const Plug *, AffectedPlugsContainer> AffectsCache;
+		mutable AffectsCache m_affectsCache;
+		// The value of the global generation count when
+		// m_affectsCache was last valid.
+		mutable size_t m_affectsCacheGeneration;
+
+};
+
+/// Dirty propagation is normally performed immediately following every
+/// plug edit. When many edits are made in quick succession, a
+/// DirtyPropagationScope may be used to defer propagation until the
+/// scope closes, so that all the edits are propagated in a single pass
+/// and plugDirtiedSignal() is emitted only once for each affected plug.
+/// Scopes may be nested, in which case propagation is deferred until the
+/// outermost scope closes.
+class DirtyPropagationScope : boost::noncopyable
+{
+
+	public :
+
+		DirtyPropagationScope();
+		~DirtyPropagationScope();
 
 };
 
@@ -68,8 +68,18 @@ class FileSystemPath : public Path
 
 		virtual void doChildren( std::vector<PathPtr> &children ) const;
 
+	private :
+
+		// Cached listing of the directory containing this path, set
+		// when the path is created by doChildren(). Used to answer
+		// queries without touching the filesystem again.
+		IE_CORE_FORWARDDECLARE( DirectoryListing )
+		ConstDirectoryListingPtr m_parentListing;
+
 };
 
+IE_CORE_DECLAREPTR( FileSystemPath )
+
 } // namespace Gaffer
 
 #endif // GAFFER_FILESYSTEMPATH_H
@@ -0,0 +1,167 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2012, John Haddon. All rights reserved.
+//  Copyright (c) 2013, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFER_PATHMATCHER_H
+#define GAFFER_PATHMATCHER_H
+
+#include "boost/intrusive_ptr.hpp"
+
+#include <string>
+#include <vector>
+
+#include "IECore/InternedString.h"
+
+namespace Gaffer
+{
+
+/// The PathMatcher class provides an acceleration structure for matching
+/// paths against a sequence of reference paths. It provides the internal
+/// implementation for GafferScene's PathFilter, and is also used to represent
+/// sets of paths such as selections and expansions in the UI.
+class PathMatcher
+{
+
+	public :
+
+		/// Values returned by match(). These are identical
+		/// to the values of GafferScene::Filter::Result.
+		enum Result
+		{
+			NoMatch = 0,
+			DescendantMatch = 1,
+			ExactMatch = 2,
+			AncestorMatch = 4,
+			EveryMatch = DescendantMatch | ExactMatch | AncestorMatch
+		};
+
+		PathMatcher();
+		/// Constructs a copy of other. This is a cheap operation, because
+		/// the internal tree is shared between the two matchers, and is
+		/// copied lazily only when one of them is modified. Even then, only
+		/// the branches leading to the modified paths are copied, and the
+		/// remainder of the tree continues to be shared. From the outside,
+		/// the copy behaves exactly as if it were a deep copy.
+		PathMatcher( const PathMatcher &other );
+		~PathMatcher();
+
+		PathMatcher &operator = ( const PathMatcher &other );
+
+		template<typename Iterator>
+		PathMatcher( Iterator pathsBegin, Iterator pathsEnd );
+
+		/// \todo Should this keep the existing tree in place,
+		/// but just remove the terminator flags on any items
+		/// not present in the new paths? This might give
+		/// better performance for selections and expansions
+		/// which will tend to be adding and removing the same
+		/// paths repeatedly.
+		template<typename Iterator>
+		void init( Iterator pathsBegin, Iterator pathsEnd );
+
+		/// Returns true if the path was added, false if
+		/// it was already there.
+		bool addPath( const std::string &path );
+		bool addPath( const std::vector<IECore::InternedString> &path );
+		/// Returns true if the path was removed, false if
+		/// it was not there.
+		bool removePath( const std::string &path );
+		bool removePath( const std::vector<IECore::InternedString> &path );
+
+		/// Adds all paths from the other PathMatcher, returning true if
+		/// any were added, and false if they were all already present.
+		bool addPaths( const PathMatcher &paths );
+		/// Removes all specified paths, returning true if any paths
+		/// were removed, and false if none existed anyway.
+		bool removePaths( const PathMatcher &paths );
+
+		/// Removes the specified path and all descendant paths.
+		/// Returns true if something was removed, false otherwise.
+		bool prune( const std::string &path );
+		bool prune( const std::vector<IECore::InternedString> &path );
+
+		void clear();
+
+		bool isEmpty() const;
+
+		/// Fills the paths container with all the paths held
+		/// within this matcher.
+		void paths( std::vector<std::string> &paths ) const;
+
+		/// Result is a bitwise or of the relevant values
+		/// from the Result enum.
+		unsigned match( const std::string &path ) const;
+		unsigned match( const std::vector<IECore::InternedString> &path ) const;
+
+		bool operator == ( const PathMatcher &other ) const;
+		bool operator != ( const PathMatcher &other ) const;
+
+	private :
+
+		struct Node;
+		typedef boost::intrusive_ptr<Node> NodePtr;
+
+		friend void intrusive_ptr_add_ref( const Node *node );
+		friend void intrusive_ptr_release( const Node *node );
+
+		// Returns a version of node which may be modified, copying
+		// it first if it is shared.
+		static Node *writable( NodePtr &node );
+		// Returns the node exactly matching the path, or NULL if it
+		// doesn't exist. Wildcards are not expanded.
+		template<typename NameIterator>
+		const Node *find( const NameIterator &start, const NameIterator &end ) const;
+
+		template<typename NameIterator>
+		bool addPath( const NameIterator &start, const NameIterator &end );
+		template<typename NameIterator>
+		void removeWalk( Node *node, const NameIterator &start, const NameIterator &end, const bool prune, bool &removed );
+		bool addPathsWalk( NodePtr &node, const Node *srcNode );
+		bool removePathsWalk( NodePtr &node, const Node *srcNode );
+		void pathsWalk( const Node *node, const std::string &path, std::vector<std::string> &paths ) const;
+
+		template<typename NameIterator>
+		void matchWalk( const Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const;
+
+		NodePtr m_root;
+
+};
+
+} // namespace Gaffer
+
+#include "Gaffer/PathMatcher.inl"
+
+#endif // GAFFER_PATHMATCHER_H
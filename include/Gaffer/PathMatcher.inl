@@ -37,7 +37,7 @@
 #ifndef GAFFER_PATHMATCHER_INL
 #define GAFFER_PATHMATCHER_INL
 
-namespace GafferScene
+namespace Gaffer
 {
 
 template<typename Iterator>
@@ -56,6 +56,6 @@ void PathMatcher::init( Iterator pathsBegin, Iterator pathsEnd )
 	}
 }
 
-} // namespace GafferScene
+} // namespace Gaffer
 
 #endif // GAFFER_PATHMATCHER_INL
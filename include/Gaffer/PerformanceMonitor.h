@@ -0,0 +1,103 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFER_PERFORMANCEMONITOR_H
+#define GAFFER_PERFORMANCEMONITOR_H
+
+#include <map>
+
+#include "Gaffer/Node.h"
+
+namespace Gaffer
+{
+
+/// Instrumentation for finding the nodes which dominate the cost of
+/// evaluating a graph. While enabled, ValuePlug records the number of
+/// hashes and computes performed for each node, the time spent in them,
+/// and the size of the values they insert into the cache. Times
+/// exclude the time spent evaluating upstream plugs on the same thread,
+/// so that the statistics for a node reflect the work done by the node
+/// itself. Upstream evaluations performed on other threads (for instance
+/// within a tbb::parallel_for() in a compute) are not excluded. Adds no
+/// significant overhead while disabled. While enabled, statistics are
+/// accumulated separately for each thread to avoid contention, and are
+/// merged by statistics().
+///
+/// \note Statistics hold a reference to each node, so nodes deleted
+/// while statistics exist will not be destroyed until clear() is called.
+class PerformanceMonitor
+{
+
+	public :
+
+		struct Statistics
+		{
+
+			Statistics();
+
+			size_t hashCount;
+			size_t computeCount;
+			/// Total time spent in hashes, in seconds.
+			double hashTime;
+			/// Total time spent in computes, in seconds.
+			double computeTime;
+			/// Total size of the values inserted into the cache,
+			/// in bytes. Values may subsequently be evicted, so
+			/// this is not a measure of current memory usage.
+			size_t cacheBytesInserted;
+
+		};
+
+		typedef std::map<ConstNodePtr, Statistics> StatisticsMap;
+
+		static void setEnabled( bool enabled );
+		static bool getEnabled();
+
+		/// Returns the statistics recorded since the last call to clear().
+		static StatisticsMap statistics();
+		static void clear();
+
+		/// Called by ValuePlug to record statistics. Not intended for
+		/// use elsewhere.
+		static void recordHash( const Node *node, double time );
+		static void recordCompute( const Node *node, double time );
+		static void recordCacheInsertion( const Node *node, size_t bytes );
+
+};
+
+} // namespace Gaffer
+
+#endif // GAFFER_PERFORMANCEMONITOR_H
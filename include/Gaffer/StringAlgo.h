@@ -65,7 +65,7 @@ inline bool matchMultiple( const char *s, const char *patterns );
 /// that strings are treated as equal if they have identical prefixes followed
 /// by a wildcard character in at least one. This allows searches to be performed
 /// to quickly find all patterns that potentially match a given string. See the
-/// GafferScene::PathMatcher class for an example where this is used in conjunction
+/// Gaffer::PathMatcher class for an example where this is used in conjunction
 /// with std::multimap and equal_range() to perform rapid matching against multiple
 /// patterns.
 struct MatchPatternLess
@@ -40,14 +40,13 @@
 
 #include "boost/python.hpp"
 
-#include "IECorePython/ScopedGILLock.h"
-
 #include "Gaffer/ComputeNode.h"
 #include "Gaffer/Context.h"
 #include "Gaffer/ValuePlug.h"
 
 #include "GafferBindings/DependencyNodeBinding.h"
 #include "GafferBindings/ExceptionAlgo.h"
+#include "GafferBindings/GILProfiler.h"
 
 namespace GafferBindings
 {
@@ -69,7 +68,7 @@ class ComputeNodeWrapper : public DependencyNodeWrapper<WrappedType>
 			WrappedType::hash( output, context, h );
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "hash" );
 				try
 				{
 					boost::python::object f = this->methodOverride( "hash" );
@@ -95,7 +94,7 @@ class ComputeNodeWrapper : public DependencyNodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "compute" );
 				try
 				{
 					boost::python::object f = this->methodOverride( "compute" );
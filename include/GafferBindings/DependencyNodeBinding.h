@@ -38,16 +38,19 @@
 #ifndef GAFFERBINDINGS_DEPENDENCYNODEBINDING_H
 #define GAFFERBINDINGS_DEPENDENCYNODEBINDING_H
 
+#include <map>
+#include <vector>
+
 #include "boost/python.hpp"
 #include "boost/python/suite/indexing/container_utils.hpp"
 
-#include "IECorePython/ScopedGILLock.h"
-
 #include "Gaffer/DependencyNode.h"
 #include "Gaffer/Context.h"
 #include "Gaffer/ValuePlug.h"
+#include "Gaffer/PlugIterator.h"
 
 #include "GafferBindings/NodeBinding.h"
+#include "GafferBindings/GILProfiler.h"
 
 namespace GafferBindings
 {
@@ -63,21 +66,46 @@ class DependencyNodeClass : public NodeClass<T, TWrapper>
 
 };
 
+/// Python subclasses may declare their dependencies statically, using
+/// a "staticAffects" class attribute which maps from the names of input
+/// plugs to sequences of names of the output plugs they affect :
+///
+/// \code
+/// class MyNode( Gaffer.ComputeNode ) :
+///
+/// 	staticAffects = {
+/// 		"in" : ( "out", ),
+/// 	}
+/// \endcode
+///
+/// Names are relative to the node, and an entry for a plug applies also to
+/// all its descendants. When such a declaration is present it is used in
+/// place of any affects() override, so that affects() queries may be
+/// answered without entering Python. The base class implementation is
+/// still called as usual.
 template<typename WrappedType>
 class DependencyNodeWrapper : public NodeWrapper<WrappedType>
 {
 	public :
 
 		DependencyNodeWrapper( PyObject *self, const std::string &name )
-			:	NodeWrapper<WrappedType>( self, name )
+			:	NodeWrapper<WrappedType>( self, name ), m_hasStaticAffects( false )
 		{
+			initStaticAffects( self );
 		}
 
 		virtual void affects( const Gaffer::Plug *input, Gaffer::DependencyNode::AffectedPlugsContainer &outputs ) const
 		{
+			if( m_hasStaticAffects )
+			{
+				WrappedType::affects( input, outputs );
+				staticAffects( input, outputs );
+				return;
+			}
+
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "affects" );
 				boost::python::object f = this->methodOverride( "affects" );
 				if( f )
 				{
@@ -94,7 +122,7 @@ class DependencyNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "enabledPlug" );
 				boost::python::object f = this->methodOverride( "enabledPlug" );
 				if( f )
 				{
@@ -114,7 +142,7 @@ class DependencyNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "correspondingInput" );
 				boost::python::object f = this->methodOverride( "correspondingInput" );
 				if( f )
 				{
@@ -133,6 +161,70 @@ class DependencyNodeWrapper : public NodeWrapper<WrappedType>
 			return const_cast<DependencyNodeWrapper *>( this )->correspondingInput( output );
 		}
 
+	private :
+
+		// We are constructed from Python, so already hold the GIL here.
+		void initStaticAffects( PyObject *self )
+		{
+			if( !PyObject_HasAttrString( self, "staticAffects" ) )
+			{
+				return;
+			}
+
+			boost::python::object pythonSelf( boost::python::handle<>( boost::python::borrowed( self ) ) );
+			boost::python::dict declaration = boost::python::extract<boost::python::dict>( pythonSelf.attr( "staticAffects" ) );
+			boost::python::list items = declaration.items();
+			for( boost::python::ssize_t i = 0, e = boost::python::len( items ); i < e; ++i )
+			{
+				const std::string inputName = boost::python::extract<std::string>( items[i][0] );
+				std::vector<std::string> &outputNames = m_staticAffects[inputName];
+				boost::python::object pythonOutputNames = items[i][1];
+				for( boost::python::ssize_t j = 0, ej = boost::python::len( pythonOutputNames ); j < ej; ++j )
+				{
+					outputNames.push_back( boost::python::extract<std::string>( pythonOutputNames[j] ) );
+				}
+			}
+
+			m_hasStaticAffects = true;
+		}
+
+		void staticAffects( const Gaffer::Plug *input, Gaffer::DependencyNode::AffectedPlugsContainer &outputs ) const
+		{
+			for( const Gaffer::Plug *plug = input; plug; plug = plug->parent<Gaffer::Plug>() )
+			{
+				StaticAffects::const_iterator it = m_staticAffects.find( plug->relativeName( this ) );
+				if( it == m_staticAffects.end() )
+				{
+					continue;
+				}
+				for( std::vector<std::string>::const_iterator nIt = it->second.begin(), nEIt = it->second.end(); nIt != nEIt; ++nIt )
+				{
+					if( const Gaffer::Plug *output = this->template descendant<Gaffer::Plug>( *nIt ) )
+					{
+						addLeafPlugs( output, outputs );
+					}
+				}
+			}
+		}
+
+		static void addLeafPlugs( const Gaffer::Plug *plug, Gaffer::DependencyNode::AffectedPlugsContainer &outputs )
+		{
+			if( plug->children().empty() )
+			{
+				outputs.push_back( plug );
+				return;
+			}
+
+			for( Gaffer::PlugIterator it( plug ); it != it.end(); ++it )
+			{
+				addLeafPlugs( it->get(), outputs );
+			}
+		}
+
+		typedef std::map<std::string, std::vector<std::string> > StaticAffects;
+		StaticAffects m_staticAffects;
+		bool m_hasStaticAffects;
+
 };
 
 } // namespace GafferBindings
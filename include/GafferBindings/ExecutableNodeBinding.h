@@ -37,11 +37,10 @@
 #ifndef GAFFERBINDINGS_EXECUTABLENODEBINDING_H
 #define GAFFERBINDINGS_EXECUTABLENODEBINDING_H
 
-#include "IECorePython/ScopedGILLock.h"
-
 #include "Gaffer/ExecutableNode.h"
 
 #include "GafferBindings/NodeBinding.h"
+#include "GafferBindings/GILProfiler.h"
 
 namespace GafferBindings
 {
@@ -71,7 +70,7 @@ class ExecutableNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "requirements" );
 				boost::python::object req = this->methodOverride( "requirements" );
 				if( req )
 				{
@@ -95,7 +94,7 @@ class ExecutableNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "hash" );
 				boost::python::object h = this->methodOverride( "hash" );
 				if( h )
 				{
@@ -111,7 +110,7 @@ class ExecutableNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "execute" );
 				boost::python::object exec = this->methodOverride( "execute" );
 				if( exec )
 				{
@@ -126,7 +125,7 @@ class ExecutableNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "executeSequence" );
 				boost::python::object execSeq = this->methodOverride( "executeSequence" );
 				if( execSeq )
 				{
@@ -146,7 +145,7 @@ class ExecutableNodeWrapper : public NodeWrapper<WrappedType>
 		{
 			if( this->isSubclassed() )
 			{
-				IECorePython::ScopedGILLock gilLock;
+				GILProfiler::ScopedGILLock gilLock( this, "requiresSequenceExecution" );
 				boost::python::object reqSecExec = this->methodOverride( "requiresSequenceExecution" );
 				if( reqSecExec )
 				{
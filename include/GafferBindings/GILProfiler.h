@@ -0,0 +1,117 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFERBINDINGS_GILPROFILER_H
+#define GAFFERBINDINGS_GILPROFILER_H
+
+#include <map>
+#include <string>
+
+#include "boost/python.hpp"
+#include "boost/noncopyable.hpp"
+
+#include "tbb/tick_count.h"
+
+#include "Gaffer/GraphComponent.h"
+
+namespace GafferBindings
+{
+
+/// Instrumentation for measuring the cost of the Global Interpreter Lock
+/// to nodes implemented in Python. While enabled, the wrappers for Python
+/// subclasses of nodes record the time spent waiting to acquire the GIL and
+/// the time spent holding it, for each node and method. This is intended as
+/// a diagnostic tool for finding the nodes which limit the performance of
+/// parallel evaluation, and adds no significant overhead while disabled.
+class GILProfiler
+{
+
+	public :
+
+		struct Statistics
+		{
+
+			Statistics();
+
+			size_t calls;
+			/// Total time spent waiting to acquire the GIL, in seconds.
+			double acquisitionTime;
+			/// Total time spent holding the GIL, in seconds.
+			double holdTime;
+
+		};
+
+		/// Statistics are keyed by the full name of the node
+		/// and the name of the method.
+		typedef std::pair<std::string, std::string> Key;
+		typedef std::map<Key, Statistics> StatisticsMap;
+
+		static void setEnabled( bool enabled );
+		static bool getEnabled();
+
+		/// Returns the statistics recorded since the last call to clear().
+		static StatisticsMap statistics();
+		static void clear();
+
+		/// Acquires the GIL in the same way as IECorePython::ScopedGILLock,
+		/// additionally recording statistics when the profiler is enabled.
+		/// The hold time includes any periods during which the GIL was
+		/// temporarily released by the code within the scope, and nested
+		/// locks are each recorded in full.
+		class ScopedGILLock : boost::noncopyable
+		{
+
+			public :
+
+				ScopedGILLock( const Gaffer::GraphComponent *node, const char *method );
+				~ScopedGILLock();
+
+			private :
+
+				const Gaffer::GraphComponent *m_node;
+				const char *m_method;
+				PyGILState_STATE m_state;
+				bool m_profiling;
+				tbb::tick_count m_acquired;
+				double m_acquisitionTime;
+
+		};
+
+};
+
+} // namespace GafferBindings
+
+#endif // GAFFERBINDINGS_GILPROFILER_H
@@ -34,14 +34,14 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
-#ifndef GAFFERSCENEBINDINGS_PATHMATCHERBINDING_H
-#define GAFFERSCENEBINDINGS_PATHMATCHERBINDING_H
+#ifndef GAFFERBINDINGS_PATHMATCHERBINDING_H
+#define GAFFERBINDINGS_PATHMATCHERBINDING_H
 
-namespace GafferSceneBindings
+namespace GafferBindings
 {
 
 void bindPathMatcher();
 
-} // namespace GafferSceneBindings
+} // namespace GafferBindings
 
-#endif // GAFFERSCENEBINDINGS_PATHMATCHERBINDING_H
+#endif // GAFFERBINDINGS_PATHMATCHERBINDING_H
@@ -77,8 +77,15 @@ class OpHolder : public ParameterisedHolderComputeNode
 
 	private :
 
+		void plugSet( Gaffer::Plug *plug );
+
 		ParameterHandlerPtr m_resultParameterHandler;
 
+		// Op instances don't support concurrent use, so computations
+		// are performed using instances taken from this pool.
+		IE_CORE_FORWARDDECLARE( InstancePool )
+		InstancePoolPtr m_instancePool;
+
 };
 
 IE_CORE_DECLAREPTR( OpHolder )
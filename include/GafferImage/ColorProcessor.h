@@ -85,8 +85,16 @@ class ColorProcessor : public ImageProcessor
 		/// Must be implemented by derived classes to compute the hash for the color processing - all implementations
 		/// must call their base class implementation first.
 		virtual void hashColorData( const Gaffer::Context *context, IECore::MurmurHash &h ) const = 0;
-		/// Must be implemented by derived classes to modify R, G and B in place.
-		virtual void processColorData( const Gaffer::Context *context, IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b ) const = 0;
+		/// Must be implemented by derived classes to process the input R, G and B tiles into
+		/// the output R, G and B tiles. The outputs are empty, with storage reserved for the
+		/// same number of elements as the inputs, and implementations must fill them. This
+		/// allows implementations which can write results directly to avoid copying the
+		/// inputs first, but those which process in place must still copy them.
+		virtual void processColorData(
+			const Gaffer::Context *context,
+			const IECore::FloatVectorData *inR, const IECore::FloatVectorData *inG, const IECore::FloatVectorData *inB,
+			IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b
+		) const = 0;
 
 	private :
 
@@ -67,7 +67,11 @@ class OpenColorIO : public ColorProcessor
 
 		virtual bool affectsColorData( const Gaffer::Plug *input ) const;
 		virtual void hashColorData( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
-		virtual void processColorData( const Gaffer::Context *context, IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b ) const;
+		virtual void processColorData(
+			const Gaffer::Context *context,
+			const IECore::FloatVectorData *inR, const IECore::FloatVectorData *inG, const IECore::FloatVectorData *inB,
+			IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b
+		) const;
 
 	private :
 
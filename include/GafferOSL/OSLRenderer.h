@@ -36,6 +36,7 @@
 #define GAFFEROSL_OSLRENDERER_H
 
 #include <stack>
+#include <set>
 
 #include "OSL/oslexec.h"
 
@@ -54,7 +55,7 @@ IE_CORE_FORWARDDECLARE( OSLRenderer )
 /// so that code for declaring shaders and state to an actual renderer can be reused for
 /// specifying the shaders and state to be executed with here.
 /// \threading None of the methods of this class are threadsafe, but ShadingEngine::shade()
-/// method is.
+/// method is. Note that ShadingEngine::shade() itself shades the points in parallel.
 class OSLRenderer : public IECore::Renderer
 {
 
@@ -134,6 +135,15 @@ class OSLRenderer : public IECore::Renderer
 
 				IECore::CompoundDataPtr shade( const IECore::CompoundData *points ) const;
 
+				/// Returns true if the shading network may query the named
+				/// attribute (or user data) from the points passed to shade().
+				/// This may be used to avoid providing data which will never
+				/// be used. Returns true conservatively when it can't be
+				/// determined whether or not the attribute is needed, for
+				/// instance when the network computes attribute names at
+				/// runtime.
+				bool needsAttribute( const std::string &name ) const;
+
 			private :
 
 				friend class OSLRenderer;
@@ -143,6 +153,9 @@ class OSLRenderer : public IECore::Renderer
 				ConstOSLRendererPtr m_renderer;
 				OSL::ShadingAttribStateRef m_shadingState;
 
+				bool m_unknownAttributesNeeded;
+				std::set<std::string> m_attributesNeeded;
+
 		};
 
 		IE_CORE_DECLAREPTR( ShadingEngine )
@@ -155,6 +168,7 @@ class OSLRenderer : public IECore::Renderer
 		class RenderState;
 		class RendererServices;
 		class ShadingResults;
+		class ShadingFunctor;
 
 		enum ClosureId
 		{
@@ -39,6 +39,7 @@
 
 #include "Gaffer/ComputeNode.h"
 #include "Gaffer/NumericPlug.h"
+#include "Gaffer/PathMatcher.h"
 
 #include "GafferScene/TypeIds.h"
 
@@ -57,11 +58,11 @@ class Filter : public Gaffer::ComputeNode
 
 		enum Result
 		{
-			NoMatch = 0,
-			DescendantMatch = 1,
-			ExactMatch = 2,
-			AncestorMatch = 4,
-			EveryMatch = DescendantMatch | ExactMatch | AncestorMatch
+			NoMatch = Gaffer::PathMatcher::NoMatch,
+			DescendantMatch = Gaffer::PathMatcher::DescendantMatch,
+			ExactMatch = Gaffer::PathMatcher::ExactMatch,
+			AncestorMatch = Gaffer::PathMatcher::AncestorMatch,
+			EveryMatch = Gaffer::PathMatcher::EveryMatch
 		};
 
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::Filter, FilterTypeId, Gaffer::ComputeNode );
@@ -92,6 +93,19 @@ class Filter : public Gaffer::ComputeNode
 		/// Returns an input scene previously stored with setInputScene().
 		static const ScenePlug *getInputScene( const Gaffer::Context *context );
 
+		/// Computes the result of the filter for each of the children of
+		/// parentPath at once, filling matches with one result per child.
+		/// This is equivalent to evaluating outPlug() for each child with
+		/// the appropriate "scene:path" in the context, but avoids much of
+		/// the per-child overhead. The input scene must already have been
+		/// specified in the context using setInputScene().
+		void childMatches( const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const;
+		/// As above, but for a plug which receives the output of a filter. If the source
+		/// of the plug is a Filter then its childMatches() method is used, otherwise
+		/// (for instance when the plug is driven by a Switch or an Expression) the plug
+		/// is evaluated for each child in turn.
+		static void plugChildMatches( const Gaffer::IntPlug *filterPlug, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches );
+
 	protected :
 
 		/// Implemented to call hashMatch() below when computing the hash for outPlug().
@@ -102,6 +116,11 @@ class Filter : public Gaffer::ComputeNode
 		/// Must be implemented by derived classes.
 		virtual void hashMatch( const ScenePlug *scene, const Gaffer::Context *context, IECore::MurmurHash &h ) const = 0;
 		virtual unsigned computeMatch( const ScenePlug *scene, const Gaffer::Context *context ) const = 0;
+		/// Called by childMatches(). The default implementation evaluates outPlug() for
+		/// each child in parallel, but derived classes may reimplement it to provide a more
+		/// efficient batched lookup. Implementations must produce results identical to those
+		/// of outPlug(), taking enabledPlug() into account.
+		virtual void computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const;
 
 	private :
 
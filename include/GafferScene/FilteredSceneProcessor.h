@@ -80,6 +80,11 @@ class FilteredSceneProcessor : public SceneProcessor
 		/// Note that if you need to make multiple queries, it is more efficient to call
 		/// filterContext() yourself once and then query the filter directly multiple times.
 		Filter::Result filterValue( const Gaffer::Context *context ) const;
+		/// Convenience method for computing the filter result for every child of
+		/// parentPath at once, using Filter::childMatches(). This is considerably
+		/// more efficient than setting the path in filterContext() and calling
+		/// filterPlug()->getValue() for each child in turn.
+		void filterChildValues( const Gaffer::Context *context, const ScenePath &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const;
 
 		static size_t g_firstPlugIndex;
 
@@ -56,13 +56,35 @@ class Instancer : public BranchCreator
 		Gaffer::StringPlug *namePlug();
 		const Gaffer::StringPlug *namePlug() const;
 
+		/// The scene to be instanced. If prototypeIndexPlug() names
+		/// a primitive variable, then each of the children of the root
+		/// of this scene is treated as a separate prototype.
 		ScenePlug *instancePlug();
 		const ScenePlug *instancePlug() const;
 
+		/// Name of a QuatfVectorData primitive variable used
+		/// to orient the instances.
+		Gaffer::StringPlug *orientationPlug();
+		const Gaffer::StringPlug *orientationPlug() const;
+
+		/// Name of a V3fVectorData or FloatVectorData primitive
+		/// variable used to scale the instances.
+		Gaffer::StringPlug *scalePlug();
+		const Gaffer::StringPlug *scalePlug() const;
+
+		/// Name of an IntVectorData primitive variable used to
+		/// choose a prototype for each instance.
+		Gaffer::StringPlug *prototypeIndexPlug();
+		const Gaffer::StringPlug *prototypeIndexPlug() const;
+
 		virtual void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const;
 
 	protected :
 
+		/// Implemented for instanceDataPlug().
+		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
+
 		virtual void hashBranchBound( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual Imath::Box3f computeBranchBound( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context ) const;
 
@@ -81,16 +103,30 @@ class Instancer : public BranchCreator
 	private :
 
 		struct BoundHash;
+		struct InstanceBoundHashes;
+		struct UniqueBoundEvaluator;
 		struct BoundUnion;
 
+		/// Stores the transform and prototype for every instance,
+		/// computed in a single pass over the primitive variables of
+		/// the source points. Evaluated with "scene:path" set to the
+		/// parent path.
+		Gaffer::ObjectPlug *instanceDataPlug();
+		const Gaffer::ObjectPlug *instanceDataPlug() const;
+
 		IECore::ConstV3fVectorDataPtr sourcePoints( const ScenePath &parentPath ) const;
+		IECore::ConstCompoundObjectPtr instanceData( const ScenePath &parentPath ) const;
+		IECore::MurmurHash instanceDataHash( const ScenePath &parentPath ) const;
 		int instanceIndex( const ScenePath &branchPath ) const;
 		// Makes a new context suitable for use when evaluating instancePlug()
-		Gaffer::ContextPtr instanceContext( const Gaffer::Context *parentContext, const ScenePath &branchPath ) const;
+		Gaffer::ContextPtr instanceContext( const Gaffer::Context *parentContext, const ScenePath &parentPath, const ScenePath &branchPath ) const;
 		// Fills an existing context with the fields needed for evaluating instancePlug()
-		void fillInstanceContext( Gaffer::Context *instanceContext, const ScenePath &branchPath ) const;
-		void fillInstanceContext( Gaffer::Context *instanceContext, const ScenePath &branchPath, int instanceId ) const;
-		Imath::M44f instanceTransform( const IECore::V3fVectorData *p, int instanceId ) const;
+		void fillInstanceContext( Gaffer::Context *instanceContext, const IECore::CompoundObject *instanceData, const ScenePath &branchPath, int instanceId ) const;
+		// Computes the distinct bounds and prototype transforms of the
+		// instances, evaluating them only once for each group of instances
+		// with identical hashes. boundIndices maps from instance id to an
+		// index into bounds and transforms.
+		void uniqueInstanceBounds( const Gaffer::Context *context, const ScenePath &branchPath, const IECore::CompoundObject *instanceData, std::vector<size_t> &boundIndices, std::vector<Imath::Box3f> &bounds, std::vector<Imath::M44f> &transforms ) const;
 
 		static size_t g_firstPlugIndex;
 
@@ -35,100 +35,19 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
-#ifndef GAFFER_PATHMATCHER_H
-#define GAFFER_PATHMATCHER_H
+#ifndef GAFFERSCENE_PATHMATCHER_H
+#define GAFFERSCENE_PATHMATCHER_H
 
-#include "boost/shared_ptr.hpp"
-
-#include "IECore/TypedData.h"
-
-#include "GafferScene/Filter.h"
+#include "Gaffer/PathMatcher.h"
 
 namespace GafferScene
 {
 
-/// The PathMatcher class provides an acceleration structure for matching
-/// paths against a sequence of reference paths. It provides the internal
-/// implementation for the PathFilter.
-class PathMatcher
-{
-
-	public :
-
-		PathMatcher();
-		/// Constructs a deep copy of other.
-		PathMatcher( const PathMatcher &other );
-
-		template<typename Iterator>
-		PathMatcher( Iterator pathsBegin, Iterator pathsEnd );
-
-		/// \todo Should this keep the existing tree in place,
-		/// but just remove the terminator flags on any items
-		/// not present in the new paths? This might give
-		/// better performance for selections and expansions
-		/// which will tend to be adding and removing the same
-		/// paths repeatedly.
-		template<typename Iterator>
-		void init( Iterator pathsBegin, Iterator pathsEnd );
-
-		/// Returns true if the path was added, false if
-		/// it was already there.
-		bool addPath( const std::string &path );
-		bool addPath( const std::vector<IECore::InternedString> &path );
-		/// Returns true if the path was removed, false if
-		/// it was not there.
-		bool removePath( const std::string &path );
-		bool removePath( const std::vector<IECore::InternedString> &path );
-
-		/// Adds all paths from the other PathMatcher, returning true if
-		/// any were added, and false if they were all already present.
-		bool addPaths( const PathMatcher &paths );
-		/// Removes all specified paths, returning true if any paths
-		/// were removed, and false if none existed anyway.
-		bool removePaths( const PathMatcher &paths );
-
-		/// Removes the specified path and all descendant paths.
-		/// Returns true if something was removed, false otherwise.
-		bool prune( const std::string &path );
-		bool prune( const std::vector<IECore::InternedString> &path );
-
-		void clear();
-
-		bool isEmpty() const;
-
-		/// Fills the paths container with all the paths held
-		/// within this matcher.
-		void paths( std::vector<std::string> &paths ) const;
-
-		/// Result is a bitwise or of the relevant values
-		/// from Filter::Result.
-		unsigned match( const std::string &path ) const;
-		unsigned match( const std::vector<IECore::InternedString> &path ) const;
-
-		bool operator == ( const PathMatcher &other ) const;
-		bool operator != ( const PathMatcher &other ) const;
-
-	private :
-
-		struct Node;
-
-		template<typename NameIterator>
-		bool addPath( const NameIterator &start, const NameIterator &end );
-		template<typename NameIterator>
-		void removeWalk( Node *node, const NameIterator &start, const NameIterator &end, const bool prune, bool &removed );
-		bool addPathsWalk( Node *node, const Node *srcNode );
-		bool removePathsWalk( Node *node, const Node *srcNode );
-		void pathsWalk( Node *node, const std::string &path, std::vector<std::string> &paths ) const;
-
-		template<typename NameIterator>
-		void matchWalk( Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const;
-
-		boost::shared_ptr<Node> m_root;
-
-};
+/// \deprecated PathMatcher now lives in the Gaffer namespace, so that
+/// it may be used by non-scene modules such as GafferUI. This typedef is
+/// provided for backwards compatibility only.
+typedef Gaffer::PathMatcher PathMatcher;
 
 } // namespace GafferScene
 
-#include "GafferScene/PathMatcher.inl"
-
-#endif // GAFFER_PATHMATCHER_H
+#endif // GAFFERSCENE_PATHMATCHER_H
@@ -42,6 +42,7 @@
 #include "Gaffer/NumericPlug.h"
 
 #include "GafferScene/ScenePlug.h"
+#include "GafferScene/PathMatcher.h"
 
 namespace IECore
 {
@@ -55,7 +56,6 @@ namespace GafferScene
 {
 
 class Filter;
-class PathMatcher;
 
 /// Returns true if the specified location exists within the scene, and false otherwise.
 /// This operates by traversing the path from the root, ensuring that each location includes
@@ -44,6 +44,7 @@
 #include "Gaffer/BoxPlug.h"
 
 #include "GafferScene/TypeIds.h"
+#include "GafferScene/PathMatcherData.h"
 
 namespace GafferScene
 {
@@ -99,6 +100,16 @@ class ScenePlug : public Gaffer::CompoundPlug
 		/// to the "scene:path" context entry.
 		Gaffer::CompoundObjectPlug *globalsPlug();
 		const Gaffer::CompoundObjectPlug *globalsPlug() const;
+		/// The plug used to pass the names of all the sets in the scene.
+		/// Note that this is not sensitive to the "scene:path" context entry.
+		Gaffer::InternedStringVectorDataPlug *setNamesPlug();
+		const Gaffer::InternedStringVectorDataPlug *setNamesPlug() const;
+		/// The plug used to pass the members of a single set, represented
+		/// as PathMatcherData. The set is specified by the "scene:setName"
+		/// context entry, so that sets are computed individually and only
+		/// on demand. This is not sensitive to the "scene:path" context entry.
+		Gaffer::ObjectPlug *setPlug();
+		const Gaffer::ObjectPlug *setPlug() const;
 		//@}
 
 		/// The type used to specify the current scene path in
@@ -110,6 +121,10 @@ class ScenePlug : public Gaffer::CompoundPlug
 		/// and quicker than constructing a new InternedString
 		/// each time.
 		static const IECore::InternedString scenePathContextName;
+		/// The name used to specify the name of the set to be
+		/// computed by setPlug(), in a Context object. The value
+		/// is stored as IECore::InternedStringData.
+		static const IECore::InternedString setNameContextName;
 
 		/// @name Convenience accessors
 		/// These functions create temporary Contexts specifying the scenePath
@@ -136,6 +151,10 @@ class ScenePlug : public Gaffer::CompoundPlug
 		IECore::MurmurHash fullAttributesHash( const ScenePath &scenePath ) const;
 		IECore::MurmurHash objectHash( const ScenePath &scenePath ) const;
 		IECore::MurmurHash childNamesHash( const ScenePath &scenePath ) const;
+
+		/// Returns the members of the specified set.
+		ConstPathMatcherDataPtr set( const IECore::InternedString &setName ) const;
+		IECore::MurmurHash setHash( const IECore::InternedString &setName ) const;
 		//@}
 
 		/// Utility function to convert a string into a path by splitting on '/'.
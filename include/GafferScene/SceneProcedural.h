@@ -41,6 +41,8 @@
 #include "tbb/atomic.h"
 #include "tbb/mutex.h"
 
+#include "boost/shared_ptr.hpp"
+
 #include "IECore/Renderer.h"
 
 #include "GafferScene/ScenePlug.h"
@@ -98,6 +100,7 @@ class SceneProcedural : public IECore::Renderer::Procedural
 			bool transformBlur;
 			bool deformationBlur;
 			Imath::V2f shutter;
+			bool eagerExpansion;
 		};
 
 		Options m_options;
@@ -115,6 +118,7 @@ class SceneProcedural : public IECore::Renderer::Procedural
 	private :
 
 		void updateAttributes( bool full );
+		static void updateAttributes( const IECore::CompoundObject *attributes, Attributes &result );
 		void computeBound();
 		void motionTimes( unsigned segments, std::set<float> &times ) const;
 		
@@ -139,6 +143,23 @@ class SceneProcedural : public IECore::Renderer::Procedural
 		// struct for creating child procedurals in parallel and computing their bounds, using
 		// tbb::parallel_for:
 		class SceneProceduralCreate;
+
+		// Everything needed to output a single location to the renderer.
+		// In the default deferred mode, render() computes one of these for
+		// the procedural's own location and defers the children to child
+		// procedurals. When the "render:eagerExpansion" option is on, the
+		// whole subtree is prefetched in parallel into a tree of Locations
+		// first, and then output to the renderer in series, avoiding the
+		// cost of the procedural hierarchy with renderers which expand
+		// procedurals on a single thread.
+		struct Location;
+		typedef boost::shared_ptr<Location> LocationPtr;
+		void computeLocation( Location &location, bool recurse ) const;
+		void renderLocation( const Location &location, IECore::Renderer *renderer ) const;
+
+		// struct for prefetching child locations in parallel, using
+		// tbb::parallel_for:
+		class LocationPrefetch;
 		
 		static tbb::mutex g_allRenderedMutex;
 		static AllRenderedSignal g_allRenderedSignal;
@@ -70,12 +70,26 @@ class SceneReader : public SceneNode
 		Gaffer::StringPlug *setsPlug();
 		const Gaffer::StringPlug *setsPlug() const;
 
+		/// When on, the samples stored in the file for each object are
+		/// cached individually, and objects at intermediate times are
+		/// interpolated from them on demand. Data which doesn't vary between
+		/// samples, such as mesh topology, is shared between them. This means
+		/// that cache memory scales with the number of stored samples rather
+		/// than with the number of distinct times requested, which is
+		/// beneficial for motion blur and timeline scrubbing.
+		Gaffer::BoolPlug *cacheObjectSamplesPlug();
+		const Gaffer::BoolPlug *cacheObjectSamplesPlug() const;
+
 		virtual void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const;
 
 		static size_t supportedExtensions( std::vector<std::string> &extensions );
 
 	protected :
 
+		/// Implemented for tagIndexPlug() and objectSamplePlug().
+		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
+
 		/// \todo These methods defer to SceneInterface::hash() to do most of the work, but we could go further.
 		/// Currently we still hash in fileNamePlug() and refreshCountPlug() because we don't trust the current
 		/// implementation of SceneCache::hash() - it should hash the filename and modification time, but instead
@@ -87,6 +101,8 @@ class SceneReader : public SceneNode
 		virtual void hashObject( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
 		virtual void hashChildNames( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
 		virtual void hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
+		virtual void hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
+		virtual void hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
 
 		virtual Imath::Box3f computeBound( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const;
 		virtual Imath::M44f computeTransform( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const;
@@ -94,11 +110,31 @@ class SceneReader : public SceneNode
 		virtual IECore::ConstObjectPtr computeObject( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const;
 		virtual IECore::ConstInternedStringVectorDataPtr computeChildNames( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const;
 		virtual IECore::ConstCompoundObjectPtr computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const;
+		virtual IECore::ConstInternedStringVectorDataPtr computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const;
+		virtual GafferScene::ConstPathMatcherDataPtr computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const;
 
 	private :
 
 		void plugSet( Gaffer::Plug *plug );
 
+		// Holds a CompoundObject mapping from tag name to PathMatcherData,
+		// for every tag required by either tagsPlug() or setsPlug(). This is
+		// built by a single walk of the file, and is computed in a context
+		// without the scene path or set name, so it is shared by all the
+		// childNames and set computations rather than each of them having
+		// to query the tags in the file for themselves.
+		Gaffer::ObjectPlug *tagIndexPlug();
+		const Gaffer::ObjectPlug *tagIndexPlug() const;
+		IECore::ConstCompoundObjectPtr tagIndex( const Gaffer::Context *context ) const;
+
+		// Holds a single stored sample of the object at the current
+		// scene path, as specified by the objectSampleContextName variable.
+		// Used by computeObject() when cacheObjectSamplesPlug() is on.
+		Gaffer::ObjectPlug *objectSamplePlug();
+		const Gaffer::ObjectPlug *objectSamplePlug() const;
+		IECore::ConstObjectPtr objectSample( const Gaffer::Context *context, size_t sampleIndex ) const;
+		IECore::MurmurHash objectSampleHash( const Gaffer::Context *context, size_t sampleIndex ) const;
+
 		// The typical access patterns for the SceneReader include accessing
 		// the same file repeatedly, and also the same path within the file
 		// repeatedly (to hash a value then compute it for instance, or to get
@@ -119,6 +155,7 @@ class SceneReader : public SceneNode
 		IECore::ConstSceneInterfacePtr scene( const ScenePath &path ) const;
 
 		static const double g_frameRate;
+		static const IECore::InternedString g_objectSampleContextName;
 		static size_t g_firstPlugIndex;
 
 };
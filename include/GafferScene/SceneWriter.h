@@ -73,7 +73,7 @@ class SceneWriter : public Gaffer::ExecutableNode
 		virtual void execute() const;
 
 		/// Re-implemented to open the file for writing, then iterate through the
-		/// frames, modifying the current Context and calling writeLocation().
+		/// frames, modifying the current Context and calling writeScene().
 		virtual void executeSequence( const std::vector<float> &frames ) const;
 
 		/// Re-implemented to return true, since the entire file must be written at once.
@@ -82,7 +82,7 @@ class SceneWriter : public Gaffer::ExecutableNode
 	private :
 
 		void createDirectories( std::string &fileName ) const;
-		void writeLocation( const GafferScene::ScenePlug *scene, const ScenePlug::ScenePath &scenePath, Gaffer::Context *context, IECore::SceneInterface *output, double time ) const;
+		void writeScene( const GafferScene::ScenePlug *scene, const Gaffer::Context *context, IECore::SceneInterface *output, double time ) const;
 
 		static size_t g_firstPlugIndex;
 
@@ -39,15 +39,16 @@
 
 #include "Gaffer/TypedObjectPlug.h"
 
-#include "GafferScene/GlobalsProcessor.h"
+#include "GafferScene/SceneProcessor.h"
 
 namespace GafferScene
 {
 
 /// This node defines sets of scene locations as PathMatcherData,
-/// placing them in the scene globals. It is not to be confused with the Gaffer::Set
-/// class which is for an entirely different purpose.
-class Set : public GlobalsProcessor
+/// outputting them via ScenePlug::setNamesPlug() and ScenePlug::setPlug().
+/// It is not to be confused with the Gaffer::Set class which is for an
+/// entirely different purpose.
+class Set : public SceneProcessor
 {
 
 	public :
@@ -55,7 +56,7 @@ class Set : public GlobalsProcessor
 		Set( const std::string &name=defaultName<Set>() );
 		virtual ~Set();
 
-		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::Set, SetTypeId, GlobalsProcessor );
+		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::Set, SetTypeId, SceneProcessor );
 
 		enum Mode
 		{
@@ -80,8 +81,11 @@ class Set : public GlobalsProcessor
 		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
 
-		virtual void hashProcessedGlobals( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
-		virtual IECore::ConstCompoundObjectPtr computeProcessedGlobals( const Gaffer::Context *context, IECore::ConstCompoundObjectPtr inputGlobals ) const;
+		virtual void hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
+		virtual void hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const;
+
+		virtual IECore::ConstInternedStringVectorDataPtr computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const;
+		virtual GafferScene::ConstPathMatcherDataPtr computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const;
 
 	private :
 
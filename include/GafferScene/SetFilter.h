@@ -67,6 +67,9 @@ class SetFilter : public Filter
 
 		virtual void hashMatch( const ScenePlug *scene, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual unsigned computeMatch( const ScenePlug *scene, const Gaffer::Context *context ) const;
+		/// Implemented as a direct lookup in the set, rather than
+		/// evaluating outPlug() for each child.
+		virtual void computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const;
 
 	private :
 
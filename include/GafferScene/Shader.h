@@ -41,16 +41,17 @@
 #include "IECore/ObjectVector.h"
 #include "IECore/Shader.h"
 
-#include "Gaffer/DependencyNode.h"
+#include "Gaffer/ComputeNode.h"
 #include "Gaffer/CompoundPlug.h"
 #include "Gaffer/TypedPlug.h"
+#include "Gaffer/TypedObjectPlug.h"
 
 #include "GafferScene/TypeIds.h"
 
 namespace GafferScene
 {
 
-class Shader : public Gaffer::DependencyNode
+class Shader : public Gaffer::ComputeNode
 {
 
 	public :
@@ -58,7 +59,7 @@ class Shader : public Gaffer::DependencyNode
 		Shader( const std::string &name=defaultName<Shader>() );
 		virtual ~Shader();
 
-		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::Shader, ShaderTypeId, Gaffer::DependencyNode );
+		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::Shader, ShaderTypeId, Gaffer::ComputeNode );
 
 		/// A plug defining the name of the shader.
 		Gaffer::StringPlug *namePlug();
@@ -89,8 +90,18 @@ class Shader : public Gaffer::DependencyNode
 		virtual Gaffer::BoolPlug *enabledPlug();
 		virtual const Gaffer::BoolPlug *enabledPlug() const;
 
+		/// Output plug holding the result of state(). The state is stored
+		/// in the compute cache, so that locations with the same state hash
+		/// share a single state rather than each building their own. The
+		/// ShaderAssignment evaluates this plug with "scene:path" removed
+		/// from the context, so that the hash is the same for every location
+		/// and is taken from the per-thread hash cache rather than traversing
+		/// the network again.
+		Gaffer::ObjectPlug *statePlug();
+		const Gaffer::ObjectPlug *statePlug() const;
+
 		/// Implemented so that the children of parametersPlug() affect
-		/// outPlug().
+		/// outPlug() and statePlug().
 		virtual void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const;
 
 		/// Returns a hash representing the result of state().
@@ -102,6 +113,11 @@ class Shader : public Gaffer::DependencyNode
 
 	protected :
 
+		/// Implemented to compute statePlug(). Other outputs have no
+		/// meaningful value, and are simply given their default values.
+		virtual void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		virtual void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const;
+
 		class NetworkBuilder
 		{
 
@@ -68,6 +68,8 @@ class ShaderAssignment : public SceneElementProcessor
 
 	private :
 
+		Gaffer::ContextPtr stateContext( const Gaffer::Context *context ) const;
+
 		static size_t g_firstPlugIndex;
 
 };
@@ -72,6 +72,9 @@ class UnionFilter : public Filter
 
 		virtual void hashMatch( const ScenePlug *scene, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		virtual unsigned computeMatch( const ScenePlug *scene, const Gaffer::Context *context ) const;
+		/// Implemented to combine the batched results of each
+		/// of the input filters.
+		virtual void computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const;
 
 		static size_t g_firstPlugIndex;
 
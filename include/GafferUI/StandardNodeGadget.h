@@ -100,6 +100,14 @@ class StandardNodeGadget : public NodeGadget
 		void setLabelsVisibleOnHover( bool labelsVisible );
 		bool getLabelsVisibleOnHover() const;
 
+		/// An overlay may be drawn over the node as a translucent wash
+		/// of colour, with a short text label beneath. This is used by
+		/// the NodeGraph to display performance statistics. A colour with
+		/// zero alpha and an empty label disable the overlay.
+		void setOverlay( const Imath::Color4f &color, const std::string &label = "" );
+		const Imath::Color4f &getOverlayColor() const;
+		const std::string &getOverlayLabel() const;
+
 		virtual Imath::Box3f bound() const;
 
 	protected :
@@ -157,6 +165,8 @@ class StandardNodeGadget : public NodeGadget
 		// closest compatible child nodule - m_dragDestinationProxy.
 		Nodule *m_dragDestinationProxy;
 		boost::optional<Imath::Color3f> m_userColor;
+		Imath::Color4f m_overlayColor;
+		std::string m_overlayLabel;
 
 };
 
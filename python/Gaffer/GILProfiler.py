@@ -0,0 +1,69 @@
+##########################################################################
+#
+#  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+from _Gaffer import _GILProfiler
+
+## Records the time spent waiting for and holding the Python GIL
+# by the methods of nodes implemented in Python, for the duration
+# of the with block. Statistics are available afterwards, keyed
+# by ( nodeFullName, methodName ) tuples.
+#
+# with Gaffer.GILProfiler() as profiler :
+#	node["out"].getValue()
+#
+# for ( node, method ), s in profiler.statistics().items() :
+#	print node, method, s["calls"], s["acquisitionTime"], s["holdTime"]
+class GILProfiler( object ) :
+
+	def __init__( self ) :
+
+		self.__statistics = {}
+
+	def __enter__( self ) :
+
+		_GILProfiler.clear()
+		_GILProfiler.setEnabled( True )
+
+		return self
+
+	def __exit__( self, type, value, traceBack ) :
+
+		_GILProfiler.setEnabled( False )
+		self.__statistics = _GILProfiler.statistics()
+
+	def statistics( self ) :
+
+		return self.__statistics
@@ -55,6 +55,9 @@ class SequencePath( Gaffer.Path ) :
 		# we use the seed for creating base paths whenever we need them
 		self.__basePathSeed = path
 		self.__minSequenceSize = minSequenceSize
+		# cache of the base paths for the current value of the path,
+		# as they're needed for every property query.
+		self.__basePathsCache = ( None, None )
 
 	def isValid( self ) :
 
@@ -128,9 +131,14 @@ class SequencePath( Gaffer.Path ) :
 
 		sequences = IECore.findSequences( leafPathStrings, self.__minSequenceSize )
 
+		# The base paths for our children are copied from one of the children
+		# of our own base path, rather than from our seed, so that they share
+		# the directory listing the children were made from.
 		result = []
 		for path in sequences + nonLeafPaths :
-			result.append( SequencePath( self.__basePath( str( path ) ), minSequenceSize=self.__minSequenceSize, filter = self.getFilter() ) )
+			basePath = children[0].copy()
+			basePath.setFromString( str( path ) )
+			result.append( SequencePath( basePath, minSequenceSize=self.__minSequenceSize, filter = self.getFilter() ) )
 
 		return result
 
@@ -152,6 +160,10 @@ class SequencePath( Gaffer.Path ) :
 
 	def __basePaths( self ) :
 
+		s = str( self )
+		if self.__basePathsCache[0] == s :
+			return self.__basePathsCache[1]
+
 		sequence = None
 		with IECore.IgnoredExceptions( Exception ) :
 			sequence = IECore.FileSequence( str( self ) )
@@ -163,6 +175,8 @@ class SequencePath( Gaffer.Path ) :
 		else :
 			result.append( self.__basePath( self ) )
 
+		self.__basePathsCache = ( s, result )
+
 		return result
 
 	def __isSequence( self ) :
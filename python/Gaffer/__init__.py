@@ -42,6 +42,8 @@ from WeakMethod import WeakMethod
 from BlockedConnection import BlockedConnection
 from FileNamePathFilter import FileNamePathFilter
 from UndoContext import UndoContext
+from DirtyPropagationScope import DirtyPropagationScope
+from GILProfiler import GILProfiler
 from Context import Context
 from InfoPathFilter import InfoPathFilter
 from LazyModule import lazyImport, LazyModule
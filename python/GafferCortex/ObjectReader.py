@@ -37,6 +37,10 @@
 
 from __future__ import with_statement
 
+import os
+import threading
+import collections
+
 import IECore
 
 import Gaffer
@@ -45,6 +49,10 @@ import Gaffer
 # single Object scenes using IECore.Reader internally.
 class ObjectReader( Gaffer.ComputeNode ) :
 
+	staticAffects = {
+		"fileName" : ( "out", ),
+	}
+
 	def __init__( self, name="ObjectReader" ) :
 
 		Gaffer.ComputeNode.__init__( self, name )
@@ -52,28 +60,103 @@ class ObjectReader( Gaffer.ComputeNode ) :
 		self.addChild( Gaffer.StringPlug( "fileName", Gaffer.Plug.Direction.In ) )
 		self.addChild( Gaffer.ObjectPlug( "out", Gaffer.Plug.Direction.Out, IECore.NullObject.defaultNullObject() ) )
 
-	def affects( self, input ) :
-
-		outputs = []
-		if input.isSame( self["fileName"] ) :
-			outputs.append( self["out"] )
-
-		return outputs
-
 	def hash( self, output, context, h ) :
 
 		assert( output.isSame( self["out"] ) )
 
 		self["fileName"].hash( h )
 
+		# we include the size and modification time of the file,
+		# so that files which are rewritten in place are reloaded.
+		fileStat = self.__stat( self["fileName"].getValue() )
+		if fileStat is not None :
+			h.append( fileStat[0] )
+			h.append( fileStat[1] )
+
 	def compute( self, plug, context ) :
 
 		assert( plug.isSame( self["out"] ) )
 
+		fileName = self["fileName"].getValue()
+		fileStat = self.__stat( fileName )
+
+		o = None
+		if fileStat is not None :
+			o = _objectCache.get( fileName, fileStat[0], fileStat[1] )
+
+		if o is not None :
+			# the object is shared with the cache and with any other
+			# ObjectReaders reading the same file, so we avoid copying.
+			plug.setValue( o, _copy = False )
+		else :
+			plug.setValue( plug.defaultValue() )
+
+	@staticmethod
+	def __stat( fileName ) :
+
+		try :
+			s = os.stat( fileName )
+		except OSError :
+			return None
+
+		return ( int( s.st_size ), float( s.st_mtime ) )
+
+IECore.registerRunTimeTyped( ObjectReader, typeName = "GafferCortex::ObjectReader" )
+
+# Process-wide cache of decoded objects, shared by all ObjectReaders
+# and keyed by file name, size and modification time, so that several
+# nodes reading the same file share a single copy. Least recently used
+# objects are evicted once their total memory usage exceeds the limit.
+#
+# We don't hold the lock while reading, because the reader may release
+# the GIL and we must not block other threads which need it. Concurrent
+# reads of the same file are therefore possible, but only one result is
+# retained.
+class _ObjectCache( object ) :
+
+	def __init__( self, maxCost ) :
+
+		self.__maxCost = maxCost
+		self.__cost = 0
+		self.__objects = collections.OrderedDict()
+		self.__lock = threading.Lock()
+
+	def get( self, fileName, size, modificationTime ) :
+
+		key = ( fileName, size, modificationTime )
+		with self.__lock :
+			entry = self.__objects.pop( key, None )
+			if entry is not None :
+				# reinsert to mark as most recently used
+				self.__objects[key] = entry
+				return entry[0]
+
 		reader = None
 		with IECore.IgnoredExceptions( RuntimeError ) :
-			reader = IECore.Reader.create( self["fileName"].getValue() )
+			reader = IECore.Reader.create( fileName )
 
-		plug.setValue( reader.read() if reader else plug.defaultValue() )
+		if reader is None :
+			return None
 
-IECore.registerRunTimeTyped( ObjectReader, typeName = "GafferCortex::ObjectReader" )
+		o = reader.read()
+		cost = o.memoryUsage()
+
+		with self.__lock :
+			entry = self.__objects.pop( key, None )
+			if entry is None :
+				entry = ( o, cost )
+				self.__cost += cost
+			self.__objects[key] = entry
+			while self.__cost > self.__maxCost and len( self.__objects ) > 1 :
+				evictedKey, evictedEntry = self.__objects.popitem( last = False )
+				self.__cost -= evictedEntry[1]
+
+		return entry[0]
+
+	def clear( self ) :
+
+		with self.__lock :
+			self.__objects.clear()
+			self.__cost = 0
+
+_objectCache = _ObjectCache( int( os.environ.get( "GAFFERCORTEX_OBJECTREADER_CACHE_MEMORY", 500 ) ) * 1024 * 1024 )
@@ -46,6 +46,8 @@ import GafferCortex
 
 class ObjectReaderTest( GafferTest.TestCase ) :
 
+	__cobFileName = "/tmp/objectReaderTest.cob"
+
 	def test( self ) :
 
 		fileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferTest/images/checker.exr" )
@@ -93,5 +95,51 @@ class ObjectReaderTest( GafferTest.TestCase ) :
 		r = GafferCortex.ObjectReader()
 		self.assertEqual( r["out"].getValue(), r["out"].defaultValue() )
 
+	def testRewrittenFileIsReloaded( self ) :
+
+		IECore.ObjectWriter( IECore.IntData( 1 ), self.__cobFileName ).write()
+
+		node = GafferCortex.ObjectReader()
+		node["fileName"].setValue( self.__cobFileName )
+		self.assertEqual( node["out"].getValue(), IECore.IntData( 1 ) )
+		h = node["out"].hash()
+
+		# make sure the modification time changes as well as the contents
+		IECore.ObjectWriter( IECore.StringData( "two" ), self.__cobFileName ).write()
+		os.utime( self.__cobFileName, ( os.stat( self.__cobFileName ).st_atime, os.stat( self.__cobFileName ).st_mtime + 10 ) )
+
+		self.assertNotEqual( node["out"].hash(), h )
+		self.assertEqual( node["out"].getValue(), IECore.StringData( "two" ) )
+
+	def testReadersShareDecodedObjects( self ) :
+
+		fileName = os.path.expandvars( "$GAFFER_ROOT/python/GafferTest/cobs/pSphereShape1.cob" )
+
+		node1 = GafferCortex.ObjectReader()
+		node1["fileName"].setValue( fileName )
+
+		node2 = GafferCortex.ObjectReader()
+		node2["fileName"].setValue( fileName )
+
+		# disable the compute cache, so that we know the sharing
+		# is coming from the ObjectReader itself.
+		originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		try :
+			o1 = node1["out"].getValue( _copy = False )
+			o2 = node2["out"].getValue( _copy = False )
+		finally :
+			Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
+
+		self.assertEqual( o1, IECore.Reader.create( fileName ).read() )
+		self.assertTrue( o1.isSame( o2 ) )
+
+	def tearDown( self ) :
+
+		GafferTest.TestCase.tearDown( self )
+
+		if os.path.exists( self.__cobFileName ) :
+			os.remove( self.__cobFileName )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -36,6 +36,7 @@
 ##########################################################################
 
 import unittest
+import threading
 
 import IECore
 
@@ -135,5 +136,38 @@ class OpHolderTest( GafferTest.TestCase ) :
 		self.assertEqual( IECore.RunTimeTyped.typeNameFromTypeId( n.typeId() ), "GafferCortex::OpHolder" )
 		self.assertEqual( IECore.RunTimeTyped.baseTypeId( n.typeId() ), GafferCortex.ParameterisedHolderComputeNode.staticTypeId() )
 
+	def testConcurrentCompute( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = GafferCortex.OpHolder()
+		opSpec = GafferCortexTest.ParameterisedHolderTest.classSpecification( "primitive/renameVariables", "IECORE_OP_PATHS" )[:-1]
+		s["n"].setOp( *opSpec )
+
+		s["n"]["parameters"]["input"].setValue( IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ) ) )
+
+		s["e"] = Gaffer.Expression()
+		s["e"]["expression"].setValue( 'parent["n"]["parameters"]["names"] = __import__( "IECore" ).StringVectorData( [ "P renamed%d" % context.getFrame() ] )' )
+
+		results = {}
+		def compute( frame ) :
+
+			with Gaffer.Context() as c :
+				c.setFrame( frame )
+				results[frame] = s["n"]["result"].getValue()
+
+		threads = []
+		for i in range( 0, 20 ) :
+			t = threading.Thread( target = compute, args = ( i, ) )
+			t.start()
+			threads.append( t )
+
+		for t in threads :
+			t.join()
+
+		for i in range( 0, 20 ) :
+			self.assertTrue( "renamed%d" % i in results[i] )
+			self.assertTrue( "P" not in results[i] )
+
 if __name__ == "__main__":
 	unittest.main()
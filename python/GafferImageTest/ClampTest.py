@@ -39,6 +39,7 @@ import unittest
 import IECore
 import Gaffer
 import GafferImage
+import GafferImageTest
 import GafferTest
 import os
 
@@ -151,5 +152,53 @@ class ClampTest( unittest.TestCase ) :
 		self.assertEqual( clamp.correspondingInput( clamp["enabled"] ), None )
 		self.assertEqual( clamp.correspondingInput( clamp["min"] ), None )
 
+	def testKnownValues( self ) :
+
+		c = GafferImage.Constant()
+		c["color"].setValue( IECore.Color4f( 0.3, 0.6, 0.2, 0.7 ) )
+
+		clamp = GafferImage.Clamp()
+		clamp["in"].setInput( c["out"] )
+		clamp["min"].setValue( IECore.Color4f( 0.3 ) )
+		clamp["max"].setValue( IECore.Color4f( 0.6 ) )
+		clamp["minClampTo"].setValue( IECore.Color4f( 0 ) )
+		clamp["maxClampTo"].setValue( IECore.Color4f( 1 ) )
+
+		def assertChannelValues( values ) :
+
+			for channelName, value in zip( "RGBA", values ) :
+				data = clamp["out"].channelData( channelName, IECore.V2i( 0 ) )
+				self.assertEqual( len( data ), GafferImage.ImagePlug.tileSize() ** 2 )
+				for v in data :
+					self.assertAlmostEqual( v, value, 6 )
+
+		# Values exactly at the minimum and maximum are not clamped.
+		assertChannelValues( ( 0.3, 0.6, 0.3, 0.6 ) )
+
+		clamp["minClampToEnabled"].setValue( True )
+		clamp["maxClampToEnabled"].setValue( True )
+		assertChannelValues( ( 0.3, 0.6, 0, 1 ) )
+
+		clamp["minEnabled"].setValue( False )
+		assertChannelValues( ( 0.3, 0.6, 0.2, 1 ) )
+
+		clamp["minEnabled"].setValue( True )
+		clamp["maxEnabled"].setValue( False )
+		assertChannelValues( ( 0.3, 0.6, 0, 0.7 ) )
+
+	def testPerformance( self ) :
+
+		constant = GafferImageTest.tilePerformanceImage()
+
+		clamp = GafferImage.Clamp()
+		clamp["in"].setInput( constant["out"] )
+		clamp["min"].setValue( IECore.Color4f( 0.3 ) )
+		clamp["max"].setValue( IECore.Color4f( 0.6 ) )
+
+		numTiles = GafferImageTest.measureTilePerformance( clamp["out"], "ClampTest.testPerformance" )
+
+		self.assertTrue( numTiles > 0 )
+
+
 if __name__ == "__main__":
 	unittest.main()
@@ -124,6 +124,94 @@ class DisplayTest( unittest.TestCase ) :
 
 		driver.imageClose()
 
+	def testUnwrittenTilesKeepHashes( self ) :
+
+		node = GafferImage.Display()
+		node["port"].setValue( 2500 )
+
+		displayWindow = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 255 ) )
+		driver = self.__createDriver( displayWindow, [ "Y" ] )
+
+		tileSize = GafferImage.ImagePlug.tileSize()
+		format = GafferImage.Format( displayWindow, 1 )
+		for i, bucketWindow in enumerate( [
+			IECore.Box2i( IECore.V2i( 0, tileSize ), IECore.V2i( tileSize - 1, 2 * tileSize - 1 ) ),
+			IECore.Box2i( IECore.V2i( tileSize, 2 * tileSize ), IECore.V2i( 2 * tileSize - 1, 3 * tileSize - 1 ) ),
+		] ) :
+
+			h1 = self.__tileHashes( node, "Y" )
+			t1 = self.__tiles( node, "Y" )
+
+			bucketData = IECore.FloatVectorData()
+			bucketData.resize( tileSize * tileSize, i + 1 )
+			driver.imageData( bucketWindow, bucketData )
+			self.__dataReceivedSemaphore.acquire()
+
+			h2 = self.__tileHashes( node, "Y" )
+			t2 = self.__tiles( node, "Y" )
+
+			bucketWindowYUp = format.yDownToFormatSpace( bucketWindow )
+			self.__assertTilesChangedInRegion( h1, h2, bucketWindowYUp )
+			self.__assertTilesChangedInRegion( t1, t2, bucketWindowYUp )
+
+			tileOrigin = GafferImage.ImagePlug.tileOrigin( bucketWindowYUp.min )
+			self.assertEqual( node["out"].channelData( "Y", tileOrigin )[0], bucketData[0] )
+
+		# Writing the same tile twice in succession, without the data
+		# being requested in between, updates the tile in place. It
+		# must still get a new hash each time.
+
+		h1 = self.__tileHashes( node, "Y" )
+		for value in ( 10, 11 ) :
+			bucketData = IECore.FloatVectorData()
+			bucketData.resize( tileSize * tileSize, value )
+			driver.imageData( bucketWindow, bucketData )
+			self.__dataReceivedSemaphore.acquire()
+
+		h2 = self.__tileHashes( node, "Y" )
+		self.__assertTilesChangedInRegion( h1, h2, bucketWindowYUp )
+		self.assertEqual( node["out"].channelData( "Y", tileOrigin ), IECore.FloatVectorData( [ 11 ] * tileSize * tileSize ) )
+
+		driver.imageClose()
+
+	def testCachedTilesAreNotModified( self ) :
+
+		node = GafferImage.Display()
+		node["port"].setValue( 2500 )
+
+		displayWindow = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 255 ) )
+		driver = self.__createDriver( displayWindow, [ "Y" ] )
+
+		tileSize = GafferImage.ImagePlug.tileSize()
+		bucketWindow = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( tileSize - 1 ) )
+		tileOrigin = GafferImage.ImagePlug.tileOrigin( GafferImage.Format( displayWindow, 1 ).yDownToFormatSpace( bucketWindow ).min )
+
+		bucketData = IECore.FloatVectorData()
+		bucketData.resize( tileSize * tileSize, 1 )
+		driver.imageData( bucketWindow, bucketData )
+		self.__dataReceivedSemaphore.acquire()
+
+		# Get the tile without copying it, so we hold the very
+		# same object as is stored in the cache.
+		with Gaffer.Context() as c :
+			c["image:channelName"] = "Y"
+			c["image:tileOrigin"] = tileOrigin
+			cachedTile = node["out"]["channelData"].getValue( _copy = False )
+
+		self.assertEqual( cachedTile, IECore.FloatVectorData( [ 1 ] * tileSize * tileSize ) )
+
+		bucketData = IECore.FloatVectorData()
+		bucketData.resize( tileSize * tileSize, 2 )
+		driver.imageData( bucketWindow, bucketData )
+		self.__dataReceivedSemaphore.acquire()
+
+		# The new data must have been written to a copy,
+		# leaving the cached tile untouched.
+		self.assertEqual( cachedTile, IECore.FloatVectorData( [ 1 ] * tileSize * tileSize ) )
+		self.assertEqual( node["out"].channelData( "Y", tileOrigin ), IECore.FloatVectorData( [ 2 ] * tileSize * tileSize ) )
+
+		driver.imageClose()
+
 	def testTransferChecker( self ) :
 
 		self.__testTransferImage( "$GAFFER_ROOT/python/GafferTest/images/checker.exr" )
@@ -196,6 +284,19 @@ class DisplayTest( unittest.TestCase ) :
 
 		return node
 
+	def __createDriver( self, displayWindow, channelNames ) :
+
+		return IECore.ClientDisplayDriver(
+			displayWindow,
+			displayWindow,
+			channelNames,
+			{
+				"displayHost" : "localHost",
+				"displayPort" : "2500",
+				"remoteDisplayType" : "GafferImage::GafferDisplayDriver",
+			}
+		)
+
 	def __tiles( self, node, channelName ) :
 
 		dataWindow = node["out"]["dataWindow"].getValue()
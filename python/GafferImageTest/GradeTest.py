@@ -41,6 +41,7 @@ import IECore
 
 import Gaffer
 import GafferImage
+import GafferImageTest
 
 class GradeTest( unittest.TestCase ) :
 
@@ -145,3 +146,60 @@ class GradeTest( unittest.TestCase ) :
 						s["c"]["out"]["channelData"].getValue( _copy=False )
 					)
 				)
+
+	def testKnownValues( self ) :
+
+		c = GafferImage.Constant()
+		c["color"].setValue( IECore.Color4f( -0.5, 0.25, 0.75, 1 ) )
+
+		g = GafferImage.Grade()
+		g["in"].setInput( c["out"] )
+		g["gain"].setValue( IECore.Color3f( 2 ) )
+		g["gamma"].setValue( IECore.Color3f( 2, 0, 2 ) )
+		g["blackClamp"].setValue( False )
+		g["whiteClamp"].setValue( False )
+
+		def assertChannelValue( channelName, value ) :
+
+			data = g["out"].channelData( channelName, IECore.V2i( 0 ) )
+			self.assertEqual( len( data ), GafferImage.ImagePlug.tileSize() ** 2 )
+			for v in data :
+				self.assertAlmostEqual( v, value, 6 )
+
+		# Negative values are graded, but not raised to the gamma
+		# and left unclamped. A gamma of 0 leaves the channel unchanged,
+		# and values above 1 are left unclamped.
+		assertChannelValue( "R", -1 )
+		assertChannelValue( "G", 0.25 )
+		assertChannelValue( "B", 1.5 ** 0.5 )
+		assertChannelValue( "A", 1 )
+
+		g["blackClamp"].setValue( True )
+		assertChannelValue( "R", 0 )
+		assertChannelValue( "B", 1.5 ** 0.5 )
+
+		g["whiteClamp"].setValue( True )
+		assertChannelValue( "R", 0 )
+		assertChannelValue( "G", 0.25 )
+		assertChannelValue( "B", 1 )
+
+		g["gamma"].setValue( IECore.Color3f( 1 ) )
+		g["blackClamp"].setValue( False )
+		g["whiteClamp"].setValue( False )
+		assertChannelValue( "R", -1 )
+		assertChannelValue( "G", 0.5 )
+		assertChannelValue( "B", 1.5 )
+
+	def testPerformance( self ) :
+
+		constant = GafferImageTest.tilePerformanceImage()
+
+		grade = GafferImage.Grade()
+		grade["in"].setInput( constant["out"] )
+		grade["gain"].setValue( IECore.Color3f( 2 ) )
+		grade["gamma"].setValue( IECore.Color3f( 1.5 ) )
+		grade["whiteClamp"].setValue( True )
+
+		numTiles = GafferImageTest.measureTilePerformance( grade["out"], "GradeTest.testPerformance" )
+
+		self.assertTrue( numTiles > 0 )
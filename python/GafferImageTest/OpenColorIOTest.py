@@ -43,6 +43,7 @@ import IECore
 import Gaffer
 import GafferTest
 import GafferImage
+import GafferImageTest
 
 class OpenColorIOTest( unittest.TestCase ) :
 
@@ -130,5 +131,19 @@ class OpenColorIOTest( unittest.TestCase ) :
 			o["out"].channelData( "G", IECore.V2i( 0 ) )
 		)
 
+	def testPerformance( self ) :
+
+		constant = GafferImageTest.tilePerformanceImage()
+
+		o = GafferImage.OpenColorIO()
+		o["in"].setInput( constant["out"] )
+		o["inputSpace"].setValue( "linear" )
+		o["outputSpace"].setValue( "sRGB" )
+
+		numTiles = GafferImageTest.measureTilePerformance( o["out"], "OpenColorIOTest.testPerformance" )
+
+		self.assertTrue( numTiles > 0 )
+
+
 if __name__ == "__main__":
 	unittest.main()
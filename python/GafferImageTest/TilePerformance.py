@@ -0,0 +1,64 @@
+##########################################################################
+#
+#  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import IECore
+
+import GafferTest
+import GafferImage
+import GafferImageTest
+
+## Returns a Constant node producing a large image, suitable
+# for use as the input to a performance test.
+def tilePerformanceImage() :
+
+	constant = GafferImage.Constant()
+	constant["format"].setValue( GafferImage.Format( 2048, 2048, 1. ) )
+	constant["color"].setValue( IECore.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+	return constant
+
+## Computes every tile of the image with the cache disabled, reporting
+# the number of tiles processed per second as an info message. Returns
+# the number of tiles processed.
+def measureTilePerformance( imagePlug, name ) :
+
+	with GafferTest.UncachedPerformanceScope( name ) as scope :
+		numTiles = GafferImageTest.processTiles( imagePlug )
+
+	if scope.elapsed() > 0 :
+		IECore.msg( IECore.Msg.Level.Info, name, "%.1f tiles/second" % ( numTiles / scope.elapsed() ) )
+
+	return numTiles
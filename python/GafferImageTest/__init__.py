@@ -37,6 +37,8 @@
 
 from _GafferImageTest import *
 
+from TilePerformance import tilePerformanceImage, measureTilePerformance
+
 from ImagePlugTest import ImagePlugTest
 from ImageReaderTest import ImageReaderTest
 from OpenColorIOTest import OpenColorIOTest
@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import time
 import threading
 
 import IECore
@@ -61,6 +62,15 @@ Gaffer.Metadata.registerNode(
 	same port as is specified on the Display node.
 	""",
 
+	# The minimum interval, in seconds, between updates
+	# of the node's output while data is being received.
+	# Buckets received within the interval are coalesced
+	# into a single update, so the cost of dirty propagation
+	# and recomputation is not paid for every bucket. This
+	# may be changed per-node, or globally by registering a
+	# different value in a startup file.
+	"updateInterval", 0.1,
+
 	plugs = {
 
 		"port" : [
@@ -85,13 +95,17 @@ Gaffer.Metadata.registerNode(
 
 ## Here we're taking signals the Display node emits when it has new data, and using them
 # to trigger a plugDirtiedSignal on the main ui thread. This is necessary because the Display
-# receives data on a background thread, where we can't do ui stuff.
+# receives data on a background thread, where we can't do ui stuff. Updates are coalesced
+# so that at most one is pending for each plug, and so that they are made no more frequently
+# than the node's "updateInterval" metadata specifies.
 
 __plugsPendingUpdate = []
 __plugsPendingUpdateLock = threading.Lock()
+__lastUpdateTimes = {}
 
 def __scheduleUpdate( plug, force = False ) :
 
+	delay = 0
 	if not force :
 		global __plugsPendingUpdate
 		global __plugsPendingUpdateLock
@@ -102,13 +116,24 @@ def __scheduleUpdate( plug, force = False ) :
 
 			__plugsPendingUpdate.append( plug )
 
-	GafferUI.EventLoop.executeOnUIThread( lambda : __update( plug ) )
+			node = plug.node()
+			interval = Gaffer.Metadata.nodeValue( node, "updateInterval" ) if node is not None else None
+			if interval :
+				lastUpdateTime = __lastUpdateTimes.get( plug.fullName(), 0 )
+				delay = max( 0, lastUpdateTime + interval - time.time() )
+
+	if delay :
+		timer = threading.Timer( delay, GafferUI.EventLoop.executeOnUIThread, args = [ lambda : __update( plug ) ] )
+		timer.daemon = True
+		timer.start()
+	else :
+		GafferUI.EventLoop.executeOnUIThread( lambda : __update( plug ) )
 
 def __update( plug ) :
-	
+
 	# it's possible that this function can get called on a plug whose node has
 	# been deleted, so we always check if the node exists:
-	
+
 	node = plug.node()
 	if node:
 		updateCountPlug = node["__updateCount"]
@@ -118,6 +143,7 @@ def __update( plug ) :
 	global __plugsPendingUpdateLock
 	with __plugsPendingUpdateLock :
 		__plugsPendingUpdate = [ p for p in __plugsPendingUpdate if not p.isSame( plug ) ]
+		__lastUpdateTimes[plug.fullName()] = time.time()
 
 __displayDataReceivedConnection = GafferImage.Display.dataReceivedSignal().connect( __scheduleUpdate )
 __displayImageReceivedConnection = GafferImage.Display.imageReceivedSignal().connect( IECore.curry( __scheduleUpdate, force = True ) )
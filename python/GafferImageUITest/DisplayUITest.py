@@ -0,0 +1,118 @@
+##########################################################################
+#
+#  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import time
+import threading
+import unittest
+
+import IECore
+
+import Gaffer
+import GafferUITest
+import GafferImage
+import GafferImageUI
+
+class DisplayUITest( GafferUITest.TestCase ) :
+
+	def setUp( self ) :
+
+		GafferUITest.TestCase.setUp( self )
+
+		self.__dataReceivedSemaphore = threading.Semaphore( 0 )
+		self.__dataReceivedConnection = GafferImage.Display.dataReceivedSignal().connect( Gaffer.WeakMethod( self.__dataReceived ) )
+
+	def __dataReceived( self, plug ) :
+
+		self.__dataReceivedSemaphore.release()
+
+	def testUpdatesAreMerged( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["d"] = GafferImage.Display()
+		s["d"]["port"].setValue( 2500 )
+		Gaffer.Metadata.registerNodeValue( s["d"], "updateInterval", 0.5 )
+
+		displayWindow = IECore.Box2i( IECore.V2i( 0 ), IECore.V2i( 255 ) )
+		driver = IECore.ClientDisplayDriver(
+			displayWindow,
+			displayWindow,
+			[ "Y" ],
+			{
+				"displayHost" : "localHost",
+				"displayPort" : "2500",
+				"remoteDisplayType" : "GafferImage::GafferDisplayDriver",
+			}
+		)
+
+		tileSize = GafferImage.ImagePlug.tileSize()
+		bucketData = IECore.FloatVectorData()
+		bucketData.resize( tileSize * tileSize, 1 )
+
+		def sendBucket( i ) :
+
+			origin = IECore.V2i( ( i % 4 ) * tileSize, ( i / 4 ) * tileSize )
+			driver.imageData( IECore.Box2i( origin, origin + IECore.V2i( tileSize - 1 ) ), bucketData )
+			self.__dataReceivedSemaphore.acquire()
+
+		# Wait for the first bucket to be displayed.
+
+		sendBucket( 0 )
+		self.__waitFor( lambda : s["d"]["__updateCount"].getValue() == 1, 5 )
+		self.assertEqual( s["d"]["__updateCount"].getValue(), 1 )
+
+		# Subsequent buckets arriving within the update interval
+		# are merged into a single update at the end of it.
+
+		for i in range( 1, 8 ) :
+			sendBucket( i )
+
+		self.waitForIdle( 100 )
+		self.assertEqual( s["d"]["__updateCount"].getValue(), 1 )
+
+		self.__waitFor( lambda : False, 1 )
+		self.assertEqual( s["d"]["__updateCount"].getValue(), 2 )
+
+		driver.imageClose()
+		self.__waitFor( lambda : s["d"]["__updateCount"].getValue() == 3, 5 )
+
+	def __waitFor( self, condition, timeout ) :
+
+		endTime = time.time() + timeout
+		while not condition() and time.time() < endTime :
+			self.waitForIdle()
+
+if __name__ == "__main__":
+	unittest.main()
@@ -87,6 +87,32 @@ class ImageViewTest( GafferUITest.TestCase ) :
 
 		view._update()
 
+	def testPerformance( self ) :
+
+		# Measures the time taken to compute everything the ImageView
+		# would draw for a large image, with the cache disabled so that
+		# everything is computed. This includes the preprocessing applied
+		# by the view (clamp, grade and display transform) and the stats
+		# for a region of interest. No GL context is needed.
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 2048, 2048, 1. ) )
+		constant["color"].setValue( IECore.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+		view = GafferUI.View.create( constant["out"] )
+		view["clipping"].setValue( True )
+		view["exposure"].setValue( 1 )
+		view["gamma"].setValue( 2 )
+
+		imageStats = view._getPreprocessor()["__imageStats"]
+		imageStats["regionOfInterest"].setValue( IECore.Box2i( IECore.V2i( 512 ), IECore.V2i( 1535 ) ) )
+
+		with GafferTest.UncachedPerformanceScope( "ImageViewTest.testPerformance" ) :
+			view._update()
+			average = imageStats["average"].getValue()
+
+		self.assertTrue( average[0] > 0 )
+
 if __name__ == "__main__":
 	unittest.main()
 
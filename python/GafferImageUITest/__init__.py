@@ -37,6 +37,7 @@
 from FormatPlugValueWidgetTest import FormatPlugValueWidgetTest
 from ImageViewTest import ImageViewTest
 from DocumentationTest import DocumentationTest
+from DisplayUITest import DisplayUITest
 
 if __name__ == "__main__":
 	unittest.main()
@@ -35,6 +35,7 @@
 ##########################################################################
 
 import os
+import unittest
 
 import IECore
 
@@ -194,5 +195,51 @@ class OSLImageTest( GafferOSLTest.OSLTestCase ) :
 		self.assertEqual( outputImage["G"].data, inputImage["G"].data )
 		self.assertEqual( outputImage["B"].data, inputImage["B"].data )
 
+	@unittest.skipIf( GafferOSL.oslLibraryVersionCode() < 10600, "OSL doesn't support querying needed attributes" )
+	def testOnlyUsedChannelsAffectShading( self ) :
+
+		getRed = GafferOSL.OSLShader()
+		getRed.loadShader( "ImageProcessing/InChannel" )
+		getRed["parameters"]["channelName"].setValue( "R" )
+
+		outRed = GafferOSL.OSLShader()
+		outRed.loadShader( "ImageProcessing/OutChannel" )
+		outRed["parameters"]["channelName"].setValue( "R" )
+		outRed["parameters"]["channelValue"].setInput( getRed["out"]["channelValue"] )
+
+		imageShader = GafferOSL.OSLShader()
+		imageShader.loadShader( "ImageProcessing/OutImage" )
+		imageShader["parameters"]["in0"].setInput( outRed["out"]["channel"] )
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setValue( os.path.expandvars( "$GAFFER_ROOT/python/GafferTest/images/rgb.100x100.exr" ) )
+
+		grade = GafferImage.Grade()
+		grade["in"].setInput( reader["out"] )
+
+		image = GafferOSL.OSLImage()
+		image["in"].setInput( grade["out"] )
+		image["shader"].setInput( imageShader["out"] )
+
+		redHash = image["out"].channelDataHash( "R", IECore.V2i( 0 ) )
+
+		# the shader only reads the red channel, so changes to
+		# the green channel should not affect the shading.
+
+		grade["gain"].setValue( IECore.Color3f( 1, 2, 1 ) )
+		self.assertEqual( image["out"].channelDataHash( "R", IECore.V2i( 0 ) ), redHash )
+
+		# but changes to the red channel should.
+
+		grade["gain"].setValue( IECore.Color3f( 2, 2, 1 ) )
+		self.assertNotEqual( image["out"].channelDataHash( "R", IECore.V2i( 0 ) ), redHash )
+
+		inputImage = grade["out"].image()
+		outputImage = image["out"].image()
+
+		self.assertEqual( outputImage["R"].data, inputImage["R"].data )
+		self.assertEqual( outputImage["G"].data, inputImage["G"].data )
+		self.assertEqual( outputImage["B"].data, inputImage["B"].data )
+
 if __name__ == "__main__":
 	unittest.main()
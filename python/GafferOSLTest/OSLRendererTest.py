@@ -147,6 +147,33 @@ class OSLRendererTest( GafferOSLTest.OSLTestCase ) :
 			for i, c in enumerate( p["Ci"] ) :
 				self.assertEqual( c, rp["colorUserData"][i] )
 
+	def testShadeManyPoints( self ) :
+
+		# enough points to be shaded in several parallel ranges
+
+		attribute = self.compileShader( os.path.dirname( __file__ ) + "/shaders/attribute.osl" )
+		debug = self.compileShader( os.path.dirname( __file__ ) + "/shaders/multipleDebugClosures.osl" )
+
+		rp = self.rectanglePoints( divisions = IECore.V2i( 200 ) )
+
+		r = GafferOSL.OSLRenderer()
+		with IECore.WorldBlock( r ) :
+
+			r.shader( "surface", attribute, { "name" : "colorUserData" } )
+			p = r.shadingEngine().shade( rp )
+
+			self.assertEqual( len( p["Ci"] ), len( rp["P"] ) )
+			for i, c in enumerate( p["Ci"] ) :
+				self.assertEqual( c, rp["colorUserData"][i] )
+
+			r.shader( "surface", debug, {} )
+			p = r.shadingEngine().shade( rp )
+
+			for n in ( "u", "v", "P" ) :
+				self.assertEqual( len( p[n] ), len( rp["P"] ) )
+				for i in range( 0, len( p[n] ) ) :
+					self.assertEqual( p[n][i], IECore.Color3f( rp[n][i] ) )
+
 	def testStructs( self ) :
 
 		shader = self.compileShader( os.path.dirname( __file__ ) + "/shaders/structs.osl" )
@@ -40,6 +40,9 @@ __import__( "GafferImage" )
 
 from _GafferScene import *
 
+## \deprecated PathMatcher now lives in the Gaffer module.
+from Gaffer import PathMatcher
+
 from ScriptProcedural import ScriptProcedural
 from AlembicPath import AlembicPath
 
@@ -125,7 +125,7 @@ class CameraTest( GafferSceneTest.SceneTestCase ) :
 
 		c = GafferScene.Camera()
 
-		cameraSet = c["out"]["globals"].getValue()["gaffer:sets"]["__cameras"]
+		cameraSet = c["out"].set( "__cameras" )
 		self.assertEqual(
 			cameraSet,
 			GafferScene.PathMatcherData(
@@ -135,7 +135,7 @@ class CameraTest( GafferSceneTest.SceneTestCase ) :
 
 		c["name"].setValue( "renderCam" )
 
-		cameraSet = c["out"]["globals"].getValue()["gaffer:sets"]["__cameras"]
+		cameraSet = c["out"].set( "__cameras" )
 		self.assertEqual(
 			cameraSet,
 			GafferScene.PathMatcherData(
@@ -154,7 +154,7 @@ class CameraTest( GafferSceneTest.SceneTestCase ) :
 		dirtied = GafferTest.CapturingSlot( c.plugDirtiedSignal() )
 		c["name"].setValue( "renderCam" )
 		self.failUnless( c["out"]["childNames"] in [ p[0] for p in dirtied ] )
-		self.failUnless( c["out"]["globals"] in [ p[0] for p in dirtied ] )
+		self.failUnless( c["out"]["set"] in [ p[0] for p in dirtied ] )
 
 		dirtied = GafferTest.CapturingSlot( c.plugDirtiedSignal() )
 		c["projection"].setValue( "orthographic" )
@@ -55,9 +55,8 @@ class CoordinateSystemTest( GafferSceneTest.SceneTestCase ) :
 		o = c["out"].object( "/coordinateSystem" )
 		self.assertTrue( isinstance( o, IECore.CoordinateSystem ) )
 
-		g = c["out"]["globals"].getValue()
-		s = g["gaffer:sets"]["__coordinateSystems"]
-		self.assertEqual( s.value.paths(), [ "/coordinateSystem" ] )
+		self.assertEqual( c["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__coordinateSystems" ] ) )
+		self.assertEqual( c["out"].set( "__coordinateSystems" ).value.paths(), [ "/coordinateSystem" ] )
 
 	def testDirtyPropagation( self ) :
 
@@ -70,7 +69,7 @@ class CoordinateSystemTest( GafferSceneTest.SceneTestCase ) :
 		dirtied = GafferTest.CapturingSlot( c.plugDirtiedSignal() )
 		c["name"].setValue( "yupyup" )
 		self.failUnless( c["out"]["childNames"] in [ p[0] for p in dirtied ] )
-		self.failUnless( c["out"]["globals"] in [ p[0] for p in dirtied ] )
+		self.failUnless( c["out"]["set"] in [ p[0] for p in dirtied ] )
 
 if __name__ == "__main__":
 	unittest.main()
@@ -556,7 +556,7 @@ class GroupTest( GafferSceneTest.SceneTestCase ) :
 		g["in"].setInput( l1["out"] )
 		g["in1"].setInput( l2["out"] )
 
-		lightSet = g["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = g["out"].set( "__lights" )
 		self.assertEqual(
 			set( lightSet.value.paths() ),
 			set( [
@@ -570,7 +570,7 @@ class GroupTest( GafferSceneTest.SceneTestCase ) :
 		g2 = GafferScene.Group()
 		g2["in"].setInput( g["out"] )
 
-		lightSet = g2["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = g2["out"].set( "__lights" )
 		self.assertEqual(
 			set( lightSet.value.paths() ),
 			set( [
@@ -617,13 +617,13 @@ class GroupTest( GafferSceneTest.SceneTestCase ) :
 		lg2["name"].setValue( "lightGroup2" )
 		lg2["in"].setInput( l["out"] )
 
-		self.assertNotEqual( lg1["out"]["globals"].hash(), lg2["out"]["globals"].hash() )
+		self.assertNotEqual( lg1["out"].setHash( "__lights" ), lg2["out"].setHash( "__lights" ) )
 
 		g = GafferScene.Group()
 		g["in"].setInput( lg1["out"] )
 		g["in1"].setInput( lg2["out"] )
 
-		lightSet = g["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = g["out"].set( "__lights" )
 		self.assertEqual(
 			set( lightSet.value.paths() ),
 			set( [
@@ -695,18 +695,20 @@ class GroupTest( GafferSceneTest.SceneTestCase ) :
 		g["in"].setInput( s1["out"] )
 		g["in1"].setInput( s2["out"] )
 
-		sets = g["out"]["globals"].getValue()["gaffer:sets"]
+		self.assertEqual( g["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "s1", "s2" ] ) )
 
 		self.assertEqual(
-			sets,
-			IECore.CompoundData( {
-				"s1" : GafferScene.PathMatcherData(
-					GafferScene.PathMatcher( [ "/group/plane" ] )
-				),
-				"s2" : GafferScene.PathMatcherData(
-					GafferScene.PathMatcher( [ "/group/plane1" ] )
-				),
-			} )
+			g["out"].set( "s1" ),
+			GafferScene.PathMatcherData(
+				GafferScene.PathMatcher( [ "/group/plane" ] )
+			)
+		)
+
+		self.assertEqual(
+			g["out"].set( "s2" ),
+			GafferScene.PathMatcherData(
+				GafferScene.PathMatcher( [ "/group/plane1" ] )
+			)
 		)
 
 	def testNextInPlug( self ) :
@@ -355,5 +355,221 @@ class InstancerTest( GafferSceneTest.SceneTestCase ) :
 			script["instancer"]["out"].childNamesHash( "/plane" )
 			c.setFrame( 307 )
 
+	def testBoundWithIdDependentPrototype( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["plane"] = GafferScene.Plane()
+		script["plane"]["divisions"].setValue( IECore.V2i( 2 ) )
+
+		script["sphere"] = GafferScene.Sphere()
+
+		script["instancer"] = GafferScene.Instancer()
+		script["instancer"]["in"].setInput( script["plane"]["out"] )
+		script["instancer"]["instance"].setInput( script["sphere"]["out"] )
+		script["instancer"]["parent"].setValue( "/plane" )
+
+		def assertBoundIsUnionOfInstanceBounds() :
+
+			instancesBound = IECore.Box3f()
+			for name in script["instancer"]["out"].childNames( "/plane/instances" ) :
+				path = "/plane/instances/" + str( name )
+				instancesBound.extendBy(
+					script["instancer"]["out"].bound( path ).transform( script["instancer"]["out"].transform( path ) )
+				)
+
+			self.assertEqual( script["instancer"]["out"].bound( "/plane/instances" ), instancesBound )
+
+		# All instances share the same bound.
+
+		assertBoundIsUnionOfInstanceBounds()
+		h1 = script["instancer"]["out"].boundHash( "/plane/instances" )
+
+		script["sphere"]["radius"].setValue( 2 )
+		assertBoundIsUnionOfInstanceBounds()
+		h2 = script["instancer"]["out"].boundHash( "/plane/instances" )
+		self.assertNotEqual( h1, h2 )
+
+		# Each instance has a different bound.
+
+		script["expression"] = Gaffer.Expression()
+		script["expression"]["engine"].setValue( "python" )
+		script["expression"]["expression"].setValue( "parent['sphere']['radius'] = 1 + context['instancer:id']" )
+
+		assertBoundIsUnionOfInstanceBounds()
+		self.assertNotEqual( script["instancer"]["out"].boundHash( "/plane/instances" ), h1 )
+		self.assertNotEqual( script["instancer"]["out"].boundHash( "/plane/instances" ), h2 )
+
+		# Only some instances have a different bound.
+
+		script["expression"]["expression"].setValue( "parent['sphere']['radius'] = 2 if context['instancer:id'] > 1 else 1" )
+
+		assertBoundIsUnionOfInstanceBounds()
+		self.assertEqual( script["instancer"]["out"].bound( "/plane/instances/8" ), IECore.Box3f( IECore.V3f( -2 ), IECore.V3f( 2 ) ) )
+
+	def testOrientationAndScale( self ) :
+
+		seeds = IECore.PointsPrimitive(
+			IECore.V3fVectorData(
+				[ IECore.V3f( 1, 0, 0 ), IECore.V3f( 0, 1, 0 ), IECore.V3f( 0, 0, 1 ) ]
+			)
+		)
+		seeds["orientation"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.Vertex,
+			IECore.QuatfVectorData( [
+				IECore.Quatf(),
+				IECore.Quatf( 0.5, IECore.V3f( 0.5, 0.5, 0.5 ) ),
+				IECore.Quatf( 0, IECore.V3f( 1, 0, 0 ) ),
+			] )
+		)
+		seeds["scale"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ IECore.V3f( 1 ), IECore.V3f( 2, 3, 4 ), IECore.V3f( 0.5 ) ] )
+		)
+		seeds["uniformScale"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 2, 3 ] )
+		)
+
+		seedsInput = GafferSceneTest.CompoundObjectSource()
+		seedsInput["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( seeds.bound() ),
+				"children" : {
+					"seeds" : {
+						"bound" : IECore.Box3fData( seeds.bound() ),
+						"object" : seeds,
+					},
+				},
+			}, )
+		)
+
+		sphere = GafferScene.Sphere()
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( seedsInput["out"] )
+		instancer["instance"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/seeds" )
+
+		def assertTransforms( orientation, scale ) :
+
+			instancesBound = IECore.Box3f()
+			for i in range( 0, 3 ) :
+
+				m = IECore.M44f()
+				if orientation :
+					m = seeds["orientation"].data[i].toMatrix44()
+				if scale == "scale" :
+					m = IECore.M44f.createScaled( seeds["scale"].data[i] ) * m
+				elif scale == "uniformScale" :
+					m = IECore.M44f.createScaled( IECore.V3f( seeds["uniformScale"].data[i] ) ) * m
+				m = m * IECore.M44f.createTranslated( seeds["P"].data[i] )
+
+				instancePath = "/seeds/instances/%d" % i
+				self.assertTrue( instancer["out"].transform( instancePath ).equalWithAbsError( m, 0.000001 ) )
+				instancesBound.extendBy( instancer["out"].bound( instancePath ).transform( m ) )
+
+			bound = instancer["out"].bound( "/seeds/instances" )
+			self.assertTrue( bound.min.equalWithAbsError( instancesBound.min, 0.00001 ) )
+			self.assertTrue( bound.max.equalWithAbsError( instancesBound.max, 0.00001 ) )
+
+		assertTransforms( False, "" )
+
+		instancer["orientation"].setValue( "orientation" )
+		assertTransforms( True, "" )
+
+		instancer["scale"].setValue( "scale" )
+		assertTransforms( True, "scale" )
+
+		instancer["scale"].setValue( "uniformScale" )
+		assertTransforms( True, "uniformScale" )
+
+		instancer["orientation"].setValue( "" )
+		assertTransforms( False, "uniformScale" )
+
+		instancer["scale"].setValue( "orientation" )
+		self.assertRaises( RuntimeError, instancer["out"].transform, "/seeds/instances/0" )
+
+		instancer["scale"].setValue( "doesNotExist" )
+		self.assertRaises( RuntimeError, instancer["out"].transform, "/seeds/instances/0" )
+
+	def testPrototypeIndex( self ) :
+
+		seeds = IECore.PointsPrimitive(
+			IECore.V3fVectorData(
+				[ IECore.V3f( 1, 0, 0 ), IECore.V3f( 0, 1, 0 ), IECore.V3f( 0, 0, 1 ), IECore.V3f( 1, 1, 1 ) ]
+			)
+		)
+		seeds["index"] = IECore.PrimitiveVariable(
+			IECore.PrimitiveVariable.Interpolation.Vertex,
+			IECore.IntVectorData( [ 0, 1, 2, -1 ] )
+		)
+
+		seedsInput = GafferSceneTest.CompoundObjectSource()
+		seedsInput["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( seeds.bound() ),
+				"children" : {
+					"seeds" : {
+						"bound" : IECore.Box3fData( seeds.bound() ),
+						"object" : seeds,
+					},
+				},
+			}, )
+		)
+
+		sphere = GafferScene.Sphere()
+		cube = GafferScene.Cube()
+		cube["transform"]["translate"].setValue( IECore.V3f( 0, 10, 0 ) )
+		plane = GafferScene.Plane()
+
+		prototypes = GafferScene.Group()
+		prototypes["in"].setInput( sphere["out"] )
+		prototypes["in1"].setInput( cube["out"] )
+		prototypes["in2"].setInput( plane["out"] )
+
+		subTree = GafferScene.SubTree()
+		subTree["in"].setInput( prototypes["out"] )
+		subTree["root"].setValue( "/group" )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( seedsInput["out"] )
+		instancer["instance"].setInput( subTree["out"] )
+		instancer["parent"].setValue( "/seeds" )
+
+		# Without a prototype index, each instance gets the whole scene.
+
+		for i in range( 0, 4 ) :
+			self.assertEqual(
+				instancer["out"].childNames( "/seeds/instances/%d" % i ),
+				IECore.InternedStringVectorData( [ "sphere", "cube", "plane" ] )
+			)
+
+		# With a prototype index, each instance is one of the children
+		# of the root.
+
+		instancer["prototypeIndex"].setValue( "index" )
+
+		expected = [ "sphere", "cube", "plane", "plane" ]
+		instancesBound = IECore.Box3f()
+		for i in range( 0, 4 ) :
+
+			instancePath = "/seeds/instances/%d" % i
+			prototypePath = "/" + expected[i]
+
+			self.assertEqual( instancer["out"].object( instancePath ), subTree["out"].object( prototypePath ) )
+			self.assertEqual( instancer["out"].bound( instancePath ), subTree["out"].bound( prototypePath ) )
+			self.assertEqual( instancer["out"].childNames( instancePath ), subTree["out"].childNames( prototypePath ) )
+			self.assertEqual(
+				instancer["out"].transform( instancePath ),
+				subTree["out"].transform( prototypePath ) * IECore.M44f.createTranslated( seeds["P"].data[i] )
+			)
+
+			instancesBound.extendBy( instancer["out"].bound( instancePath ).transform( instancer["out"].transform( instancePath ) ) )
+
+		self.assertEqual( instancer["out"].bound( "/seeds/instances" ), instancesBound )
+
+		self.assertSceneValid( instancer["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
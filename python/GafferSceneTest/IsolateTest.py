@@ -212,27 +212,27 @@ class IsolateTest( GafferSceneTest.SceneTestCase ) :
 		group["in"].setInput( light1["out"] )
 		group["in1"].setInput( light2["out"] )
 
-		lightSet = group["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = group["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 		isolate = GafferScene.Isolate()
 		isolate["in"].setInput( group["out"] )
 
-		lightSet = isolate["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = isolate["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 		filter = GafferScene.PathFilter()
 		isolate["filter"].setInput( filter["out"] )
 
-		lightSet = isolate["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = isolate["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [] ) )
 
 		filter["paths"].setValue( IECore.StringVectorData( [ "/group/light" ] ) )
-		lightSet = isolate["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = isolate["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light" ] ) )
 
 		filter["paths"].setValue( IECore.StringVectorData( [ "/group/light*" ] ) )
-		lightSet = isolate["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = isolate["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 	def testGlobalsDoNotDependOnScenePath( self ) :
@@ -257,6 +257,81 @@ class IsolateTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( h1, h2 )
 		self.assertEqual( h2, h3 )
 
+	def testSetsDoNotDependOnScenePath( self ) :
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/grid/borderLines" ] ) )
+
+		grid = GafferScene.Grid()
+
+		isolate = GafferScene.Isolate()
+		isolate["in"].setInput( grid["out"] )
+		isolate["filter"].setInput( pathFilter["out"] )
+
+		c = Gaffer.Context()
+		c["scene:setName"] = IECore.InternedStringData( "test" )
+		with c :
+			h1 = isolate["out"]["set"].hash()
+			c["scene:path"] = IECore.InternedStringVectorData( [ "grid" ] )
+			h2 = isolate["out"]["set"].hash()
+			c["scene:path"] = IECore.InternedStringVectorData( [ "grid", "centerLines" ] )
+			h3 = isolate["out"]["set"].hash()
+
+		self.assertEqual( h1, h2 )
+		self.assertEqual( h2, h3 )
+
+	def testIsolateManyChildren( self ) :
+
+		sphere = IECore.SpherePrimitive()
+		children = {}
+		for i in range( 0, 1000 ) :
+			children["child%d" % i] = {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"object" : sphere,
+			}
+
+		input = GafferSceneTest.CompoundObjectSource()
+		input["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"children" : {
+					"group" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"children" : children,
+					},
+				},
+			} ),
+		)
+
+		s = GafferScene.Set()
+		s["in"].setInput( input["out"] )
+		s["name"].setValue( "test" )
+		s["paths"].setValue( IECore.StringVectorData( [ "/group/child5", "/group/child500" ] ) )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/group/child1*" ] ) )
+
+		setFilter = GafferScene.SetFilter()
+		setFilter["set"].setValue( "test" )
+
+		unionFilter = GafferScene.UnionFilter()
+		unionFilter["in"][0].setInput( pathFilter["out"] )
+		unionFilter["in"][1].setInput( setFilter["out"] )
+
+		inputChildNames = [ str( n ) for n in input["out"].childNames( "/group" ) ]
+		matchingChildNames = set( [ n for n in inputChildNames if n.startswith( "child1" ) or n in ( "child5", "child500" ) ] )
+
+		isolate = GafferScene.Isolate()
+		isolate["in"].setInput( s["out"] )
+
+		for filter, expected in [
+			( pathFilter, [ n for n in inputChildNames if n.startswith( "child1" ) ] ),
+			( setFilter, [ n for n in inputChildNames if n in ( "child5", "child500" ) ] ),
+			( unionFilter, [ n for n in inputChildNames if n in matchingChildNames ] ),
+		] :
+			isolate["filter"].setInput( filter["out"] )
+			self.assertEqual( [ str( n ) for n in isolate["out"].childNames( "/group" ) ], expected )
+
 	def testFrom( self ) :
 
 		# - group1
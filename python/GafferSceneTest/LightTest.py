@@ -61,7 +61,7 @@ class LightTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( l["out"].transform( "/light" ), IECore.M44f() )
 		self.assertEqual( l["out"].childNames( "/light" ), IECore.InternedStringVectorData() )
 
-		lightSet = l["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = l["out"].set( "__lights" )
 		self.assertEqual(
 			lightSet,
 			GafferScene.PathMatcherData(
@@ -77,7 +77,7 @@ class LightTest( GafferSceneTest.SceneTestCase ) :
 
 		self.assertSceneValid( g["out"] )
 
-		lightSet = g["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = g["out"].set( "__lights" )
 		self.assertEqual(
 			lightSet,
 			GafferScene.PathMatcherData(
@@ -100,10 +100,10 @@ class LightTest( GafferSceneTest.SceneTestCase ) :
 	def testDisabled( self ) :
 
 		l = GafferSceneTest.TestLight()
-		self.assertTrue( "gaffer:sets" in l["out"]["globals"].getValue() )
+		self.assertEqual( l["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
 		l["enabled"].setValue( False )
-		self.assertFalse( "gaffer:sets" in l["out"]["globals"].getValue() )
+		self.assertEqual( l["out"]["setNames"].getValue(), IECore.InternedStringVectorData() )
 
 if __name__ == "__main__":
 	unittest.main()
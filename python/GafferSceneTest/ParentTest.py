@@ -196,10 +196,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertSceneValid( p["out"] )
 		self.assertEqual( p["out"].childNames( "/" ), IECore.InternedStringVectorData( [ "light1", "light2" ] ) )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( set( sets["__lights"].value.paths() ), set( [ "/light1", "/light2" ] ) )
+		self.assertEqual( set( p["out"].set( "__lights" ).value.paths() ), set( [ "/light1", "/light2" ] ) )
 
 	def testSetsUniqueToChild( self ) :
 
@@ -214,10 +213,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertSceneValid( p["out"] )
 		self.assertEqual( p["out"].childNames( "/" ), IECore.InternedStringVectorData( [ "cube", "light" ] ) )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( sets["__lights"].value.paths(), [ "/light" ] )
+		self.assertEqual( p["out"].set( "__lights" ).value.paths(), [ "/light" ] )
 
 	def testSetsUniqueToParent( self ) :
 
@@ -232,10 +230,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertSceneValid( p["out"] )
 		self.assertEqual( p["out"].childNames( "/" ), IECore.InternedStringVectorData( [ "light", "cube" ] ) )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( sets["__lights"].value.paths(), [ "/light" ] )
+		self.assertEqual( p["out"].set( "__lights" ).value.paths(), [ "/light" ] )
 
 	def testSetsWithNonRootParent( self ) :
 
@@ -250,10 +247,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertSceneValid( p["out"] )
 		self.assertEqual( p["out"].childNames( "/cube" ), IECore.InternedStringVectorData( [ "light" ] ) )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( sets["__lights"].value.paths(), [ "/cube/light" ] )
+		self.assertEqual( p["out"].set( "__lights" ).value.paths(), [ "/cube/light" ] )
 
 	def testSetsWithDeepNesting( self ) :
 
@@ -272,10 +268,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 
 		self.assertSceneValid( p["out"] )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( sets["__lights"].value.paths(), [ "/cube/group/group/light" ] )
+		self.assertEqual( p["out"].set( "__lights" ).value.paths(), [ "/cube/group/group/light" ] )
 
 	def testSetsWithWithRenaming( self ) :
 
@@ -290,10 +285,9 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertSceneValid( p["out"] )
 		self.assertEqual( p["out"].childNames( "/" ), IECore.InternedStringVectorData( [ "light", "light1" ] ) )
 
-		sets = p["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [ "__lights" ] )
+		self.assertEqual( p["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "__lights" ] ) )
 
-		self.assertEqual( set( sets["__lights"].value.paths() ), set( [ "/light", "/light1" ] ) )
+		self.assertEqual( set( p["out"].set( "__lights" ).value.paths() ), set( [ "/light", "/light1" ] ) )
 
 if __name__ == "__main__":
 	unittest.main()
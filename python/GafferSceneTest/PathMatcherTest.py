@@ -299,6 +299,82 @@ class PathMatcherTest( unittest.TestCase ) :
 
 		self.assertEqual( m2.match( "/a" ), GafferScene.Filter.Result.ExactMatch )
 
+	def testCopyOnWrite( self ) :
+
+		m = GafferScene.PathMatcher( [ "/a/b", "/a/c", "/d/e", "/f/.../g" ] )
+		mPaths = sorted( m.paths() )
+
+		m2 = GafferScene.PathMatcher( m )
+		self.assertEqual( m2, m )
+
+		self.assertTrue( m2.addPath( "/a/b/x" ) )
+		self.assertTrue( m2.removePath( "/a/c" ) )
+		self.assertTrue( m2.removePath( "/f/.../g" ) )
+		self.assertTrue( m2.prune( "/d" ) )
+		self.assertEqual( sorted( m2.paths() ), [ "/a/b", "/a/b/x" ] )
+		self.assertEqual( sorted( m.paths() ), mPaths )
+
+		m3 = GafferScene.PathMatcher()
+		self.assertTrue( m3.addPaths( m ) )
+		self.assertEqual( m3, m )
+		self.assertTrue( m3.addPath( "/a/b/y" ) )
+		self.assertTrue( m3.removePaths( m ) )
+		self.assertEqual( m3.paths(), [ "/a/b/y" ] )
+		self.assertEqual( sorted( m.paths() ), mPaths )
+
+		m.clear()
+		self.assertEqual( sorted( m2.paths() ), [ "/a/b", "/a/b/x" ] )
+		self.assertEqual( m3.paths(), [ "/a/b/y" ] )
+
+	def testEditScaling( self ) :
+
+		# this test provides a useful means of measuring the performance of
+		# copying and editing large matchers. copies share their internal
+		# structure until they're modified, so should be cheap regardless of
+		# the size of the matcher, and edits should only pay for the branches
+		# they touch. uncomment the timers to get useful information printed out.
+
+		for name, paths in [
+			( "DEEP", self.generatePaths( seed = 10, depthRange = ( 3, 14 ), numChildrenRange = ( 2, 6 ) ) ),
+			( "SHALLOW", self.generatePaths( seed = 10, depthRange = ( 2, 2 ), numChildrenRange = ( 500, 1000 ) ) ),
+		] :
+
+			matcher = GafferScene.PathMatcher( paths )
+			editPaths = paths[::100]
+
+			t = IECore.Timer()
+			copies = [ GafferScene.PathMatcher( matcher ) for i in range( 0, 100 ) ]
+			#print "COPY " + name, t.stop()
+
+			t = IECore.Timer()
+			for path in editPaths :
+				copies[0].removePath( path )
+			#print "REMOVE " + name, t.stop()
+
+			t = IECore.Timer()
+			for path in editPaths :
+				newPath = path.copy()
+				newPath.append( "new" )
+				copies[1].addPath( newPath )
+			#print "ADD " + name, t.stop()
+
+			t = IECore.Timer()
+			copies[2].addPaths( copies[1] )
+			copies[3].removePaths( copies[1] )
+			#print "ADD/REMOVE PATHS " + name, t.stop()
+
+			t = IECore.Timer()
+			for path in editPaths :
+				self.assertFalse( copies[0].match( path ) & GafferScene.Filter.Result.ExactMatch )
+				self.assertTrue( copies[1].match( path ) & GafferScene.Filter.Result.ExactMatch )
+				self.assertTrue( copies[2].match( path ) & GafferScene.Filter.Result.ExactMatch )
+				self.assertFalse( copies[3].match( path ) & GafferScene.Filter.Result.ExactMatch )
+				self.assertTrue( matcher.match( path ) & GafferScene.Filter.Result.ExactMatch )
+			#print "MATCH " + name, t.stop()
+
+			self.assertTrue( copies[3].isEmpty() )
+			self.assertEqual( copies[4], matcher )
+
 	def testAddAndRemovePaths( self ) :
 
 		m = GafferScene.PathMatcher()
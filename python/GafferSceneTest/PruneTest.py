@@ -39,6 +39,7 @@ import unittest
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferScene
 import GafferSceneTest
 
@@ -157,6 +158,157 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 		filter["paths"].setValue( IECore.StringVectorData( [ "/groupA/sphereAA" ] ) )
 		self.assertEqual( prune["out"].childNames( "/groupA" ), IECore.InternedStringVectorData( [ "sphereAB" ] ) )
 
+	def testPruneManyChildren( self ) :
+
+		sphere = IECore.SpherePrimitive()
+		children = {}
+		for i in range( 0, 1000 ) :
+			children["child%d" % i] = {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"object" : sphere,
+			}
+
+		input = GafferSceneTest.CompoundObjectSource()
+		input["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"children" : {
+					"group" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"children" : children,
+					},
+				},
+			} ),
+		)
+
+		s = GafferScene.Set()
+		s["in"].setInput( input["out"] )
+		s["name"].setValue( "test" )
+		s["paths"].setValue( IECore.StringVectorData( [ "/group/child5", "/group/child500" ] ) )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/group/child1*" ] ) )
+
+		setFilter = GafferScene.SetFilter()
+		setFilter["set"].setValue( "test" )
+
+		unionFilter = GafferScene.UnionFilter()
+		unionFilter["in"][0].setInput( pathFilter["out"] )
+		unionFilter["in"][1].setInput( setFilter["out"] )
+
+		inputChildNames = [ str( n ) for n in input["out"].childNames( "/group" ) ]
+		matchingChildNames = set( [ n for n in inputChildNames if n.startswith( "child1" ) or n in ( "child5", "child500" ) ] )
+
+		prune = GafferScene.Prune()
+		prune["in"].setInput( s["out"] )
+
+		for filter, expected in [
+			( pathFilter, [ n for n in inputChildNames if not n.startswith( "child1" ) ] ),
+			( setFilter, [ n for n in inputChildNames if n not in ( "child5", "child500" ) ] ),
+			( unionFilter, [ n for n in inputChildNames if n not in matchingChildNames ] ),
+		] :
+			prune["filter"].setInput( filter["out"] )
+			self.assertEqual( [ str( n ) for n in prune["out"].childNames( "/group" ) ], expected )
+
+		unionFilter["enabled"].setValue( False )
+		self.assertEqual( prune["out"].childNames( "/group" ), input["out"].childNames( "/group" ) )
+
+	def testNonFilterSource( self ) :
+
+		sphere = IECore.SpherePrimitive()
+		children = {}
+		for i in range( 0, 10 ) :
+			children["child%d" % i] = {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"object" : sphere,
+			}
+
+		s = Gaffer.ScriptNode()
+		s["input"] = GafferSceneTest.CompoundObjectSource()
+		s["input"]["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"children" : {
+					"group" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"children" : children,
+					},
+				},
+			} ),
+		)
+
+		s["prune"] = GafferScene.Prune()
+		s["prune"]["in"].setInput( s["input"]["out"] )
+
+		# Drive the filter from an Expression rather than a Filter,
+		# so it must be evaluated separately for each child.
+
+		s["dot"] = Gaffer.Dot()
+		s["dot"].setup( s["prune"]["filter"] )
+		s["prune"]["filter"].setInput( s["dot"]["out"] )
+
+		s["e"] = Gaffer.Expression()
+		s["e"]["expression"].setValue(
+			'path = context.get( "scene:path", [] )\n'
+			'parent["dot"]["in"] = 2 if len( path ) == 2 and str( path[1] ) in ( "child1", "child3" ) else 0'
+		)
+
+		self.assertEqual(
+			[ str( n ) for n in s["prune"]["out"].childNames( "/group" ) ],
+			[ "child%d" % i for i in range( 0, 10 ) if i not in ( 1, 3 ) ]
+		)
+
+	def testCancellationDuringParallelFilterEvaluation( self ) :
+
+		sphere = IECore.SpherePrimitive()
+		children = {}
+		for i in range( 0, 1000 ) :
+			children["child%d" % i] = {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"object" : sphere,
+			}
+
+		s = Gaffer.ScriptNode()
+		s["input"] = GafferSceneTest.CompoundObjectSource()
+		s["input"]["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"children" : {
+					"group" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"children" : children,
+					},
+				},
+			} ),
+		)
+
+		s["prune"] = GafferScene.Prune()
+		s["prune"]["in"].setInput( s["input"]["out"] )
+
+		# Drive the filter from a node which cancels the computation
+		# while the children are being filtered in parallel.
+
+		s["add"] = GafferTest.CancellingAddNode()
+		s["add"]["op1"].setValue( 2 )
+		s["add"].canceller = Gaffer.Canceller()
+
+		s["dot"] = Gaffer.Dot()
+		s["dot"].setup( s["prune"]["filter"] )
+		s["prune"]["filter"].setInput( s["dot"]["out"] )
+		s["dot"]["in"].setInput( s["add"]["sum"] )
+
+		pruneErrors = GafferTest.CapturingSlot( s["prune"].errorSignal() )
+		addErrors = GafferTest.CapturingSlot( s["add"].errorSignal() )
+
+		with Gaffer.Context( s.context(), s["add"].canceller ) :
+			self.assertRaises( RuntimeError, s["prune"]["out"].childNames, "/group" )
+
+		self.assertEqual( len( pruneErrors ), 0 )
+		self.assertEqual( len( addErrors ), 0 )
+
+		s["add"].canceller = None
+		self.assertEqual( s["prune"]["out"].childNames( "/group" ), IECore.InternedStringVectorData() )
+
 	def testAdjustBounds( self ) :
 
 		sphere1 = IECore.SpherePrimitive()
@@ -209,27 +361,27 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 		group["in"].setInput( light1["out"] )
 		group["in1"].setInput( light2["out"] )
 
-		lightSet = group["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = group["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 		prune = GafferScene.Prune()
 		prune["in"].setInput( group["out"] )
 
-		lightSet = prune["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = prune["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 		filter = GafferScene.PathFilter()
 		prune["filter"].setInput( filter["out"] )
 
-		lightSet = prune["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = prune["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light", "/group/light1" ] ) )
 
 		filter["paths"].setValue( IECore.StringVectorData( [ "/group/light" ] ) )
-		lightSet = prune["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = prune["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/light1" ] ) )
 
 		filter["paths"].setValue( IECore.StringVectorData( [ "/group/light*" ] ) )
-		lightSet = prune["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = prune["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [] )
 
 	def testSetsWhenAncestorPruned( self ) :
@@ -247,7 +399,7 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 		topGroup["in"].setInput( group1["out"] )
 		topGroup["in1"].setInput( group2["out"] )
 
-		lightSet = topGroup["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = topGroup["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/group/light", "/group/group1/light" ] ) )
 
 		filter = GafferScene.PathFilter()
@@ -257,7 +409,7 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 		prune["in"].setInput( topGroup["out"] )
 		prune["filter"].setInput( filter["out"] )
 
-		lightSet = prune["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = prune["out"].set( "__lights" )
 		self.assertEqual( set( lightSet.value.paths() ), set( [ "/group/group1/light" ] ) )
 
 	def testFilterPromotion( self ) :
@@ -291,5 +443,28 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( h1, h2 )
 		self.assertEqual( h2, h3 )
 
+	def testSetsDoNotDependOnScenePath( self ) :
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/grid/borderLines" ] ) )
+
+		grid = GafferScene.Grid()
+
+		prune = GafferScene.Prune()
+		prune["in"].setInput( grid["out"] )
+		prune["filter"].setInput( pathFilter["out"] )
+
+		c = Gaffer.Context()
+		c["scene:setName"] = IECore.InternedStringData( "test" )
+		with c :
+			h1 = prune["out"]["set"].hash()
+			c["scene:path"] = IECore.InternedStringVectorData( [ "grid" ] )
+			h2 = prune["out"]["set"].hash()
+			c["scene:path"] = IECore.InternedStringVectorData( [ "grid", "centerLines" ] )
+			h3 = prune["out"]["set"].hash()
+
+		self.assertEqual( h1, h2 )
+		self.assertEqual( h2, h3 )
+
 if __name__ == "__main__":
 	unittest.main()
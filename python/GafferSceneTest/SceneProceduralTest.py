@@ -245,6 +245,70 @@ class SceneProceduralTest( unittest.TestCase ) :
 		
 		
 		
+	def testEagerExpansion( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["plane"] = GafferScene.Plane()
+		script["sphere"] = GafferScene.Sphere()
+
+		script["group"] = GafferScene.Group()
+		script["group"]["in"].setInput( script["plane"]["out"] )
+		script["group"]["in1"].setInput( script["sphere"]["out"] )
+
+		script["outerGroup"] = GafferScene.Group()
+		script["outerGroup"]["in"].setInput( script["group"]["out"] )
+		script["outerGroup"]["in1"].setInput( script["plane"]["out"] )
+
+		script["filter"] = GafferScene.PathFilter()
+		script["filter"]["paths"].setValue( IECore.StringVectorData( [ "/group/group/sphere" ] ) )
+
+		script["attributes"] = GafferScene.StandardAttributes()
+		script["attributes"]["in"].setInput( script["outerGroup"]["out"] )
+		script["attributes"]["filter"].setInput( script["filter"]["match"] )
+		script["attributes"]["attributes"]["visibility"]["enabled"].setValue( True )
+		script["attributes"]["attributes"]["visibility"]["value"].setValue( False )
+
+		script["options"] = GafferScene.StandardOptions()
+		script["options"]["in"].setInput( script["attributes"]["out"] )
+
+		def render() :
+
+			renderer = IECore.CapturingRenderer()
+			with IECore.WorldBlock( renderer ) :
+				procedural = GafferScene.SceneProcedural( script["options"]["out"], Gaffer.Context(), "/" )
+				self.__WrappingProcedural( procedural ).render( renderer )
+
+			names = set()
+			primitives = []
+			def walk( g ) :
+				if isinstance( g, IECore.Group ) :
+					name = g.getAttribute( "name" )
+					if name is not None :
+						names.add( name.value )
+					for c in g.children() :
+						walk( c )
+				elif isinstance( g, IECore.Primitive ) :
+					primitives.append( g )
+
+			walk( renderer.world() )
+			return names, primitives
+
+		deferredNames, deferredPrimitives = render()
+
+		script["options"]["options"]["eagerExpansion"]["enabled"].setValue( True )
+		script["options"]["options"]["eagerExpansion"]["value"].setValue( True )
+
+		eagerNames, eagerPrimitives = render()
+
+		self.assertEqual( eagerNames, deferredNames )
+		self.assertTrue( "/group/group/plane" in eagerNames )
+		self.assertTrue( "/group/plane" in eagerNames )
+		self.assertFalse( "/group/group/sphere" in eagerNames )
+
+		self.assertEqual( len( eagerPrimitives ), 2 )
+		self.assertEqual( eagerPrimitives, deferredPrimitives )
+
 
 if __name__ == "__main__":
 	unittest.main()
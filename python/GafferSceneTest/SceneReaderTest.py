@@ -178,6 +178,39 @@ class SceneReaderTest( GafferSceneTest.SceneTestCase ) :
 				mesh = scene.object( "/1/2" )
 				self.assertEqual( mesh["Cd"].data, IECore.V3fVectorData( [ IECore.V3f( time, 1, 0 ) ] * 6 ) )
 
+	def testCacheObjectSamples( self ) :
+
+		self.writeAnimatedSCC()
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setValue( self.__testFile )
+		reader["refreshCount"].setValue( self.uniqueInt( self.__testFile ) )
+
+		samplingReader = GafferScene.SceneReader()
+		samplingReader["fileName"].setValue( self.__testFile )
+		samplingReader["refreshCount"].setValue( reader["refreshCount"].getValue() )
+		samplingReader["cacheObjectSamples"].setValue( True )
+
+		context = Gaffer.Context()
+		for time in [ 0, 0.25, 0.5, 0.75, 1, 1.25, 3, 7.5, 10, 12 ] :
+			context.setFrame( time )
+			with context :
+				for path in [ "/1", "/1/2", "/1/2/3" ] :
+					self.assertEqual( samplingReader["out"].object( path ), reader["out"].object( path ) )
+
+		# times which map onto the same stored sample should
+		# share hashes, and therefore cache entries.
+
+		def objectHash( frame ) :
+			context.setFrame( frame )
+			with context :
+				return samplingReader["out"].objectHash( "/1/2" )
+
+		self.assertEqual( objectHash( 10 ), objectHash( 12 ) )
+		self.assertEqual( objectHash( -1 ), objectHash( 0 ) )
+		self.assertNotEqual( objectHash( 0 ), objectHash( 0.25 ) )
+		self.assertNotEqual( objectHash( 0.25 ), objectHash( 0.5 ) )
+
 	def testEnabled( self ) :
 
 		sc = IECore.SceneCache( self.__testFile, IECore.IndexedIO.OpenMode.Write )
@@ -436,36 +469,65 @@ class SceneReaderTest( GafferSceneTest.SceneTestCase ) :
 		s["fileName"].setValue( "/tmp/test.scc" )
 		s["refreshCount"].setValue( self.uniqueInt( "/tmp/test.scc" ) ) # account for our changing of file contents between tests
 
-		sets = s["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( sets.keys(), [] )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [] ) )
 
 		s["sets"].setValue( "chrome" )
-		sets = s["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( len( sets ), 1 )
-		self.assertEqual( sets.keys(), [ "chrome" ] )
-		self.assertEqual( sets["chrome"].value.paths(), [ "/sphereGroup" ] )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "chrome" ] ) )
+		self.assertEqual( s["out"].set( "chrome" ).value.paths(), [ "/sphereGroup" ] )
 
 		s["sets"].setValue( "wood" )
-		sets = s["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertEqual( len( sets ), 1 )
-		self.assertEqual( sets.keys(), [ "wood" ] )
-		self.assertEqual( sets["wood"].value.paths(), [ "/planeGroup/plane" ] )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "wood" ] ) )
+		self.assertEqual( s["out"].set( "wood" ).value.paths(), [ "/planeGroup/plane" ] )
 
 		s["sets"].setValue( "*e*" )
-		sets = s["out"]["globals"].getValue()["gaffer:sets"]
 		# we can't simply assert that we have only "something" and "chrome" because the pesky
 		# SceneCache inserts tags of its own behind our backs, and our wildcards might match them.
-		self.assertTrue( set( sets.keys() ).issuperset( set( [ "something", "chrome" ] ) ) )
-		self.assertTrue( "wood" not in sets )
-		self.assertEqual( sets["chrome"].value.paths(), [ "/sphereGroup" ] )
-		self.assertEqual( sets["something"].value.paths(), [ "/planeGroup/plane" ] )
+		self.assertTrue( set( [ str( n ) for n in s["out"]["setNames"].getValue() ] ).issuperset( set( [ "something", "chrome" ] ) ) )
+		self.assertTrue( "wood" not in [ str( n ) for n in s["out"]["setNames"].getValue() ] )
+		self.assertEqual( s["out"].set( "chrome" ).value.paths(), [ "/sphereGroup" ] )
+		self.assertEqual( s["out"].set( "something" ).value.paths(), [ "/planeGroup/plane" ] )
 
 		s["sets"].setValue( "wood *e*" )
-		sets = s["out"]["globals"].getValue()["gaffer:sets"]
-		self.assertTrue( set( sets.keys() ).issuperset( set( [ "wood", "something", "chrome" ] ) ) )
-		self.assertEqual( sets["chrome"].value.paths(), [ "/sphereGroup" ] )
-		self.assertEqual( sets["wood"].value.paths(), [ "/planeGroup/plane" ] )
-		self.assertEqual( sets["something"].value.paths(), [ "/planeGroup/plane" ] )
+		self.assertTrue( set( [ str( n ) for n in s["out"]["setNames"].getValue() ] ).issuperset( set( [ "wood", "something", "chrome" ] ) ) )
+		self.assertEqual( s["out"].set( "chrome" ).value.paths(), [ "/sphereGroup" ] )
+		self.assertEqual( s["out"].set( "wood" ).value.paths(), [ "/planeGroup/plane" ] )
+		self.assertEqual( s["out"].set( "something" ).value.paths(), [ "/planeGroup/plane" ] )
+
+	def testTagsAndSetsTogether( self ) :
+
+		s = IECore.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+
+		sphereGroup = s.createChild( "sphereGroup" )
+		sphereGroup.writeTags( [ "chrome" ] )
+		sphere = sphereGroup.createChild( "sphere" )
+		sphere.writeObject( IECore.SpherePrimitive(), 0 )
+
+		planeGroup = s.createChild( "planeGroup" )
+		plane = planeGroup.createChild( "plane" )
+		plane.writeTags( [ "wood", "something" ] )
+		plane.writeObject( IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ) ), 0 )
+
+		del s, sphereGroup, sphere, planeGroup, plane
+
+		s = GafferScene.SceneReader()
+		s["fileName"].setValue( "/tmp/test.scc" )
+		s["refreshCount"].setValue( self.uniqueInt( "/tmp/test.scc" ) )
+		s["tags"].setValue( "wood" )
+		s["sets"].setValue( "chrome something" )
+
+		self.assertEqual( set( [ str( x ) for x in s["out"].childNames( "/" ) ] ), set( [ "planeGroup" ] ) )
+		self.assertEqual( set( [ str( x ) for x in s["out"].childNames( "/planeGroup" ) ] ), set( [ "plane" ] ) )
+		self.assertEqual( s["out"].set( "chrome" ).value.paths(), [ "/sphereGroup" ] )
+		self.assertEqual( s["out"].set( "something" ).value.paths(), [ "/planeGroup/plane" ] )
+		self.assertEqual( s["out"].set( "wood" ).value.paths(), [] )
+
+		s["tags"].setValue( "chrome" )
+		self.assertEqual( set( [ str( x ) for x in s["out"].childNames( "/" ) ] ), set( [ "sphereGroup" ] ) )
+		self.assertEqual( set( [ str( x ) for x in s["out"].childNames( "/sphereGroup" ) ] ), set( [ "sphere" ] ) )
+		self.assertEqual( s["out"].set( "chrome" ).value.paths(), [ "/sphereGroup" ] )
+
+		s["tags"].setValue( "iDontExist" )
+		self.assertEqual( s["out"].childNames( "/" ), IECore.InternedStringVectorData() )
 
 	def testInvalidFiles( self ) :
 
@@ -102,21 +102,18 @@ class SceneTestCase( GafferTest.TestCase ) :
 	## Checks that all paths referenced by sets do exist.
 	def assertSetsValid( self, scenePlug ) :
 
-		globals = scenePlug["globals"].getValue()
-		if "gaffer:sets" in globals :
-			for s in globals["gaffer:sets"].values() :
-				for path in s.value.paths() :
-					self.assertPathExists( scenePlug, path )
+		for setName in scenePlug["setNames"].getValue() :
+			s = scenePlug.set( setName )
+			for path in s.value.paths() :
+				self.assertPathExists( scenePlug, path )
 
 	## Checks that all lights, coordinate systems and cameras
 	# in the scene are in the appropriate built-in sets.
 	def assertBuiltInSetsComplete( self, scenePlug ) :
 
-		globals = scenePlug["globals"].getValue()
-		sets = globals.get( "gaffer:sets", {} )
-		lightSet = sets.get( "__lights", GafferScene.PathMatcherData() )
-		cameraSet = sets.get( "__cameras", GafferScene.PathMatcherData() )
-		coordinateSystemSet = sets.get( "__coordinateSystems", GafferScene.PathMatcherData() )
+		lightSet = scenePlug.set( "__lights" )
+		cameraSet = scenePlug.set( "__cameras" )
+		coordinateSystemSet = scenePlug.set( "__coordinateSystems" )
 
 		def walkScene( scenePath ) :
 
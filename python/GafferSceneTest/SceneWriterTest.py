@@ -145,6 +145,49 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 
 		testCacheFile( self.__testFile )
 
+	def testWriteLargeHierarchy( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["plane"] = GafferScene.Plane()
+		script["plane"]["divisions"].setValue( IECore.V2i( 10 ) )
+
+		script["sphere"] = GafferScene.Sphere()
+		script["group"] = GafferScene.Group()
+		script["group"]["in"].setInput( script["sphere"]["out"] )
+		script["group"]["in1"].setInput( script["sphere"]["out"] )
+
+		script["instancer"] = GafferScene.Instancer()
+		script["instancer"]["in"].setInput( script["plane"]["out"] )
+		script["instancer"]["instance"].setInput( script["group"]["out"] )
+		script["instancer"]["parent"].setValue( "/plane" )
+
+		script["writer"] = GafferScene.SceneWriter()
+		script["writer"]["in"].setInput( script["instancer"]["out"] )
+		script["writer"]["fileName"].setValue( self.__testFile )
+		script["writer"].execute()
+
+		script["reader"] = GafferScene.SceneReader()
+		script["reader"]["fileName"].setValue( self.__testFile )
+
+		def assertLocationsEqual( path ) :
+
+			self.assertEqual( script["reader"]["out"].childNames( path ), script["instancer"]["out"].childNames( path ) )
+			self.assertTrue(
+				script["reader"]["out"].transform( path ).equalWithAbsError(
+					script["instancer"]["out"].transform( path ), 0.000001
+				)
+			)
+			self.assertEqual(
+				isinstance( script["reader"]["out"].object( path ), IECore.NullObject ),
+				isinstance( script["instancer"]["out"].object( path ), IECore.NullObject )
+			)
+
+			for childName in script["instancer"]["out"].childNames( path ) :
+				assertLocationsEqual( path.rstrip( "/" ) + "/" + str( childName ) )
+
+		assertLocationsEqual( "/" )
+
 	def testHash( self ) :
 
 		c = Gaffer.Context()
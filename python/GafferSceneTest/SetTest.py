@@ -39,6 +39,7 @@ import unittest
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferScene
 import GafferSceneTest
 
@@ -51,24 +52,56 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s["in"].setInput( p["out"] )
 
 		s["paths"].setValue( IECore.StringVectorData( [ "/one", "/plane" ] ) )
-		g = s["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/one", "/plane" ] ) )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s["out"].set( "set" ).value.paths() ), set( [ "/one", "/plane" ] ) )
 
 		s["name"].setValue( "shinyThings" )
 
-		g = s["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "shinyThings" ] )
-		self.assertEqual( set( g["gaffer:sets"]["shinyThings"].value.paths() ), set( [ "/one", "/plane" ] ) )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "shinyThings" ] ) )
+		self.assertEqual( set( s["out"].set( "shinyThings" ).value.paths() ), set( [ "/one", "/plane" ] ) )
 
 		s["paths"].setValue( IECore.StringVectorData( [ "/two", "/sphere" ] ) )
 
-		g = s["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "shinyThings" ] )
-		self.assertEqual( set( g["gaffer:sets"]["shinyThings"].value.paths() ), set( [ "/two", "/sphere" ] ) )
+		self.assertEqual( s["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "shinyThings" ] ) )
+		self.assertEqual( set( s["out"].set( "shinyThings" ).value.paths() ), set( [ "/two", "/sphere" ] ) )
+
+	def testEditingOneSetDoesntAffectOthers( self ) :
+
+		p = GafferScene.Plane()
+
+		s1 = GafferScene.Set()
+		s1["in"].setInput( p["out"] )
+		s1["name"].setValue( "setOne" )
+		s1["paths"].setValue( IECore.StringVectorData( [ "/one" ] ) )
+
+		s2 = GafferScene.Set()
+		s2["in"].setInput( s1["out"] )
+		s2["name"].setValue( "setTwo" )
+		s2["paths"].setValue( IECore.StringVectorData( [ "/two" ] ) )
+
+		globalsHash = s2["out"]["globals"].hash()
+		setNamesHash = s2["out"]["setNames"].hash()
+		setOneHash = s2["out"].setHash( "setOne" )
+		setTwoHash = s2["out"].setHash( "setTwo" )
+
+		cs = GafferTest.CapturingSlot( s2.plugDirtiedSignal() )
+		s1["paths"].setValue( IECore.StringVectorData( [ "/one", "/three" ] ) )
+
+		# Plugs can't be dirtied per set, so the set plug is dirtied
+		# as a whole, but nothing else is.
+		dirtied = set( [ x[0].relativeName( s2 ) for x in cs ] )
+		self.assertTrue( "out.set" in dirtied )
+		self.assertFalse( "out.globals" in dirtied )
+		self.assertFalse( "out.setNames" in dirtied )
+
+		# And only the edited set gets a new hash.
+		self.assertEqual( s2["out"]["globals"].hash(), globalsHash )
+		self.assertEqual( s2["out"]["setNames"].hash(), setNamesHash )
+		self.assertNotEqual( s2["out"].setHash( "setOne" ), setOneHash )
+		self.assertEqual( s2["out"].setHash( "setTwo" ), setTwoHash )
+
+		self.assertEqual( set( s2["out"].set( "setOne" ).value.paths() ), set( [ "/one", "/three" ] ) )
+		self.assertEqual( s2["out"].set( "setTwo" ).value.paths(), [ "/two" ] )
 
 	def testInputNotModified( self ) :
 
@@ -81,20 +114,15 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s2["name"].setValue( "setTwo" )
 		s2["paths"].setValue( IECore.StringVectorData( [ "/two" ] ) )
 
-		g1 = s1["out"]["globals"].getValue( _copy = False )
-		self.assertEqual( g1.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g1["gaffer:sets"].keys(), [ "setOne" ] )
-		self.assertEqual( g1["gaffer:sets"]["setOne"].value.paths(), [ "/one" ] )
+		self.assertEqual( s1["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "setOne" ] ) )
+		self.assertEqual( s1["out"].set( "setOne" ).value.paths(), [ "/one" ] )
 
-		g2 = s2["out"]["globals"].getValue( _copy = False )
-		self.assertEqual( g2.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( set( g2["gaffer:sets"].keys() ), set( [ "setOne", "setTwo" ] ) )
-		self.assertEqual( g2["gaffer:sets"]["setOne"].value.paths(), [ "/one" ] )
-		self.assertEqual( g2["gaffer:sets"]["setTwo"].value.paths(), [ "/two" ] )
+		self.assertEqual( set( [ str( n ) for n in s2["out"]["setNames"].getValue() ] ), set( [ "setOne", "setTwo" ] ) )
+		self.assertEqual( s2["out"].set( "setOne" ).value.paths(), [ "/one" ] )
+		self.assertEqual( s2["out"].set( "setTwo" ).value.paths(), [ "/two" ] )
 
-		self.assertEqual( g1.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g1["gaffer:sets"].keys(), [ "setOne" ] )
-		self.assertEqual( g1["gaffer:sets"]["setOne"].value.paths(), [ "/one" ] )
+		self.assertEqual( s1["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "setOne" ] ) )
+		self.assertEqual( s1["out"].set( "setOne" ).value.paths(), [ "/one" ] )
 
 	def testOverwrite( self ) :
 
@@ -105,15 +133,11 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s2["paths"].setValue( IECore.StringVectorData( [ "/new"] ) )
 		s2["in"].setInput( s1["out"] )
 
-		g1 = s1["out"]["globals"].getValue()
-		self.assertEqual( g1.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g1["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g1["gaffer:sets"]["set"].value.paths() ), set( [ "/old" ] ) )
+		self.assertEqual( s1["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s1["out"].set( "set" ).value.paths() ), set( [ "/old" ] ) )
 
-		g2 = s2["out"]["globals"].getValue()
-		self.assertEqual( g2.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g2["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g2["gaffer:sets"]["set"].value.paths() ), set( [ "/new" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/new" ] ) )
 
 	def testAdd( self ) :
 
@@ -125,17 +149,13 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s2["mode"].setValue( s2.Mode.Add )
 		s2["in"].setInput( s1["out"] )
 
-		g = s2["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/old", "/new" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/old", "/new" ] ) )
 
 		s1["enabled"].setValue( False )
 
-		g = s2["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/new" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/new" ] ) )
 
 	def testRemove( self ) :
 
@@ -147,17 +167,13 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s2["mode"].setValue( s2.Mode.Remove )
 		s2["in"].setInput( s1["out"] )
 
-		g = s2["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/b" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/b" ] ) )
 
 		s2["enabled"].setValue( False )
 
-		g = s2["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/a", "/b" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/a", "/b" ] ) )
 
 	def testRemoveFromNonExistentSet( self ) :
 
@@ -172,10 +188,8 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		s2["mode"].setValue( s2.Mode.Remove )
 		s2["in"].setInput( s1["out"] )
 
-		g = s2["out"]["globals"].getValue()
-		self.assertEqual( g.keys(), [ "gaffer:sets" ] )
-		self.assertEqual( g["gaffer:sets"].keys(), [ "set" ] )
-		self.assertEqual( set( g["gaffer:sets"]["set"].value.paths() ), set( [ "/a", "/b" ] ) )
+		self.assertEqual( s2["out"]["setNames"].getValue(), IECore.InternedStringVectorData( [ "set" ] ) )
+		self.assertEqual( set( s2["out"].set( "set" ).value.paths() ), set( [ "/a", "/b" ] ) )
 
 if __name__ == "__main__":
 	unittest.main()
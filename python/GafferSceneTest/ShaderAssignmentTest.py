@@ -81,6 +81,32 @@ class ShaderAssignmentTest( unittest.TestCase ) :
 		self.assertNotEqual( a["out"].attributes( "/ball1" ), IECore.CompoundObject() )
 		self.assertEqual( a["out"].attributes( "/ball2" ), IECore.CompoundObject() )
 
+	def testStateSharedBetweenLocations( self ) :
+
+		plane = GafferScene.Plane()
+		sphere = GafferScene.Sphere()
+
+		group = GafferScene.Group()
+		group["in"].setInput( plane["out"] )
+		group["in1"].setInput( sphere["out"] )
+
+		s = GafferSceneTest.TestShader()
+		s["type"].setValue( "test:surface" )
+
+		f = GafferScene.PathFilter()
+		f["paths"].setValue( IECore.StringVectorData( [ "/group/plane", "/group/sphere" ] ) )
+
+		a = GafferScene.ShaderAssignment()
+		a["in"].setInput( group["out"] )
+		a["shader"].setInput( s["out"] )
+		a["filter"].setInput( f["out"] )
+
+		planeState = a["out"].attributes( "/group/plane", _copy = False )["test:surface"]
+		sphereState = a["out"].attributes( "/group/sphere", _copy = False )["test:surface"]
+
+		self.assertTrue( planeState.isSame( sphereState ) )
+		self.assertTrue( planeState.isSame( s.state( _copy = False ) ) )
+
 	def testFilterInputAcceptance( self ) :
 
 		a = GafferScene.ShaderAssignment()
@@ -113,5 +113,24 @@ class ShaderTest( unittest.TestCase ) :
 		self.assertEqual( state[0].type, "test:shader" )
 		self.assertEqual( state[1].type, "test:surface" )
 
+	def testStateIsCached( self ) :
+
+		surface = GafferSceneTest.TestShader( "surface" )
+		surface["type"].setValue( "test:surface" )
+		surface["parameters"]["t"] = Gaffer.Color3fPlug()
+
+		texture = GafferSceneTest.TestShader( "texture" )
+		surface["parameters"]["t"].setInput( texture["out"] )
+
+		self.assertTrue( surface.state( _copy = False ).isSame( surface.state( _copy = False ) ) )
+		self.assertEqual( surface.stateHash(), surface["__state"].hash() )
+
+		cs = GafferTest.CapturingSlot( surface.plugDirtiedSignal() )
+		texture["parameters"]["i"].setValue( 10 )
+		self.assertTrue( surface["__state"] in [ x[0] for x in cs ] )
+
+		state = surface.state()
+		self.assertEqual( state[0].parameters["i"], IECore.IntData( 10 ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -162,7 +162,7 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 		s["in"].setInput( g["out"] )
 		s["root"].setValue( "/group/lightGroup1" )
 
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/light" ] )
 
 		self.assertSetsValid( s["out"] )
@@ -171,7 +171,7 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 
 		s["includeRoot"].setValue( True )
 
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/lightGroup1/light" ] )
 
 		self.assertSetsValid( s["out"] )
@@ -185,12 +185,12 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 		s = GafferScene.SubTree()
 		s["in"].setInput( g["out"] )
 
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/group/light" ] )
 		self.assertSetsValid( s["out"] )
 
 		s["root"].setValue( "/" )
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/group/light" ] )
 		self.assertSetsValid( s["out"] )
 
@@ -199,12 +199,12 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 		s["includeRoot"].setValue( True )
 
 		s["root"].setValue( "" )
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/group/light" ] )
 		self.assertSetsValid( s["out"] )
 
 		s["root"].setValue( "/" )
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/group/light" ] )
 		self.assertSetsValid( s["out"] )
 
@@ -285,7 +285,7 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 		s["root"].setValue( "/group" )
 		s["includeRoot"].setValue( True )
 
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/group/light" ] )
 		self.assertSetsValid( s["out"] )
 
@@ -301,7 +301,7 @@ class SubTreeTest( GafferSceneTest.SceneTestCase ) :
 		s["in"].setInput( g["out"] )
 		s["root"].setValue( "group" )
 
-		lightSet = s["out"]["globals"].getValue()["gaffer:sets"]["__lights"]
+		lightSet = s["out"].set( "__lights" )
 		self.assertEqual( lightSet.value.paths(), [ "/light" ] )
 		self.assertSetsValid( s["out"] )
 
@@ -102,6 +102,50 @@ class UnionFilterTest( GafferSceneTest.SceneTestCase ) :
 		h4 = u["out"].hash()
 		self.assertNotEqual( h3, h4 )
 
+	def testPruneWithConnectedUnion( self ) :
+
+		sphere = IECore.SpherePrimitive()
+		input = GafferSceneTest.CompoundObjectSource()
+		input["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( sphere.bound() ),
+				"children" : {
+					"a" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"object" : sphere,
+					},
+					"b" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"object" : sphere,
+					},
+					"c" : {
+						"bound" : IECore.Box3fData( sphere.bound() ),
+						"object" : sphere,
+					},
+				},
+			} ),
+		)
+
+		f1 = GafferScene.PathFilter()
+		f1["paths"].setValue( IECore.StringVectorData( [ "/a" ] ) )
+
+		f2 = GafferScene.PathFilter()
+		f2["paths"].setValue( IECore.StringVectorData( [ "/c" ] ) )
+
+		u = GafferScene.UnionFilter()
+		u["in"][0].setInput( f1["out"] )
+		u["in"][1].setInput( f2["out"] )
+
+		# The ArrayPlug always keeps an unconnected input at the end.
+		self.assertEqual( len( u["in"] ), 3 )
+		self.assertTrue( u["in"][2].getInput() is None )
+
+		prune = GafferScene.Prune()
+		prune["in"].setInput( input["out"] )
+		prune["filter"].setInput( u["out"] )
+
+		self.assertEqual( prune["out"].childNames( "/" ), IECore.InternedStringVectorData( [ "b" ] ) )
+
 	def testDirtiedSignal( self ) :
 
 		u = GafferScene.UnionFilter( "u" )
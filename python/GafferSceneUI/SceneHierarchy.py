@@ -146,19 +146,16 @@ class SceneHierarchy( GafferUI.NodeSetEditor ) :
 
 		assert( pathListing is self.__pathListing )
 
-		paths = pathListing.getExpandedPaths()
-		paths = IECore.StringVectorData( [ "/" ] + [ str( path ) for path in paths ] )
-		pathMatcherData = GafferScene.PathMatcherData()
-		pathMatcherData.value.init( paths )
+		paths = pathListing.getExpansion()
+		paths.addPath( "/" )
 		with Gaffer.BlockedConnection( self._contextChangedConnection() ) :
-			self.getContext().set( "ui:scene:expandedPaths", pathMatcherData )
+			self.getContext().set( "ui:scene:expandedPaths", GafferScene.PathMatcherData( paths ) )
 
 	def __selectionChanged( self, pathListing ) :
 
 		assert( pathListing is self.__pathListing )
 
-		paths = pathListing.getSelectedPaths()
-		paths = IECore.StringVectorData( [ str( path ) for path in paths ] )
+		paths = IECore.StringVectorData( pathListing.getSelection().paths() )
 		with Gaffer.BlockedConnection( self._contextChangedConnection() ) :
 			self.getContext().set( "ui:scene:selectedPaths", paths )
 
@@ -168,26 +165,14 @@ class SceneHierarchy( GafferUI.NodeSetEditor ) :
 		if expandedPaths is None :
 			return
 
-		p = self.__pathListing.getPath()
-		expandedPaths = [ p.copy().setFromString( s ) for s in expandedPaths.value.paths() ]
 		with Gaffer.BlockedConnection( self.__expansionChangedConnection ) :
-			self.__pathListing.setExpandedPaths( expandedPaths )
+			self.__pathListing.setExpansion( expandedPaths.value )
 
 	def __transferSelectionFromContext( self ) :
 
 		selection = self.getContext()["ui:scene:selectedPaths"]
 		with Gaffer.BlockedConnection( self.__selectionChangedConnection ) :
-			## \todo Qt is dog slow with large non-contiguous selections,
-			# so we're only mirroring single selections currently. Rewrite
-			# PathListingWidget so it manages selection itself using a PathMatcher
-			# and we can refer to the same data structure everywhere, and reenable
-			# mirroring of multi-selection.
-			if len( selection ) == 1 :
-				p = self.__pathListing.getPath()
-				selection = [ p.copy().setFromString( s ) for s in selection ]
-				self.__pathListing.setSelectedPaths( selection, scrollToFirst=True, expandNonLeaf=False )
-			else :
-				self.__pathListing.setSelectedPaths( [] )
+			self.__pathListing.setSelection( Gaffer.PathMatcher( selection ), scrollToFirst=True, expandNonLeaf=False )
 
 	def __playbackStateChanged( self, playback ) :
 
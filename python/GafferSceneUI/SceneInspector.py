@@ -65,6 +65,8 @@ class SceneInspector( GafferUI.NodeSetEditor ) :
 			self.__fullAttributes = None
 			self.__object = None
 			self.__globals = None
+			self.__setNames = None
+			self.__sets = {}
 
 		@property
 		def scene( self ) :
@@ -125,6 +127,20 @@ class SceneInspector( GafferUI.NodeSetEditor ) :
 
 			return self.__globals
 
+		def setNames( self ) :
+
+			if self.__setNames is None :
+				self.__setNames = [ str( n ) for n in self.scene["setNames"].getValue() ]
+
+			return self.__setNames
+
+		def set( self, setName ) :
+
+			if setName not in self.__sets :
+				self.__sets[setName] = self.scene.set( setName ) if setName in self.setNames() else None
+
+			return self.__sets[setName]
+
 	## A list of Section instances may be passed to create a custom inspector,
 	# otherwise all registered Sections will be used.
 	def __init__( self, scriptNode, sections = None, **kw ) :
@@ -1716,9 +1732,7 @@ class __SetMembershipSection( Section ) :
 			if target.path is None :
 				return None
 
-			globals = target.globals()
-			sets = globals.get( "gaffer:sets", {} )
-			set = sets.get( self.__setName )
+			set = target.set( self.__setName )
 			if set is None :
 				return None
 
@@ -1736,8 +1750,7 @@ class __SetMembershipSection( Section ) :
 			if not target.path :
 				return []
 
-			sets = target.globals().get( "gaffer:sets", {} )
-			return [ self.__class__( setName ) for setName in sorted( sets.keys() ) ]
+			return [ self.__class__( setName ) for setName in sorted( target.setNames() ) ]
 
 SceneInspector.registerSection( __SetMembershipSection, tab = "Selection" )
 
@@ -2027,14 +2040,11 @@ class _SetsSection( Section ) :
 
 		def __call__( self, target ) :
 
-			globals = target.globals()
-			sets = globals.get( "gaffer:sets", {} )
-			return sets.get( self.__setName )
+			return target.set( self.__setName )
 
 		def children( self, target ) :
 
-			sets = target.globals().get( "gaffer:sets", {} )
-			return [ self.__class__( setName ) for setName in sorted( sets.keys() ) ]
+			return [ self.__class__( setName ) for setName in sorted( target.setNames() ) ]
 
 SceneInspector.SetsSection = _SetsSection
 
@@ -75,6 +75,31 @@ Gaffer.Metadata.registerPlugValue( GafferScene.SceneNode, "enabled", "nodeUI:sec
 
 # Instancer
 
+Gaffer.Metadata.registerNodeDescription(
+
+GafferScene.Instancer,
+
+"""Instances a scene at each of the points of a primitive. Primitive variables
+may be used to orient and scale the instances, and to choose between several
+prototypes.""",
+
+"instance",
+"""The scene to be instanced. When a prototype index is used, each of the
+children of the root of this scene is a separate prototype.""",
+
+"orientation",
+"""The name of a QuatfVectorData primitive variable used to orient the instances.""",
+
+"scale",
+"""The name of a V3fVectorData or FloatVectorData primitive variable used to
+scale the instances.""",
+
+"prototypeIndex",
+"""The name of an IntVectorData primitive variable used to choose a prototype
+for each instance. Indices outside the range of available prototypes are wrapped.""",
+
+)
+
 GafferUI.PlugValueWidget.registerCreator( GafferScene.Instancer, "instance", None )
 
 # ObjectToScene
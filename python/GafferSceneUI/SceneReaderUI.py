@@ -56,6 +56,12 @@ GafferScene.SceneReader,
 "sets",
 "Specifies a list of tags to be loaded and converted into gaffer sets.",
 
+"cacheObjectSamples",
+"Caches the samples stored in the file for each object, and interpolates "
+"between them on demand, rather than caching a separate object for every "
+"time requested. This reduces memory usage when rendering with motion blur "
+"or scrubbing the timeline.",
+
 )
 
 ##########################################################################
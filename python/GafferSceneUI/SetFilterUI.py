@@ -88,10 +88,7 @@ def __setsPopupMenu( menuDefinition, plugValueWidget ) :
 		for output in node["out"].outputs() :
 			if not isinstance( output.node(), GafferScene.SceneProcessor ) :
 				continue
-			globals = output.node()["in"]["globals"].getValue()
-			if "gaffer:sets" not in globals :
-				continue
-			setNames.update( globals["gaffer:sets"].keys() )
+			setNames.update( [ str( n ) for n in output.node()["in"]["setNames"].getValue() ] )
 
 	if not setNames :
 		return
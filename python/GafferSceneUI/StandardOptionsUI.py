@@ -80,6 +80,14 @@ def __motionBlurSummary( plug ) :
 
 	return ", ".join( info )
 
+def __expansionSummary( plug ) :
+
+	info = []
+	if plug["eagerExpansion"]["enabled"].getValue() :
+		info.append( "Eager " + ( "On" if plug["eagerExpansion"]["value"].getValue() else "Off" ) )
+
+	return ", ".join( info )
+
 GafferUI.PlugValueWidget.registerCreator(
 
 	GafferScene.StandardOptions,
@@ -115,6 +123,14 @@ GafferUI.PlugValueWidget.registerCreator(
 			),
 		},
 
+		{
+			"label" : "Expansion",
+			"summary" : __expansionSummary,
+			"namesAndLabels" : (
+				( "render:eagerExpansion", "Eager" ),
+			),
+		},
+
 	),
 
 )
@@ -37,6 +37,7 @@
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferUI
 import GafferUITest
 import GafferScene
@@ -176,6 +177,34 @@ class SceneViewTest( GafferUITest.TestCase ) :
 		self.assertEqual( getExpandedPaths(), set( [ "/", "/A", "/A/C" ] ) )
 		self.assertEqual( getSelection(), set( [ "/A/C/E" ] ) )
 
+	def testPerformance( self ) :
+
+		# Measures the time taken to compute everything the SceneView
+		# would draw for a fully expanded scene containing many objects,
+		# with the cache disabled so that everything is computed. The
+		# SceneGadget updates itself on demand when its bound is queried,
+		# so no GL context is needed.
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( IECore.V2i( 30 ) )
+
+		sphere = GafferScene.Sphere()
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["instance"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		view = GafferUI.View.create( instancer["out"] )
+		view["minimumExpansionDepth"].setValue( 999 )
+
+		sceneGadget = view.viewportGadget().getPrimaryChild()
+
+		with GafferTest.UncachedPerformanceScope( "SceneViewTest.testPerformance" ) :
+			bound = sceneGadget.bound()
+
+		self.assertEqual( bound, instancer["out"].bound( "/" ) )
+
 if __name__ == "__main__":
 	unittest.main()
 
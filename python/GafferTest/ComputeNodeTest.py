@@ -452,5 +452,126 @@ class ComputeNodeTest( GafferTest.TestCase ) :
 
 		self.assertTrue( self.fRan )
 
+	def testStaticAffects( self ) :
+
+		class StaticAffectsNode( Gaffer.ComputeNode ) :
+
+			staticAffects = {
+				"in" : ( "out", ),
+				"compound" : ( "compoundOut", ),
+			}
+
+			def __init__( self, name = "StaticAffectsNode" ) :
+
+				Gaffer.ComputeNode.__init__( self, name )
+
+				self["in"] = Gaffer.IntPlug()
+				self["compound"] = Gaffer.V2fPlug()
+				self["other"] = Gaffer.IntPlug()
+				self["out"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+				self["compoundOut"] = Gaffer.V2fPlug( direction = Gaffer.Plug.Direction.Out )
+
+				self.numAffectsCalls = 0
+
+			# should be ignored in favour of staticAffects
+			def affects( self, input ) :
+
+				self.numAffectsCalls += 1
+				return []
+
+		IECore.registerRunTimeTyped( StaticAffectsNode )
+
+		n = StaticAffectsNode()
+
+		cs = GafferTest.CapturingSlot( n.plugDirtiedSignal() )
+		n["in"].setValue( 10 )
+		dirtied = set( [ c[0].relativeName( n ) for c in cs ] )
+		self.assertTrue( "out" in dirtied )
+		self.assertFalse( "compoundOut.x" in dirtied )
+
+		del cs[:]
+		n["compound"]["x"].setValue( 1 )
+		dirtied = set( [ c[0].relativeName( n ) for c in cs ] )
+		self.assertTrue( "compoundOut.x" in dirtied )
+		self.assertTrue( "compoundOut.y" in dirtied )
+		self.assertFalse( "out" in dirtied )
+
+		del cs[:]
+		n["other"].setValue( 1 )
+		self.assertEqual( [ c[0].relativeName( n ) for c in cs ], [ "other" ] )
+
+		self.assertEqual( n.numAffectsCalls, 0 )
+
+	def testGILProfiler( self ) :
+
+		n = GafferTest.AddNode()
+		n["op1"].setValue( 1 )
+		n["op2"].setValue( 2 )
+
+		with Gaffer.GILProfiler() as profiler :
+			self.assertEqual( n["sum"].getValue(), 3 )
+
+		statistics = profiler.statistics()
+		for method in ( "hash", "compute" ) :
+			s = statistics[( n.fullName(), method )]
+			self.assertTrue( s["calls"] >= 1 )
+			self.assertTrue( s["acquisitionTime"] >= 0 )
+			self.assertTrue( s["holdTime"] >= 0 )
+
+		# nothing should be recorded outside of the with block
+
+		n["op1"].setValue( 2 )
+		self.assertEqual( n["sum"].getValue(), 4 )
+
+		with Gaffer.GILProfiler() as profiler :
+			pass
+
+		self.assertEqual( profiler.statistics(), {} )
+
+	def testCancellation( self ) :
+
+		n = GafferTest.AddNode()
+		n["op1"].setValue( 1 )
+		n["op2"].setValue( 2 )
+
+		cs = GafferTest.CapturingSlot( n.errorSignal() )
+
+		# computations in a cancelled context are abandoned before
+		# they begin.
+
+		canceller = Gaffer.Canceller()
+		canceller.cancel()
+		with Gaffer.Context( Gaffer.Context(), canceller ) :
+			self.assertRaises( RuntimeError, n["sum"].getValue )
+
+		self.assertEqual( n.numComputeCalls, 0 )
+		self.assertEqual( len( cs ), 0 )
+
+		# computations cancelled part way through must not
+		# leave their results in the cache.
+
+		n = GafferTest.CancellingAddNode()
+		n["op1"].setValue( 1 )
+		n["op2"].setValue( 2 )
+		n.canceller = Gaffer.Canceller()
+
+		cs = GafferTest.CapturingSlot( n.errorSignal() )
+
+		with Gaffer.Context( Gaffer.Context(), n.canceller ) :
+			self.assertRaises( RuntimeError, n["sum"].getValue )
+
+		self.assertEqual( n.numComputeCalls, 1 )
+		self.assertEqual( len( cs ), 0 )
+
+		n.canceller = None
+		self.assertEqual( n["sum"].getValue(), 3 )
+		self.assertEqual( n.numComputeCalls, 2 )
+
+		# and having been computed without cancellation, the
+		# result is cached as usual.
+
+		self.assertEqual( n["sum"].getValue(), 3 )
+		self.assertEqual( n.numComputeCalls, 2 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -360,5 +360,137 @@ class DependencyNodeTest( GafferTest.TestCase ) :
 
 		f1["in"][0].setValue( 10 )
 
+	def testDirtyPropagationScope( self ) :
+
+		a1 = GafferTest.AddNode()
+		a2 = GafferTest.AddNode()
+		a2["op1"].setInput( a1["sum"] )
+
+		cs = GafferTest.CapturingSlot( a2.plugDirtiedSignal() )
+
+		with Gaffer.DirtyPropagationScope() :
+
+			a1["op1"].setValue( 1 )
+			a1["op2"].setValue( 2 )
+			a2["op2"].setValue( 3 )
+
+			with Gaffer.DirtyPropagationScope() :
+				a1["op1"].setValue( 4 )
+
+			self.assertEqual( len( cs ), 0 )
+
+		self.assertEqual( len( cs ), 3 )
+		self.assertTrue( cs[0][0].isSame( a2["op2"] ) )
+		self.assertTrue( cs[1][0].isSame( a2["op1"] ) )
+		self.assertTrue( cs[2][0].isSame( a2["sum"] ) )
+
+		self.assertEqual( a2["sum"].getValue(), 9 )
+
+	def testDirtyPropagationScopeWithRemovedPlugs( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["a1"] = GafferTest.AddNode()
+		s["a2"] = GafferTest.AddNode()
+		s["a2"]["op1"].setInput( s["a1"]["sum"] )
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		cs = GafferTest.CapturingSlot( s["a2"].plugDirtiedSignal() )
+
+		with Gaffer.DirtyPropagationScope() :
+
+			s["n"]["user"]["p"].setValue( 1 )
+			del s["n"]["user"]["p"]
+			# Create a new plug which may occupy the same memory
+			# as the one we just deleted.
+			s["n"]["user"]["q"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+			s["n"]["user"]["q"].setValue( 2 )
+
+			s["a1"]["op1"].setValue( 1 )
+			del s["a1"]
+
+		self.assertEqual( set( x[0].getName() for x in cs ), set( [ "op1", "sum" ] ) )
+
+	def testAffectsCacheInvalidation( self ) :
+
+		class DynamicNode( Gaffer.DependencyNode ) :
+
+			def __init__( self, name = "DynamicNode" ) :
+
+				Gaffer.DependencyNode.__init__( self, name )
+
+				self["in"] = Gaffer.IntPlug()
+				self["out"] = Gaffer.CompoundPlug( direction = Gaffer.Plug.Direction.Out )
+
+			def affects( self, input ) :
+
+				result = Gaffer.DependencyNode.affects( self, input )
+				if input.isSame( self["in"] ) :
+					result.extend( self["out"].children() )
+
+				return result
+
+		n = DynamicNode()
+		cs = GafferTest.CapturingSlot( n.plugDirtiedSignal() )
+
+		n["in"].setValue( 1 )
+		self.assertEqual( [ x[0].getName() for x in cs ], [ "in" ] )
+
+		n["out"]["a"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+		del cs[:]
+		n["in"].setValue( 2 )
+		self.assertEqual( [ x[0].getName() for x in cs ], [ "in", "a", "out" ] )
+
+		del n["out"]["a"]
+		del cs[:]
+		n["in"].setValue( 3 )
+		self.assertEqual( [ x[0].getName() for x in cs ], [ "in" ] )
+
+	def testAffectsCacheInvalidationUpstream( self ) :
+
+		# A node whose affects() depends on the source of
+		# its input, as FilteredSceneProcessor's does.
+
+		class SourceDependentNode( Gaffer.DependencyNode ) :
+
+			def __init__( self, name = "SourceDependentNode" ) :
+
+				Gaffer.DependencyNode.__init__( self, name )
+
+				self["in"] = Gaffer.IntPlug()
+				self["out1"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+				self["out2"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+
+			def affects( self, input ) :
+
+				result = Gaffer.DependencyNode.affects( self, input )
+				if input.isSame( self["in"] ) :
+					if input.source().getName() == "op1" :
+						result.append( self["out1"] )
+					else :
+						result.append( self["out2"] )
+
+				return result
+
+		s = Gaffer.ScriptNode()
+		s["a"] = GafferTest.AddNode()
+		s["d"] = Gaffer.Dot()
+		s["d"].setup( s["a"]["op1"] )
+		s["d"]["in"].setInput( s["a"]["op1"] )
+		s["n"] = SourceDependentNode()
+		s["n"]["in"].setInput( s["d"]["out"] )
+
+		cs = GafferTest.CapturingSlot( s["n"].plugDirtiedSignal() )
+		s["a"]["op1"].setValue( 1 )
+		self.assertEqual( [ x[0].getName() for x in cs ], [ "in", "out1" ] )
+
+		# Rewiring upstream of the Dot emits plugInputChangedSignal()
+		# only on the Dot, but must still invalidate our cache.
+
+		s["d"]["in"].setInput( s["a"]["op2"] )
+		del cs[:]
+		s["a"]["op2"].setValue( 1 )
+		self.assertEqual( [ x[0].getName() for x in cs ], [ "in", "out2" ] )
+
 if __name__ == "__main__":
 	unittest.main()
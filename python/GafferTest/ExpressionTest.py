@@ -37,6 +37,8 @@
 
 import unittest
 
+import IECore
+
 import Gaffer
 import GafferTest
 
@@ -133,6 +135,7 @@ class ExpressionTest( GafferTest.TestCase ) :
 		e = Gaffer.Expression.Engine.registeredEngines()
 		self.failUnless( isinstance( e, tuple ) )
 		self.failUnless( "python" in e )
+		self.failUnless( "native" in e )
 
 	def testDefaultEngine( self ) :
 
@@ -275,5 +278,82 @@ class ExpressionTest( GafferTest.TestCase ) :
 		self.failUnless( s["n"]["sum"] in [ p[0] for p in dirtied ] )
 		
 
+	def testNativeEngine( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["m1"] = GafferTest.MultiplyNode()
+		s["m1"]["op1"].setValue( 10 )
+		s["m1"]["op2"].setValue( 20 )
+
+		s["m2"] = GafferTest.MultiplyNode()
+		s["m2"]["op2"].setValue( 1 )
+
+		s["e"] = Gaffer.Expression()
+		s["e"]["engine"].setValue( "native" )
+		s["e"]["expression"].setValue( "parent.m2.op1 = parent.m1.product * 2 + parent['m1']['op1'] % 3" )
+
+		self.assertEqual( s["m2"]["product"].getValue(), 401 )
+		self.assertEqual( len( s["e"]["in"] ), 2 )
+
+		ss = s.serialise()
+
+		s2 = Gaffer.ScriptNode()
+		s2.execute( ss )
+
+		self.assertEqual( s2["m2"]["product"].getValue(), 401 )
+
+	def testNativeEngineContextAccess( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = Gaffer.Node()
+		s["n"]["f"] = Gaffer.FloatPlug()
+		s["n"]["i"] = Gaffer.IntPlug()
+		s["n"]["s"] = Gaffer.StringPlug()
+
+		s["e1"] = Gaffer.Expression()
+		s["e1"]["engine"].setValue( "native" )
+		s["e1"]["expression"].setValue( "parent.n.f = context.frame > 5 ? context['frame'] / 2 : context.get( 'iDontExist', -1 )" )
+
+		s["e2"] = Gaffer.Expression()
+		s["e2"]["engine"].setValue( "native" )
+		s["e2"]["expression"].setValue( "parent.n.i = context.getFrame()" )
+
+		s["e3"] = Gaffer.Expression()
+		s["e3"]["engine"].setValue( "native" )
+		s["e3"]["expression"].setValue( "parent.n.s = '#' + str( int( context.frame ) )" )
+
+		with Gaffer.Context() as c :
+			for i in range( 0, 10 ) :
+				c.setFrame( i )
+				self.assertEqual( s["n"]["f"].getValue(), i / 2.0 if i > 5 else -1 )
+				self.assertEqual( s["n"]["i"].getValue(), i )
+				self.assertEqual( s["n"]["s"].getValue(), "#%d" % i )
+
+	def testNativeEngineErrors( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = Gaffer.Node()
+		s["n"]["i"] = Gaffer.IntPlug()
+		s["n"]["s"] = Gaffer.StringPlug()
+
+		s["e"] = Gaffer.Expression()
+		s["e"]["engine"].setValue( "native" )
+
+		with IECore.CapturingMessageHandler() as mh :
+			s["e"]["expression"].setValue( "parent.n.i = 1 +" )
+
+		self.assertEqual( len( mh.messages ), 1 )
+		self.assertTrue( "Syntax error" in mh.messages[0].message )
+		self.assertEqual( s["n"]["i"].getInput(), None )
+
+		s["e"]["expression"].setValue( "parent.n.i = 'a' + 1" )
+		self.assertRaises( RuntimeError, s["n"]["i"].getValue )
+
+		s["e"]["expression"].setValue( "parent.n.s = 1" )
+		self.assertRaises( RuntimeError, s["n"]["s"].getValue )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -230,6 +230,84 @@ class FileSystemPathTest( GafferTest.TestCase ) :
 		self.assertTrue( "fileSystem:modificationTime" in a )
 		self.assertTrue( "fileSystem:size" in a )
 
+	def testChildrenUpdateWhenDirectoryChanges( self ) :
+
+		p = Gaffer.FileSystemPath( self.__dir )
+		self.assertEqual( p.children(), [] )
+
+		with open( self.__dir + "/a", "w" ) as f :
+			f.write( "AAAA" )
+
+		self.assertEqual( [ str( c ) for c in p.children() ], [ self.__dir + "/a" ] )
+
+		os.mkdir( self.__dir + "/b" )
+		c = p.children()
+		self.assertEqual( [ str( x ) for x in c ], [ self.__dir + "/a", self.__dir + "/b" ] )
+		self.assertTrue( c[0].isLeaf() )
+		self.assertFalse( c[1].isLeaf() )
+
+		os.remove( self.__dir + "/a" )
+		self.assertEqual( [ str( x ) for x in p.children() ], [ self.__dir + "/b" ] )
+
+	def testChildProperties( self ) :
+
+		with open( self.__dir + "/a", "w" ) as f :
+			f.write( "AAAA" )
+
+		c = Gaffer.FileSystemPath( self.__dir ).children()
+		self.assertEqual( len( c ), 1 )
+
+		s = os.stat( self.__dir + "/a" )
+		self.assertEqual( c[0].property( "fileSystem:size" ), 4 )
+		self.assertEqual( c[0].property( "fileSystem:owner" ), pwd.getpwuid( s.st_uid ).pw_name )
+		self.assertEqual( c[0].property( "fileSystem:group" ), grp.getgrgid( s.st_gid ).gr_name )
+
+	def testListingCache( self ) :
+
+		with open( self.__dir + "/a", "w" ) as f :
+			f.write( "AAAA" )
+
+		# Listings of recently modified directories aren't cached,
+		# so we backdate the directory's modification time.
+		t = time.time() - 10
+		os.utime( self.__dir, ( t, t ) )
+
+		p = Gaffer.FileSystemPath( self.__dir )
+		c1 = p.children()
+		self.assertEqual( c1[0].property( "fileSystem:size" ), 4 )
+
+		# Modifying a file doesn't modify the directory, so we expect
+		# the new children to use the cached listing, and therefore
+		# the old size.
+
+		with open( self.__dir + "/a", "w" ) as f :
+			f.write( "AAAAAAAA" )
+
+		c2 = p.children()
+		self.assertEqual( [ str( x ) for x in c2 ], [ self.__dir + "/a" ] )
+		self.assertEqual( c2[0].property( "fileSystem:size" ), 4 )
+
+		# Adding a file modifies the directory, so we expect a new
+		# listing to be made.
+
+		with open( self.__dir + "/b", "w" ) as f :
+			f.write( "B" )
+
+		c3 = p.children()
+		self.assertEqual( [ str( x ) for x in c3 ], [ self.__dir + "/a", self.__dir + "/b" ] )
+		self.assertEqual( c3[0].property( "fileSystem:size" ), 8 )
+		self.assertEqual( c3[1].property( "fileSystem:size" ), 1 )
+
+		# Paths obtained before the change continue to use the
+		# listing they were made from, which is only validated
+		# when children() is called.
+		self.assertEqual( c1[0].property( "fileSystem:size" ), 4 )
+		self.assertEqual( c1[0].copy().property( "fileSystem:size" ), 4 )
+
+		# Unless they are modified to point elsewhere.
+		c1[0].setFromString( self.__dir + "/b" )
+		self.assertEqual( c1[0].property( "fileSystem:size" ), 1 )
+
 	def setUp( self ) :
 
 		self.__originalCWD = os.getcwd()
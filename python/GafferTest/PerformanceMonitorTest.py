@@ -0,0 +1,169 @@
+##########################################################################
+#
+#  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import time
+import unittest
+
+import IECore
+
+import Gaffer
+import GafferTest
+
+class PerformanceMonitorTest( GafferTest.TestCase ) :
+
+	class SleepNode( Gaffer.ComputeNode ) :
+
+		def __init__( self, name = "SleepNode" ) :
+
+			Gaffer.ComputeNode.__init__( self, name )
+
+			self["in"] = Gaffer.IntPlug()
+			self["out"] = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
+
+		def affects( self, input ) :
+
+			if input.isSame( self["in"] ) :
+				return [ self["out"] ]
+
+			return []
+
+		def hash( self, output, context, h ) :
+
+			self["in"].hash( h )
+
+		def compute( self, plug, context ) :
+
+			time.sleep( 0.1 )
+			plug.setValue( self["in"].getValue() )
+
+	def setUp( self ) :
+
+		GafferTest.TestCase.setUp( self )
+
+		self.__cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+
+		Gaffer.PerformanceMonitor.clear()
+
+	def tearDown( self ) :
+
+		GafferTest.TestCase.tearDown( self )
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__cacheMemoryLimit )
+
+		Gaffer.PerformanceMonitor.setEnabled( False )
+		Gaffer.PerformanceMonitor.clear()
+
+	def testCounts( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["a1"] = GafferTest.AddNode()
+		s["a2"] = GafferTest.AddNode()
+		s["a2"]["op1"].setInput( s["a1"]["sum"] )
+
+		# nothing is recorded while disabled
+
+		s["a2"]["sum"].getValue()
+		self.assertEqual( Gaffer.PerformanceMonitor.statistics(), [] )
+
+		Gaffer.PerformanceMonitor.setEnabled( True )
+		s["a2"]["sum"].getValue()
+		Gaffer.PerformanceMonitor.setEnabled( False )
+
+		statistics = Gaffer.PerformanceMonitor.statistics()
+		self.assertEqual( len( statistics ), 2 )
+		for node in ( s["a1"], s["a2"] ) :
+			nodeStatistics = self.__nodeStatistics( statistics, node )
+			self.assertEqual( nodeStatistics["hashCount"], 1 )
+			self.assertEqual( nodeStatistics["computeCount"], 1 )
+			self.assertTrue( nodeStatistics["hashTime"] >= 0 )
+			self.assertTrue( nodeStatistics["computeTime"] >= 0 )
+			# the cache limit is 0, so nothing remains in the cache,
+			# but the insertions are still recorded.
+			self.assertTrue( nodeStatistics["cacheBytesInserted"] > 0 )
+
+		Gaffer.PerformanceMonitor.clear()
+		self.assertEqual( Gaffer.PerformanceMonitor.statistics(), [] )
+
+	def testUpstreamTimeExcluded( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["sleep"] = self.SleepNode()
+		s["add"] = GafferTest.AddNode()
+		s["add"]["op1"].setInput( s["sleep"]["out"] )
+
+		Gaffer.PerformanceMonitor.setEnabled( True )
+		s["add"]["sum"].getValue()
+		Gaffer.PerformanceMonitor.setEnabled( False )
+
+		statistics = Gaffer.PerformanceMonitor.statistics()
+		self.assertTrue( self.__nodeStatistics( statistics, s["sleep"] )["computeTime"] >= 0.1 )
+		self.assertTrue( self.__nodeStatistics( statistics, s["add"] )["computeTime"] < 0.1 )
+
+	def testNodesWithSameName( self ) :
+
+		s1 = Gaffer.ScriptNode()
+		s1["a"] = GafferTest.AddNode()
+
+		s2 = Gaffer.ScriptNode()
+		s2["a"] = GafferTest.AddNode()
+		s2["a"]["op1"].setValue( 1 )
+
+		self.assertEqual( s1["a"].fullName(), s2["a"].fullName() )
+
+		Gaffer.PerformanceMonitor.setEnabled( True )
+		s1["a"]["sum"].getValue()
+		s2["a"]["sum"].getValue()
+		s2["a"]["op1"].setValue( 2 )
+		s2["a"]["sum"].getValue()
+		Gaffer.PerformanceMonitor.setEnabled( False )
+
+		statistics = Gaffer.PerformanceMonitor.statistics()
+		self.assertEqual( len( statistics ), 2 )
+		self.assertEqual( self.__nodeStatistics( statistics, s1["a"] )["computeCount"], 1 )
+		self.assertEqual( self.__nodeStatistics( statistics, s2["a"] )["computeCount"], 2 )
+
+	@staticmethod
+	def __nodeStatistics( statistics, node ) :
+
+		for n, s in statistics :
+			if n.isSame( node ) :
+				return s
+
+		return None
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,73 @@
+##########################################################################
+#
+#  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import IECore
+
+import Gaffer
+
+## A context manager for use in performance tests. The compute cache
+# is disabled within the scope, so that everything is computed from
+# scratch, and the time taken is reported as an info message on exit.
+# The time is also available from elapsed() so that tests may report
+# more specific measurements of their own.
+class UncachedPerformanceScope( object ) :
+
+	def __init__( self, name ) :
+
+		self.__name = name
+		self.__elapsed = None
+
+	def __enter__( self ) :
+
+		self.__cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		self.__timer = IECore.Timer()
+
+		return self
+
+	def __exit__( self, type, value, traceBack ) :
+
+		self.__elapsed = self.__timer.stop()
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__cacheMemoryLimit )
+
+		if type is None :
+			IECore.msg( IECore.Msg.Level.Info, self.__name, "%.3f seconds" % self.__elapsed )
+
+	## Returns the time in seconds spent within the scope, or
+	# None if the scope has not yet been exited.
+	def elapsed( self ) :
+
+		return self.__elapsed
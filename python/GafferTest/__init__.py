@@ -54,6 +54,7 @@ except AttributeError :
 
 from TestCase import TestCase
 from AddNode import AddNode
+from CancellingAddNode import CancellingAddNode
 from SphereNode import SphereNode
 from SignalsTest import SignalsTest
 from GraphComponentTest import GraphComponentTest
@@ -86,6 +87,7 @@ from ContextTest import ContextTest
 from CompoundPathFilterTest import CompoundPathFilterTest
 from BadNode import BadNode
 from CapturingSlot import CapturingSlot
+from UncachedPerformanceScope import UncachedPerformanceScope
 from LazyModuleTest import LazyModuleTest
 from NodeBindingTest import NodeBindingTest
 from DictPathTest import DictPathTest
@@ -104,6 +106,7 @@ from RandomTest import RandomTest
 from CompoundDataPlugTest import CompoundDataPlugTest
 from DependencyNodeTest import DependencyNodeTest
 from ComputeNodeTest import ComputeNodeTest
+from PerformanceMonitorTest import PerformanceMonitorTest
 from BoxPlugTest import BoxPlugTest
 from BoxTest import BoxTest
 from OutputRedirectionTest import OutputRedirectionTest
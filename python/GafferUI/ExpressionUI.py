@@ -57,7 +57,13 @@ Gaffer.Metadata.registerNode(
 
 			"description",
 			"""
-			The expression language to use.
+			The expression language to use. The python engine provides
+			the full Python language, whereas the native engine provides
+			a small C-like language for arithmetic and string manipulation.
+			Native expressions are evaluated without Python, so are much
+			cheaper to compute from many threads at once.
+
+			parent.node.plug = parent.other.plug * 2 + context.frame
 			"""
 
 		),
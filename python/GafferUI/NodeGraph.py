@@ -68,6 +68,7 @@ class NodeGraph( GafferUI.EditorWidget ) :
 		self.__dropConnection = self.__gadgetWidget.dropSignal().connect( Gaffer.WeakMethod( self.__drop ) )
 
 		self.__nodeMenu = None
+		self.__performanceOverlay = None
 
 	## Returns the internal GadgetWidget holding the GraphGadget.
 	def graphGadgetWidget( self ) :
@@ -89,6 +90,21 @@ class NodeGraph( GafferUI.EditorWidget ) :
 
 		self.__frame( nodes, extend )
 
+	## Displays a heat map over the nodes in the graph, showing one of the
+	# statistics recorded by Gaffer.PerformanceMonitor : "hashTime", "computeTime",
+	# "hashCount", "computeCount" or "cacheBytesInserted". The statistics for a Box are
+	# the sum of the statistics for all the nodes inside it. The overlay reflects
+	# the statistics at the time of the call - call again to update it. Passing
+	# None removes the overlay.
+	def setPerformanceOverlay( self, statistic ) :
+
+		self.__performanceOverlay = statistic
+		self.__updatePerformanceOverlay()
+
+	def getPerformanceOverlay( self ) :
+
+		return self.__performanceOverlay
+
 	def getTitle( self ) :
 
 		title = super( NodeGraph, self ).getTitle()
@@ -175,6 +191,37 @@ class NodeGraph( GafferUI.EditorWidget ) :
 				}
 			)
 
+	## May be used from a slot attached to nodeContextMenuSignal() to install
+	# menu items for monitoring performance and displaying the results as an
+	# overlay on the graph.
+	@classmethod
+	def appendPerformanceOverlayMenuDefinitions( cls, nodeGraph, node, menuDefinition ) :
+
+		menuDefinition.append( "/PerformanceDivider", { "divider" : True } )
+		menuDefinition.append(
+			"/Performance/Monitor",
+			{
+				"command" : Gaffer.PerformanceMonitor.setEnabled,
+				"checkBox" : Gaffer.PerformanceMonitor.getEnabled(),
+			}
+		)
+		menuDefinition.append(
+			"/Performance/Clear Statistics",
+			{
+				"command" : IECore.curry( cls.__clearPerformanceStatistics, nodeGraph ),
+			}
+		)
+
+		menuDefinition.append( "/Performance/OverlayDivider", { "divider" : True } )
+		for label, statistic in cls.__performanceOverlayStatistics :
+			menuDefinition.append(
+				"/Performance/" + label,
+				{
+					"command" : IECore.curry( cls.__setPerformanceOverlay, nodeGraph, statistic ),
+					"checkBox" : nodeGraph.getPerformanceOverlay() == statistic,
+				}
+			)
+
 	__nodeDoubleClickSignal = Gaffer.Signal2()
 	## Returns a signal which is emitted whenever a node is double clicked.
 	# Slots should have the signature ( nodeGraph, node ).
@@ -433,6 +480,8 @@ class NodeGraph( GafferUI.EditorWidget ) :
 
 		self.titleChangedSignal()( self )
 
+		self.__updatePerformanceOverlay()
+
 	def __rootNameChanged( self, root ) :
 
 		self.titleChangedSignal()( self )
@@ -445,6 +494,77 @@ class NodeGraph( GafferUI.EditorWidget ) :
 		# remove us? Consider how this relates to NodeEditor.__deleteWindow() too.
 		self.parent().removeChild( self )
 
+	def __updatePerformanceOverlay( self ) :
+
+		graphGadget = self.graphGadget()
+		root = graphGadget.getRoot()
+
+		# Sum the statistics for each child of the root,
+		# so that Boxes include the nodes they contain.
+
+		values = {}
+		if self.__performanceOverlay is not None :
+			for node, statistics in Gaffer.PerformanceMonitor.statistics() :
+				child = node
+				while child is not None and not root.isSame( child.parent() ) :
+					child = child.parent()
+				if child is None :
+					continue
+				childName = child.getName()
+				values[childName] = values.get( childName, 0 ) + statistics[self.__performanceOverlay]
+
+		maxValue = max( values.values() ) if values else 0
+
+		for node in root.children( Gaffer.Node ) :
+
+			nodeGadget = graphGadget.nodeGadget( node )
+			if not isinstance( nodeGadget, GafferUI.StandardNodeGadget ) :
+				continue
+
+			value = values.get( node.getName() )
+			if value is None or not maxValue :
+				nodeGadget.setOverlay( IECore.Color4f( 0 ) )
+				continue
+
+			heat = value / float( maxValue )
+			nodeGadget.setOverlay(
+				IECore.Color4f( heat, 0.25 * ( 1.0 - heat ), 0, 0.2 + 0.5 * heat ),
+				self.__formatStatistic( self.__performanceOverlay, value )
+			)
+
+	@staticmethod
+	def __formatStatistic( statistic, value ) :
+
+		if statistic.endswith( "Time" ) :
+			return "%.2fs" % value if value >= 1 else "%.1fms" % ( value * 1000 )
+		elif statistic == "cacheBytesInserted" :
+			for unit in ( "B", "K", "M" ) :
+				if value < 1024 :
+					return "%d%s" % ( value, unit )
+				value /= 1024.0
+			return "%.1fG" % value
+		else :
+			return str( value )
+
+	__performanceOverlayStatistics = [
+		( "Show Compute Time", "computeTime" ),
+		( "Show Hash Time", "hashTime" ),
+		( "Show Compute Count", "computeCount" ),
+		( "Show Hash Count", "hashCount" ),
+		( "Show Cache Bytes Inserted", "cacheBytesInserted" ),
+	]
+
+	@classmethod
+	def __setPerformanceOverlay( cls, nodeGraph, statistic, value ) :
+
+		nodeGraph.setPerformanceOverlay( statistic if value else None )
+
+	@classmethod
+	def __clearPerformanceStatistics( cls, nodeGraph ) :
+
+		Gaffer.PerformanceMonitor.clear()
+		nodeGraph.setPerformanceOverlay( nodeGraph.getPerformanceOverlay() )
+
 	@classmethod
 	def __getNodeInputConnectionsVisible( cls, graphGadget, node ) :
 
@@ -89,7 +89,7 @@ class PathChooserWidget( GafferUI.Widget ) :
 				parenting = { "expand" : True }
 			) as splitContainer :
 
-				self.__directoryListing = GafferUI.PathListingWidget( tmpPath, allowMultipleSelection=allowMultipleSelection )
+				self.__directoryListing = GafferUI.PathListingWidget( tmpPath, allowMultipleSelection=allowMultipleSelection, asynchronous=True )
 				self.__displayModeChangedConnection = self.__directoryListing.displayModeChangedSignal().connect( Gaffer.WeakMethod( self.__displayModeChanged ) )
 				if len( previewTypes ) :
 					self.__previewWidget = GafferUI.CompoundPathPreview( tmpPath, childTypes=previewTypes )
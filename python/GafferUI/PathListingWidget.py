@@ -39,7 +39,9 @@ from __future__ import with_statement
 
 import os
 import time
+import weakref
 import warnings
+import threading
 
 import IECore
 
@@ -53,6 +55,8 @@ QtGui = GafferUI._qtImport( "QtGui" )
 ## The PathListingWidget displays the contents of a Path, updating the Path to represent the
 # current directory as the user navigates around. It supports both a list and a tree view,
 # allows customisable column listings, and supports both single and multiple selection.
+# When asynchronous is True, the children of a newly navigated-to directory are computed
+# on a background thread before the listing is updated.
 class PathListingWidget( GafferUI.Widget ) :
 
 	Column = _GafferUI._PathListingWidgetColumn
@@ -93,6 +97,7 @@ class PathListingWidget( GafferUI.Widget ) :
 		columns = defaultFileSystemColumns,
 		allowMultipleSelection = False,
 		displayMode = DisplayMode.List,
+		asynchronous = False,
 		**kw
 	) :
 
@@ -136,6 +141,7 @@ class PathListingWidget( GafferUI.Widget ) :
 		self.__dragPointer = "paths"
 
 		self.__path = None
+		self.__asynchronous = asynchronous
 
 		self.setDisplayMode( displayMode )
 		self.setPath( path )
@@ -204,24 +210,27 @@ class PathListingWidget( GafferUI.Widget ) :
 
 		return False
 
-	## \todo Improve performance of this method by making
-	# a complete implementation in C++. This might be best
-	# done by using a PathMatcher do define the expanded
-	# paths, rather than a huge list.
+	## \deprecated Use setExpansion() instead.
 	def setExpandedPaths( self, paths ) :
 
-		indices = []
-		for path in paths :
-			index = self.__indexForPath( path )
-			if index.isValid() :
-				indices.append( index )
-
-		self._qtWidget().setExpandedIndices( indices )
+		self.setExpansion( Gaffer.PathMatcher( [ str( path ) for path in paths ] ) )
 
 	def getExpandedPaths( self ) :
 
 		return _GafferUI._pathListingWidgetGetExpandedPaths( GafferUI._qtAddress( self._qtWidget() ) )
 
+	## Sets the expanded items using a PathMatcher. Only the
+	# items whose expansion state differs from the current state
+	# are updated, so small edits to large expansions are cheap.
+	def setExpansion( self, paths ) :
+
+		self._qtWidget().setExpansion( paths )
+
+	## Returns a PathMatcher containing all the expanded items.
+	def getExpansion( self ) :
+
+		return _GafferUI._pathListingWidgetGetExpansion( GafferUI._qtAddress( self._qtWidget() ) )
+
 	def expansionChangedSignal( self ) :
 
 		return self.__expansionChangedSignal
@@ -330,6 +339,32 @@ class PathListingWidget( GafferUI.Widget ) :
 
 		self.selectionChangedSignal()( self )
 
+	## Returns a PathMatcher containing all the currently
+	# selected items.
+	def getSelection( self ) :
+
+		return _GafferUI._pathListingWidgetGetSelection( GafferUI._qtAddress( self._qtWidget() ) )
+
+	## Sets the currently selected items using a PathMatcher.
+	# This is much quicker than setSelectedPaths() for large
+	# selections.
+	def setSelection( self, paths, scrollToFirst=True, expandNonLeaf=True ) :
+
+		if self._qtWidget().selectionMode() != QtGui.QAbstractItemView.ExtendedSelection :
+			assert( len( paths.paths() ) <= 1 )
+
+		selectionModel = self._qtWidget().selectionModel()
+		selectionModel.selectionChanged.disconnect( self.__selectionChangedSlot )
+
+		_GafferUI._pathListingWidgetSetSelection(
+			GafferUI._qtAddress( self._qtWidget() ),
+			paths, scrollToFirst, expandNonLeaf
+		)
+
+		selectionModel.selectionChanged.connect( self.__selectionChangedSlot )
+
+		self.selectionChangedSignal()( self )
+
 	## \deprecated Use getSelectedPaths() instead.
 	# \todo Remove me
 	def selectedPaths( self ) :
@@ -357,7 +392,9 @@ class PathListingWidget( GafferUI.Widget ) :
 
 		return self.__dragPointer
 
-	def __update( self ) :
+	# If dirChildren is specified, it is used as the precomputed children
+	# of the directory being viewed.
+	def __update( self, dirChildren = None ) :
 
 		# update the listing if necessary. when the path itself changes, we only
 		# want to update if the directory being viewed has changed. if the path
@@ -371,21 +408,21 @@ class PathListingWidget( GafferUI.Widget ) :
 		dirPath = self.__dirPath()
 		if self.__currentDir!=dirPath or str( self.__path )==self.__currentPath :
 
-			selectedPaths = self.getSelectedPaths()
-			expandedPaths = None
+			selection = self.getSelection()
+			expansion = None
 			if str( self.__path ) == self.__currentPath :
 				# the path location itself hasn't changed so we are assuming that just the filter has.
 				# if we're in the tree view mode, the user would probably be very happy
 				# if we didn't forget what was expanded.
 				if self.getDisplayMode() == self.DisplayMode.Tree :
-					expandedPaths = self.getExpandedPaths()
+					expansion = self.getExpansion()
 
-			_GafferUI._pathListingWidgetUpdateModel( GafferUI._qtAddress( self._qtWidget() ), dirPath.copy() )
+			_GafferUI._pathListingWidgetUpdateModel( GafferUI._qtAddress( self._qtWidget() ), dirPath.copy(), dirChildren )
 
-			if expandedPaths is not None :
-				self.setExpandedPaths( expandedPaths )
+			if expansion is not None :
+				self.setExpansion( expansion )
 
-			self.setSelectedPaths( selectedPaths, scrollToFirst = False )
+			self.setSelection( selection, scrollToFirst = False )
 
 			self.__currentDir = dirPath
 
@@ -442,10 +479,48 @@ class PathListingWidget( GafferUI.Widget ) :
 	def __pathChangedUpdate( self ) :
 
 		self.__pathChangedUpdatePending = False
-		self.__update()
+
+		if self.__asynchronous :
+			# Compute the children of the new directory on a background thread,
+			# so that the UI remains responsive while we wait for slow filesystems.
+			# The children are then passed to the model on the UI thread, so that
+			# they needn't be computed again. As in DeferredPathPreview, the thread holds only a weak reference to
+			# ourselves, so we may die while it is still running.
+			thread = threading.Thread(
+				target = IECore.curry( PathListingWidget.__computeChildren, weakref.ref( self ), self.__dirPath().copy() )
+			)
+			thread.daemon = True
+			thread.start()
+		else :
+			self.__update()
 
 		return False # cause this idle callback to run once only
 
+	@staticmethod
+	def __computeChildren( selfWeakRef, dirPath ) :
+
+		# If an error occurs, we leave the model to compute the
+		# children again itself, so that the error is reported.
+		children = None
+		with IECore.IgnoredExceptions( Exception ) :
+			children = dirPath.children()
+
+		GafferUI.EventLoop.executeOnUIThread( IECore.curry( PathListingWidget.__computeChildrenFinished, selfWeakRef, dirPath, children ) )
+
+	@staticmethod
+	def __computeChildrenFinished( selfWeakRef, dirPath, children ) :
+
+		self = selfWeakRef()
+		if self is None :
+			return
+
+		if dirPath != self.__dirPath() :
+			# The path has changed since we started, so another
+			# background computation will follow to update us.
+			return
+
+		self.__update( children )
+
 	def __indexForPath( self, path ) :
 
 		result = QtCore.QModelIndex()
@@ -598,18 +673,19 @@ class _TreeView( QtGui.QTreeView ) :
 
 		self.__recalculateColumnSizes()
 
-	def setExpandedIndices( self, indices ) :
+	def setExpansion( self, paths ) :
 
 		self.collapsed.disconnect( self.__collapsed )
 		self.expanded.disconnect( self.__expanded )
 
-		self.collapseAll()
 		# This call is critical to performance - without
 		# it an update is triggered for every call to
 		# setExpanded().
 		self.scheduleDelayedItemsLayout()
-		for index in indices :
-			self.setExpanded( index, True )
+
+		# Defer to C++ to apply only the changes
+		# between the old and new expansions.
+		_GafferUI._pathListingWidgetSetExpansion( GafferUI._qtAddress( self ), paths )
 
 		self.collapsed.connect( self.__collapsed )
 		self.expanded.connect( self.__expanded )
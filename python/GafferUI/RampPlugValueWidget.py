@@ -121,9 +121,12 @@ class RampPlugValueWidget( GafferUI.PlugValueWidget ) :
 		) :
 
 			if len( slider.getPositions() ) == plug.numPoints() :
-				# the user has moved an existing point on the slider
-				for index, position in enumerate( slider.getPositions() ) :
-					plug.pointXPlug( index ).setValue( position )
+				# the user has moved an existing point on the slider.
+				# we propagate dirtiness once for all the points rather
+				# than once per point, as this happens for every mouse move.
+				with Gaffer.DirtyPropagationScope() :
+					for index, position in enumerate( slider.getPositions() ) :
+						plug.pointXPlug( index ).setValue( position )
 			else :
 				# a new position was added on the end by the user clicking
 				# on an empty area of the slider.
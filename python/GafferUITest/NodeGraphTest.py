@@ -1114,5 +1114,63 @@ class NodeGraphTest( GafferUITest.TestCase ) :
 
 		self.waitForIdle( 1000 )
 
+	def testPerformanceOverlay( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["a"] = GafferTest.AddNode()
+		s["b"] = Gaffer.Box()
+		s["b"]["a1"] = GafferTest.AddNode()
+		s["b"]["a2"] = GafferTest.AddNode()
+		s["b"]["a2"]["op1"].setInput( s["b"]["a1"]["sum"] )
+		s["n"] = Gaffer.Node()
+
+		# A node with the same name in another script,
+		# which must not be counted towards s["a"].
+		s2 = Gaffer.ScriptNode()
+		s2["a"] = GafferTest.AddNode()
+		self.assertEqual( s2["a"].fullName(), s["a"].fullName() )
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		Gaffer.PerformanceMonitor.clear()
+		Gaffer.PerformanceMonitor.setEnabled( True )
+		try :
+			s["a"]["sum"].getValue()
+			s["b"]["a2"]["sum"].getValue()
+			s2["a"]["sum"].getValue()
+		finally :
+			Gaffer.PerformanceMonitor.setEnabled( False )
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+
+		g = GafferUI.NodeGraph( s )
+		self.assertEqual( g.getPerformanceOverlay(), None )
+
+		g.setPerformanceOverlay( "computeCount" )
+		self.assertEqual( g.getPerformanceOverlay(), "computeCount" )
+
+		graphGadget = g.graphGadget()
+		self.assertEqual( graphGadget.nodeGadget( s["a"] ).getOverlayLabel(), "1" )
+		self.assertEqual( graphGadget.nodeGadget( s["b"] ).getOverlayLabel(), "2" )
+		self.assertEqual( graphGadget.nodeGadget( s["n"] ).getOverlayLabel(), "" )
+
+		# the hottest node gets the most opaque overlay
+		self.assertTrue(
+			graphGadget.nodeGadget( s["b"] ).getOverlayColor()[3] >
+			graphGadget.nodeGadget( s["a"] ).getOverlayColor()[3]
+		)
+
+		# inside the box, the nodes are shown individually
+
+		graphGadget.setRoot( s["b"] )
+		self.assertEqual( graphGadget.nodeGadget( s["b"]["a1"] ).getOverlayLabel(), "1" )
+		self.assertEqual( graphGadget.nodeGadget( s["b"]["a2"] ).getOverlayLabel(), "1" )
+
+		g.setPerformanceOverlay( None )
+		self.assertEqual( graphGadget.nodeGadget( s["b"]["a1"] ).getOverlayLabel(), "" )
+		self.assertEqual( graphGadget.nodeGadget( s["b"]["a1"] ).getOverlayColor(), IECore.Color4f( 0 ) )
+
+		Gaffer.PerformanceMonitor.clear()
+
 if __name__ == "__main__":
 	unittest.main()
@@ -80,6 +80,67 @@ class PathListingWidgetTest( unittest.TestCase ) :
 		w.setPath( Gaffer.DictPath( {}, "/" ) )
 		self.assertEqual( len( w.getExpandedPaths() ), 0 )
 
+	def testExpansion( self ) :
+
+		d = {}
+		for i in range( 0, 10 ) :
+			dd = {}
+			for j in range( 0, 10 ) :
+				dd[str(j)] = j
+			d[str(i)] = dd
+
+		p = Gaffer.DictPath( d, "/" )
+		w = GafferUI.PathListingWidget( p, displayMode = GafferUI.PathListingWidget.DisplayMode.Tree )
+		self.assertTrue( w.getExpansion().isEmpty() )
+
+		c = GafferTest.CapturingSlot( w.expansionChangedSignal() )
+
+		w.setExpansion( Gaffer.PathMatcher( [ "/1", "/2" ] ) )
+		self.assertEqual( len( c ), 1 )
+		self.assertEqual( w.getExpansion(), Gaffer.PathMatcher( [ "/1", "/2" ] ) )
+		self.assertTrue( w.getPathExpanded( Gaffer.DictPath( d, "/1" ) ) )
+		self.assertTrue( w.getPathExpanded( Gaffer.DictPath( d, "/2" ) ) )
+		self.assertFalse( w.getPathExpanded( Gaffer.DictPath( d, "/3" ) ) )
+
+		w.setExpansion( Gaffer.PathMatcher( [ "/2", "/3" ] ) )
+		self.assertEqual( len( c ), 2 )
+		self.assertEqual( w.getExpansion(), Gaffer.PathMatcher( [ "/2", "/3" ] ) )
+		self.assertFalse( w.getPathExpanded( Gaffer.DictPath( d, "/1" ) ) )
+
+		# Paths which don't exist should be ignored.
+		w.setExpansion( Gaffer.PathMatcher( [ "/2", "/notThere" ] ) )
+		self.assertEqual( w.getExpansion(), Gaffer.PathMatcher( [ "/2" ] ) )
+
+		w.setExpansion( Gaffer.PathMatcher() )
+		self.assertTrue( w.getExpansion().isEmpty() )
+
+	def testSelection( self ) :
+
+		d = {
+			"a" : {
+				"e" : 10,
+			},
+			"b" : {
+				"f" : "g",
+			},
+		}
+
+		p = Gaffer.DictPath( d, "/" )
+		w = GafferUI.PathListingWidget( p, allowMultipleSelection=True, displayMode = GafferUI.PathListingWidget.DisplayMode.Tree )
+		self.assertTrue( w.getSelection().isEmpty() )
+
+		c = GafferTest.CapturingSlot( w.selectionChangedSignal() )
+
+		w.setSelection( Gaffer.PathMatcher( [ "/a", "/b/f" ] ) )
+		self.assertEqual( len( c ), 1 )
+		self.assertEqual( w.getSelection(), Gaffer.PathMatcher( [ "/a", "/b/f" ] ) )
+		self.assertEqual( set( [ str( p ) for p in w.getSelectedPaths() ] ), set( [ "/a", "/b/f" ] ) )
+		self.assertTrue( w.getPathExpanded( Gaffer.DictPath( d, "/a" ) ) )
+
+		w.setSelection( Gaffer.PathMatcher() )
+		self.assertEqual( len( c ), 2 )
+		self.assertTrue( w.getSelection().isEmpty() )
+
 	def testExpansionSignalFrequency( self ) :
 
 		d = {}
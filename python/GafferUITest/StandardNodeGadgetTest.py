@@ -175,6 +175,22 @@ class StandardNodeGadgetTest( GafferUITest.TestCase ) :
 		Gaffer.Metadata.registerPlugValue( n["op2"], "nodeGadget:nodulePosition", "left" )
 		self.assertEqual( g.noduleTangent( g.nodule( n["op2"] ) ), IECore.V3f( -1, 0, 0 ) )
 
+	def testOverlay( self ) :
+
+		n = Gaffer.Node()
+		g = GafferUI.StandardNodeGadget( n )
+
+		self.assertEqual( g.getOverlayColor(), IECore.Color4f( 0 ) )
+		self.assertEqual( g.getOverlayLabel(), "" )
+
+		g.setOverlay( IECore.Color4f( 1, 0, 0, 0.5 ), "10ms" )
+		self.assertEqual( g.getOverlayColor(), IECore.Color4f( 1, 0, 0, 0.5 ) )
+		self.assertEqual( g.getOverlayLabel(), "10ms" )
+
+		g.setOverlay( IECore.Color4f( 0 ) )
+		self.assertEqual( g.getOverlayColor(), IECore.Color4f( 0 ) )
+		self.assertEqual( g.getOverlayLabel(), "" )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -55,15 +55,39 @@ using namespace IECore;
 static InternedString g_frame( "frame" );
 
 Context::Context()
-	:	m_changedSignal( NULL ), m_hashValid( false )
+	:	m_changedSignal( NULL ), m_canceller( NULL ), m_hashValid( false )
 {
 	set( g_frame, 1.0f );
 }
 
 Context::Context( const Context &other, Ownership ownership )
-	:	m_map( other.m_map ), m_changedSignal( NULL ), m_hash( other.m_hash ), m_hashValid( other.m_hashValid )
+	:	m_map( other.m_map ), m_changedSignal( NULL ), m_canceller( other.m_canceller ), m_hash( other.m_hash ), m_hashValid( other.m_hashValid )
 {
-	// We used the (shallow) Map copy constructor in our initialiser above
+	copyStorage( ownership );
+}
+
+Context::Context( const Context &other, const Canceller &canceller )
+	:	m_map( other.m_map ), m_changedSignal( NULL ), m_canceller( &canceller ), m_hash( other.m_hash ), m_hashValid( other.m_hashValid )
+{
+	copyStorage( Copied );
+}
+
+Context::~Context()
+{
+	for( Map::const_iterator it = m_map.begin(), eIt = m_map.end(); it != eIt; ++it )
+	{
+		if( it->second.ownership != Borrowed )
+		{
+			it->second.data->removeRef();
+		}
+	}
+
+	delete m_changedSignal;
+}
+
+void Context::copyStorage( Ownership ownership )
+{
+	// Our constructors use the (shallow) Map copy constructor in their initialisers
 	// because it offers a big performance win over iterating and inserting copies
 	// ourselves. Now we need to go in and tweak our copies based on the ownership.
 
@@ -89,19 +113,6 @@ Context::Context( const Context &other, Ownership ownership )
 	}
 }
 
-Context::~Context()
-{
-	for( Map::const_iterator it = m_map.begin(), eIt = m_map.end(); it != eIt; ++it )
-	{
-		if( it->second.ownership != Borrowed )
-		{
-			it->second.data->removeRef();
-		}
-	}
-
-	delete m_changedSignal;
-}
-
 void Context::remove( const IECore::InternedString &name )
 {
 	Map::iterator it = m_map.find( name );
@@ -154,6 +165,11 @@ Context::ChangedSignal &Context::changedSignal()
 	return *m_changedSignal;
 }
 
+const Canceller *Context::canceller() const
+{
+	return m_canceller;
+}
+
 IECore::MurmurHash Context::hash() const
 {
 	if( m_hashValid )
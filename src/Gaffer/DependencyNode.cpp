@@ -36,9 +36,12 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "tbb/enumerable_thread_specific.h"
+#include "tbb/atomic.h"
 
-#include "boost/graph/adjacency_list.hpp"
-#include "boost/graph/topological_sort.hpp"
+#include "boost/bind.hpp"
+#include "boost/unordered_set.hpp"
+
+#include "IECore/MessageHandler.h"
 
 #include "Gaffer/DependencyNode.h"
 #include "Gaffer/ValuePlug.h"
@@ -49,9 +52,19 @@ using namespace Gaffer;
 
 IE_CORE_DEFINERUNTIMETYPED( DependencyNode );
 
+namespace
+{
+
+// Incremented by invalidateAllAffectsCaches(). Each node compares
+// this with its own generation to find out if its cache is stale.
+tbb::atomic<size_t> g_affectsCacheGeneration;
+
+} // namespace
+
 DependencyNode::DependencyNode( const std::string &name )
-	:	Node( name )
+	:	Node( name ), m_affectsCacheGeneration( g_affectsCacheGeneration )
 {
+	plugSetSignal().connect( boost::bind( &DependencyNode::plugChanged, this, ::_1 ) );
 }
 
 DependencyNode::~DependencyNode()
@@ -88,11 +101,56 @@ const Plug *DependencyNode::correspondingInput( const Plug *output ) const
 }
 
 //////////////////////////////////////////////////////////////////////////
-// Dirty propagation
+// Affects cache
 //////////////////////////////////////////////////////////////////////////
 
-namespace
+const DependencyNode::AffectedPlugsContainer &DependencyNode::cachedAffects( const Plug *input ) const
 {
+	const size_t generation = g_affectsCacheGeneration;
+	if( generation != m_affectsCacheGeneration )
+	{
+		m_affectsCache.clear();
+		m_affectsCacheGeneration = generation;
+	}
+
+	AffectsCache::const_iterator it = m_affectsCache.find( input );
+	if( it != m_affectsCache.end() )
+	{
+		return it->second;
+	}
+
+	// Compute into a temporary so that nothing is cached
+	// if affects() throws.
+	AffectedPlugsContainer affected;
+	affects( input, affected );
+
+	AffectedPlugsContainer &result = m_affectsCache[input];
+	result.swap( affected );
+	return result;
+}
+
+void DependencyNode::invalidateAffectsCache()
+{
+	m_affectsCache.clear();
+}
+
+void DependencyNode::invalidateAllAffectsCaches()
+{
+	++g_affectsCacheGeneration;
+}
+
+void DependencyNode::plugChanged( Plug *plug )
+{
+	// Implementations of affects() may legitimately depend on
+	// the values of our plugs, so we must discard the cache whenever
+	// they change. Changes to connections and the plug hierarchy
+	// are dealt with separately by invalidateAllAffectsCaches().
+	invalidateAffectsCache();
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Dirty propagation
+//////////////////////////////////////////////////////////////////////////
 
 // We don't emit dirtiness immediately for each plug as we traverse the
 // dependency graph for two reasons :
@@ -107,77 +165,126 @@ namespace
 // The container used is stored per-thread as although it's illegal to be
 // monkeying with a script from multiple threads, it's perfectly legal to
 // be monkeying with a different script in each thread.
-class DirtyPlugs
+class DependencyNode::DirtyPlugs
 {
 
 	public :
 
+		DirtyPlugs()
+			:	m_deferCount( 0 ), m_emitting( false )
+		{
+		}
+
 		void insert( Plug *plugToDirty )
 		{
+			// A plug without any references can't have a parent or any
+			// outputs, so there is nothing to propagate to. We mustn't
+			// take a reference to it either, because dropping it would
+			// destroy the plug.
+			if( !plugToDirty->refCount() )
+			{
+				return;
+			}
+
+			// If the container is currently empty then we are at the start of a traversal,
+			// and will emit plugDirtiedSignal() and empty the container before returning
+			// from this function. If the container isn't empty then we are mid-traversal
+			// and will just add to it. Likewise, if a DirtyPropagationScope is active we
+			// just add to the container, and leave the emission to the scope.
+			const bool emit = empty() && !m_deferCount;
 			insertInternal( plugToDirty );
+			if( emit )
+			{
+				emitAndClear();
+			}
+		}
+
+		void defer()
+		{
+			m_deferCount++;
 		}
 
-		void emit()
+		void undefer()
 		{
-			std::vector<VertexDescriptor> sorted;
-			topological_sort( m_graph, std::back_inserter( sorted ) );
-			for( std::vector<VertexDescriptor>::const_reverse_iterator it = sorted.rbegin(), eIt = sorted.rend(); it != eIt; ++it )
+			if( --m_deferCount == 0 && !m_emitting && !empty() )
 			{
-				Plug *plug = m_graph[*it];
-				Node *node = plug->node();
-				if( node )
-				{
-					node->plugDirtiedSignal()( plug );
-				}
+				emitAndClear();
 			}
 		}
 
-		void clear()
+	private :
+
+		bool empty() const
 		{
-			m_graph.clear();
-			m_plugs.clear();
+			return m_visited.empty();
 		}
 
-		bool empty() const
+		// We clear rather than reallocate our containers, so that
+		// their storage is reused from one propagation to the next.
+		void clear()
 		{
-			return m_plugs.empty();
+			m_visited.clear();
+			// Releasing our references may destroy plugs, and a destroyed
+			// plug may propagate dirtiness as it disconnects its outputs. So
+			// we must have finished with m_postOrder before releasing them.
+			std::vector<PlugPtr> postOrder;
+			postOrder.swap( m_postOrder );
+			postOrder.clear();
+			if( m_postOrder.empty() )
+			{
+				postOrder.swap( m_postOrder );
+			}
 		}
 
-	private :
+		// Emitting in the reverse of the order in which plugs were finished
+		// by the traversal guarantees that dirtiness is only signalled for
+		// an affected plug after it has been signalled for all upstream dirty
+		// plugs. Plugs inserted by slots connected to plugDirtiedSignal() are
+		// emitted in a subsequent batch.
+		void emitAndClear()
+		{
+			m_emitting = true;
+			try
+			{
+				size_t batchBegin = 0;
+				while( batchBegin < m_postOrder.size() )
+				{
+					const size_t batchEnd = m_postOrder.size();
+					for( size_t i = batchEnd; i > batchBegin; --i )
+					{
+						Plug *plug = m_postOrder[i-1].get();
+						if( Node *node = plug->node() )
+						{
+							node->plugDirtiedSignal()( plug );
+						}
+					}
+					batchBegin = batchEnd;
+				}
+			}
+			catch( ... )
+			{
+				m_emitting = false;
+				clear();
+				throw;
+			}
+			m_emitting = false;
+			clear();
+		}
 
-		// We use this graph structure to keep track of the dirty propagation.
-		// Vertices in the graph represent plugs which have been dirtied, and
-		// edges represent the relationships that caused the dirtying - an
-		// edge from U to V indicates that V was dirtied by U. We do a topological
-		// sort on the graph to give us an appropriate order to emit the dirty
-		// signals in, so that dirtiness is only signalled for an affected plug
-		// after it has been signalled for all upstream dirty plugs.
-		typedef boost::adjacency_list<vecS, vecS, directedS, Plug *> Graph;
-		typedef Graph::vertex_descriptor VertexDescriptor;
-
-		typedef std::map<const Plug *, VertexDescriptor> PlugMap;
-
-		// Inserts a vertex representing plugToDirty into the graph, and
-		// then inserts all affected plugs. Note that we visit affected
-		// plugs for plugToDirty in the reverse order to which we wish to
-		// emit signals - this is because boost::topological_sort() outputs
-		// vertices in reverse order.
-		VertexDescriptor insertInternal( Plug *plugToDirty )
+		// Performs a depth first traversal from plugToDirty, appending
+		// each plug to m_postOrder only after all the plugs it dirties
+		// have been appended. Note that we visit the dirtied plugs in
+		// the reverse of the order in which we wish to emit signals, to
+		// account for the reversal in emitAndClear().
+		void insertInternal( Plug *plugToDirty )
 		{
 			// If we've inserted this one before, then early out. There's
-			// no point repeating the propagation all over again, and our
-			// Graph isn't designed to have duplicate edges anyway.
-			PlugMap::const_iterator it = m_plugs.find( plugToDirty );
-			if( it != m_plugs.end() )
+			// no point repeating the propagation all over again.
+			if( !m_visited.insert( plugToDirty ).second )
 			{
-				return it->second;
+				return;
 			}
 
-			// Insert a vertex for this plug.
-			VertexDescriptor result = add_vertex( m_graph );
-			m_graph[result] = plugToDirty;
-			m_plugs[plugToDirty] = result;
-
 			// Propagate dirtiness to output plugs and affected plugs.
 			// We only propagate dirtiness along leaf level plugs, because
 			// they are the only plugs which can be the target of the affects(),
@@ -186,16 +293,14 @@ class DirtyPlugs
 			{
 				for( Plug::OutputContainer::const_reverse_iterator it=plugToDirty->outputs().rbegin(), eIt=plugToDirty->outputs().rend(); it!=eIt; ++it )
 				{
-					VertexDescriptor outputVertex = insertInternal( const_cast<Plug *>( *it ) );
-					add_edge( result, outputVertex, m_graph );
+					insertInternal( const_cast<Plug *>( *it ) );
 				}
 
 				const DependencyNode *dependencyNode = plugToDirty->ancestor<DependencyNode>();
 				if( dependencyNode )
 				{
-					DependencyNode::AffectedPlugsContainer affected;
-					dependencyNode->affects( plugToDirty, affected );
-					for( DependencyNode::AffectedPlugsContainer::const_reverse_iterator it=affected.rbegin(); it!=affected.rend(); it++ )
+					const AffectedPlugsContainer &affected = dependencyNode->cachedAffects( plugToDirty );
+					for( AffectedPlugsContainer::const_reverse_iterator it=affected.rbegin(); it!=affected.rend(); it++ )
 					{
 						if( ( *it )->isInstanceOf( (IECore::TypeId)Gaffer::CompoundPlugTypeId ) )
 						{
@@ -206,49 +311,64 @@ class DirtyPlugs
 						}
 						// cast is ok - AffectedPlugsContainer only holds const pointers so that
 						// affects() can be const to discourage implementations from having side effects.
-						VertexDescriptor affectedVertex = insertInternal( const_cast<Plug *>( *it ) );
-						add_edge( result, affectedVertex, m_graph );
+						insertInternal( const_cast<Plug *>( *it ) );
 					}
 				}
 			}
 
 			// Insert all ancestor plugs.
-			Plug *child = plugToDirty;
-			VertexDescriptor childVertex = result;
-			while( Plug *parent = child->parent<Plug>() )
+			if( Plug *parent = plugToDirty->parent<Plug>() )
 			{
-				VertexDescriptor parentVertex = insertInternal( parent );
-				add_edge( childVertex, parentVertex, m_graph );
-
-				child = parent;
-				childVertex = parentVertex;
+				insertInternal( parent );
 			}
 
-			return result;
+			m_postOrder.push_back( plugToDirty );
 		}
 
-		Graph m_graph;
-		PlugMap m_plugs;
+		// We hold a reference to each plug until we have finished emitting,
+		// because slots connected to plugDirtiedSignal() (or any edits made
+		// within a DirtyPropagationScope) may remove plugs from the graph.
+		// Holding the references also guarantees that an address in m_visited
+		// can't be reused by a new plug before we're done.
+		typedef boost::unordered_set<const Plug *> VisitedSet;
+		VisitedSet m_visited;
+		std::vector<PlugPtr> m_postOrder;
 
-};
+		int m_deferCount;
+		bool m_emitting;
 
-} // namespace
+};
 
-static tbb::enumerable_thread_specific<DirtyPlugs> g_dirtyPlugs;
+DependencyNode::DirtyPlugs &DependencyNode::dirtyPlugs()
+{
+	static tbb::enumerable_thread_specific<DirtyPlugs> g_dirtyPlugs;
+	return g_dirtyPlugs.local();
+}
 
 void DependencyNode::propagateDirtiness( Plug *plugToDirty )
 {
-	DirtyPlugs &dirtyPlugs = g_dirtyPlugs.local();
+	dirtyPlugs().insert( plugToDirty );
+}
+
+//////////////////////////////////////////////////////////////////////////
+// DirtyPropagationScope
+//////////////////////////////////////////////////////////////////////////
+
+DirtyPropagationScope::DirtyPropagationScope()
+{
+	DependencyNode::dirtyPlugs().defer();
+}
 
-	// If the container is currently empty then we are at the start of a traversal,
-	// and will emit plugDirtiedSignal() and empty the container before returning
-	// from this function. If the container isn't empty then we are mid-traversal
-	// and will just add to it.
-	const bool emit = dirtyPlugs.empty();
-	dirtyPlugs.insert( plugToDirty );
-	if( emit )
+DirtyPropagationScope::~DirtyPropagationScope()
+{
+	// We mustn't throw from a destructor, so we report any
+	// errors from slots connected to plugDirtiedSignal() instead.
+	try
+	{
+		DependencyNode::dirtyPlugs().undefer();
+	}
+	catch( const std::exception &e )
 	{
-		dirtyPlugs.emit();
-		dirtyPlugs.clear();
+		IECore::msg( IECore::Msg::Error, "DirtyPropagationScope", e.what() );
 	}
 }
@@ -39,13 +39,19 @@
 #include <grp.h>
 #include <sys/stat.h>
 
+#include <algorithm>
+#include <ctime>
+
 #include "boost/filesystem.hpp"
 #include "boost/filesystem/operations.hpp"
 #include "boost/algorithm/string.hpp"
 #include "boost/date_time/posix_time/conversion.hpp"
 
+#include "tbb/parallel_for.h"
+
 #include "IECore/SimpleTypedData.h"
 #include "IECore/DateTimeData.h"
+#include "IECore/LRUCache.h"
 
 #include "Gaffer/PathFilter.h"
 #include "Gaffer/FileSystemPath.h"
@@ -66,6 +72,246 @@ static InternedString g_groupPropertyName( "fileSystem:group" );
 static InternedString g_modificationTimePropertyName( "fileSystem:modificationTime" );
 static InternedString g_sizePropertyName( "fileSystem:size" );
 
+//////////////////////////////////////////////////////////////////////////
+// Directory listing cache
+//
+// Browsing large directories (typically render outputs with many thousands
+// of frames) over a network filesystem is dominated by the cost of calling
+// stat() on every entry, often several times over as the various properties
+// are queried. We therefore cache the contents of each directory along with
+// the stat results for its entries, populating the entries in parallel.
+// A listing is considered valid for as long as the directory itself is
+// unchanged, as determined by stat()ing the directory each time children()
+// is called. The children hold on to the listing they were made from, and
+// answer isValid(), isLeaf() and property() queries from it directly.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct DirectoryEntry
+{
+
+	DirectoryEntry( const std::string &name )
+		:	name( name ), valid( false ), directory( false ), uid( 0 ), gid( 0 ), modificationTime( 0 ), size( 0 )
+	{
+	}
+
+	std::string name;
+	// True if the entry exists, even if it is a broken symbolic link.
+	bool valid;
+	// As with is_directory(), symbolic links are followed.
+	bool directory;
+	uid_t uid;
+	gid_t gid;
+	std::time_t modificationTime;
+	uintmax_t size;
+
+	bool operator < ( const DirectoryEntry &other ) const
+	{
+		return name < other.name;
+	}
+
+};
+
+// The subset of a directory's stat() results used to determine
+// whether or not a listing is out of date.
+struct DirectorySignature
+{
+
+	DirectorySignature()
+		:	modificationTime( 0 ), inode( 0 ), size( 0 )
+	{
+	}
+
+	DirectorySignature( const struct stat &s )
+		:	modificationTime( s.st_mtime ), inode( s.st_ino ), size( s.st_size )
+	{
+	}
+
+	bool operator == ( const DirectorySignature &other ) const
+	{
+		return modificationTime == other.modificationTime && inode == other.inode && size == other.size;
+	}
+
+	std::time_t modificationTime;
+	ino_t inode;
+	off_t size;
+
+};
+
+struct StatEntries
+{
+
+	StatEntries( const std::string &directory, std::vector<DirectoryEntry> &entries )
+		:	m_directory( directory ), m_entries( entries )
+	{
+	}
+
+	void operator()( const tbb::blocked_range<size_t> &r ) const
+	{
+		for( size_t i = r.begin(); i != r.end(); ++i )
+		{
+			DirectoryEntry &entry = m_entries[i];
+			const std::string fileName = m_directory + "/" + entry.name;
+			struct stat s;
+			if( stat( fileName.c_str(), &s ) == 0 )
+			{
+				entry.valid = true;
+				entry.directory = S_ISDIR( s.st_mode );
+				entry.uid = s.st_uid;
+				entry.gid = s.st_gid;
+				entry.modificationTime = s.st_mtime;
+				entry.size = S_ISREG( s.st_mode ) ? s.st_size : 0;
+			}
+			else if( lstat( fileName.c_str(), &s ) == 0 )
+			{
+				// Broken symbolic link.
+				entry.valid = true;
+				entry.uid = s.st_uid;
+				entry.gid = s.st_gid;
+				entry.modificationTime = s.st_mtime;
+			}
+		}
+	}
+
+	private :
+
+		const std::string &m_directory;
+		std::vector<DirectoryEntry> &m_entries;
+
+};
+
+} // namespace
+
+class FileSystemPath::DirectoryListing : public IECore::RefCounted
+{
+
+	public :
+
+		DirectoryListing( const std::string &directory )
+			:	directory( directory ), stable( false )
+		{
+		}
+
+		const std::string directory;
+		DirectorySignature signature;
+		// Modification times only have a resolution of one second on many
+		// filesystems, so a directory modified in the same second as we
+		// listed it might be modified again without the signature changing.
+		// We don't trust such listings, and never cache them.
+		bool stable;
+		// Sorted by name.
+		std::vector<DirectoryEntry> entries;
+
+		const DirectoryEntry *entry( const std::string &name ) const
+		{
+			std::vector<DirectoryEntry>::const_iterator it = std::lower_bound( entries.begin(), entries.end(), DirectoryEntry( name ) );
+			if( it != entries.end() && it->name == name )
+			{
+				return &(*it);
+			}
+			return NULL;
+		}
+
+		// Returns an up to date listing for the directory, computing
+		// it if necessary, or NULL if the directory doesn't exist.
+		static ConstDirectoryListingPtr listing( const std::string &directory )
+		{
+			struct stat s;
+			if( stat( directory.c_str(), &s ) != 0 || !S_ISDIR( s.st_mode ) )
+			{
+				return NULL;
+			}
+
+			// We use get() alone rather than checking cached() first, because
+			// the entry could be evicted between the two calls. The getter
+			// never lists anything, so a miss simply yields NULL.
+			Cache *c = cache();
+			ConstDirectoryListingPtr result = c->get( directory );
+			if( result && result->stable && result->signature == DirectorySignature( s ) )
+			{
+				return result;
+			}
+
+			// We compute the listing ourselves rather than via the cache, so
+			// that an unstable listing can be returned without caching it.
+			// It is up to date now, but must be recomputed the next time.
+			DirectoryListingPtr newListing = new DirectoryListing( directory );
+			newListing->list( s );
+			if( newListing->stable )
+			{
+				c->set( directory, newListing, 1 + newListing->entries.size() );
+			}
+			else
+			{
+				c->erase( directory );
+			}
+
+			return newListing;
+		}
+
+		// Returns the entry for the path from the listing it was created
+		// from by FileSystemPath::doChildren(), or NULL if there is no such
+		// listing. The listing was validated when the children were made,
+		// so this never touches the filesystem.
+		static const DirectoryEntry *entry( const FileSystemPath *fileSystemPath )
+		{
+			const DirectoryListing *listing = fileSystemPath->m_parentListing.get();
+			if( !listing || fileSystemPath->names().empty() )
+			{
+				return NULL;
+			}
+
+			// The path may have been modified since it was created.
+			if( path( fileSystemPath->string() ).parent_path().string() != listing->directory )
+			{
+				return NULL;
+			}
+
+			return listing->entry( fileSystemPath->names().back().value() );
+		}
+
+	private :
+
+		void list( const struct stat &s )
+		{
+			signature = DirectorySignature( s );
+			stable = time( NULL ) > s.st_mtime + 1;
+
+			boost::system::error_code e;
+			for( directory_iterator it( path( directory ), e ), eIt; it != eIt; it.increment( e ) )
+			{
+				if( e )
+				{
+					break;
+				}
+				entries.push_back( DirectoryEntry( it->path().filename().string() ) );
+			}
+
+			std::sort( entries.begin(), entries.end() );
+			tbb::parallel_for( tbb::blocked_range<size_t>( 0, entries.size() ), StatEntries( directory, entries ) );
+		}
+
+		typedef LRUCache<std::string, ConstDirectoryListingPtr> Cache;
+
+		// Listings are computed by listing() and inserted with set(),
+		// so the getter just reports a miss.
+		static ConstDirectoryListingPtr getter( const std::string &directory, size_t &cost )
+		{
+			cost = 0;
+			return NULL;
+		}
+
+		static Cache *cache()
+		{
+			// Cost is measured in entries.
+			static Cache *c = new Cache( getter, 1000000 );
+			return c;
+		}
+
+};
+
 FileSystemPath::FileSystemPath( PathFilterPtr filter )
 	:	Path( filter )
 {
@@ -87,12 +333,27 @@ FileSystemPath::~FileSystemPath()
 
 bool FileSystemPath::isValid() const
 {
+	if( !Path::isValid() )
+	{
+		return false;
+	}
+
+	if( const DirectoryEntry *entry = DirectoryListing::entry( this ) )
+	{
+		return entry->valid;
+	}
+
 	const file_type t = symlink_status( path( this->string() ) ).type();
-	return Path::isValid() && t != status_error && t != file_not_found;
+	return t != status_error && t != file_not_found;
 }
 
 bool FileSystemPath::isLeaf() const
 {
+	if( const DirectoryEntry *entry = DirectoryListing::entry( this ) )
+	{
+		return entry->valid && !entry->directory;
+	}
+
 	return isValid() && !is_directory( path( this->string() ) );
 }
 
@@ -108,55 +369,94 @@ void FileSystemPath::propertyNames( std::vector<IECore::InternedString> &names )
 
 IECore::ConstRunTimeTypedPtr FileSystemPath::property( const IECore::InternedString &name ) const
 {
+	if(
+		name != g_ownerPropertyName && name != g_groupPropertyName &&
+		name != g_modificationTimePropertyName && name != g_sizePropertyName
+	)
+	{
+		return Path::property( name );
+	}
+
+	const DirectoryEntry *entry = DirectoryListing::entry( this );
+
 	if( name == g_ownerPropertyName )
 	{
-		std::string n = this->string();
-		struct stat s;
-		stat( n.c_str(), &s );
-		struct passwd *pw = getpwuid( s.st_uid );
+		uid_t uid;
+		if( entry )
+		{
+			uid = entry->uid;
+		}
+		else
+		{
+			std::string n = this->string();
+			struct stat s;
+			stat( n.c_str(), &s );
+			uid = s.st_uid;
+		}
+		struct passwd *pw = getpwuid( uid );
 		return new StringData( pw ? pw->pw_name : "" );
 	}
 	else if( name == g_groupPropertyName )
 	{
-		std::string n = this->string();
-		struct stat s;
-		stat( n.c_str(), &s );
-		struct group *gr = getgrgid( s.st_gid );
+		gid_t gid;
+		if( entry )
+		{
+			gid = entry->gid;
+		}
+		else
+		{
+			std::string n = this->string();
+			struct stat s;
+			stat( n.c_str(), &s );
+			gid = s.st_gid;
+		}
+		struct group *gr = getgrgid( gid );
 		return new StringData( gr ? gr->gr_name : "" );
 	}
 	else if( name == g_modificationTimePropertyName )
 	{
+		if( entry )
+		{
+			return new DateTimeData( from_time_t( entry->modificationTime ) );
+		}
 		boost::system::error_code e;
 		std::time_t t = last_write_time( path( this->string() ), e );
 		return new DateTimeData( from_time_t( t ) );
 	}
-	else if( name == g_sizePropertyName )
+	else
 	{
+		if( entry )
+		{
+			return new UInt64Data( entry->size );
+		}
 		boost::system::error_code e;
 		uintmax_t s = file_size( path( this->string() ), e );
 		return new UInt64Data( !e ? s : 0 );
 	}
-
-	return Path::property( name );
 }
 
 PathPtr FileSystemPath::copy() const
 {
-	return new FileSystemPath( names(), root(), const_cast<PathFilter *>( getFilter() ) );
+	FileSystemPathPtr result = new FileSystemPath( names(), root(), const_cast<PathFilter *>( getFilter() ) );
+	result->m_parentListing = m_parentListing;
+	return result;
 }
 
 void FileSystemPath::doChildren( std::vector<PathPtr> &children ) const
 {
-	path p( this->string() );
-
-	if( !is_directory( p ) )
+	const std::string directory = this->string();
+	ConstDirectoryListingPtr listing = DirectoryListing::listing( directory );
+	if( !listing )
 	{
 		return;
 	}
 
-	for( directory_iterator it( p ), eIt; it != eIt; ++it )
+	children.reserve( children.size() + listing->entries.size() );
+	for( std::vector<DirectoryEntry>::const_iterator it = listing->entries.begin(), eIt = listing->entries.end(); it != eIt; ++it )
 	{
-		children.push_back( new FileSystemPath( it->path().string(), const_cast<PathFilter *>( getFilter() ) ) );
+		FileSystemPathPtr child = new FileSystemPath( ( path( directory ) / it->name ).string(), const_cast<PathFilter *>( getFilter() ) );
+		child->m_parentListing = listing;
+		children.push_back( child );
 	}
 }
 
@@ -0,0 +1,1261 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+#include <cstdlib>
+#include <cstring>
+#include <sstream>
+
+#include "boost/format.hpp"
+
+#include "IECore/SimpleTypedData.h"
+
+#include "Gaffer/Expression.h"
+#include "Gaffer/NumericPlug.h"
+#include "Gaffer/TypedPlug.h"
+#include "Gaffer/Context.h"
+
+using namespace IECore;
+using namespace Gaffer;
+
+//////////////////////////////////////////////////////////////////////////
+// The "native" expression engine implements a small C-like language for
+// simple arithmetic and string manipulation. Expressions are compiled once
+// into bytecode for a simple stack machine, and are then executed without
+// any need for Python or the GIL, so may be evaluated freely in parallel.
+// An expression is a single assignment to a plug :
+//
+//     parent.node.plug = parent.otherNode.plug * 2 + context.frame
+//
+// Plugs and context variables may also be referenced using Python style
+// subscripts, as in parent["node"]["plug"] and context["frame"], and the
+// context.get( name, default ) and context.getFrame() methods familiar
+// from the python engine are also supported.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+//////////////////////////////////////////////////////////////////////////
+// Values
+//////////////////////////////////////////////////////////////////////////
+
+struct Value
+{
+
+	enum Type
+	{
+		Int,
+		Float,
+		String
+	};
+
+	Value()
+		:	type( Int ), i( 0 ), f( 0.0f )
+	{
+	}
+
+	explicit Value( int v )
+		:	type( Int ), i( v ), f( 0.0f )
+	{
+	}
+
+	explicit Value( float v )
+		:	type( Float ), i( 0 ), f( v )
+	{
+	}
+
+	explicit Value( const std::string &v )
+		:	type( String ), i( 0 ), f( 0.0f ), s( v )
+	{
+	}
+
+	float asFloat() const
+	{
+		return type == Float ? f : (float)i;
+	}
+
+	int asInt() const
+	{
+		return type == Float ? (int)f : i;
+	}
+
+	bool asBool() const
+	{
+		switch( type )
+		{
+			case Int :
+				return i != 0;
+			case Float :
+				return f != 0.0f;
+			default :
+				return !s.empty();
+		}
+	}
+
+	std::string asString() const
+	{
+		switch( type )
+		{
+			case Int :
+			case Float :
+			{
+				std::ostringstream o;
+				if( type == Int )
+				{
+					o << i;
+				}
+				else
+				{
+					o << f;
+				}
+				return o.str();
+			}
+			default :
+				return s;
+		}
+	}
+
+	Type type;
+	int i;
+	float f;
+	std::string s;
+
+};
+
+const Value &numericArgument( const Value &v, const char *functionName )
+{
+	if( v.type == Value::String )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Function \"%s\" requires numeric arguments" ) % functionName ) );
+	}
+	return v;
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Functions
+//////////////////////////////////////////////////////////////////////////
+
+Value absFunction( const Value *args )
+{
+	const Value &v = numericArgument( args[0], "abs" );
+	return v.type == Value::Int ? Value( std::abs( v.i ) ) : Value( std::fabs( v.f ) );
+}
+
+Value floorFunction( const Value *args )
+{
+	return Value( (int)std::floor( numericArgument( args[0], "floor" ).asFloat() ) );
+}
+
+Value ceilFunction( const Value *args )
+{
+	return Value( (int)std::ceil( numericArgument( args[0], "ceil" ).asFloat() ) );
+}
+
+Value roundFunction( const Value *args )
+{
+	return Value( (int)std::floor( numericArgument( args[0], "round" ).asFloat() + 0.5f ) );
+}
+
+Value sqrtFunction( const Value *args )
+{
+	return Value( std::sqrt( numericArgument( args[0], "sqrt" ).asFloat() ) );
+}
+
+Value sinFunction( const Value *args )
+{
+	return Value( std::sin( numericArgument( args[0], "sin" ).asFloat() ) );
+}
+
+Value cosFunction( const Value *args )
+{
+	return Value( std::cos( numericArgument( args[0], "cos" ).asFloat() ) );
+}
+
+Value powFunction( const Value *args )
+{
+	return Value( std::pow( numericArgument( args[0], "pow" ).asFloat(), numericArgument( args[1], "pow" ).asFloat() ) );
+}
+
+Value minFunction( const Value *args )
+{
+	const Value &a = numericArgument( args[0], "min" );
+	const Value &b = numericArgument( args[1], "min" );
+	if( a.type == Value::Int && b.type == Value::Int )
+	{
+		return Value( std::min( a.i, b.i ) );
+	}
+	return Value( std::min( a.asFloat(), b.asFloat() ) );
+}
+
+Value maxFunction( const Value *args )
+{
+	const Value &a = numericArgument( args[0], "max" );
+	const Value &b = numericArgument( args[1], "max" );
+	if( a.type == Value::Int && b.type == Value::Int )
+	{
+		return Value( std::max( a.i, b.i ) );
+	}
+	return Value( std::max( a.asFloat(), b.asFloat() ) );
+}
+
+Value clampFunction( const Value *args )
+{
+	const Value &v = numericArgument( args[0], "clamp" );
+	const Value &l = numericArgument( args[1], "clamp" );
+	const Value &h = numericArgument( args[2], "clamp" );
+	if( v.type == Value::Int && l.type == Value::Int && h.type == Value::Int )
+	{
+		return Value( std::max( l.i, std::min( h.i, v.i ) ) );
+	}
+	return Value( std::max( l.asFloat(), std::min( h.asFloat(), v.asFloat() ) ) );
+}
+
+Value mixFunction( const Value *args )
+{
+	const float a = numericArgument( args[0], "mix" ).asFloat();
+	const float b = numericArgument( args[1], "mix" ).asFloat();
+	const float t = numericArgument( args[2], "mix" ).asFloat();
+	return Value( a + ( b - a ) * t );
+}
+
+Value intFunction( const Value *args )
+{
+	if( args[0].type != Value::String )
+	{
+		return Value( args[0].asInt() );
+	}
+	char *end = 0;
+	const long result = strtol( args[0].s.c_str(), &end, 10 );
+	if( args[0].s.empty() || *end != '\0' )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Cannot convert \"%s\" to int" ) % args[0].s ) );
+	}
+	return Value( (int)result );
+}
+
+Value floatFunction( const Value *args )
+{
+	if( args[0].type != Value::String )
+	{
+		return Value( args[0].asFloat() );
+	}
+	char *end = 0;
+	const double result = strtod( args[0].s.c_str(), &end );
+	if( args[0].s.empty() || *end != '\0' )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Cannot convert \"%s\" to float" ) % args[0].s ) );
+	}
+	return Value( (float)result );
+}
+
+Value strFunction( const Value *args )
+{
+	return Value( args[0].asString() );
+}
+
+typedef Value (*Function)( const Value *args );
+
+struct FunctionDescription
+{
+	const char *name;
+	int arity;
+	Function function;
+};
+
+const FunctionDescription g_functions[] = {
+	{ "abs", 1, absFunction },
+	{ "floor", 1, floorFunction },
+	{ "ceil", 1, ceilFunction },
+	{ "round", 1, roundFunction },
+	{ "sqrt", 1, sqrtFunction },
+	{ "sin", 1, sinFunction },
+	{ "cos", 1, cosFunction },
+	{ "pow", 2, powFunction },
+	{ "min", 2, minFunction },
+	{ "max", 2, maxFunction },
+	{ "clamp", 3, clampFunction },
+	{ "mix", 3, mixFunction },
+	{ "int", 1, intFunction },
+	{ "float", 1, floatFunction },
+	{ "str", 1, strFunction },
+};
+
+const int g_numFunctions = sizeof( g_functions ) / sizeof( FunctionDescription );
+
+//////////////////////////////////////////////////////////////////////////
+// Bytecode
+//////////////////////////////////////////////////////////////////////////
+
+enum Opcode
+{
+	// Pushes a value onto the stack.
+	PushConstant,
+	PushInput,
+	PushContext,
+	// Replaces the top of the stack with a context
+	// variable, if it exists.
+	PushContextOrDefault,
+	// Replace the top of the stack with the result.
+	Negate,
+	Not,
+	ToBool,
+	// Pop two values, and push the result.
+	Add,
+	Subtract,
+	Multiply,
+	Divide,
+	Modulo,
+	Less,
+	LessEqual,
+	Greater,
+	GreaterEqual,
+	Equal,
+	NotEqual,
+	// Flow control.
+	Jump,
+	JumpIfFalse,
+	// Pops the arguments for g_functions[argument],
+	// and pushes the result.
+	Call
+};
+
+struct Instruction
+{
+
+	Instruction( Opcode o, int a = 0 )
+		:	opcode( o ), argument( a )
+	{
+	}
+
+	Opcode opcode;
+	int argument;
+
+};
+
+typedef std::vector<Instruction> Program;
+
+const char *opcodeSymbol( Opcode opcode )
+{
+	switch( opcode )
+	{
+		case Add : return "+";
+		case Subtract : return "-";
+		case Multiply : return "*";
+		case Divide : return "/";
+		case Modulo : return "%";
+		case Less : return "<";
+		case LessEqual : return "<=";
+		case Greater : return ">";
+		case GreaterEqual : return ">=";
+		case Equal : return "==";
+		case NotEqual : return "!=";
+		default : return "";
+	}
+}
+
+template<typename T>
+Value compare( Opcode opcode, const T &a, const T &b )
+{
+	switch( opcode )
+	{
+		case Less : return Value( (int)( a < b ) );
+		case LessEqual : return Value( (int)( a <= b ) );
+		case Greater : return Value( (int)( a > b ) );
+		case GreaterEqual : return Value( (int)( a >= b ) );
+		case Equal : return Value( (int)( a == b ) );
+		default : return Value( (int)( a != b ) );
+	}
+}
+
+Value binaryOperation( Opcode opcode, const Value &a, const Value &b )
+{
+	if( a.type == Value::String || b.type == Value::String )
+	{
+		if( a.type == b.type )
+		{
+			if( opcode == Add )
+			{
+				return Value( a.s + b.s );
+			}
+			else if( opcode >= Less )
+			{
+				return compare( opcode, a.s, b.s );
+			}
+		}
+		throw IECore::Exception( boost::str( boost::format( "Unsupported operands for \"%s\"" ) % opcodeSymbol( opcode ) ) );
+	}
+
+	if( a.type == Value::Int && b.type == Value::Int )
+	{
+		switch( opcode )
+		{
+			case Add : return Value( a.i + b.i );
+			case Subtract : return Value( a.i - b.i );
+			case Multiply : return Value( a.i * b.i );
+			case Divide :
+			case Modulo :
+				if( b.i == 0 )
+				{
+					throw IECore::Exception( "Integer division by zero" );
+				}
+				return Value( opcode == Divide ? a.i / b.i : a.i % b.i );
+			default :
+				return compare( opcode, a.i, b.i );
+		}
+	}
+
+	const float x = a.asFloat();
+	const float y = b.asFloat();
+	switch( opcode )
+	{
+		case Add : return Value( x + y );
+		case Subtract : return Value( x - y );
+		case Multiply : return Value( x * y );
+		case Divide : return Value( x / y );
+		case Modulo : return Value( std::fmod( x, y ) );
+		default : return compare( opcode, x, y );
+	}
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Compiler
+//////////////////////////////////////////////////////////////////////////
+
+struct Token
+{
+
+	enum Type
+	{
+		Identifier,
+		Number,
+		String,
+		Symbol,
+		End
+	};
+
+	Type type;
+	std::string text;
+	Value value;
+	size_t position;
+
+};
+
+class Compiler
+{
+
+	public :
+
+		Compiler( const std::string &text, Program &program, std::vector<Value> &constants, std::string &outPlug, std::vector<std::string> &inPlugs, std::vector<IECore::InternedString> &contextNames )
+			:	m_expression( text ), m_position( 0 ), m_program( program ), m_constants( constants ), m_inPlugs( inPlugs ), m_contextNames( contextNames )
+		{
+			next();
+
+			const Token &t = m_token;
+			if( t.type != Token::Identifier || t.text != "parent" )
+			{
+				error( "Expected assignment to a plug" );
+			}
+			next();
+			outPlug = path();
+
+			expect( "=" );
+			expression();
+
+			if( m_token.type == Token::Symbol && m_token.text == ";" )
+			{
+				next();
+			}
+			if( m_token.type != Token::End )
+			{
+				error( "Unexpected \"" + m_token.text + "\"" );
+			}
+		}
+
+	private :
+
+		// Lexing
+		// ======
+
+		void error( const std::string &message ) const
+		{
+			throw IECore::Exception( boost::str( boost::format( "Syntax error at position %d : %s" ) % ( m_token.position + 1 ) % message ) );
+		}
+
+		void skipWhitespaceAndComments()
+		{
+			while( m_position < m_expression.size() )
+			{
+				const char c = m_expression[m_position];
+				if( isspace( c ) )
+				{
+					m_position++;
+				}
+				else if( c == '#' || m_expression.compare( m_position, 2, "//" ) == 0 )
+				{
+					while( m_position < m_expression.size() && m_expression[m_position] != '\n' )
+					{
+						m_position++;
+					}
+				}
+				else
+				{
+					break;
+				}
+			}
+		}
+
+		void next()
+		{
+			skipWhitespaceAndComments();
+
+			m_token.position = m_position;
+			m_token.text.clear();
+
+			if( m_position >= m_expression.size() )
+			{
+				m_token.type = Token::End;
+				m_token.text = "end of expression";
+				return;
+			}
+
+			const char *begin = m_expression.c_str() + m_position;
+			const char c = *begin;
+			if( isalpha( c ) || c == '_' )
+			{
+				while( m_position < m_expression.size() && ( isalnum( m_expression[m_position] ) || m_expression[m_position] == '_' ) )
+				{
+					m_position++;
+				}
+				m_token.type = Token::Identifier;
+				m_token.text = m_expression.substr( m_token.position, m_position - m_token.position );
+			}
+			else if( isdigit( c ) || ( c == '.' && isdigit( begin[1] ) ) )
+			{
+				char *end = 0;
+				const long i = strtol( begin, &end, 10 );
+				if( *end == '.' || *end == 'e' || *end == 'E' )
+				{
+					const double f = strtod( begin, &end );
+					m_token.value = Value( (float)f );
+				}
+				else
+				{
+					m_token.value = Value( (int)i );
+				}
+				m_token.type = Token::Number;
+				m_position += end - begin;
+				m_token.text = m_expression.substr( m_token.position, m_position - m_token.position );
+			}
+			else if( c == '"' || c == '\'' )
+			{
+				std::string s;
+				m_position++;
+				while( true )
+				{
+					if( m_position >= m_expression.size() )
+					{
+						error( "Unterminated string" );
+					}
+					char sc = m_expression[m_position++];
+					if( sc == c )
+					{
+						break;
+					}
+					else if( sc == '\\' && m_position < m_expression.size() )
+					{
+						sc = m_expression[m_position++];
+						switch( sc )
+						{
+							case 'n' : sc = '\n'; break;
+							case 't' : sc = '\t'; break;
+							default : break;
+						}
+					}
+					s.push_back( sc );
+				}
+				m_token.type = Token::String;
+				m_token.value = Value( s );
+				m_token.text = m_expression.substr( m_token.position, m_position - m_token.position );
+			}
+			else
+			{
+				static const char *twoCharacterSymbols[] = { "<=", ">=", "==", "!=", "&&", "||", 0 };
+				for( const char **s = twoCharacterSymbols; *s; ++s )
+				{
+					if( m_expression.compare( m_position, 2, *s ) == 0 )
+					{
+						m_token.type = Token::Symbol;
+						m_token.text = *s;
+						m_position += 2;
+						return;
+					}
+				}
+				if( !strchr( ".[](),=;+-*/%<>!?:", c ) )
+				{
+					error( boost::str( boost::format( "Unexpected character '%c'" ) % c ) );
+				}
+				m_token.type = Token::Symbol;
+				m_token.text = std::string( 1, c );
+				m_position++;
+			}
+		}
+
+		bool accept( const char *symbol )
+		{
+			if( m_token.type == Token::Symbol && m_token.text == symbol )
+			{
+				next();
+				return true;
+			}
+			return false;
+		}
+
+		void expect( const char *symbol )
+		{
+			if( !accept( symbol ) )
+			{
+				error( boost::str( boost::format( "Expected \"%s\" but found \"%s\"" ) % symbol % m_token.text ) );
+			}
+		}
+
+		// Parsing and code generation
+		// ===========================
+		//
+		// This is a simple recursive descent parser, emitting
+		// instructions as it goes. Precedence follows C.
+
+		void emit( Opcode opcode, int argument = 0 )
+		{
+			m_program.push_back( Instruction( opcode, argument ) );
+		}
+
+		// Emits a jump, returning its index so that the target can
+		// be filled in later by patch().
+		size_t emitJump( Opcode opcode )
+		{
+			emit( opcode, -1 );
+			return m_program.size() - 1;
+		}
+
+		void patch( size_t jump )
+		{
+			m_program[jump].argument = m_program.size();
+		}
+
+		void emitConstant( const Value &value )
+		{
+			m_constants.push_back( value );
+			emit( PushConstant, m_constants.size() - 1 );
+		}
+
+		// Parses a sequence of ".name" or "[\"name\"]" elements,
+		// returning them joined with ".".
+		std::string path()
+		{
+			std::string result;
+			while( true )
+			{
+				if( accept( "." ) )
+				{
+					if( m_token.type != Token::Identifier )
+					{
+						error( "Expected name after \".\"" );
+					}
+				}
+				else if( accept( "[" ) )
+				{
+					if( m_token.type != Token::String )
+					{
+						error( "Expected string subscript" );
+					}
+				}
+				else
+				{
+					break;
+				}
+
+				if( result.size() )
+				{
+					result += ".";
+				}
+				result += m_token.type == Token::String ? m_token.value.s : m_token.text;
+
+				const bool subscript = m_token.type == Token::String;
+				next();
+				if( subscript )
+				{
+					expect( "]" );
+				}
+			}
+
+			if( result.empty() )
+			{
+				error( "Expected \".\" or \"[\"" );
+			}
+			return result;
+		}
+
+		void expression()
+		{
+			conditional();
+		}
+
+		void conditional()
+		{
+			logicalOr();
+			if( accept( "?" ) )
+			{
+				const size_t jumpToFalse = emitJump( JumpIfFalse );
+				expression();
+				const size_t jumpToEnd = emitJump( Jump );
+				expect( ":" );
+				patch( jumpToFalse );
+				conditional();
+				patch( jumpToEnd );
+			}
+		}
+
+		void logicalOr()
+		{
+			logicalAnd();
+			while( accept( "||" ) )
+			{
+				const size_t jumpToRight = emitJump( JumpIfFalse );
+				emitConstant( Value( 1 ) );
+				const size_t jumpToEnd = emitJump( Jump );
+				patch( jumpToRight );
+				logicalAnd();
+				emit( ToBool );
+				patch( jumpToEnd );
+			}
+		}
+
+		void logicalAnd()
+		{
+			equality();
+			while( accept( "&&" ) )
+			{
+				const size_t jumpToFalse = emitJump( JumpIfFalse );
+				equality();
+				emit( ToBool );
+				const size_t jumpToEnd = emitJump( Jump );
+				patch( jumpToFalse );
+				emitConstant( Value( 0 ) );
+				patch( jumpToEnd );
+			}
+		}
+
+		void equality()
+		{
+			relational();
+			while( true )
+			{
+				if( accept( "==" ) )
+				{
+					relational();
+					emit( Equal );
+				}
+				else if( accept( "!=" ) )
+				{
+					relational();
+					emit( NotEqual );
+				}
+				else
+				{
+					break;
+				}
+			}
+		}
+
+		void relational()
+		{
+			additive();
+			while( true )
+			{
+				Opcode opcode;
+				if( accept( "<" ) )
+				{
+					opcode = Less;
+				}
+				else if( accept( "<=" ) )
+				{
+					opcode = LessEqual;
+				}
+				else if( accept( ">" ) )
+				{
+					opcode = Greater;
+				}
+				else if( accept( ">=" ) )
+				{
+					opcode = GreaterEqual;
+				}
+				else
+				{
+					break;
+				}
+				additive();
+				emit( opcode );
+			}
+		}
+
+		void additive()
+		{
+			multiplicative();
+			while( true )
+			{
+				if( accept( "+" ) )
+				{
+					multiplicative();
+					emit( Add );
+				}
+				else if( accept( "-" ) )
+				{
+					multiplicative();
+					emit( Subtract );
+				}
+				else
+				{
+					break;
+				}
+			}
+		}
+
+		void multiplicative()
+		{
+			unary();
+			while( true )
+			{
+				Opcode opcode;
+				if( accept( "*" ) )
+				{
+					opcode = Multiply;
+				}
+				else if( accept( "/" ) )
+				{
+					opcode = Divide;
+				}
+				else if( accept( "%" ) )
+				{
+					opcode = Modulo;
+				}
+				else
+				{
+					break;
+				}
+				unary();
+				emit( opcode );
+			}
+		}
+
+		void unary()
+		{
+			if( accept( "-" ) )
+			{
+				unary();
+				emit( Negate );
+			}
+			else if( accept( "!" ) )
+			{
+				unary();
+				emit( Not );
+			}
+			else if( accept( "+" ) )
+			{
+				unary();
+			}
+			else
+			{
+				primary();
+			}
+		}
+
+		void primary()
+		{
+			if( m_token.type == Token::Number || m_token.type == Token::String )
+			{
+				emitConstant( m_token.value );
+				next();
+			}
+			else if( accept( "(" ) )
+			{
+				expression();
+				expect( ")" );
+			}
+			else if( m_token.type == Token::Identifier )
+			{
+				const std::string name = m_token.text;
+				next();
+				if( name == "parent" )
+				{
+					emit( PushInput, index( m_inPlugs, path() ) );
+				}
+				else if( name == "context" )
+				{
+					const std::string variable = path();
+					if( accept( "(" ) )
+					{
+						contextMethod( variable );
+					}
+					else
+					{
+						emit( PushContext, index( m_contextNames, IECore::InternedString( variable ) ) );
+					}
+				}
+				else if( name == "true" || name == "false" )
+				{
+					emitConstant( Value( (int)( name == "true" ) ) );
+				}
+				else if( accept( "(" ) )
+				{
+					call( name );
+				}
+				else
+				{
+					error( "Unknown name \"" + name + "\"" );
+				}
+			}
+			else
+			{
+				error( "Unexpected \"" + m_token.text + "\"" );
+			}
+		}
+
+		// Provides the equivalent of the Context python methods
+		// used in the python engine.
+		void contextMethod( const std::string &method )
+		{
+			if( method == "getFrame" )
+			{
+				expect( ")" );
+				emit( PushContext, index( m_contextNames, IECore::InternedString( "frame" ) ) );
+			}
+			else if( method == "get" )
+			{
+				if( m_token.type != Token::String )
+				{
+					error( "Context name must be a string" );
+				}
+				const IECore::InternedString variable( m_token.value.s );
+				next();
+				if( accept( "," ) )
+				{
+					expression();
+					expect( ")" );
+					emit( PushContextOrDefault, index( m_contextNames, variable ) );
+				}
+				else
+				{
+					expect( ")" );
+					emit( PushContext, index( m_contextNames, variable ) );
+				}
+			}
+			else
+			{
+				error( "Unknown context method \"" + method + "\"" );
+			}
+		}
+
+		void call( const std::string &name )
+		{
+			int numArguments = 0;
+			if( !accept( ")" ) )
+			{
+				do
+				{
+					expression();
+					numArguments++;
+				} while( accept( "," ) );
+				expect( ")" );
+			}
+
+			for( int i = 0; i < g_numFunctions; ++i )
+			{
+				if( name == g_functions[i].name )
+				{
+					if( numArguments != g_functions[i].arity )
+					{
+						error( boost::str( boost::format( "Function \"%s\" takes %d arguments" ) % name % g_functions[i].arity ) );
+					}
+					emit( Call, i );
+					return;
+				}
+			}
+
+			error( "Unknown function \"" + name + "\"" );
+		}
+
+		// Returns the index of value in container, adding
+		// it if it is not there already.
+		template<typename T>
+		int index( std::vector<T> &container, const T &value )
+		{
+			typename std::vector<T>::const_iterator it = std::find( container.begin(), container.end(), value );
+			if( it == container.end() )
+			{
+				container.push_back( value );
+				return container.size() - 1;
+			}
+			return it - container.begin();
+		}
+
+		const std::string &m_expression;
+		size_t m_position;
+		Token m_token;
+
+		Program &m_program;
+		std::vector<Value> &m_constants;
+		std::vector<std::string> &m_inPlugs;
+		std::vector<IECore::InternedString> &m_contextNames;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// Engine
+//////////////////////////////////////////////////////////////////////////
+
+Value plugValue( const ValuePlug *plug )
+{
+	switch( (Gaffer::TypeId)plug->typeId() )
+	{
+		case IntPlugTypeId :
+			return Value( static_cast<const IntPlug *>( plug )->getValue() );
+		case FloatPlugTypeId :
+			return Value( static_cast<const FloatPlug *>( plug )->getValue() );
+		case BoolPlugTypeId :
+			return Value( (int)static_cast<const BoolPlug *>( plug )->getValue() );
+		case StringPlugTypeId :
+			return Value( static_cast<const StringPlug *>( plug )->getValue() );
+		default :
+			throw IECore::Exception( boost::str( boost::format( "Unsupported plug type \"%s\"" ) % plug->typeName() ) );
+	}
+}
+
+void setPlugValue( ValuePlug *plug, const Value &value )
+{
+	switch( (Gaffer::TypeId)plug->typeId() )
+	{
+		case IntPlugTypeId :
+			if( value.type != Value::String )
+			{
+				static_cast<IntPlug *>( plug )->setValue( value.asInt() );
+				return;
+			}
+			break;
+		case FloatPlugTypeId :
+			if( value.type != Value::String )
+			{
+				static_cast<FloatPlug *>( plug )->setValue( value.asFloat() );
+				return;
+			}
+			break;
+		case BoolPlugTypeId :
+			static_cast<BoolPlug *>( plug )->setValue( value.asBool() );
+			return;
+		case StringPlugTypeId :
+			if( value.type == Value::String )
+			{
+				static_cast<StringPlug *>( plug )->setValue( value.s );
+				return;
+			}
+			break;
+		default :
+			throw IECore::Exception( boost::str( boost::format( "Unsupported plug type \"%s\"" ) % plug->typeName() ) );
+	}
+
+	throw IECore::Exception( boost::str( boost::format( "Cannot assign %s value to \"%s\"" ) % ( value.type == Value::String ? "string" : "numeric" ) % plug->typeName() ) );
+}
+
+Value contextValue( const Data *d, const IECore::InternedString &name )
+{
+	switch( d->typeId() )
+	{
+		case IntDataTypeId :
+			return Value( static_cast<const IntData *>( d )->readable() );
+		case FloatDataTypeId :
+			return Value( static_cast<const FloatData *>( d )->readable() );
+		case DoubleDataTypeId :
+			return Value( (float)static_cast<const DoubleData *>( d )->readable() );
+		case BoolDataTypeId :
+			return Value( (int)static_cast<const BoolData *>( d )->readable() );
+		case StringDataTypeId :
+			return Value( static_cast<const StringData *>( d )->readable() );
+		default :
+			throw IECore::Exception( boost::str( boost::format( "Context variable \"%s\" has unsupported type \"%s\"" ) % name.value() % d->typeName() ) );
+	}
+}
+
+class NativeEngine : public Expression::Engine
+{
+
+	public :
+
+		NativeEngine( const std::string &expression )
+		{
+			Compiler( expression, m_program, m_constants, m_outPlug, m_inPlugs, m_contextNames );
+		}
+
+		virtual std::string outPlug()
+		{
+			return m_outPlug;
+		}
+
+		virtual void inPlugs( std::vector<std::string> &plugPaths )
+		{
+			plugPaths.insert( plugPaths.end(), m_inPlugs.begin(), m_inPlugs.end() );
+		}
+
+		virtual void contextNames( std::vector<IECore::InternedString> &names )
+		{
+			names.insert( names.end(), m_contextNames.begin(), m_contextNames.end() );
+		}
+
+		// The program is never modified after construction, and all
+		// working state lives on the stack, so execute() may be called
+		// concurrently from any number of threads.
+		virtual void execute( const Context *context, const std::vector<const ValuePlug *> &proxyInputs, ValuePlug *proxyOutput )
+		{
+			std::vector<Value> stack;
+			stack.reserve( 16 );
+
+			for( size_t pc = 0, e = m_program.size(); pc < e; )
+			{
+				const Instruction &instruction = m_program[pc++];
+				switch( instruction.opcode )
+				{
+					case PushConstant :
+						stack.push_back( m_constants[instruction.argument] );
+						break;
+					case PushInput :
+						stack.push_back( plugValue( proxyInputs[instruction.argument] ) );
+						break;
+					case PushContext :
+					{
+						const IECore::InternedString &name = m_contextNames[instruction.argument];
+						stack.push_back( contextValue( context->get<Data>( name ), name ) );
+						break;
+					}
+					case PushContextOrDefault :
+					{
+						const IECore::InternedString &name = m_contextNames[instruction.argument];
+						if( const Data *d = context->get<Data>( name, 0 ) )
+						{
+							stack.back() = contextValue( d, name );
+						}
+						break;
+					}
+					case Negate :
+					{
+						Value &v = stack.back();
+						if( v.type == Value::String )
+						{
+							throw IECore::Exception( "Unsupported operand for unary \"-\"" );
+						}
+						v.i = -v.i;
+						v.f = -v.f;
+						break;
+					}
+					case Not :
+						stack.back() = Value( (int)!stack.back().asBool() );
+						break;
+					case ToBool :
+						stack.back() = Value( (int)stack.back().asBool() );
+						break;
+					case Jump :
+						pc = instruction.argument;
+						break;
+					case JumpIfFalse :
+					{
+						const bool condition = stack.back().asBool();
+						stack.pop_back();
+						if( !condition )
+						{
+							pc = instruction.argument;
+						}
+						break;
+					}
+					case Call :
+					{
+						const FunctionDescription &f = g_functions[instruction.argument];
+						const size_t argumentsBegin = stack.size() - f.arity;
+						Value result = f.function( &stack[argumentsBegin] );
+						stack.resize( argumentsBegin );
+						stack.push_back( result );
+						break;
+					}
+					default :
+					{
+						const Value b = stack.back();
+						stack.pop_back();
+						stack.back() = binaryOperation( instruction.opcode, stack.back(), b );
+					}
+				}
+			}
+
+			setPlugValue( proxyOutput, stack.back() );
+		}
+
+	private :
+
+		Program m_program;
+		std::vector<Value> m_constants;
+
+		std::string m_outPlug;
+		std::vector<std::string> m_inPlugs;
+		std::vector<IECore::InternedString> m_contextNames;
+
+};
+
+Expression::EnginePtr createNativeEngine( const std::string &expression )
+{
+	return new NativeEngine( expression );
+}
+
+struct NativeEngineRegistration
+{
+
+	NativeEngineRegistration()
+	{
+		Expression::Engine::registerEngine( "native", createNativeEngine );
+	}
+
+};
+
+NativeEngineRegistration g_registration;
+
+} // namespace
@@ -35,21 +35,33 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <map>
+
+#include "IECore/RefCounted.h"
+
 #include "Gaffer/StringAlgo.h"
 
-#include "GafferScene/PathMatcher.h"
+#include "Gaffer/PathMatcher.h"
 
 using namespace std;
-using namespace GafferScene;
+using namespace Gaffer;
+
+static IECore::InternedString g_ellipsis( "..." );
 
 //////////////////////////////////////////////////////////////////////////
 // Node implementation
 //////////////////////////////////////////////////////////////////////////
 
-struct PathMatcher::Node
+// Nodes are reference counted, and may be shared between any number of
+// PathMatchers and parent nodes. A shared node must never be modified
+// directly - instead PathMatcher::writable() must be used to make a
+// unique copy before editing. Since copies are shallow, only the nodes
+// on the path to an edit are ever copied, and the rest of the tree
+// remains shared.
+struct PathMatcher::Node : public IECore::RefCounted
 {
 
-	typedef std::multimap<IECore::InternedString, Node *, Gaffer::MatchPatternLess> ChildMap;
+	typedef std::multimap<IECore::InternedString, NodePtr, Gaffer::MatchPatternLess> ChildMap;
 	typedef ChildMap::iterator ChildMapIterator;
 	typedef ChildMap::value_type ChildMapValue;
 	typedef ChildMap::const_iterator ConstChildMapIterator;
@@ -57,23 +69,15 @@ struct PathMatcher::Node
 	typedef std::pair<ConstChildMapIterator, ConstChildMapIterator> ConstChildMapRange;
 
 	Node()
-		:	terminator( false ), ellipsis( 0 )
+		:	terminator( false )
 	{
 	}
 
+	// Shallow copy - the children are shared
+	// with the other node.
 	Node( const Node &other )
-		:	terminator( other.terminator ), ellipsis( other.ellipsis ? new Node( *(other.ellipsis) ) : 0 )
-	{
-		ChildMapIterator hint = children.begin();
-		for( ConstChildMapIterator it = other.children.begin(), eIt = other.children.end(); it != eIt; it++ )
-		{
-			hint = children.insert( hint, ChildMapValue( it->first, new Node( *(it->second) ) ) );
-		}
-	}
-
-	~Node()
+		:	terminator( other.terminator ), children( other.children ), ellipsis( other.ellipsis )
 	{
-		clearChildren();
 	}
 
 	ChildMapIterator childIterator( const IECore::InternedString &name )
@@ -105,23 +109,23 @@ struct PathMatcher::Node
 	}
 
 	// returns the child exactly matching name.
-	Node *child( const IECore::InternedString &name )
+	const Node *child( const IECore::InternedString &name ) const
 	{
-		ChildMapIterator it = childIterator( name );
+		if( name == g_ellipsis )
+		{
+			return ellipsis.get();
+		}
+
+		ConstChildMapIterator it = childIterator( name );
 		if( it != children.end() )
 		{
-			return it->second;
+			return it->second.get();
 		}
 		return 0;
 	}
 
 	// returns the range of children which /may/ match name
 	// when wildcards are taken into account.
-	ChildMapRange childRange( const IECore::InternedString &name )
-	{
-		return children.equal_range( name );
-	}
-
 	ConstChildMapRange childRange( const IECore::InternedString &name ) const
 	{
 		return children.equal_range( name );
@@ -129,6 +133,12 @@ struct PathMatcher::Node
 
 	bool operator == ( const Node &other ) const
 	{
+		if( this == &other )
+		{
+			// shared node
+			return true;
+		}
+
 		if( terminator != other.terminator )
 		{
 			return false;
@@ -167,7 +177,7 @@ struct PathMatcher::Node
 		return true;
 	}
 
-	bool operator != ( const Node &other )
+	bool operator != ( const Node &other ) const
 	{
 		return !( *this == other );
 	}
@@ -175,18 +185,12 @@ struct PathMatcher::Node
 	bool clearChildren()
 	{
 		const bool result = !children.empty() || ellipsis;
-		ChildMap::iterator it, eIt;
-		for( it = children.begin(), eIt = children.end(); it != eIt; it++ )
-		{
-			delete it->second;
-		}
 		children.clear();
-		delete ellipsis;
 		ellipsis = NULL;
 		return result;
 	}
 
-	bool isEmpty()
+	bool isEmpty() const
 	{
 		return !terminator && !ellipsis && children.empty();
 	}
@@ -196,29 +200,52 @@ struct PathMatcher::Node
 	ChildMap children;
 	// child node for "...". this is stored separately as it uses
 	// a slightly different matching algorithm.
-	Node *ellipsis;
+	NodePtr ellipsis;
 
 };
 
+namespace Gaffer
+{
+
+void intrusive_ptr_add_ref( const PathMatcher::Node *node )
+{
+	node->addRef();
+}
+
+void intrusive_ptr_release( const PathMatcher::Node *node )
+{
+	node->removeRef();
+}
+
+} // namespace Gaffer
+
 //////////////////////////////////////////////////////////////////////////
 // PathMatcher implementation
 //////////////////////////////////////////////////////////////////////////
 
-static IECore::InternedString g_ellipsis( "..." );
-
 PathMatcher::PathMatcher()
+	:	m_root( new Node )
 {
-	m_root = boost::shared_ptr<Node>( new Node );
 }
 
 PathMatcher::PathMatcher( const PathMatcher &other )
+	:	m_root( other.m_root )
+{
+}
+
+PathMatcher::~PathMatcher()
+{
+}
+
+PathMatcher &PathMatcher::operator = ( const PathMatcher &other )
 {
-	m_root = boost::shared_ptr<Node>( new Node( *(other.m_root) ) );
+	m_root = other.m_root;
+	return *this;
 }
 
 void PathMatcher::clear()
 {
-	m_root = boost::shared_ptr<Node>( new Node );
+	m_root = new Node;
 }
 
 bool PathMatcher::isEmpty() const
@@ -250,37 +277,37 @@ unsigned PathMatcher::match( const std::string &path ) const
 
 unsigned PathMatcher::match( const std::vector<IECore::InternedString> &path ) const
 {
-   Node *node = m_root.get();
-   if( !node )
-   {
-       return Filter::NoMatch;
-   }
+	const Node *node = m_root.get();
+	if( !node )
+	{
+		return NoMatch;
+	}
 
-	unsigned result = Filter::NoMatch;
+	unsigned result = NoMatch;
 	matchWalk( node, path.begin(), path.end(), result );
 	return result;
 }
 
 template<typename NameIterator>
-void PathMatcher::matchWalk( Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const
+void PathMatcher::matchWalk( const Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const
 {
 	// see if we've matched to the end of the path, and terminate the recursion if we have.
 	if( start == end )
 	{
 		if( node->terminator )
 		{
-			result |= Filter::ExactMatch;
+			result |= ExactMatch;
 		}
 		if( node->children.size() )
 		{
-			result |= Filter::DescendantMatch;
+			result |= DescendantMatch;
 		}
 		if( node->ellipsis )
 		{
-			result |= Filter::DescendantMatch;
+			result |= DescendantMatch;
 			if( node->ellipsis->terminator )
 			{
-				result |= Filter::ExactMatch;
+				result |= ExactMatch;
 			}
 		}
 		return;
@@ -291,24 +318,24 @@ void PathMatcher::matchWalk( Node *node, const NameIterator &start, const NameIt
 	// though.
 	if( node->terminator )
 	{
-		result |= Filter::AncestorMatch;
+		result |= AncestorMatch;
 	}
 
 	// now we can match the remainder of the path against child branches to see
 	// if we have any exact or descendant matches.
-	Node::ChildMapRange range = node->childRange( *start );
+	Node::ConstChildMapRange range = node->childRange( *start );
 	if( range.first != range.second )
 	{
 		NameIterator newStart = start; newStart++;
-		for( Node::ChildMapIterator it = range.first; it != range.second; it++ )
+		for( Node::ConstChildMapIterator it = range.first; it != range.second; it++ )
 		{
 			if( Gaffer::match( start->c_str(), it->first.c_str() ) )
 			{
-				matchWalk( it->second, newStart, end, result );
+				matchWalk( it->second.get(), newStart, end, result );
 				// if we've found every kind of match then we can terminate early,
 				// but otherwise we need to keep going even though we may
 				// have found some of the match types already.
-				if( result == Filter::EveryMatch )
+				if( result == EveryMatch )
 				{
 					return;
 				}
@@ -318,17 +345,17 @@ void PathMatcher::matchWalk( Node *node, const NameIterator &start, const NameIt
 
 	if( node->ellipsis )
 	{
-		result |= Filter::DescendantMatch;
+		result |= DescendantMatch;
 		if( node->ellipsis->terminator )
 		{
-			result |= Filter::ExactMatch;
+			result |= ExactMatch;
 		}
 
 		NameIterator newStart = start;
 		while( newStart != end )
 		{
-			matchWalk( node->ellipsis, newStart, end, result );
-			if( result == Filter::EveryMatch )
+			matchWalk( node->ellipsis.get(), newStart, end, result );
+			if( result == EveryMatch )
 			{
 				return;
 			}
@@ -352,35 +379,39 @@ bool PathMatcher::addPath( const std::vector<IECore::InternedString> &path )
 template<typename NameIterator>
 bool PathMatcher::addPath( const NameIterator &start, const NameIterator &end )
 {
-	Node *node = m_root.get();
+	// Early out if the path exists already, so that we
+	// don't unshare any nodes unnecessarily.
+	const Node *existingNode = find( start, end );
+	if( existingNode && existingNode->terminator )
+	{
+		return false;
+	}
+
+	Node *node = writable( m_root );
 	for( NameIterator it = start; it != end; ++it )
 	{
-		Node *nextNode = 0;
 		const IECore::InternedString name( *it );
 		if( name == g_ellipsis )
 		{
-			nextNode = node->ellipsis;
-			if( !nextNode )
+			if( !node->ellipsis )
 			{
-				nextNode = new Node;
-				node->ellipsis = nextNode;
+				node->ellipsis = new Node;
 			}
+			node = writable( node->ellipsis );
 		}
 		else
 		{
-			nextNode = node->child( name );
-			if( !nextNode )
+			Node::ChildMapIterator childIt = node->childIterator( name );
+			if( childIt == node->children.end() )
 			{
-				nextNode = new Node;
-				node->children.insert( Node::ChildMapValue( name, nextNode ) );
+				childIt = node->children.insert( Node::ChildMapValue( name, new Node ) );
 			}
+			node = writable( childIt->second );
 		}
-		node = nextNode;
 	}
 
-	bool result = !node->terminator;
 	node->terminator = true;
-	return result;
+	return true;
 }
 
 bool PathMatcher::removePath( const std::string &path )
@@ -392,19 +423,31 @@ bool PathMatcher::removePath( const std::string &path )
 
 bool PathMatcher::removePath( const std::vector<IECore::InternedString> &path )
 {
+	const Node *existingNode = find( path.begin(), path.end() );
+	if( !existingNode || !existingNode->terminator )
+	{
+		return false;
+	}
+
 	bool result = false;
-	removeWalk( m_root.get(), path.begin(), path.end(), /* prune = */ false, result );
+	removeWalk( writable( m_root ), path.begin(), path.end(), /* prune = */ false, result );
 	return result;
 }
 
 bool PathMatcher::addPaths( const PathMatcher &paths )
 {
-	return addPathsWalk( m_root.get(), paths.m_root.get() );
+	if( m_root->isEmpty() )
+	{
+		// We can share the entire tree.
+		m_root = paths.m_root;
+		return !m_root->isEmpty();
+	}
+	return addPathsWalk( m_root, paths.m_root.get() );
 }
 
 bool PathMatcher::removePaths( const PathMatcher &paths )
 {
-	return removePathsWalk( m_root.get(), paths.m_root.get() );
+	return removePathsWalk( m_root, paths.m_root.get() );
 }
 
 bool PathMatcher::prune( const std::string &path )
@@ -416,11 +459,40 @@ bool PathMatcher::prune( const std::string &path )
 
 bool PathMatcher::prune( const std::vector<IECore::InternedString> &path )
 {
+	const Node *existingNode = find( path.begin(), path.end() );
+	if( !existingNode || existingNode->isEmpty() )
+	{
+		return false;
+	}
+
 	bool result = false;
-	removeWalk( m_root.get(), path.begin(), path.end(), /* prune = */ true, result );
+	removeWalk( writable( m_root ), path.begin(), path.end(), /* prune = */ true, result );
 	return result;
 }
 
+PathMatcher::Node *PathMatcher::writable( NodePtr &node )
+{
+	if( node->refCount() > 1 )
+	{
+		// Node is shared with another PathMatcher
+		// or parent, so we must copy it before
+		// it can be modified.
+		node = new Node( *node );
+	}
+	return node.get();
+}
+
+template<typename NameIterator>
+const PathMatcher::Node *PathMatcher::find( const NameIterator &start, const NameIterator &end ) const
+{
+	const Node *node = m_root.get();
+	for( NameIterator it = start; it != end && node; ++it )
+	{
+		node = node->child( *it );
+	}
+	return node;
+}
+
 template<typename NameIterator>
 void PathMatcher::removeWalk( Node *node, const NameIterator &start, const NameIterator &end, const bool prune, bool &removed )
 {
@@ -438,74 +510,83 @@ void PathMatcher::removeWalk( Node *node, const NameIterator &start, const NameI
 
 	const IECore::InternedString name( *start );
 	Node::ChildMapIterator childIt = node->children.end();
-	Node *childNode = 0;
+	NodePtr *childNode = NULL;
 	if( name == g_ellipsis )
 	{
-		childNode = node->ellipsis;
+		childNode = &node->ellipsis;
 	}
 	else
 	{
 		childIt = node->childIterator( name );
 		if( childIt != node->children.end() )
 		{
-			childNode = childIt->second;
+			childNode = &childIt->second;
 		}
 	}
 
-	if( !childNode )
+	if( !childNode || !*childNode )
 	{
 		return;
 	}
 
 	NameIterator childStart = start; childStart++;
-	removeWalk( childNode, childStart, end, prune, removed );
-	if( childNode->isEmpty() )
+	removeWalk( writable( *childNode ), childStart, end, prune, removed );
+	if( (*childNode)->isEmpty() )
 	{
-		delete childNode;
 		if( childIt != node->children.end() )
 		{
 			node->children.erase( childIt );
 		}
 		else
 		{
-			node->ellipsis = 0;
+			node->ellipsis = NULL;
 		}
 	}
 }
 
-bool PathMatcher::addPathsWalk( Node *node, const Node *srcNode )
+bool PathMatcher::addPathsWalk( NodePtr &node, const Node *srcNode )
 {
+	if( node.get() == srcNode )
+	{
+		// Shared node - all the source
+		// paths exist already.
+		return false;
+	}
+
+	Node *writableNode = writable( node );
+
 	bool result = false;
-	if( !node->terminator && srcNode->terminator )
+	if( !writableNode->terminator && srcNode->terminator )
 	{
-		node->terminator = result = true;
+		writableNode->terminator = result = true;
 	}
 
 	for( Node::ChildMap::const_iterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
 	{
-		const Node *srcChild = it->second;
-		if( Node *child = node->child( it->first ) )
+		const Node::ChildMapIterator childIt = writableNode->childIterator( it->first );
+		if( childIt != writableNode->children.end() )
 		{
 			// result must be on right of ||, to avoid short-circuiting addPathsWalk().
-			result = addPathsWalk( child, srcChild ) || result;
+			result = addPathsWalk( childIt->second, it->second.get() ) || result;
 		}
 		else
 		{
-			node->children.insert( Node::ChildMapValue( it->first, new Node( *srcChild ) ) );
+			// Share the source branch rather than copying it.
+			writableNode->children.insert( Node::ChildMapValue( it->first, it->second ) );
 			result = true; // source node can only exist if it or a descendant is a terminator
 		}
 	}
 
 	if( srcNode->ellipsis )
 	{
-		if( node->ellipsis )
+		if( writableNode->ellipsis )
 		{
 			// result must be on right of ||, to avoid short-circuiting addPathsWalk().
-			result = addPathsWalk( node->ellipsis, srcNode->ellipsis ) || result;
+			result = addPathsWalk( writableNode->ellipsis, srcNode->ellipsis.get() ) || result;
 		}
 		else
 		{
-			node->ellipsis = new Node( *srcNode->ellipsis );
+			writableNode->ellipsis = srcNode->ellipsis;
 			result = true; // source node can only exist if it or a descendant is a terminator
 		}
 	}
@@ -513,42 +594,49 @@ bool PathMatcher::addPathsWalk( Node *node, const Node *srcNode )
 	return result;
 }
 
-bool PathMatcher::removePathsWalk( Node *node, const Node *srcNode )
+bool PathMatcher::removePathsWalk( NodePtr &node, const Node *srcNode )
 {
+	if( node.get() == srcNode )
+	{
+		// Shared node - every path will be removed.
+		const bool result = !node->isEmpty();
+		node = new Node;
+		return result;
+	}
+
+	Node *writableNode = writable( node );
+
 	bool result = false;
-	if( node->terminator && srcNode->terminator )
+	if( writableNode->terminator && srcNode->terminator )
 	{
-		node->terminator = false;
+		writableNode->terminator = false;
 		result = true;
 	}
 
 	for( Node::ChildMap::const_iterator it = srcNode->children.begin(), eIt = srcNode->children.end(); it != eIt; ++it )
 	{
-		const Node::ChildMapIterator childIt = node->childIterator( it->first );
-		if( childIt != node->children.end() )
+		const Node::ChildMapIterator childIt = writableNode->childIterator( it->first );
+		if( childIt != writableNode->children.end() )
 		{
-			Node *child = childIt->second;
-			if( removePathsWalk( child, it->second ) )
+			if( removePathsWalk( childIt->second, it->second.get() ) )
 			{
 				result = true;
-				if( child->isEmpty() )
+				if( childIt->second->isEmpty() )
 				{
-					node->children.erase( childIt );
-					delete child;
+					writableNode->children.erase( childIt );
 				}
 			}
 		}
 	}
 
-	if( node->ellipsis && srcNode->ellipsis )
+	if( writableNode->ellipsis && srcNode->ellipsis )
 	{
-		if( removePathsWalk( node->ellipsis, srcNode->ellipsis ) )
+		if( removePathsWalk( writableNode->ellipsis, srcNode->ellipsis.get() ) )
 		{
 			result = true;
-			if( node->ellipsis->isEmpty() )
+			if( writableNode->ellipsis->isEmpty() )
 			{
-				delete node->ellipsis;
-				node->ellipsis = NULL;
+				writableNode->ellipsis = NULL;
 			}
 		}
 	}
@@ -556,14 +644,14 @@ bool PathMatcher::removePathsWalk( Node *node, const Node *srcNode )
 	return result;
 }
 
-void PathMatcher::pathsWalk( Node *node, const std::string &path, std::vector<std::string> &paths ) const
+void PathMatcher::pathsWalk( const Node *node, const std::string &path, std::vector<std::string> &paths ) const
 {
 	if( node->terminator )
 	{
 		paths.push_back( path );
 	}
 
-	for( Node::ChildMapIterator it = node->children.begin(), eIt = node->children.end(); it != eIt; it++ )
+	for( Node::ConstChildMapIterator it = node->children.begin(), eIt = node->children.end(); it != eIt; it++ )
 	{
 		std::string childPath = path;
 		if( node != m_root.get() )
@@ -571,7 +659,7 @@ void PathMatcher::pathsWalk( Node *node, const std::string &path, std::vector<st
 			childPath += "/";
 		}
 		childPath += it->first;
-		pathsWalk( it->second, childPath, paths );
+		pathsWalk( it->second.get(), childPath, paths );
 	}
 
 	if( node->ellipsis )
@@ -582,7 +670,7 @@ void PathMatcher::pathsWalk( Node *node, const std::string &path, std::vector<st
 			childPath += "/";
 		}
 		childPath += "...";
-		pathsWalk( node->ellipsis, childPath, paths );
+		pathsWalk( node->ellipsis.get(), childPath, paths );
 
 	}
 }
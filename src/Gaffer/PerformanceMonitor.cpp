@@ -0,0 +1,168 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include <vector>
+
+#include "tbb/atomic.h"
+#include "tbb/spin_mutex.h"
+#include "tbb/enumerable_thread_specific.h"
+
+#include "boost/unordered_map.hpp"
+
+#include "Gaffer/PerformanceMonitor.h"
+
+using namespace Gaffer;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal implementation details
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+tbb::atomic<bool> g_enabled;
+
+// Statistics are accumulated separately for each thread, so that
+// recording them doesn't serialise evaluation. They are only merged
+// when statistics() is called.
+struct ThreadStatistics
+{
+
+	// The node pointer is stored alongside the statistics so that
+	// we can key the map with a raw pointer, avoiding the reference
+	// counting overhead of constructing a ConstNodePtr for each lookup.
+	typedef std::pair<ConstNodePtr, PerformanceMonitor::Statistics> Entry;
+	typedef boost::unordered_map<const Node *, Entry> Map;
+
+	PerformanceMonitor::Statistics &statistics( const Node *node )
+	{
+		Entry &entry = map[node];
+		if( !entry.first )
+		{
+			entry.first = node;
+		}
+		return entry.second;
+	}
+
+	// Only ever contended when statistics() or clear() are called
+	// while statistics are being recorded.
+	typedef tbb::spin_mutex Mutex;
+	Mutex mutex;
+	Map map;
+
+};
+
+typedef tbb::enumerable_thread_specific<ThreadStatistics> ThreadStatisticsContainer;
+ThreadStatisticsContainer g_threadStatistics;
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// PerformanceMonitor
+//////////////////////////////////////////////////////////////////////////
+
+PerformanceMonitor::Statistics::Statistics()
+	:	hashCount( 0 ), computeCount( 0 ), hashTime( 0 ), computeTime( 0 ), cacheBytesInserted( 0 )
+{
+}
+
+void PerformanceMonitor::setEnabled( bool enabled )
+{
+	g_enabled = enabled;
+}
+
+bool PerformanceMonitor::getEnabled()
+{
+	return g_enabled;
+}
+
+PerformanceMonitor::StatisticsMap PerformanceMonitor::statistics()
+{
+	StatisticsMap result;
+	for( ThreadStatisticsContainer::iterator it = g_threadStatistics.begin(), eIt = g_threadStatistics.end(); it != eIt; ++it )
+	{
+		ThreadStatistics::Mutex::scoped_lock lock( it->mutex );
+		for( ThreadStatistics::Map::const_iterator mIt = it->map.begin(), meIt = it->map.end(); mIt != meIt; ++mIt )
+		{
+			const Statistics &threadStatistics = mIt->second.second;
+			Statistics &statistics = result[mIt->second.first];
+			statistics.hashCount += threadStatistics.hashCount;
+			statistics.computeCount += threadStatistics.computeCount;
+			statistics.hashTime += threadStatistics.hashTime;
+			statistics.computeTime += threadStatistics.computeTime;
+			statistics.cacheBytesInserted += threadStatistics.cacheBytesInserted;
+		}
+	}
+	return result;
+}
+
+void PerformanceMonitor::clear()
+{
+	// Swap the statistics out so that any nodes we were keeping
+	// alive are destroyed after the mutexes have been released.
+	std::vector<ThreadStatistics::Map> statistics;
+	for( ThreadStatisticsContainer::iterator it = g_threadStatistics.begin(), eIt = g_threadStatistics.end(); it != eIt; ++it )
+	{
+		statistics.push_back( ThreadStatistics::Map() );
+		ThreadStatistics::Mutex::scoped_lock lock( it->mutex );
+		statistics.back().swap( it->map );
+	}
+}
+
+void PerformanceMonitor::recordHash( const Node *node, double time )
+{
+	ThreadStatistics &threadStatistics = g_threadStatistics.local();
+	ThreadStatistics::Mutex::scoped_lock lock( threadStatistics.mutex );
+	Statistics &statistics = threadStatistics.statistics( node );
+	statistics.hashCount++;
+	statistics.hashTime += time;
+}
+
+void PerformanceMonitor::recordCompute( const Node *node, double time )
+{
+	ThreadStatistics &threadStatistics = g_threadStatistics.local();
+	ThreadStatistics::Mutex::scoped_lock lock( threadStatistics.mutex );
+	Statistics &statistics = threadStatistics.statistics( node );
+	statistics.computeCount++;
+	statistics.computeTime += time;
+}
+
+void PerformanceMonitor::recordCacheInsertion( const Node *node, size_t bytes )
+{
+	ThreadStatistics &threadStatistics = g_threadStatistics.local();
+	ThreadStatistics::Mutex::scoped_lock lock( threadStatistics.mutex );
+	threadStatistics.statistics( node ).cacheBytesInserted += bytes;
+}
@@ -304,6 +304,11 @@ void Plug::setInput( PlugPtr input, bool setChildInputs, bool updateParentInput
 
 void Plug::setInputInternal( PlugPtr input, bool emit )
 {
+	// The results of DependencyNode::affects() may depend on the
+	// sources of plugs on any node, so all cached results are now
+	// suspect.
+	DependencyNode::invalidateAllAffectsCaches();
+
 	if( m_input )
 	{
 		m_input->m_outputs.remove( this );
@@ -409,6 +414,10 @@ PlugPtr Plug::createCounterpart( const std::string &name, Direction direction )
 
 void Plug::parentChanging( Gaffer::GraphComponent *newParent )
 {
+	// Changes to the plug hierarchy may change the results of
+	// DependencyNode::affects(), so we invalidate the cached results.
+	DependencyNode::invalidateAllAffectsCaches();
+
 	// This method manages the connections between plugs when
 	// additional child plugs are added or removed. We only
 	// want to react to these changes when they are first made -
@@ -453,6 +462,10 @@ void Plug::parentChanging( Gaffer::GraphComponent *newParent )
 		}
 		// Remove any remaining output connections.
 		removeOutputs();
+		// Removing our connections will have propagated dirtiness and
+		// therefore repopulated the caches, but we're about to disappear
+		// so must make sure we're not referenced by them.
+		DependencyNode::invalidateAllAffectsCaches();
 	}
 	else if( Plug *newParentPlug = IECore::runTimeCast<Plug>( newParent ) )
 	{
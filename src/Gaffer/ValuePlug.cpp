@@ -38,17 +38,21 @@
 #include <stack>
 
 #include "tbb/enumerable_thread_specific.h"
+#include "tbb/tick_count.h"
 
 #include "boost/bind.hpp"
 #include "boost/format.hpp"
 #include "boost/unordered_map.hpp"
+#include "boost/noncopyable.hpp"
 
 #include "IECore/LRUCache.h"
 
 #include "Gaffer/ValuePlug.h"
 #include "Gaffer/ComputeNode.h"
 #include "Gaffer/Context.h"
+#include "Gaffer/Canceller.h"
 #include "Gaffer/Action.h"
+#include "Gaffer/PerformanceMonitor.h"
 
 using namespace Gaffer;
 
@@ -99,14 +103,24 @@ class ValuePlug::Computation
 			{
 				return computation.hash();
 			}
+			catch( const Cancelled & )
+			{
+				// cancellation isn't an error, so we don't emit errorSignal().
+				throw;
+			}
 			catch( const std::exception &e )
 			{
+				// TBB transports exceptions thrown in parallel tasks as
+				// tbb::captured_exception, so Cancelled may arrive here in
+				// disguise. Cancellation is checked for explicitly.
+				Canceller::check( Context::current()->canceller() );
 				computation.m_threadData->errorSource = computation.m_threadData->errorSource ? computation.m_threadData->errorSource : p;
 				emitError( plug, p, computation.m_threadData->errorSource, e.what() );
 				throw;
 			}
 			catch( ... )
 			{
+				Canceller::check( Context::current()->canceller() );
 				computation.m_threadData->errorSource = computation.m_threadData->errorSource ? computation.m_threadData->errorSource : p;
 				emitError( plug, p, computation.m_threadData->errorSource, "Unknown error" );
 				throw;
@@ -136,14 +150,24 @@ class ValuePlug::Computation
 			{
 				return computation.value();
 			}
+			catch( const Cancelled & )
+			{
+				// cancellation isn't an error, so we don't emit errorSignal().
+				throw;
+			}
 			catch( const std::exception &e )
 			{
+				// TBB transports exceptions thrown in parallel tasks as
+				// tbb::captured_exception, so Cancelled may arrive here in
+				// disguise. Cancellation is checked for explicitly.
+				Canceller::check( Context::current()->canceller() );
 				computation.m_threadData->errorSource = computation.m_threadData->errorSource ? computation.m_threadData->errorSource : p;
 				emitError( plug, p, computation.m_threadData->errorSource, e.what() );
 				throw;
 			}
 			catch( ... )
 			{
+				Canceller::check( Context::current()->canceller() );
 				computation.m_threadData->errorSource = computation.m_threadData->errorSource ? computation.m_threadData->errorSource : p;
 				emitError( plug, p, computation.m_threadData->errorSource, "Unknown error" );
 				throw;
@@ -194,7 +218,8 @@ class ValuePlug::Computation
 	private :
 
 		Computation( const ValuePlug *resultPlug, const IECore::MurmurHash *precomputedHash = NULL )
-			:	m_resultPlug( resultPlug ), m_precomputedHash( precomputedHash ), m_resultValue( NULL ), m_threadData( &g_threadData.local() )
+			:	m_resultPlug( resultPlug ), m_precomputedHash( precomputedHash ), m_resultValue( NULL ), m_threadData( &g_threadData.local() ),
+				m_parent( m_threadData->computationStack.size() ? m_threadData->computationStack.top() : NULL ), m_upstreamTime( 0 )
 		{
 			m_threadData->computationStack.push( this );
 		}
@@ -259,6 +284,12 @@ class ValuePlug::Computation
 				{
 					computeOrSetFromInput();
 
+					// If the computation was cancelled, the result may be incomplete
+					// even if it didn't throw, because computes are free to catch
+					// exceptions from upstream and fall back to a default value. So
+					// we check again, to ensure we never cache such a result.
+					Canceller::check( Context::current()->canceller() );
+
 					// Store the value in the cache, after first checking that this hasn't
 					// been done already. The check is useful because it's common for an
 					// upstream compute triggered by computeOrSetFromInput() to have already
@@ -275,7 +306,15 @@ class ValuePlug::Computation
 					/// the locking associated with LRUCache::get().
 					if( !g_valueCache.get( hash ) )
 					{
-						g_valueCache.set( hash, m_resultValue, m_resultValue->memoryUsage() );
+						const size_t cost = m_resultValue->memoryUsage();
+						g_valueCache.set( hash, m_resultValue, cost );
+						if( PerformanceMonitor::getEnabled() )
+						{
+							if( const Node *node = m_resultPlug->node() )
+							{
+								PerformanceMonitor::recordCacheInsertion( node, cost );
+							}
+						}
 					}
 				}
 			}
@@ -292,6 +331,9 @@ class ValuePlug::Computation
 		// Calculates the hash for m_resultPlug - not using any cache at all.
 		IECore::MurmurHash hashInternal() const
 		{
+			Canceller::check( Context::current()->canceller() );
+			MonitorScope monitorScope( this, /* compute = */ false );
+
 			if( const ValuePlug *input = m_resultPlug->getInput<ValuePlug>() )
 			{
 				// We know that the input is of a different type to m_resultPlug,
@@ -327,6 +369,9 @@ class ValuePlug::Computation
 		// Throws if the result was not successfully retrieved.
 		void computeOrSetFromInput()
 		{
+			Canceller::check( Context::current()->canceller() );
+			MonitorScope monitorScope( this, /* compute = */ true );
+
 			if( const ValuePlug *input = m_resultPlug->getInput<ValuePlug>() )
 			{
 				// cast is ok, because we know that the resulting setValue() call won't
@@ -354,6 +399,65 @@ class ValuePlug::Computation
 			}
 		}
 
+		// Records the time spent in a hash or compute with the PerformanceMonitor.
+		// The PerformanceMonitor is interested in the cost of each node in isolation,
+		// so we exclude the time spent in upstream computations performed on this
+		// thread, accumulating it into m_upstreamTime on the parent computation
+		// instead.
+		class MonitorScope : boost::noncopyable
+		{
+
+			public :
+
+				MonitorScope( const Computation *computation, bool compute )
+					:	m_computation( computation ), m_compute( compute ), m_enabled( PerformanceMonitor::getEnabled() ), m_upstreamTime( 0 )
+				{
+					if( m_enabled )
+					{
+						m_upstreamTime = m_computation->m_upstreamTime;
+						m_start = tbb::tick_count::now();
+					}
+				}
+
+				~MonitorScope()
+				{
+					if( !m_enabled )
+					{
+						return;
+					}
+
+					const double time = ( tbb::tick_count::now() - m_start ).seconds();
+					if( const Node *node = m_computation->m_resultPlug->node() )
+					{
+						const double upstreamTime = m_computation->m_upstreamTime - m_upstreamTime;
+						if( m_compute )
+						{
+							PerformanceMonitor::recordCompute( node, time - upstreamTime );
+						}
+						else
+						{
+							PerformanceMonitor::recordHash( node, time - upstreamTime );
+						}
+					}
+
+					if( m_computation->m_parent )
+					{
+						// Measured after recording the statistics above, so that
+						// the cost of recording isn't charged to the parent.
+						m_computation->m_parent->m_upstreamTime += ( tbb::tick_count::now() - m_start ).seconds();
+					}
+				}
+
+			private :
+
+				const Computation *m_computation;
+				const bool m_compute;
+				const bool m_enabled;
+				double m_upstreamTime;
+				tbb::tick_count m_start;
+
+		};
+
 		// Emits Node::errorSignal() for all plugs between plug and sourcePlug (inclusive).
 		static void emitError( const ValuePlug *plug, const ValuePlug *sourcePlug, const Plug *errorSource, const char *error )
 		{
@@ -409,6 +513,12 @@ class ValuePlug::Computation
 		const IECore::MurmurHash *m_precomputedHash;
 		IECore::ConstObjectPtr m_resultValue;
 		ThreadData *m_threadData;
+		// The computation which triggered this one, if it
+		// was performed on the same thread.
+		const Computation *m_parent;
+		// Time spent in upstream computations triggered by this one
+		// on the same thread. Used by MonitorScope.
+		mutable double m_upstreamTime;
 
 		static IECore::ObjectPtr nullGetter( const IECore::MurmurHash &h, size_t &cost )
 		{
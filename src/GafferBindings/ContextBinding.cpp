@@ -39,6 +39,7 @@
 #include "IECorePython/RefCountedBinding.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/Canceller.h"
 
 #include "GafferBindings/SignalBinding.h"
 #include "GafferBindings/ContextBinding.h"
@@ -124,6 +125,11 @@ ContextPtr current()
 
 void GafferBindings::bindContext()
 {
+	class_<Canceller, boost::noncopyable>( "Canceller" )
+		.def( "cancel", &Canceller::cancel )
+		.def( "cancelled", &Canceller::cancelled )
+	;
+
 	IECorePython::RefCountedClass<Context, IECore::RefCounted> contextClass( "Context" );
 	scope s = contextClass;
 
@@ -136,6 +142,7 @@ void GafferBindings::bindContext()
 	contextClass
 		.def( init<>() )
 		.def( init<const Context &, Context::Ownership>( ( arg( "other" ), arg( "ownership" ) = Context::Copied ) ) )
+		.def( init<const Context &, const Canceller &>( ( arg( "other" ), arg( "canceller" ) ) )[ with_custodian_and_ward<1,3>() ] )
 		.def( "setFrame", &Context::setFrame )
 		.def( "getFrame", &Context::getFrame )
 		.def( "set", &Context::set<float> )
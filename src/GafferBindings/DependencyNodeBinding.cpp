@@ -38,14 +38,46 @@
 #include "boost/python.hpp"
 
 #include "GafferBindings/DependencyNodeBinding.h"
+#include "GafferBindings/GILProfiler.h"
 
 using namespace boost::python;
 using namespace GafferBindings;
 using namespace Gaffer;
 
+namespace
+{
+
+dict gilProfilerStatistics()
+{
+	const GILProfiler::StatisticsMap statistics = GILProfiler::statistics();
+
+	dict result;
+	for( GILProfiler::StatisticsMap::const_iterator it = statistics.begin(), eIt = statistics.end(); it != eIt; ++it )
+	{
+		dict s;
+		s["calls"] = it->second.calls;
+		s["acquisitionTime"] = it->second.acquisitionTime;
+		s["holdTime"] = it->second.holdTime;
+		result[make_tuple( it->first.first, it->first.second )] = s;
+	}
+
+	return result;
+}
+
+} // namespace
+
 void GafferBindings::bindDependencyNode()
 {
 	typedef DependencyNodeWrapper<DependencyNode> Wrapper;
 
 	DependencyNodeClass<DependencyNode, Wrapper>();
+
+	class_<DirtyPropagationScope, boost::noncopyable>( "_DirtyPropagationScope" );
+
+	class_<GILProfiler>( "_GILProfiler", no_init )
+		.def( "setEnabled", &GILProfiler::setEnabled ).staticmethod( "setEnabled" )
+		.def( "getEnabled", &GILProfiler::getEnabled ).staticmethod( "getEnabled" )
+		.def( "statistics", &gilProfilerStatistics ).staticmethod( "statistics" )
+		.def( "clear", &GILProfiler::clear ).staticmethod( "clear" )
+	;
 }
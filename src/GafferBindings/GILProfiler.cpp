@@ -0,0 +1,127 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "tbb/atomic.h"
+#include "tbb/spin_mutex.h"
+
+#include "GafferBindings/GILProfiler.h"
+
+using namespace GafferBindings;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal implementation details
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+tbb::atomic<bool> g_enabled;
+
+typedef tbb::spin_mutex StatisticsMutex;
+StatisticsMutex g_statisticsMutex;
+GILProfiler::StatisticsMap g_statistics;
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// GILProfiler
+//////////////////////////////////////////////////////////////////////////
+
+GILProfiler::Statistics::Statistics()
+	:	calls( 0 ), acquisitionTime( 0 ), holdTime( 0 )
+{
+}
+
+void GILProfiler::setEnabled( bool enabled )
+{
+	g_enabled = enabled;
+}
+
+bool GILProfiler::getEnabled()
+{
+	return g_enabled;
+}
+
+GILProfiler::StatisticsMap GILProfiler::statistics()
+{
+	StatisticsMutex::scoped_lock lock( g_statisticsMutex );
+	return g_statistics;
+}
+
+void GILProfiler::clear()
+{
+	StatisticsMutex::scoped_lock lock( g_statisticsMutex );
+	g_statistics.clear();
+}
+
+//////////////////////////////////////////////////////////////////////////
+// GILProfiler::ScopedGILLock
+//////////////////////////////////////////////////////////////////////////
+
+GILProfiler::ScopedGILLock::ScopedGILLock( const Gaffer::GraphComponent *node, const char *method )
+	:	m_node( node ), m_method( method ), m_profiling( g_enabled ), m_acquisitionTime( 0 )
+{
+	if( !m_profiling )
+	{
+		m_state = PyGILState_Ensure();
+		return;
+	}
+
+	const tbb::tick_count start = tbb::tick_count::now();
+	m_state = PyGILState_Ensure();
+	m_acquired = tbb::tick_count::now();
+	m_acquisitionTime = ( m_acquired - start ).seconds();
+}
+
+GILProfiler::ScopedGILLock::~ScopedGILLock()
+{
+	if( !m_profiling )
+	{
+		PyGILState_Release( m_state );
+		return;
+	}
+
+	const double holdTime = ( tbb::tick_count::now() - m_acquired ).seconds();
+	PyGILState_Release( m_state );
+
+	const Key key( m_node->fullName(), m_method );
+
+	StatisticsMutex::scoped_lock lock( g_statisticsMutex );
+	Statistics &statistics = g_statistics[key];
+	statistics.calls++;
+	statistics.acquisitionTime += m_acquisitionTime;
+	statistics.holdTime += holdTime;
+}
@@ -39,6 +39,7 @@
 #include "boost/python/suite/indexing/container_utils.hpp"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "Gaffer/Path.h"
 #include "Gaffer/PathFilter.h"
@@ -289,7 +290,14 @@ const char *rootWrapper( Path &p )
 list childrenWrapper( Path &p )
 {
 	std::vector<PathPtr> c;
-	p.children( c );
+	{
+		// Release the GIL so that children may be computed
+		// on a background thread without locking up the UI.
+		// Python implementations of doChildren() reacquire
+		// it as necessary.
+		IECorePython::ScopedGILRelease gilRelease;
+		p.children( c );
+	}
 	list result;
 	for( std::vector<PathPtr>::const_iterator it = c.begin(), eIt = c.end(); it != eIt; ++it )
 	{
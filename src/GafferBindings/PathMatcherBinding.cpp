@@ -40,15 +40,15 @@
 
 #include "IECore/VectorTypedData.h"
 
-#include "GafferScene/PathMatcher.h"
+#include "Gaffer/PathMatcher.h"
 
-#include "GafferSceneBindings/PathMatcherBinding.h"
+#include "GafferBindings/PathMatcherBinding.h"
 
 using namespace boost::python;
-using namespace GafferSceneBindings;
-using namespace GafferScene;
+using namespace GafferBindings;
+using namespace Gaffer;
 
-namespace GafferSceneBindings
+namespace GafferBindings
 {
 
 // we don't actually wrap the existing init, but rather reimplement it
@@ -107,7 +107,7 @@ static list paths( const PathMatcher &p )
 
 void bindPathMatcher()
 {
-	class_<PathMatcher>( "PathMatcher" )
+	scope s = class_<PathMatcher>( "PathMatcher" )
 		.def( "__init__", make_constructor( constructFromObject ) )
 		.def( "__init__", make_constructor( constructFromVectorData ) )
 		.def( init<const PathMatcher &>() )
@@ -128,6 +128,14 @@ void bindPathMatcher()
 		.def( self == self )
 		.def( self != self )
 	;
+
+	enum_<PathMatcher::Result>( "Result" )
+		.value( "NoMatch", PathMatcher::NoMatch )
+		.value( "DescendantMatch", PathMatcher::DescendantMatch )
+		.value( "ExactMatch", PathMatcher::ExactMatch )
+		.value( "AncestorMatch", PathMatcher::AncestorMatch )
+		.value( "EveryMatch", PathMatcher::EveryMatch )
+	;
 }
 
-} // namespace GafferSceneBindings
+} // namespace GafferBindings
@@ -0,0 +1,81 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "boost/python.hpp"
+
+#include "Gaffer/PerformanceMonitor.h"
+
+#include "GafferBindings/PerformanceMonitorBinding.h"
+
+using namespace boost::python;
+using namespace GafferBindings;
+using namespace Gaffer;
+
+namespace
+{
+
+// Returns a list of ( node, statistics ) tuples. We don't use a dict
+// keyed by node name, because names are not unique across scripts.
+list performanceMonitorStatistics()
+{
+	const PerformanceMonitor::StatisticsMap statistics = PerformanceMonitor::statistics();
+
+	list result;
+	for( PerformanceMonitor::StatisticsMap::const_iterator it = statistics.begin(), eIt = statistics.end(); it != eIt; ++it )
+	{
+		dict s;
+		s["hashCount"] = it->second.hashCount;
+		s["computeCount"] = it->second.computeCount;
+		s["hashTime"] = it->second.hashTime;
+		s["computeTime"] = it->second.computeTime;
+		s["cacheBytesInserted"] = it->second.cacheBytesInserted;
+		result.append( make_tuple( boost::const_pointer_cast<Node>( it->first ), s ) );
+	}
+
+	return result;
+}
+
+} // namespace
+
+void GafferBindings::bindPerformanceMonitor()
+{
+	class_<PerformanceMonitor>( "PerformanceMonitor", no_init )
+		.def( "setEnabled", &PerformanceMonitor::setEnabled ).staticmethod( "setEnabled" )
+		.def( "getEnabled", &PerformanceMonitor::getEnabled ).staticmethod( "getEnabled" )
+		.def( "statistics", &performanceMonitorStatistics ).staticmethod( "statistics" )
+		.def( "clear", &PerformanceMonitor::clear ).staticmethod( "clear" )
+	;
+}
@@ -34,6 +34,13 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/mutex.h"
+#include "tbb/spin_mutex.h"
+
+#include <algorithm>
+
+#include "boost/bind.hpp"
+
 #include "IECore/Op.h"
 #include "IECore/MurmurHash.h"
 
@@ -45,11 +52,233 @@
 using namespace IECore;
 using namespace GafferCortex;
 
+//////////////////////////////////////////////////////////////////////////
+// InstancePool
+//////////////////////////////////////////////////////////////////////////
+
+// Computing the result requires setting the parameter values appropriate
+// to the current context and then calling operate(), so a single Op instance
+// cannot be used by several computations at once. The InstancePool provides
+// each computation with an Op of its own where possible. Additional instances
+// are only created when a computation finds the pool empty, and never more
+// than the number of computations we have actually seen running concurrently,
+// so OpHolders which are only ever computed serially never load any. Creation
+// is serialised, and the ParameterHandlers adopt the holder's existing plugs
+// without changing their values, so no plug signals are emitted from within
+// the compute. For Ops which were given to the OpHolder directly rather than
+// being loaded by class name, and while additional instances are unavailable,
+// computations fall back to using the held Op itself, and are serialised.
+class OpHolder::InstancePool : public IECore::RefCounted
+{
+
+	public :
+
+		InstancePool( OpHolder *holder )
+			:	m_holder( holder ), m_dirty( false ), m_generation( 0 ), m_numActive( 0 ), m_maxActive( 0 ), m_numCreated( 0 )
+		{
+		}
+
+		// Called when the structure of the parameters has changed.
+		// The pooled instances are discarded the next time one is
+		// requested, and new ones are created as they are needed.
+		void markDirty()
+		{
+			tbb::spin_mutex::scoped_lock lock( m_mutex );
+			m_dirty = true;
+		}
+
+		// Provides exclusive use of an Op and its ParameterHandlers
+		// for the lifetime of the Instance.
+		class Instance : boost::noncopyable
+		{
+
+			public :
+
+				Instance( InstancePool *pool )
+					:	m_pool( pool ), m_usingPrototype( false ), m_generation( 0 )
+				{
+					bool create = false;
+					{
+						tbb::spin_mutex::scoped_lock lock( pool->m_mutex );
+						if( pool->m_dirty )
+						{
+							pool->m_instances.clear();
+							pool->m_numCreated = 0;
+							pool->m_generation++;
+							pool->m_dirty = false;
+						}
+
+						m_generation = pool->m_generation;
+						pool->m_maxActive = std::max( pool->m_maxActive, ++pool->m_numActive );
+
+						if( pool->m_instances.size() )
+						{
+							const Entry &entry = pool->m_instances.back();
+							m_op = entry.op;
+							m_parameterHandler = entry.parameterHandler;
+							m_resultParameterHandler = entry.resultParameterHandler;
+							pool->m_instances.pop_back();
+							return;
+						}
+
+						// The held Op serves as one instance, so we
+						// need one fewer than the concurrency we've seen.
+						if( pool->m_numCreated + 1 < pool->m_maxActive )
+						{
+							pool->m_numCreated++;
+							create = true;
+						}
+					}
+
+					if( create )
+					{
+						try
+						{
+							create = pool->createEntry( m_op, m_parameterHandler, m_resultParameterHandler );
+						}
+						catch( ... )
+						{
+							release( /* returnEntry = */ false );
+							throw;
+						}
+						if( create )
+						{
+							return;
+						}
+					}
+
+					m_usingPrototype = true;
+					m_prototypeLock.acquire( pool->m_prototypeMutex );
+					m_op = pool->m_holder->getOp();
+					m_parameterHandler = pool->m_holder->parameterHandler();
+					m_resultParameterHandler = pool->m_holder->m_resultParameterHandler;
+				}
+
+				~Instance()
+				{
+					release( !m_usingPrototype );
+				}
+
+				Op *op()
+				{
+					return m_op.get();
+				}
+
+				ParameterHandler *parameterHandler()
+				{
+					return m_parameterHandler.get();
+				}
+
+				ParameterHandler *resultParameterHandler()
+				{
+					return m_resultParameterHandler.get();
+				}
+
+			private :
+
+				void release( bool returnEntry )
+				{
+					tbb::spin_mutex::scoped_lock lock( m_pool->m_mutex );
+					m_pool->m_numActive--;
+					if( !returnEntry )
+					{
+						if( !m_op && m_generation == m_pool->m_generation )
+						{
+							// Creation failed.
+							m_pool->m_numCreated--;
+						}
+						return;
+					}
+
+					// Instances created before the pool was
+					// dirtied are simply discarded.
+					if( m_generation == m_pool->m_generation && !m_pool->m_dirty )
+					{
+						Entry entry = { m_op, m_parameterHandler, m_resultParameterHandler };
+						m_pool->m_instances.push_back( entry );
+					}
+				}
+
+				InstancePoolPtr m_pool;
+				bool m_usingPrototype;
+				size_t m_generation;
+				tbb::mutex::scoped_lock m_prototypeLock;
+
+				OpPtr m_op;
+				ParameterHandlerPtr m_parameterHandler;
+				ParameterHandlerPtr m_resultParameterHandler;
+
+		};
+
+	private :
+
+		// Returns false if the held Op wasn't loaded by class name,
+		// in which case we have no way of making another instance.
+		bool createEntry( OpPtr &op, ParameterHandlerPtr &parameterHandler, ParameterHandlerPtr &resultParameterHandler )
+		{
+			tbb::mutex::scoped_lock lock( m_creationMutex );
+
+			std::string className;
+			int classVersion;
+			std::string searchPathEnvVar;
+			m_holder->getParameterised( &className, &classVersion, &searchPathEnvVar );
+			if( className.empty() )
+			{
+				return false;
+			}
+
+			// The ParameterHandlers are set up exactly as ParameterisedHolder::setParameterised()
+			// does when keeping existing values, so they adopt the existing plugs rather than
+			// creating new ones. loadClass() acquires the GIL itself.
+			OpPtr newOp = runTimeCast<Op>( m_holder->loadClass( className, classVersion, searchPathEnvVar ) );
+			if( !newOp )
+			{
+				throw IECore::Exception( "Parameterised object is not an IECore::Op" );
+			}
+			ParameterHandlerPtr newParameterHandler = new CompoundParameterHandler( newOp->parameters() );
+			newParameterHandler->restore( m_holder );
+			newParameterHandler->setupPlug( m_holder );
+			ParameterHandlerPtr newResultParameterHandler = ParameterHandler::create( const_cast<Parameter *>( newOp->resultParameter() ) );
+			newResultParameterHandler->setupPlug( m_holder, Gaffer::Plug::Out );
+
+			op = newOp;
+			parameterHandler = newParameterHandler;
+			resultParameterHandler = newResultParameterHandler;
+			return true;
+		}
+
+		OpHolder *m_holder;
+
+		struct Entry
+		{
+			OpPtr op;
+			ParameterHandlerPtr parameterHandler;
+			ParameterHandlerPtr resultParameterHandler;
+		};
+
+		tbb::spin_mutex m_mutex;
+		std::vector<Entry> m_instances;
+		bool m_dirty;
+		size_t m_generation;
+		size_t m_numActive;
+		size_t m_maxActive;
+		size_t m_numCreated;
+
+		tbb::mutex m_creationMutex;
+		tbb::mutex m_prototypeMutex;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// OpHolder
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( OpHolder )
 
 OpHolder::OpHolder( const std::string &name )
 	:	ParameterisedHolderComputeNode( name ), m_resultParameterHandler( 0 )
 {
+	plugSetSignal().connect( boost::bind( &OpHolder::plugSet, this, ::_1 ) );
 }
 
 void OpHolder::setParameterised( IECore::RunTimeTypedPtr parameterised, bool keepExistingValues )
@@ -59,6 +288,10 @@ void OpHolder::setParameterised( IECore::RunTimeTypedPtr parameterised, bool kee
 	{
 		throw IECore::Exception( "Parameterised object is not an IECore::Op" );
 	}
+
+	// The existing pool is of no further use, and there's
+	// no need for plugSet() to dirty it as the plugs are set up.
+	m_instancePool = NULL;
 	ParameterisedHolderComputeNode::setParameterised( parameterised, keepExistingValues );
 
 	m_resultParameterHandler = ParameterHandler::create( const_cast<Parameter *>( op->resultParameter() ) );
@@ -73,6 +306,8 @@ void OpHolder::setParameterised( IECore::RunTimeTypedPtr parameterised, bool kee
 		throw IECore::Exception( "Result plug is not derived from ValuePlug" );
 	}
 
+	m_instancePool = new InstancePool( this );
+
 	plugDirtiedSignal()( resultPlug.get() );
 }
 
@@ -127,11 +362,24 @@ void OpHolder::compute( Gaffer::ValuePlug *output, const Gaffer::Context *contex
 {
 	if( output->getName()=="result" )
 	{
-		const_cast<CompoundParameterHandler *>( parameterHandler() )->setParameterValue();
-		const_cast<Op *>( getOp() )->operate();
-		m_resultParameterHandler->setPlugValue();
+		InstancePool::Instance instance( m_instancePool.get() );
+		instance.parameterHandler()->setParameterValue();
+		instance.op()->operate();
+		instance.resultParameterHandler()->setPlugValue();
 		return;
 	}
 
 	ParameterisedHolderComputeNode::compute( output, context );
 }
+
+void OpHolder::plugSet( Gaffer::Plug *plug )
+{
+	// Plugs prefixed with "__" are used by ClassParameterHandler and
+	// ClassVectorParameterHandler to store the classes held by the
+	// parameters. When they change the structure of the parameters
+	// changes too, so the pooled instances are no longer usable.
+	if( m_instancePool && plug->getName().string().compare( 0, 2, "__" ) == 0 )
+	{
+		m_instancePool->markDirty();
+	}
+}
@@ -127,19 +127,28 @@ void ColorProcessor::compute( Gaffer::ValuePlug *output, const Gaffer::Context *
 {
 	if( output == colorDataPlug() )
 	{
-		FloatVectorDataPtr r, g, b;
+		ConstFloatVectorDataPtr inR, inG, inB;
 		{
 			ContextPtr tmpContext = new Context( *context, Context::Borrowed );
 			Context::Scope scopedContext( tmpContext.get() );
 			tmpContext->set( ImagePlug::channelNameContextName, string( "R" ) );
-			r = inPlug()->channelDataPlug()->getValue()->copy();
+			inR = inPlug()->channelDataPlug()->getValue();
 			tmpContext->set( ImagePlug::channelNameContextName, string( "G" ) );
-			g = inPlug()->channelDataPlug()->getValue()->copy();
+			inG = inPlug()->channelDataPlug()->getValue();
 			tmpContext->set( ImagePlug::channelNameContextName, string( "B" ) );
-			b = inPlug()->channelDataPlug()->getValue()->copy();
+			inB = inPlug()->channelDataPlug()->getValue();
 		}
 
-		processColorData( context, r.get(), g.get(), b.get() );
+		// The derived class fills fresh output buffers itself, so
+		// we don't copy the inputs or initialise the outputs here.
+		FloatVectorDataPtr r = new FloatVectorData;
+		FloatVectorDataPtr g = new FloatVectorData;
+		FloatVectorDataPtr b = new FloatVectorData;
+		r->writable().reserve( inR->readable().size() );
+		g->writable().reserve( inG->readable().size() );
+		b->writable().reserve( inB->readable().size() );
+
+		processColorData( context, inR.get(), inG.get(), inB.get(), r.get(), g.get(), b.get() );
 
 		ObjectVectorPtr result = new ObjectVector();
 		result->members().push_back( r );
@@ -39,6 +39,8 @@
 #include "boost/lexical_cast.hpp"
 #include "boost/multi_array.hpp"
 
+#include "tbb/atomic.h"
+
 #include "IECore/LRUCache.h"
 #include "IECore/DisplayDriverServer.h"
 #include "IECore/DisplayDriver.h"
@@ -88,6 +90,7 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 		GafferDisplayDriver( const Imath::Box2i &displayWindow, const Imath::Box2i &dataWindow,
 			const vector<string> &channelNames, ConstCompoundDataPtr parameters )
 			:	DisplayDriver( displayWindow, dataWindow, channelNames, parameters ),
+				m_id( g_nextId++ ),
 				m_gafferFormat( displayWindow, 1 ),
 				m_gafferDataWindow( m_gafferFormat.yDownToFormatSpace( dataWindow ) )
 		{
@@ -129,28 +132,27 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 			Box2i yUpBox = m_gafferFormat.yDownToFormatSpace( box );
 			const V2i boxMinTileOrigin = ImagePlug::tileOrigin( yUpBox.min );
 			const V2i boxMaxTileOrigin = ImagePlug::tileOrigin( yUpBox.max );
+			const int numChannels = channelNames().size();
 			for( int tileOriginY = boxMinTileOrigin.y; tileOriginY <= boxMaxTileOrigin.y; tileOriginY += ImagePlug::tileSize() )
 			{
 				for( int tileOriginX = boxMinTileOrigin.x; tileOriginX <= boxMaxTileOrigin.x; tileOriginX += ImagePlug::tileSize() )
 				{
-					for( int channelIndex = 0, numChannels = channelNames().size(); channelIndex < numChannels; ++channelIndex )
+					const V2i tileOrigin( tileOriginX, tileOriginY );
+					const V2i tileIndex = tileOrigin / ImagePlug::tileSize();
+					if( !validTileIndex( tileIndex ) )
 					{
-						const V2i tileOrigin( tileOriginX, tileOriginY );
-						ConstFloatVectorDataPtr tileData = getTile( tileOrigin, channelIndex );
-						if( !tileData )
-						{
-							// we've been sent data outside of the data window
-							continue;
-						}
+						// we've been sent data outside of the data window
+						continue;
+					}
 
-						// we must create a new object to hold the updated tile data,
-						// because the old one might well have been returned from
-						// computeChannelData and be being held in the cache.
-						FloatVectorDataPtr updatedTileData = tileData->copy();
-						vector<float> &updatedTile = updatedTileData->writable();
+					const Box2i tileBound( tileOrigin, tileOrigin + Imath::V2i( GafferImage::ImagePlug::tileSize() - 1 ) );
+					const Box2i transferBound = IECore::boxIntersection( tileBound, yUpBox );
 
-						const Box2i tileBound( tileOrigin, tileOrigin + Imath::V2i( GafferImage::ImagePlug::tileSize() - 1 ) );
-						const Box2i transferBound = IECore::boxIntersection( tileBound, yUpBox );
+					tbb::spin_rw_mutex::scoped_lock tileLock( m_tileMutex, true /* write */ );
+					for( int channelIndex = 0; channelIndex < numChannels; ++channelIndex )
+					{
+						Tile &tile = m_tiles[tileIndex.x][tileIndex.y][channelIndex];
+						vector<float> &updatedTile = writableTileData( tile );
 						for( int y = transferBound.min.y; y<=transferBound.max.y; ++y )
 						{
 							int srcY = m_gafferFormat.formatToYDownSpace( y );
@@ -164,8 +166,10 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 								dstIndex++;
 							}
 						}
-
-						setTile( tileOrigin, channelIndex, updatedTileData );
+						// Bumping the version gives the tile a new hash, while
+						// all the tiles we haven't touched retain their old
+						// hashes, and therefore remain valid in the cache.
+						tile.version++;
 					}
 				}
 			}
@@ -188,6 +192,27 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 			return true;
 		}
 
+		void channelDataHash( const Imath::V2i &tileOrigin, const std::string &channelName, IECore::MurmurHash &h )
+		{
+			vector<string>::const_iterator cIt = find( channelNames().begin(), channelNames().end(), channelName );
+			const V2i tileIndex = tileOrigin / ImagePlug::tileSize();
+			if( cIt != channelNames().end() && validTileIndex( tileIndex ) )
+			{
+				tbb::spin_rw_mutex::scoped_lock tileLock( m_tileMutex, false /* read */ );
+				const Tile &tile = m_tiles[tileIndex.x][tileIndex.y][cIt - channelNames().begin()];
+				if( tile.data )
+				{
+					h.append( (uint64_t)m_id );
+					h.append( tileOrigin );
+					h.append( channelName );
+					h.append( (uint64_t)tile.version );
+					return;
+				}
+			}
+
+			h = blackTileHash();
+		}
+
 		ConstFloatVectorDataPtr channelData( const Imath::V2i &tileOrigin, const std::string &channelName )
 		{
 			vector<string>::const_iterator cIt = find( channelNames().begin(), channelNames().end(), channelName );
@@ -230,16 +255,20 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 
 		static const DisplayDriverDescription<GafferDisplayDriver> g_description;
 
+		bool validTileIndex( const V2i &tileIndex ) const
+		{
+			return
+				tileIndex.x >= m_tiles.index_bases()[0] &&
+				tileIndex.x < (int)(m_tiles.index_bases()[0] + m_tiles.shape()[0] ) &&
+				tileIndex.y >= m_tiles.index_bases()[1] &&
+				tileIndex.y < (int)(m_tiles.index_bases()[1] + m_tiles.shape()[1] )
+			;
+		}
+
 		ConstFloatVectorDataPtr getTile( const V2i &tileOrigin, size_t channelIndex )
 		{
 			V2i tileIndex = tileOrigin / ImagePlug::tileSize();
-
-			if(
-				tileIndex.x < m_tiles.index_bases()[0] ||
-				tileIndex.x >= (int)(m_tiles.index_bases()[0] + m_tiles.shape()[0] ) ||
-				tileIndex.y < m_tiles.index_bases()[1] ||
-				tileIndex.y >= (int)(m_tiles.index_bases()[1] + m_tiles.shape()[1] )
-			)
+			if( !validTileIndex( tileIndex ) )
 			{
 				// outside data window
 				return NULL;
@@ -247,7 +276,7 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 
 			tbb::spin_rw_mutex::scoped_lock tileLock( m_tileMutex, false /* read */ );
 
-			ConstFloatVectorDataPtr result = m_tiles[tileIndex.x][tileIndex.y][channelIndex];
+			ConstFloatVectorDataPtr result = m_tiles[tileIndex.x][tileIndex.y][channelIndex].data;
 			if( !result )
 			{
 				result = ImagePlug::blackTile();
@@ -256,18 +285,48 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 			return result;
 		}
 
-		void setTile( const V2i &tileOrigin, size_t channelIndex, ConstFloatVectorDataPtr tile )
+		struct Tile
 		{
-			V2i tileIndex = tileOrigin / ImagePlug::tileSize();
-			tbb::spin_rw_mutex::scoped_lock tileLock( m_tileMutex, true /* write */ );
-			m_tiles[tileIndex.x][tileIndex.y][channelIndex] = tile;
+			Tile() : version( 0 ) {}
+			FloatVectorDataPtr data;
+			size_t version;
+		};
+
+		// Returns the data for a tile, ready to be modified. Must be called
+		// with m_tileMutex locked for writing. If the existing data may be
+		// referenced elsewhere (it might have been returned from
+		// computeChannelData() and be held in the cache), then we must
+		// make a copy to modify. Otherwise we can save the cost of the copy
+		// and update the data in place.
+		vector<float> &writableTileData( Tile &tile )
+		{
+			if( !tile.data )
+			{
+				tile.data = ImagePlug::blackTile()->copy();
+			}
+			else if( tile.data->refCount() > 1 )
+			{
+				tile.data = tile.data->copy();
+			}
+			return tile.data->writable();
+		}
+
+		static const IECore::MurmurHash &blackTileHash()
+		{
+			static const IECore::MurmurHash h = ImagePlug::blackTile()->Object::hash();
+			return h;
 		}
 
 		// indexed by tileIndexX, tileIndexY, channelIndex.
-		typedef boost::multi_array<ConstFloatVectorDataPtr, 3> TileArray;
+		typedef boost::multi_array<Tile, 3> TileArray;
 		TileArray m_tiles;
 		tbb::spin_rw_mutex m_tileMutex;
 
+		// Unique identifier used to distinguish our
+		// tile hashes from those of other drivers.
+		const size_t m_id;
+		static tbb::atomic<size_t> g_nextId;
+
 		Format m_gafferFormat;
 		Imath::Box2i m_gafferDataWindow;
 		IECore::ConstCompoundDataPtr m_parameters;
@@ -277,6 +336,7 @@ class GafferDisplayDriver : public IECore::DisplayDriver
 };
 
 const DisplayDriver::DisplayDriverDescription<GafferDisplayDriver> GafferDisplayDriver::g_description;
+tbb::atomic<size_t> GafferDisplayDriver::g_nextId;
 
 } // namespace GafferImage
 
@@ -457,15 +517,21 @@ Imath::Box2i Display::computeDataWindow( const Gaffer::Context *context, const I
 
 void Display::hashChannelData( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	ConstFloatVectorDataPtr channelData = ImagePlug::blackTile();
 	if( m_driver )
 	{
-		channelData = m_driver->channelData(
+		// The driver versions each tile as it receives data, so this
+		// is much cheaper than hashing the data itself, and only the
+		// tiles which have received new data will have a new hash.
+		m_driver->channelDataHash(
 			context->get<Imath::V2i>( ImagePlug::tileOriginContextName ),
-			context->get<std::string>( ImagePlug::channelNameContextName )
+			context->get<std::string>( ImagePlug::channelNameContextName ),
+			h
 		);
 	}
-	h = channelData->Object::hash();
+	else
+	{
+		h = ImagePlug::blackTile()->Object::hash();
+	}
 }
 
 IECore::ConstFloatVectorDataPtr Display::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
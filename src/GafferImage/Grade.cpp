@@ -34,6 +34,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "Gaffer/Context.h"
 
 #include "GafferImage/Grade.h"
@@ -41,6 +43,50 @@
 using namespace IECore;
 using namespace Gaffer;
 
+namespace
+{
+
+// Grades a tile in place. The gamma and clamping options are template
+// parameters so that each combination compiles to a tight inner loop
+// with no branches, which the compiler is free to vectorise.
+template<bool applyGamma, bool blackClamp, bool whiteClamp>
+void gradeKernel( float *data, size_t size, float a, float b, float invGamma )
+{
+	for( float *end = data + size; data != end; ++data )
+	{
+		float c = a * *data + b;
+		if( applyGamma )
+		{
+			c = c >= 0.f ? (float)pow( c, invGamma ) : c;
+		}
+		if( blackClamp )
+		{
+			c = std::max( c, 0.f );
+		}
+		if( whiteClamp )
+		{
+			c = std::min( c, 1.f );
+		}
+		*data = c;
+	}
+}
+
+typedef void (*GradeKernel)( float *, size_t, float, float, float );
+
+// Indexed by applyGamma << 2 | blackClamp << 1 | whiteClamp.
+const GradeKernel g_gradeKernels[] = {
+	gradeKernel<false, false, false>,
+	gradeKernel<false, false, true>,
+	gradeKernel<false, true, false>,
+	gradeKernel<false, true, true>,
+	gradeKernel<true, false, false>,
+	gradeKernel<true, false, true>,
+	gradeKernel<true, true, false>,
+	gradeKernel<true, true, true>
+};
+
+} // namespace
+
 namespace GafferImage
 {
 
@@ -243,9 +289,6 @@ void Grade::hashChannelData( const GafferImage::ImagePlug *output, const Gaffer:
 
 void Grade::processChannelData( const Gaffer::Context *context, const ImagePlug *parent, const std::string &channel, FloatVectorDataPtr outData ) const
 {
-	// Calculate the valid data window that we are to merge.
-	const int dataWidth = ImagePlug::tileSize()*ImagePlug::tileSize();
-
 	// Do some pre-processing.
 	float A, B, gamma;
 	parameters( ChannelMaskPlug::channelIndex( channel ), A, B, gamma );
@@ -253,24 +296,11 @@ void Grade::processChannelData( const Gaffer::Context *context, const ImagePlug
 	const bool whiteClamp = whiteClampPlug()->getValue();
 	const bool blackClamp = blackClampPlug()->getValue();
 
-	// Get some useful pointers.
-	float *outPtr = &(outData->writable()[0]);
-	const float *END = outPtr + dataWidth;
-
-	while (outPtr != END)
-	{
-		// Calculate the colour of the graded pixel.
-		float colour = *outPtr;	// As the input has been copied to outData, grab the input colour from there.
-		const float c = A * colour + B;
-		colour = ( c >= 0.f && invGamma != 1.f ? (float)pow( c, invGamma ) : c );
-
-		// Clamp the white and blacks if necessary.
-		if ( blackClamp && colour < 0.f ) colour = 0.f;
-		if ( whiteClamp && colour > 1.f ) colour = 1.f;
-
-		// Write back the result.
-		*outPtr++ = colour;
-	}
+	// Choose the kernel for our options and apply it to the whole tile.
+	// As the input has been copied to outData, we can work in place.
+	const GradeKernel kernel = g_gradeKernels[ ( invGamma != 1.f ) << 2 | blackClamp << 1 | whiteClamp ];
+	std::vector<float> &out = outData->writable();
+	kernel( &(out[0]), out.size(), A, B, invGamma );
 }
 
 void Grade::parameters( size_t channelIndex, float &a, float &b, float &gamma ) const
@@ -42,6 +42,7 @@
 #include "IECore/BoxAlgo.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/Canceller.h"
 
 #include "GafferImage/ImagePlug.h"
 #include "GafferImage/FormatPlug.h"
@@ -97,6 +98,7 @@ class CopyTiles
 			{
 				for( int tileOriginX = minTileOrigin.x; tileOriginX <= maxTileOrigin.x; tileOriginX += m_tileSize )
 				{
+					Canceller::check( m_parentContext->canceller() );
 					for( vector<string>::const_iterator it = m_channelNames.begin(), eIt = m_channelNames.end(); it != eIt; it++ )
 					{
 						context->set( ImagePlug::channelNameContextName, *it );
@@ -40,6 +40,8 @@
 
 #include "OpenColorIO/OpenColorIO.h"
 
+#include "IECore/LRUCache.h"
+
 #include "Gaffer/Context.h"
 
 #include "GafferImage/OpenColorIO.h"
@@ -71,6 +73,42 @@ typedef tbb::null_mutex OCIOMutex;
 
 static OCIOMutex g_ocioMutex;
 
+// Getting a processor from the config is relatively expensive, and we
+// need one for every tile we process, so we keep them in a cache. The key
+// is made from the cache id of the config (which accounts for the current
+// context variables as well as the config itself) and the input and output
+// spaces, so the mutex is only taken when there is a cache miss.
+
+static const char g_keySeparator = '\n';
+
+static std::string processorKey( const std::string &inputSpace, const std::string &outputSpace )
+{
+	::OpenColorIO::ConstConfigRcPtr config = ::OpenColorIO::GetCurrentConfig();
+	return std::string( config->getCacheID() ) + g_keySeparator + inputSpace + g_keySeparator + outputSpace;
+}
+
+static ::OpenColorIO::ConstProcessorRcPtr processorGetter( const std::string &key, size_t &cost )
+{
+	const size_t outputSeparator = key.rfind( g_keySeparator );
+	const size_t inputSeparator = key.rfind( g_keySeparator, outputSeparator - 1 );
+	const std::string inputSpace = key.substr( inputSeparator + 1, outputSeparator - inputSeparator - 1 );
+	const std::string outputSpace = key.substr( outputSeparator + 1 );
+
+	cost = 1;
+
+	OCIOMutex::scoped_lock lock( g_ocioMutex );
+	::OpenColorIO::ConstConfigRcPtr config = ::OpenColorIO::GetCurrentConfig();
+	return config->getProcessor( inputSpace.c_str(), outputSpace.c_str() );
+}
+
+typedef LRUCache<std::string, ::OpenColorIO::ConstProcessorRcPtr> ProcessorCache;
+
+static ProcessorCache *processorCache()
+{
+	static ProcessorCache *c = new ProcessorCache( processorGetter, 100 );
+	return c;
+}
+
 } // namespace Detail
 
 IE_CORE_DEFINERUNTIMETYPED( OpenColorIO );
@@ -141,17 +179,24 @@ void OpenColorIO::hashColorData( const Gaffer::Context *context, IECore::MurmurH
 	outputSpacePlug()->hash( h );
 }
 
-void OpenColorIO::processColorData( const Gaffer::Context *context, IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b ) const
+void OpenColorIO::processColorData(
+	const Gaffer::Context *context,
+	const IECore::FloatVectorData *inR, const IECore::FloatVectorData *inG, const IECore::FloatVectorData *inB,
+	IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b
+) const
 {
 	string inputSpace( inputSpacePlug()->getValue() );
 	string outputSpace( outputSpacePlug()->getValue() );
 
-	::OpenColorIO::ConstProcessorRcPtr processor;
-	{
-		Detail::OCIOMutex::scoped_lock lock( Detail::g_ocioMutex );
-		::OpenColorIO::ConstConfigRcPtr config = ::OpenColorIO::GetCurrentConfig();
-		processor = config->getProcessor( inputSpace.c_str(), outputSpace.c_str() );
-	}
+	::OpenColorIO::ConstProcessorRcPtr processor = Detail::processorCache()->get(
+		Detail::processorKey( inputSpace, outputSpace )
+	);
+
+	// OpenColorIO only processes pixels in place, so we must
+	// copy the inputs into the outputs first.
+	r->writable().assign( inR->readable().begin(), inR->readable().end() );
+	g->writable().assign( inG->readable().begin(), inG->readable().end() );
+	b->writable().assign( inB->readable().begin(), inB->readable().end() );
 
 	::OpenColorIO::PlanarImageDesc image(
 		r->baseWritable(),
@@ -0,0 +1,79 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "Gaffer/Context.h"
+
+#include "GafferImageTest/ProcessTiles.h"
+
+using namespace std;
+using namespace Imath;
+using namespace IECore;
+using namespace Gaffer;
+using namespace GafferImage;
+
+size_t GafferImageTest::processTiles( const GafferImage::ImagePlug *imagePlug )
+{
+	const Box2i dataWindow = imagePlug->dataWindowPlug()->getValue();
+	ConstStringVectorDataPtr channelNamesData = imagePlug->channelNamesPlug()->getValue();
+	const vector<string> &channelNames = channelNamesData->readable();
+
+	if( dataWindow.isEmpty() )
+	{
+		return 0;
+	}
+
+	ContextPtr context = new Context( *Context::current(), Context::Borrowed );
+	Context::Scope scopedContext( context.get() );
+
+	size_t numTiles = 0;
+	const V2i minTileOrigin = ImagePlug::tileOrigin( dataWindow.min );
+	const V2i maxTileOrigin = ImagePlug::tileOrigin( dataWindow.max );
+	for( vector<string>::const_iterator it = channelNames.begin(), eIt = channelNames.end(); it != eIt; ++it )
+	{
+		context->set( ImagePlug::channelNameContextName, *it );
+		for( int y = minTileOrigin.y; y <= maxTileOrigin.y; y += ImagePlug::tileSize() )
+		{
+			for( int x = minTileOrigin.x; x <= maxTileOrigin.x; x += ImagePlug::tileSize() )
+			{
+				context->set( ImagePlug::tileOriginContextName, V2i( x, y ) );
+				imagePlug->channelDataPlug()->getValue();
+				numTiles++;
+			}
+		}
+	}
+
+	return numTiles;
+}
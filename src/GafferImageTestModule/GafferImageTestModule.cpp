@@ -37,6 +37,7 @@
 #include "boost/python.hpp"
 
 #include "GafferImageTest/ImageReaderTest.h"
+#include "GafferImageTest/ProcessTiles.h"
 
 using namespace boost::python;
 using namespace GafferImageTest;
@@ -45,4 +46,5 @@ BOOST_PYTHON_MODULE( _GafferImageTest )
 {
 	def( "testOIIOJpgRead", &testOIIOJpgRead );
 	def( "testOIIOExrRead", &testOIIOExrRead );
+	def( "processTiles", &processTiles );
 }
@@ -88,6 +88,8 @@
 #include "GafferBindings/LeafPathFilterBinding.h"
 #include "GafferBindings/MatchPatternPathFilterBinding.h"
 #include "GafferBindings/FileSystemPathBinding.h"
+#include "GafferBindings/PathMatcherBinding.h"
+#include "GafferBindings/PerformanceMonitorBinding.h"
 
 using namespace boost::python;
 using namespace Gaffer;
@@ -180,6 +182,8 @@ BOOST_PYTHON_MODULE( _Gaffer )
 	bindLeafPathFilter();
 	bindMatchPatternPathFilter();
 	bindFileSystemPath();
+	bindPathMatcher();
+	bindPerformanceMonitor();
 
 	NodeClass<Backdrop>();
 
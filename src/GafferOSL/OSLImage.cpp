@@ -266,18 +266,27 @@ void OSLImage::hashShading( const Gaffer::Context *context, IECore::MurmurHash &
 	h.append( tileOrigin );
 	inPlug()->formatPlug()->hash( h );
 
+	const OSLShader *shader = runTimeCast<const OSLShader>( shaderPlug()->source<Plug>()->node() );
+	OSLRenderer::ConstShadingEnginePtr shadingEngine = shader ? shader->shadingEngine() : NULL;
+	if( !shadingEngine )
+	{
+		return;
+	}
+
+	// we only hash the channels which the shader will actually read,
+	// so that edits to other channels don't trigger a reshade.
 	ConstStringVectorDataPtr channelNamesData = inPlug()->channelNamesPlug()->getValue();
 	const vector<string> &channelNames = channelNamesData->readable();
 	for( vector<string>::const_iterator it = channelNames.begin(), eIt = channelNames.end(); it != eIt; ++it )
 	{
-		h.append( inPlug()->channelDataHash( *it, tileOrigin ) );
+		if( shadingEngine->needsAttribute( *it ) )
+		{
+			h.append( *it );
+			h.append( inPlug()->channelDataHash( *it, tileOrigin ) );
+		}
 	}
 
-	const OSLShader *shader = runTimeCast<const OSLShader>( shaderPlug()->source<Plug>()->node() );
-	if( shader )
-	{
-		shader->stateHash( h );
-	}
+	shader->stateHash( h );
 }
 
 IECore::ConstCompoundDataPtr OSLImage::computeShading( const Gaffer::Context *context ) const
@@ -298,6 +307,13 @@ IECore::ConstCompoundDataPtr OSLImage::computeShading( const Gaffer::Context *co
 
 	CompoundDataPtr shadingPoints = new CompoundData();
 
+	// make the P, u and v globals for the tile. these are written
+	// in place rather than appended point by point, and since u only
+	// varies with x, we compute a single row and copy it for each
+	// row of the tile.
+
+	const int tileSize = ImagePlug::tileSize();
+
 	V3fVectorDataPtr pData = new V3fVectorData;
 	FloatVectorDataPtr uData = new FloatVectorData;
 	FloatVectorDataPtr vData = new FloatVectorData;
@@ -306,10 +322,9 @@ IECore::ConstCompoundDataPtr OSLImage::computeShading( const Gaffer::Context *co
 	vector<float> &uWritable = uData->writable();
 	vector<float> &vWritable = vData->writable();
 
-	const size_t tileSize = ImagePlug::tileSize();
-	pWritable.reserve( tileSize * tileSize );
-	uWritable.reserve( tileSize * tileSize );
-	vWritable.reserve( tileSize * tileSize );
+	pWritable.resize( tileSize * tileSize );
+	uWritable.resize( tileSize * tileSize );
+	vWritable.resize( tileSize * tileSize );
 
 	/// \todo Non-zero display window origins - do we have those?
 	const float uStep = 1.0f / format.width();
@@ -318,28 +333,46 @@ IECore::ConstCompoundDataPtr OSLImage::computeShading( const Gaffer::Context *co
 	const float vStep = 1.0f / format.height();
 	const float vMin = 0.5f * vStep;
 
-	const size_t xMax = tileOrigin.x + tileSize;
-	const size_t yMax = tileOrigin.y + tileSize;
-	for( size_t y = tileOrigin.y; y < yMax; ++y )
+	vector<float>::iterator uRowBegin = uWritable.begin();
+	vector<float>::iterator uRowEnd = uRowBegin + tileSize;
+	for( int x = 0; x < tileSize; ++x )
+	{
+		uRowBegin[x] = uMin + ( tileOrigin.x + x ) * uStep;
+	}
+
+	V3f *p = &pWritable[0];
+	vector<float>::iterator u = uWritable.begin();
+	vector<float>::iterator v = vWritable.begin();
+	for( int y = 0; y < tileSize; ++y )
 	{
-		const float v = vMin + y * vStep;
-		for( size_t x = tileOrigin.x; x < xMax; ++x )
+		const float pixelY = tileOrigin.y + y;
+		if( y )
 		{
-			uWritable.push_back( uMin + x * uStep );
-			vWritable.push_back( v );
-			pWritable.push_back( V3f( x, y, 0.0f ) );
+			copy( uRowBegin, uRowEnd, u );
 		}
+		fill( v, v + tileSize, vMin + pixelY * vStep );
+		for( int x = 0; x < tileSize; ++x )
+		{
+			*p++ = V3f( tileOrigin.x + x, pixelY, 0.0f );
+		}
+		u += tileSize;
+		v += tileSize;
 	}
 
 	shadingPoints->writable()["P"] = pData;
 	shadingPoints->writable()["u"] = uData;
 	shadingPoints->writable()["v"] = vData;
 
+	// only fetch the channels the shader will actually read.
+
 	ConstStringVectorDataPtr channelNamesData = inPlug()->channelNamesPlug()->getValue();
 	const vector<string> &channelNames = channelNamesData->readable();
 	for( vector<string>::const_iterator it = channelNames.begin(), eIt = channelNames.end(); it != eIt; ++it )
 	{
-		shadingPoints->writable()[*it] = boost::const_pointer_cast<FloatVectorData>( inPlug()->channelData( *it, tileOrigin ) );
+		if( shadingEngine->needsAttribute( *it ) )
+		{
+			shadingPoints->writable()[*it] = boost::const_pointer_cast<FloatVectorData>( inPlug()->channelData( *it, tileOrigin ) );
+		}
 	}
 
 	CompoundDataPtr result = shadingEngine->shade( shadingPoints.get() );
@@ -34,6 +34,9 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/parallel_for.h"
+#include "tbb/spin_rw_mutex.h"
+
 #include "boost/algorithm/string/split.hpp"
 #include "boost/algorithm/string/predicate.hpp"
 #include "boost/algorithm/string/classification.hpp"
@@ -251,6 +254,11 @@ class OSLRenderer::RenderState
 			return ShadingSystem::convert_value( value, type, src, it->typeDesc );
 		}
 
+		void setPointIndex( size_t pointIndex )
+		{
+			m_pointIndex = pointIndex;
+		}
+
 		void incrementPointIndex()
 		{
 			m_pointIndex++;
@@ -862,15 +870,85 @@ class OSLRenderer::ShadingResults
 			(*m_ci)[pointIndex] += weight;
 		}
 
+		/// \todo This is a lot like the UserData struct above - maybe we should
+		/// just have one type we can use for both?
+		struct DebugResult
+		{
+			DebugResult()
+				:	basePointer( NULL )
+			{
+			}
+
+			ustring name;
+			TypeDesc type;
+			void *basePointer;
+
+			bool operator < ( const DebugResult &rhs ) const
+			{
+				return name.c_str() < rhs.name.c_str();
+			}
+
+			bool operator < ( const ustring &rhs ) const
+			{
+				return name.c_str() < rhs.c_str();
+			}
+		};
+
 		void addDebug( size_t pointIndex, const ClosureComponent *closure, const Color3f &weight )
+		{
+			const DebugResult result = debugResult( closure );
+
+			Color3f value = weight;
+			if( const ClosureComponent::Attr *valueAttr = attr( closure, DebugParameters::valueAttrKey ) )
+			{
+				value *= valueAttr->color();
+			}
+
+			char *dst = static_cast<char *>( result.basePointer );
+			dst += pointIndex * result.type.elementsize();
+			ShadingSystem::convert_value(
+				dst,
+				result.type,
+				&value,
+				result.type.aggregate == TypeDesc::SCALAR ? TypeDesc::TypeFloat : TypeDesc::TypeColor
+			);
+		}
+
+		// Returns the DebugResult for the specified closure, allocating
+		// storage for it if this is the first time it has been seen. Points
+		// are shaded concurrently, so we must lock while doing this, but we
+		// return by value so that the conversion into the storage (which is
+		// preallocated for all points) can be done outside the lock. Once
+		// the first few points have been shaded, all lookups are for existing
+		// results, so we only take a write lock when inserting a new one.
+		DebugResult debugResult( const ClosureComponent *closure )
 		{
 			const DebugParameters *parameters = static_cast<const DebugParameters *>( closure->data() );
+
+			tbb::spin_rw_mutex::scoped_lock lock( m_debugResultsMutex, /* write = */ false );
+
 			vector<DebugResult>::iterator it = lower_bound(
 				m_debugResults.begin(),
 				m_debugResults.end(),
 				parameters->name
 			);
 
+			if( it != m_debugResults.end() && it->name == parameters->name )
+			{
+				return *it;
+			}
+
+			if( !lock.upgrade_to_writer() )
+			{
+				// The lock was released temporarily during the upgrade, so
+				// another thread may have modified m_debugResults. Search again.
+				it = lower_bound(
+					m_debugResults.begin(),
+					m_debugResults.end(),
+					parameters->name
+				);
+			}
+
 			if( it == m_debugResults.end() || it->name != parameters->name )
 			{
 				DebugResult result;
@@ -891,49 +969,100 @@ class OSLRenderer::ShadingResults
 				it = m_debugResults.insert( it, result );
 			}
 
-			Color3f value = weight;
-			if( const ClosureComponent::Attr *valueAttr = attr( closure, DebugParameters::valueAttrKey ) )
-			{
-				value *= valueAttr->color();
-			}
+			return *it;
+		}
 
-			char *dst = static_cast<char *>( it->basePointer );
-			dst += pointIndex * it->type.elementsize();
-			ShadingSystem::convert_value(
-				dst,
-				it->type,
-				&value,
-				it->type.aggregate == TypeDesc::SCALAR ? TypeDesc::TypeFloat : TypeDesc::TypeColor
-			);
+		CompoundDataPtr m_results;
+		vector<Color3f> *m_ci;
+		vector<DebugResult> m_debugResults; // sorted on name for quick lookups
+		tbb::spin_rw_mutex m_debugResultsMutex;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// OSLRenderer::ShadingFunctor
+//////////////////////////////////////////////////////////////////////////
+
+// Shades a range of points. Each invocation uses its own ShadingContext,
+// ShaderGlobals and RenderState, so that ranges may be shaded concurrently,
+// writing directly into the results which have been preallocated for all
+// the points.
+class OSLRenderer::ShadingFunctor
+{
+
+	public :
+
+		ShadingFunctor(
+			ShadingSystem *shadingSystem,
+			ShadingAttribState &shadingState,
+			const ShaderGlobals &shaderGlobals,
+			const RenderState &renderState,
+			const OSL::Vec3 *p,
+			const float *u,
+			const float *v,
+			const V3f *n,
+			ShadingResults &results
+		)
+			:	m_shadingSystem( shadingSystem ), m_shadingState( shadingState ),
+				m_shaderGlobals( shaderGlobals ), m_renderState( renderState ),
+				m_p( p ), m_u( u ), m_v( v ), m_n( n ), m_results( results )
+		{
 		}
 
-		/// \todo This is a lot like the UserData struct above - maybe we should
-		/// just have one type we can use for both?
-		struct DebugResult
+		void operator()( const tbb::blocked_range<size_t> &range ) const
 		{
-			DebugResult()
-				:	basePointer( NULL )
-			{
-			}
+			RenderState renderState( m_renderState );
+			renderState.setPointIndex( range.begin() );
 
-			ustring name;
-			TypeDesc type;
-			void *basePointer;
+			ShaderGlobals shaderGlobals = m_shaderGlobals;
+			shaderGlobals.renderstate = &renderState;
 
-			bool operator < ( const DebugResult &rhs ) const
+			ShadingContext *shadingContext = m_shadingSystem->get_context();
+			try
 			{
-				return name.c_str() < rhs.name.c_str();
-			}
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					shaderGlobals.P = m_p[i];
+					if( m_u )
+					{
+						shaderGlobals.u = m_u[i];
+					}
+					if( m_v )
+					{
+						shaderGlobals.v = m_v[i];
+					}
+					if( m_n )
+					{
+						shaderGlobals.N = m_n[i];
+					}
 
-			bool operator < ( const ustring &rhs ) const
+					shaderGlobals.Ci = NULL;
+
+					m_shadingSystem->execute( *shadingContext, m_shadingState, shaderGlobals );
+					m_results.addResult( i, shaderGlobals.Ci );
+					renderState.incrementPointIndex();
+				}
+			}
+			catch( ... )
 			{
-				return name.c_str() < rhs.c_str();
+				m_shadingSystem->release_context( shadingContext );
+				throw;
 			}
-		};
 
-		CompoundDataPtr m_results;
-		vector<Color3f> *m_ci;
-		vector<DebugResult> m_debugResults; // sorted on name for quick lookups
+			m_shadingSystem->release_context( shadingContext );
+		}
+
+	private :
+
+		ShadingSystem *m_shadingSystem;
+		ShadingAttribState &m_shadingState;
+		const ShaderGlobals &m_shaderGlobals;
+		const RenderState &m_renderState;
+		const OSL::Vec3 *m_p;
+		const float *m_u;
+		const float *m_v;
+		const V3f *m_n;
+		ShadingResults &m_results;
 
 };
 
@@ -942,8 +1071,55 @@ class OSLRenderer::ShadingResults
 //////////////////////////////////////////////////////////////////////////
 
 OSLRenderer::ShadingEngine::ShadingEngine( ConstOSLRendererPtr renderer, OSL::ShadingAttribStateRef shadingState )
-	:	m_renderer( renderer ), m_shadingState( shadingState )
+	:	m_renderer( renderer ), m_shadingState( shadingState ), m_unknownAttributesNeeded( true )
 {
+#if OSL_LIBRARY_VERSION_CODE >= 10600
+	// ask OSL which attributes and user data the optimised network
+	// may query, so that needsAttribute() can allow clients to avoid
+	// providing data that will never be used.
+
+	ShadingSystem *shadingSystem = m_renderer->m_shadingSystem.get();
+	ShaderGroup *group = m_shadingState.get();
+
+	int unknownAttributesNeeded = 1;
+	if( !shadingSystem->getattribute( group, "unknown_attributes_needed", TypeDesc::TypeInt, &unknownAttributesNeeded ) || unknownAttributesNeeded )
+	{
+		return;
+	}
+
+	int numAttributesNeeded = 0;
+	ustring *attributesNeeded = NULL;
+	if(
+		!shadingSystem->getattribute( group, "num_attributes_needed", TypeDesc::TypeInt, &numAttributesNeeded ) ||
+		( numAttributesNeeded && !shadingSystem->getattribute( group, "attributes_needed", TypeDesc::PTR, &attributesNeeded ) )
+	)
+	{
+		return;
+	}
+
+	// parameters which aren't locked to their values may also be
+	// provided by our RendererServices, via get_userdata().
+	int numUserData = 0;
+	ustring *userDataNames = NULL;
+	if(
+		!shadingSystem->getattribute( group, "num_userdata", TypeDesc::TypeInt, &numUserData ) ||
+		( numUserData && !shadingSystem->getattribute( group, "userdata_names", TypeDesc::PTR, &userDataNames ) )
+	)
+	{
+		return;
+	}
+
+	for( int i = 0; i < numAttributesNeeded; ++i )
+	{
+		m_attributesNeeded.insert( attributesNeeded[i].string() );
+	}
+	for( int i = 0; i < numUserData; ++i )
+	{
+		m_attributesNeeded.insert( userDataNames[i].string() );
+	}
+
+	m_unknownAttributesNeeded = false;
+#endif
 }
 
 template <typename T>
@@ -1021,11 +1197,11 @@ IECore::CompoundDataPtr OSLRenderer::ShadingEngine::shade( const IECore::Compoun
 	shaderGlobals.dPdu = uniformValue<V3f>( points, "dPdu" );
 	shaderGlobals.dPdv = uniformValue<V3f>( points, "dPdv" );
 
-	// add a RenderState to the ShaderGlobals. this will
-	// get passed to our RendererServices queries.
+	// make a RenderState for the ShaderGlobals. each range of
+	// points shaded gets its own copy, which is passed to our
+	// RendererServices queries.
 
-	RenderState renderState( points );
-	shaderGlobals.renderstate = &renderState;
+	const RenderState renderState( points );
 
 	// get pointers to varying data, we'll use these to
 	// update the shaderGlobals as we iterate over our points.
@@ -1040,33 +1216,27 @@ IECore::CompoundDataPtr OSLRenderer::ShadingEngine::shade( const IECore::Compoun
 
 	ShadingResults results( numPoints );
 
-	// iterate over the input points, doing the shading as we go
+	// shade the input points in parallel, with each range of points
+	// writing directly into the preallocated results.
 
-	ShadingContext *shadingContext = m_renderer->m_shadingSystem->get_context();
-	for( size_t i = 0; i < numPoints; ++i )
-	{
-		shaderGlobals.P = *p++;
-		if( u )
-		{
-			shaderGlobals.u = *u++;
-		}
-		if( v )
-		{
-			shaderGlobals.v = *v++;
-		}
-		if( n )
-		{
-			shaderGlobals.N = *n++;
-		}
+	ShadingFunctor functor(
+		m_renderer->m_shadingSystem.get(),
+		*m_shadingState,
+		shaderGlobals,
+		renderState,
+		p, u, v, n,
+		results
+	);
+	tbb::parallel_for( tbb::blocked_range<size_t>( 0, numPoints, 1000 ), functor );
 
-		shaderGlobals.Ci = NULL;
+	return results.results();
+}
 
-		m_renderer->m_shadingSystem->execute( *shadingContext, *m_shadingState, shaderGlobals );
-		results.addResult( i, shaderGlobals.Ci );
-		renderState.incrementPointIndex();
+bool OSLRenderer::ShadingEngine::needsAttribute( const std::string &name ) const
+{
+	if( m_unknownAttributesNeeded )
+	{
+		return true;
 	}
-
-	m_renderer->m_shadingSystem->release_context( shadingContext );
-
-	return results.results();
+	return m_attributesNeeded.find( name ) != m_attributesNeeded.end();
 }
@@ -128,6 +128,7 @@ BOOST_PYTHON_MODULE( _GafferOSL )
 
 	IECorePython::RefCountedClass<OSLRenderer::ShadingEngine, IECore::RefCounted>( "ShadingEngine" )
 		.def( "shade", &OSLRenderer::ShadingEngine::shade )
+		.def( "needsAttribute", &OSLRenderer::ShadingEngine::needsAttribute )
 	;
 
 }
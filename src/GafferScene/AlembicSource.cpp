@@ -269,6 +269,26 @@ IECore::ConstCompoundObjectPtr AlembicSource::computeGlobals( const Gaffer::Cont
 	return parent->globalsPlug()->defaultValue();
 }
 
+void AlembicSource::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = parent->setNamesPlug()->defaultValue()->Object::hash();
+}
+
+IECore::ConstInternedStringVectorDataPtr AlembicSource::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return parent->setNamesPlug()->defaultValue();
+}
+
+void AlembicSource::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = parent->setPlug()->defaultValue()->Object::hash();
+}
+
+GafferScene::ConstPathMatcherDataPtr AlembicSource::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return boost::static_pointer_cast<const PathMatcherData>( parent->setPlug()->defaultValue() );
+}
+
 IECoreAlembic::AlembicInputPtr AlembicSource::inputForPath( const ScenePath &path ) const
 {
 	const std::string fileName = fileNamePlug()->getValue();
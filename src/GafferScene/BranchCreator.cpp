@@ -35,6 +35,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "boost/algorithm/string/predicate.hpp"
 
 #include "Gaffer/Context.h"
@@ -312,56 +314,108 @@ IECore::ConstInternedStringVectorDataPtr BranchCreator::computeChildNames( const
 }
 
 void BranchCreator::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = inPlug()->globalsPlug()->hash();
+}
+
+IECore::ConstCompoundObjectPtr BranchCreator::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return inPlug()->globalsPlug()->getValue();
+}
+
+void BranchCreator::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
 	ConstCompoundDataPtr mapping = boost::static_pointer_cast<const CompoundData>( mappingPlug()->getValue() );
 	if( !mapping->readable().size() )
 	{
-		h = inPlug()->globalsPlug()->hash();
+		h = inPlug()->setNamesPlug()->hash();
 		return;
 	}
 
-	MurmurHash branchGlobalsHash;
-	hashBranchGlobals( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), context, branchGlobalsHash );
-	if( branchGlobalsHash == MurmurHash() )
+	MurmurHash branchSetNamesHash;
+	hashBranchSetNames( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), context, branchSetNamesHash );
+	if( branchSetNamesHash == MurmurHash() )
 	{
-		h = inPlug()->globalsPlug()->hash();
+		h = inPlug()->setNamesPlug()->hash();
 		return;
 	}
 
-	SceneProcessor::hashGlobals( context, parent, h );
-	inPlug()->globalsPlug()->hash( h );
-	mapping->hash( h );
-	h.append( branchGlobalsHash );
+	SceneProcessor::hashSetNames( context, parent, h );
+	inPlug()->setNamesPlug()->hash( h );
+	h.append( branchSetNamesHash );
 }
 
-IECore::ConstCompoundObjectPtr BranchCreator::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+IECore::ConstInternedStringVectorDataPtr BranchCreator::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstCompoundObjectPtr inputGlobals = inPlug()->globalsPlug()->getValue();
+	ConstInternedStringVectorDataPtr inputSetNamesData = inPlug()->setNamesPlug()->getValue();
 
 	ConstCompoundDataPtr mapping = boost::static_pointer_cast<const CompoundData>( mappingPlug()->getValue() );
 	if( !mapping->readable().size() )
 	{
-		return inputGlobals;
+		return inputSetNamesData;
+	}
+
+	ConstInternedStringVectorDataPtr branchSetNamesData = computeBranchSetNames( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), context );
+	if( !branchSetNamesData )
+	{
+		return inputSetNamesData;
 	}
 
-	const CompoundData *branchSets = NULL;
-	ConstCompoundObjectPtr branchGlobals = computeBranchGlobals( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), context );
-	if( branchGlobals )
+	InternedStringVectorDataPtr resultData = inputSetNamesData->copy();
+	vector<InternedString> &result = resultData->writable();
+	const vector<InternedString> &branchSetNames = branchSetNamesData->readable();
+	for( vector<InternedString>::const_iterator it = branchSetNames.begin(), eIt = branchSetNames.end(); it != eIt; ++it )
 	{
-		branchSets = branchGlobals->member<CompoundData>( "gaffer:sets", /* throwExceptions = */ false );
+		if( std::find( result.begin(), result.end(), *it ) == result.end() )
+		{
+			result.push_back( *it );
+		}
 	}
-	if( !branchSets )
+
+	return resultData;
+}
+
+void BranchCreator::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	ConstCompoundDataPtr mapping = boost::static_pointer_cast<const CompoundData>( mappingPlug()->getValue() );
+	if( !mapping->readable().size() )
 	{
-		return inputGlobals;
+		h = inPlug()->setPlug()->hash();
+		return;
 	}
 
-	IECore::CompoundObjectPtr outputGlobals = new CompoundObject;
-	// Shallow copy of the input, because most of it will remain unchanged.
-	outputGlobals->members() = inputGlobals->members();
-	// Deep copy of the input sets, because we'll be modifying them.
-	const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets", /* throwExeptions = */ false );
-	CompoundDataPtr outputSets = inputSets ? inputSets->copy() : new CompoundData;
-	outputGlobals->members()["gaffer:sets"] = outputSets;
+	MurmurHash branchSetHash;
+	hashBranchSet( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), setName, context, branchSetHash );
+	if( branchSetHash == MurmurHash() )
+	{
+		h = inPlug()->setPlug()->hash();
+		return;
+	}
+
+	SceneProcessor::hashSet( setName, context, parent, h );
+	inPlug()->setPlug()->hash( h );
+	mapping->hash( h );
+	h.append( branchSetHash );
+}
+
+GafferScene::ConstPathMatcherDataPtr BranchCreator::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	ConstPathMatcherDataPtr inputSetData = boost::static_pointer_cast<const PathMatcherData>( inPlug()->setPlug()->getValue() );
+
+	ConstCompoundDataPtr mapping = boost::static_pointer_cast<const CompoundData>( mappingPlug()->getValue() );
+	if( !mapping->readable().size() )
+	{
+		return inputSetData;
+	}
+
+	ConstPathMatcherDataPtr branchSetData = computeBranchSet( mapping->member<InternedStringVectorData>( g_parentKey )->readable(), setName, context );
+	if( !branchSetData )
+	{
+		return inputSetData;
+	}
+
+	PathMatcherDataPtr outputSetData = inputSetData->copy();
+	PathMatcher &outputSet = outputSetData->writable();
 
 	const CompoundData *forwardMapping = mapping->member<CompoundData>( g_forwardMappingKey );
 
@@ -372,37 +426,31 @@ IECore::ConstCompoundObjectPtr BranchCreator::computeGlobals( const Gaffer::Cont
 		parentString += "/";
 	}
 
-	for( CompoundDataMap::const_iterator it = branchSets->readable().begin(), eIt = branchSets->readable().end(); it != eIt; ++it )
+	/// \todo If PathMatcher allowed us to rename nodes and merge in other PathMatchers, this could
+	/// be much more efficient.
+	vector<string> branchPaths;
+	branchSetData->readable().paths( branchPaths );
+	for( vector<string>::const_iterator pIt = branchPaths.begin(), peIt = branchPaths.end(); pIt != peIt; ++pIt )
 	{
-		const PathMatcher &branchSet = static_cast<const PathMatcherData *>( it->second.get() )->readable();
-		PathMatcher &outputSet = outputSets->member<PathMatcherData>( it->first, /* throwExceptions = */ false, /* createIfMissing = */ true )->writable();
-
-		/// \todo If PathMatcher allowed us to rename nodes and merge in other PathMatchers, this could
-		/// be much more efficient.
-		vector<string> branchPaths;
-		branchSet.paths( branchPaths );
-		for( vector<string>::const_iterator pIt = branchPaths.begin(), peIt = branchPaths.end(); pIt != peIt; ++pIt )
+		const string &branchPath = *pIt;
+		const size_t secondSlashPos = branchPath.find( '/', 1 );
+		const std::string branchName( branchPath, 1, secondSlashPos - 1 );
+		const InternedStringData *outputName = forwardMapping->member<InternedStringData>( branchName );
+		if( !outputName )
 		{
-			const string &branchPath = *pIt;
-			const size_t secondSlashPos = branchPath.find( '/', 1 );
-			const std::string branchName( branchPath, 1, secondSlashPos - 1 );
-			const InternedStringData *outputName = forwardMapping->member<InternedStringData>( branchName );
-			if( !outputName )
-			{
-				// See comments in Group::computeGlobals().
-				continue;
-			}
+			// See comments in Group::computeSet().
+			continue;
+		}
 
-			std::string outputPath = parentString + outputName->readable().string();
-			if( secondSlashPos != string::npos )
-			{
-				outputPath += branchPath.substr( secondSlashPos );
-			}
-			outputSet.addPath( outputPath );
+		std::string outputPath = parentString + outputName->readable().string();
+		if( secondSlashPos != string::npos )
+		{
+			outputPath += branchPath.substr( secondSlashPos );
 		}
+		outputSet.addPath( outputPath );
 	}
 
-	return outputGlobals;
+	return outputSetData;
 }
 
 void BranchCreator::hashBranchBound( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
@@ -436,7 +484,7 @@ void BranchCreator::hashBranchChildNames( const ScenePath &parentPath, const Sce
 	}
 	else
 	{
-		// In the rare case that we're being called from from our own globals computation
+		// In the rare case that we're being called from from our own mapping computation
 		// via hashMapping(), the full path isn't in the context, so we need to
 		// construct it ourselves.
 		ScenePath fullPath( parentPath );
@@ -445,15 +493,25 @@ void BranchCreator::hashBranchChildNames( const ScenePath &parentPath, const Sce
 	}
 }
 
-void BranchCreator::hashBranchGlobals( const ScenePath &parentPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+void BranchCreator::hashBranchSetNames( const ScenePath &parentPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 }
 
-IECore::ConstCompoundObjectPtr BranchCreator::computeBranchGlobals( const ScenePath &parentPath, const Gaffer::Context *context ) const
+IECore::ConstInternedStringVectorDataPtr BranchCreator::computeBranchSetNames( const ScenePath &parentPath, const Gaffer::Context *context ) const
 {
 	// It's OK to return NULL, because the value returned from this method
 	// isn't used as the result of a compute(), and won't be stored on a plug.
-	// For the same reason, it's ok for hashBranchGlobals() to do nothing by default.
+	// For the same reason, it's ok for hashBranchSetNames() to do nothing by default.
+	return NULL;
+}
+
+void BranchCreator::hashBranchSet( const ScenePath &parentPath, const IECore::InternedString &setName, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+}
+
+GafferScene::ConstPathMatcherDataPtr BranchCreator::computeBranchSet( const ScenePath &parentPath, const IECore::InternedString &setName, const Gaffer::Context *context ) const
+{
+	// See comments in computeBranchSetNames().
 	return NULL;
 }
 
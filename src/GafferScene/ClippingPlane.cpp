@@ -37,7 +37,6 @@
 #include "IECore/ClippingPlane.h"
 
 #include "GafferScene/ClippingPlane.h"
-#include "GafferScene/PathMatcherData.h"
 
 using namespace Gaffer;
 using namespace GafferScene;
@@ -54,38 +53,10 @@ ClippingPlane::~ClippingPlane()
 {
 }
 
-void ClippingPlane::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
+IECore::InternedString ClippingPlane::standardSetName() const
 {
-	ObjectSource::affects( input, outputs );
-
-	if( input == namePlug() )
-	{
-		outputs.push_back( outPlug()->globalsPlug() );
-	}
-}
-
-void ClippingPlane::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
-{
-	ObjectSource::hashGlobals( context, parent, h );
-	namePlug()->hash( h );
-}
-
-IECore::ConstCompoundObjectPtr ClippingPlane::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
-{
-	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
-
-	IECore::CompoundDataPtr sets = result->member<IECore::CompoundData>(
-		"gaffer:sets",
-		/* throwExceptions = */ false,
-		/* createIfMissing = */ true
-	);
-
-	PathMatcherDataPtr clippingPlaneSet = new PathMatcherData;
-	clippingPlaneSet->writable().addPath( "/" + namePlug()->getValue() );
-
-	sets->writable()["__clippingPlanes"] = clippingPlaneSet;
-
-	return result;
+	static IECore::InternedString g_setName( "__clippingPlanes" );
+	return g_setName;
 }
 
 void ClippingPlane::hashSource( const Gaffer::Context *context, IECore::MurmurHash &h ) const
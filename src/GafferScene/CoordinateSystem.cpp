@@ -37,7 +37,6 @@
 #include "IECore/CoordinateSystem.h"
 
 #include "GafferScene/CoordinateSystem.h"
-#include "GafferScene/PathMatcherData.h"
 
 using namespace Gaffer;
 using namespace GafferScene;
@@ -54,38 +53,10 @@ CoordinateSystem::~CoordinateSystem()
 {
 }
 
-void CoordinateSystem::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
+IECore::InternedString CoordinateSystem::standardSetName() const
 {
-	ObjectSource::affects( input, outputs );
-
-	if( input == namePlug() )
-	{
-		outputs.push_back( outPlug()->globalsPlug() );
-	}
-}
-
-void CoordinateSystem::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
-{
-	ObjectSource::hashGlobals( context, parent, h );
-	namePlug()->hash( h );
-}
-
-IECore::ConstCompoundObjectPtr CoordinateSystem::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
-{
-	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
-
-	IECore::CompoundDataPtr sets = result->member<IECore::CompoundData>(
-		"gaffer:sets",
-		/* throwExceptions = */ false,
-		/* createIfMissing = */ true
-	);
-
-	PathMatcherDataPtr coordinateSystemSet = new PathMatcherData;
-	coordinateSystemSet->writable().addPath( "/" + namePlug()->getValue() );
-
-	sets->writable()["__coordinateSystems"] = coordinateSystemSet;
-
-	return result;
+	static IECore::InternedString g_setName( "__coordinateSystems" );
+	return g_setName;
 }
 
 void CoordinateSystem::hashSource( const Gaffer::Context *context, IECore::MurmurHash &h ) const
@@ -34,13 +34,68 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/parallel_for.h"
+
 #include "Gaffer/Context.h"
 
 #include "GafferScene/Filter.h"
+#include "GafferScene/ScenePlug.h"
 
+using namespace std;
+using namespace tbb;
 using namespace GafferScene;
 using namespace Gaffer;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Used with tbb::parallel_for to evaluate a filter
+// plug for a range of children.
+class ChildMatcher
+{
+
+	public :
+
+		ChildMatcher( const IntPlug *filterPlug, const Context *context, const vector<IECore::InternedString> &parentPath, const vector<IECore::InternedString> &childNames, vector<unsigned> &matches )
+			:	m_filterPlug( filterPlug ), m_context( context ), m_parentPath( parentPath ), m_childNames( childNames ), m_matches( matches )
+		{
+		}
+
+		void operator()( const blocked_range<size_t> &range ) const
+		{
+			ContextPtr context = new Context( *m_context, Context::Borrowed );
+			Context::Scope scopedContext( context.get() );
+
+			ScenePlug::ScenePath childPath = m_parentPath;
+			childPath.push_back( IECore::InternedString() ); // for the child name
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				childPath.back() = m_childNames[i];
+				context->set( ScenePlug::scenePathContextName, childPath );
+				m_matches[i] = m_filterPlug->getValue();
+			}
+		}
+
+	private :
+
+		const IntPlug *m_filterPlug;
+		const Context *m_context;
+		const vector<IECore::InternedString> &m_parentPath;
+		const vector<IECore::InternedString> &m_childNames;
+		vector<unsigned> &m_matches;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Filter
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( Filter );
 
 const IECore::InternedString Filter::g_inputSceneContextName( "scene:filter:inputScene" );
@@ -113,6 +168,31 @@ const ScenePlug *Filter::getInputScene( const Gaffer::Context *context )
 	return (const ScenePlug *)( context->get<uint64_t>( g_inputSceneContextName, 0 ) );
 }
 
+void Filter::childMatches( const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	matches.resize( childNames.size() );
+
+	Context::Scope scopedContext( context );
+	computeChildMatches( getInputScene( context ), context, parentPath, childNames, matches );
+}
+
+void Filter::plugChildMatches( const Gaffer::IntPlug *filterPlug, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches )
+{
+	if( const Filter *filter = IECore::runTimeCast<const Filter>( filterPlug->source<Plug>()->node() ) )
+	{
+		filter->childMatches( context, parentPath, childNames, matches );
+		return;
+	}
+
+	matches.resize( childNames.size() );
+	parallel_for( blocked_range<size_t>( 0, childNames.size() ), ChildMatcher( filterPlug, context, parentPath, childNames, matches ) );
+}
+
+void Filter::computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	parallel_for( blocked_range<size_t>( 0, childNames.size() ), ChildMatcher( outPlug(), context, parentPath, childNames, matches ) );
+}
+
 void Filter::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ComputeNode::hash( output, context, h );
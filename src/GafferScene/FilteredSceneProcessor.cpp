@@ -81,7 +81,7 @@ void FilteredSceneProcessor::affects( const Gaffer::Plug *input, AffectedPlugsCo
 		const Filter *filter = runTimeCast<const Filter>( filterPlug()->source<Plug>()->node() );
 		if( filter && filter->sceneAffectsMatch( scenePlug, static_cast<const ValuePlug *>( input ) ) )
 		{
-			if( input != scenePlug->globalsPlug() )
+			if( input != scenePlug->globalsPlug() && input != scenePlug->setPlug() )
 			{
 				/// \todo Obviously it would be great to remove this restriction and implement AttributeFilters and
 				/// BoundFilters and suchlike. There are currently two issues :
@@ -92,12 +92,12 @@ void FilteredSceneProcessor::affects( const Gaffer::Plug *input, AffectedPlugsCo
 				///   when descendant and ancestor matches are relevant. If we had a hierarchy hash we might be able
 				///   to do even better.
 				///
-				/// - The Isolate and Prune nodes make a single call to filterHash() in hashGlobals(), to account for
+				/// - The Isolate and Prune nodes make a single call to filterHash() in hashSet(), to account for
 				///   the fact that the filter is used in remapping sets. This wouldn't work for filter types which
 				///   actually vary based on data within the scene hierarchy, because then multiple calls would be
 				///   necessary. We could make more calls here, but that would be expensive. In an ideal world we'd
 				///   be able to compute a hash for the filter across a whole hierarchy.
-				throw Exception( "Filters may not currently depend on parts of the scene other than the globals." );
+				throw Exception( "Filters may not currently depend on parts of the scene other than the globals and sets." );
 			}
 			outputs.push_back( filterPlug() );
 		}
@@ -148,3 +148,9 @@ Filter::Result FilteredSceneProcessor::filterValue( const Gaffer::Context *conte
 	Context::Scope s( c.get() );
 	return (Filter::Result)filterPlug()->getValue();
 }
+
+void FilteredSceneProcessor::filterChildValues( const Gaffer::Context *context, const ScenePath &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	ContextPtr c = filterContext( context );
+	Filter::plugChildMatches( filterPlug(), c.get(), parentPath, childNames, matches );
+}
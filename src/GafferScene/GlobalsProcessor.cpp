@@ -51,6 +51,8 @@ GlobalsProcessor::GlobalsProcessor( const std::string &name )
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
 	outPlug()->objectPlug()->setInput( inPlug()->objectPlug() );
 	outPlug()->childNamesPlug()->setInput( inPlug()->childNamesPlug() );
+	outPlug()->setNamesPlug()->setInput( inPlug()->setNamesPlug() );
+	outPlug()->setPlug()->setInput( inPlug()->setPlug() );
 }
 
 GlobalsProcessor::~GlobalsProcessor()
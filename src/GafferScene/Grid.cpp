@@ -462,3 +462,23 @@ IECore::ConstCompoundObjectPtr Grid::computeGlobals( const Gaffer::Context *cont
 {
 	return outPlug()->globalsPlug()->defaultValue();
 }
+
+void Grid::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneNode::hashSetNames( context, parent, h );
+}
+
+IECore::ConstInternedStringVectorDataPtr Grid::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return outPlug()->setNamesPlug()->defaultValue();
+}
+
+void Grid::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneNode::hashSet( setName, context, parent, h );
+}
+
+GafferScene::ConstPathMatcherDataPtr Grid::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return boost::static_pointer_cast<const PathMatcherData>( outPlug()->setPlug()->defaultValue() );
+}
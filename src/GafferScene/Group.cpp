@@ -276,12 +276,26 @@ void Group::hashChildNames( const ScenePath &path, const Gaffer::Context *contex
 
 void Group::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	SceneProcessor::hashGlobals( context, parent, h );
+	h = inPlug()->globalsPlug()->hash();
+}
 
-	// all input globals affect the output, as does the mapping, because we use it to compute the sets
+void Group::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneProcessor::hashSetNames( context, parent, h );
 	for( vector<ScenePlugPtr>::const_iterator it = m_inPlugs.inputs().begin(), eIt = m_inPlugs.inputs().end(); it!=eIt; it++ )
 	{
-		(*it)->globalsPlug()->hash( h );
+		(*it)->setNamesPlug()->hash( h );
+	}
+}
+
+void Group::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneProcessor::hashSet( setName, context, parent, h );
+
+	// all input sets affect the output, as does the mapping, because we use it to compute the sets
+	for( vector<ScenePlugPtr>::const_iterator it = m_inPlugs.inputs().begin(), eIt = m_inPlugs.inputs().end(); it!=eIt; it++ )
+	{
+		(*it)->setPlug()->hash( h );
 	}
 	mappingPlug()->hash( h );
 	namePlug()->hash( h );
@@ -468,74 +482,91 @@ IECore::ConstInternedStringVectorDataPtr Group::computeChildNames( const ScenePa
 
 IECore::ConstCompoundObjectPtr Group::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	IECore::CompoundObjectPtr result = inPlug()->globalsPlug()->getValue()->copy();
+	return inPlug()->globalsPlug()->getValue();
+}
+
+IECore::ConstInternedStringVectorDataPtr Group::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	InternedStringVectorDataPtr resultData = new InternedStringVectorData;
+	vector<InternedString> &result = resultData->writable();
+	std::set<InternedString> visited;
+	for( vector<ScenePlugPtr>::const_iterator it = m_inPlugs.inputs().begin(), eIt = m_inPlugs.inputs().end(); it!=eIt; it++ )
+	{
+		ConstInternedStringVectorDataPtr inputSetNamesData = (*it)->setNamesPlug()->getValue();
+		const vector<InternedString> &inputSetNames = inputSetNamesData->readable();
+		for( vector<InternedString>::const_iterator nIt = inputSetNames.begin(), neIt = inputSetNames.end(); nIt != neIt; ++nIt )
+		{
+			if( visited.insert( *nIt ).second )
+			{
+				result.push_back( *nIt );
+			}
+		}
+	}
+	return resultData;
+}
 
+GafferScene::ConstPathMatcherDataPtr Group::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
 	std::string groupName = namePlug()->getValue();
 
 	ConstCompoundObjectPtr mapping = boost::static_pointer_cast<const CompoundObject>( mappingPlug()->getValue() );
 	const ObjectVector *forwardMappings = mapping->member<ObjectVector>( "__GroupForwardMappings", true /* throw if missing */ );
 
-	CompoundDataPtr outputSets = new CompoundData;
-	result->members()["gaffer:sets"] = outputSets;
+	PathMatcherDataPtr outputSetData = new PathMatcherData;
+	PathMatcher &outputSet = outputSetData->writable();
 
 	for( size_t i = 0, e = m_inPlugs.inputs().size(); i < e; i++ )
 	{
-		ConstCompoundObjectPtr inputGlobals = m_inPlugs.inputs()[i]->globalsPlug()->getValue();
-		const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets", /* throwExceptions = */ false );
-		if( !inputSets )
+		ConstPathMatcherDataPtr inputSetData = boost::static_pointer_cast<const PathMatcherData>( m_inPlugs.inputs()[i]->setPlug()->getValue() );
+		const PathMatcher &inputSet = inputSetData->readable();
+		if( inputSet.isEmpty() )
 		{
 			continue;
 		}
 
 		const CompoundData *forwardMapping = static_cast<const IECore::CompoundData *>( forwardMappings->members()[i].get() );
 
-		for( CompoundDataMap::const_iterator it = inputSets->readable().begin(), eIt = inputSets->readable().end(); it != eIt; it++ )
+		/// \todo If PathMatcher allowed access to the internal nodes, and allowed them to be shared between
+		/// matchers, we could be much more efficient here by making a new matcher which referenced the contents
+		/// of the input matchers.
+		vector<string> inputPaths;
+		inputSet.paths( inputPaths );
+		for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
 		{
-			const PathMatcher &inputSet = static_cast<const PathMatcherData *>( it->second.get() )->readable();
-			PathMatcher &outputSet = outputSets->member<PathMatcherData>( it->first, /* throwExceptions = */ false, /* createIfMissing = */ true )->writable();
-
-			/// \todo If PathMatcher allowed access to the internal nodes, and allowed them to be shared between
-			/// matchers, we could be much more efficient here by making a new matcher which referenced the contents
-			/// of the input matchers.
-			vector<string> inputPaths;
-			inputSet.paths( inputPaths );
-			for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
+			const string &inputPath = *pIt;
+			const size_t secondSlashPos = inputPath.find( '/', 1 );
+			const std::string inputName( inputPath, 1, secondSlashPos - 1 );
+			const InternedStringData *outputName = forwardMapping->member<InternedStringData>( inputName );
+			if( !outputName )
 			{
-				const string &inputPath = *pIt;
-				const size_t secondSlashPos = inputPath.find( '/', 1 );
-				const std::string inputName( inputPath, 1, secondSlashPos - 1 );
-				const InternedStringData *outputName = forwardMapping->member<InternedStringData>( inputName );
-				if( !outputName )
-				{
-					// Getting here indicates either a bug in computeMapping() or an inconsistency in one
-					// of our inputs whereby a forward declaration has been made with a name which isn't
-					// in childNames( "/" ). The second case can occur in practice when an input is being
-					// connected or disconnected - because our inputs are CompoundPlugs, part way through
-					// the setInput() process the child connections for globalsPlug() and childNamesPlug()
-					// will not correspond, leading us here. This problem occurs in InteractiveRenderManRenderTest
-					// when the scene is being updated from a plugDirtiedSignal() which is emitted when one
-					// child plug has been disconnected, but before the other one has. The real solution to
-					// this would be to properly batch up dirty signals so that only a single signal is
-					// emitted for the parent after all signals for the children have been emitted. Then we
-					// would only ever be called in a consistent connection state.
-					/// \todo Implement improved batching for dirty signalling and remove this workaround,
-					/// reverting to a call to forwardMapping->member<InternedStringData>( inputName, true ),
-					/// which will throw when an error is detected.
-					continue;
-				}
-
-				std::string outputPath = std::string( "/" ) + groupName + "/" + outputName->readable().string();
-				if( secondSlashPos != string::npos )
-				{
-					outputPath += inputPath.substr( secondSlashPos );
-				}
+				// Getting here indicates either a bug in computeMapping() or an inconsistency in one
+				// of our inputs whereby a forward declaration has been made with a name which isn't
+				// in childNames( "/" ). The second case can occur in practice when an input is being
+				// connected or disconnected - because our inputs are CompoundPlugs, part way through
+				// the setInput() process the child connections for setPlug() and childNamesPlug()
+				// will not correspond, leading us here. This problem occurs in InteractiveRenderManRenderTest
+				// when the scene is being updated from a plugDirtiedSignal() which is emitted when one
+				// child plug has been disconnected, but before the other one has. The real solution to
+				// this would be to properly batch up dirty signals so that only a single signal is
+				// emitted for the parent after all signals for the children have been emitted. Then we
+				// would only ever be called in a consistent connection state.
+				/// \todo Implement improved batching for dirty signalling and remove this workaround,
+				/// reverting to a call to forwardMapping->member<InternedStringData>( inputName, true ),
+				/// which will throw when an error is detected.
+				continue;
+			}
 
-				outputSet.addPath( outputPath );
+			std::string outputPath = std::string( "/" ) + groupName + "/" + outputName->readable().string();
+			if( secondSlashPos != string::npos )
+			{
+				outputPath += inputPath.substr( secondSlashPos );
 			}
+
+			outputSet.addPath( outputPath );
 		}
 	}
 
-	return result;
+	return outputSetData;
 }
 
 SceneNode::ScenePath Group::sourcePath( const ScenePath &outputPath, const std::string &groupName, ScenePlug **source ) const
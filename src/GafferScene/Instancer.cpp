@@ -35,12 +35,17 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <map>
+
 #include "tbb/parallel_reduce.h"
+#include "tbb/parallel_for.h"
 #include "tbb/blocked_range.h"
 
 #include "boost/lexical_cast.hpp"
+#include "boost/format.hpp"
 
 #include "IECore/VectorTypedData.h"
+#include "IECore/Primitive.h"
 
 #include "Gaffer/Context.h"
 
@@ -53,6 +58,122 @@ using namespace IECore;
 using namespace Gaffer;
 using namespace GafferScene;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+InternedString g_instancerIdContextName( "instancer:id" );
+InternedString g_transformsName( "transforms" );
+InternedString g_prototypeIndicesName( "prototypeIndices" );
+InternedString g_prototypeNamesName( "prototypeNames" );
+
+// Used in place of the instance data when there is only a single prototype.
+ConstCompoundObjectPtr g_noInstanceData = new CompoundObject;
+
+template<typename T>
+const T *primitiveVariable( const Primitive *primitive, const std::string &name, size_t size )
+{
+	if( name.empty() )
+	{
+		return NULL;
+	}
+
+	PrimitiveVariableMap::const_iterator it = primitive->variables.find( name );
+	if( it == primitive->variables.end() )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Primitive variable \"%s\" does not exist" ) % name ) );
+	}
+
+	const T *result = runTimeCast<const T>( it->second.data.get() );
+	if( result && result->readable().size() != size )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Primitive variable \"%s\" has wrong size" ) % name ) );
+	}
+
+	return result;
+}
+
+// Builds the transform for each instance in a single pass over
+// the primitive variables.
+struct TransformBuilder
+{
+
+	TransformBuilder( const vector<V3f> &p, const QuatfVectorData *orientation, const V3fVectorData *scale, const FloatVectorData *uniformScale, vector<M44f> &transforms )
+		:	m_p( p ), m_orientation( orientation ), m_scale( scale ), m_uniformScale( uniformScale ), m_transforms( transforms )
+	{
+	}
+
+	void operator() ( const blocked_range<size_t> &r ) const
+	{
+		for( size_t i=r.begin(); i!=r.end(); ++i )
+		{
+			M44f &m = m_transforms[i];
+			if( m_orientation )
+			{
+				m = m_orientation->readable()[i].normalized().toMatrix44();
+			}
+			if( m_scale )
+			{
+				m = M44f().setScale( m_scale->readable()[i] ) * m;
+			}
+			else if( m_uniformScale )
+			{
+				m = M44f().setScale( m_uniformScale->readable()[i] ) * m;
+			}
+			m[3][0] = m_p[i][0];
+			m[3][1] = m_p[i][1];
+			m[3][2] = m_p[i][2];
+		}
+	}
+
+	private :
+
+		const vector<V3f> &m_p;
+		const QuatfVectorData *m_orientation;
+		const V3fVectorData *m_scale;
+		const FloatVectorData *m_uniformScale;
+		vector<M44f> &m_transforms;
+
+};
+
+const vector<InternedString> *prototypeNames( const CompoundObject *instanceData )
+{
+	const InternedStringVectorData *names = instanceData->member<InternedStringVectorData>( g_prototypeNamesName );
+	return names ? &names->readable() : NULL;
+}
+
+int prototypeIndex( const CompoundObject *instanceData, size_t instanceId )
+{
+	const IntVectorData *indices = instanceData->member<IntVectorData>( g_prototypeIndicesName );
+	return indices ? indices->readable()[instanceId] : 0;
+}
+
+// Returns the path to the location in the instance scene
+// which represents the specified prototype.
+ScenePlug::ScenePath prototypePath( const CompoundObject *instanceData, int index )
+{
+	ScenePlug::ScenePath result;
+	if( const vector<InternedString> *names = prototypeNames( instanceData ) )
+	{
+		result.push_back( (*names)[index] );
+	}
+	return result;
+}
+
+const vector<M44f> &instanceTransforms( const CompoundObject *instanceData )
+{
+	return instanceData->member<M44fVectorData>( g_transformsName, /* throwExceptions = */ true )->readable();
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Instancer
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( Instancer );
 
 size_t Instancer::g_firstPlugIndex = 0;
@@ -63,6 +184,10 @@ Instancer::Instancer( const std::string &name )
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new StringPlug( "name", Plug::In, "instances" ) );
 	addChild( new ScenePlug( "instance" ) );
+	addChild( new StringPlug( "orientation", Plug::In, "" ) );
+	addChild( new StringPlug( "scale", Plug::In, "" ) );
+	addChild( new StringPlug( "prototypeIndex", Plug::In, "" ) );
+	addChild( new ObjectPlug( "__instanceData", Plug::Out, new CompoundObject() ) );
 }
 
 Instancer::~Instancer()
@@ -89,6 +214,46 @@ const ScenePlug *Instancer::instancePlug() const
 	return getChild<ScenePlug>( g_firstPlugIndex + 1 );
 }
 
+Gaffer::StringPlug *Instancer::orientationPlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::StringPlug *Instancer::orientationPlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 2 );
+}
+
+Gaffer::StringPlug *Instancer::scalePlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 3 );
+}
+
+const Gaffer::StringPlug *Instancer::scalePlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 3 );
+}
+
+Gaffer::StringPlug *Instancer::prototypeIndexPlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::StringPlug *Instancer::prototypeIndexPlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::ObjectPlug *Instancer::instanceDataPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::ObjectPlug *Instancer::instanceDataPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
 void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	BranchCreator::affects( input, outputs );
@@ -96,6 +261,15 @@ void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) co
 	if( input->parent<ScenePlug>() == instancePlug() )
 	{
 		outputs.push_back( outPlug()->getChild<ValuePlug>( input->getName() ) );
+		if( input == instancePlug()->childNamesPlug() )
+		{
+			outputs.push_back( instanceDataPlug() );
+		}
+		else if( input == instancePlug()->transformPlug() )
+		{
+			// The bound includes the transforms of the prototypes.
+			outputs.push_back( outPlug()->boundPlug() );
+		}
 	}
 	else if( input == namePlug() )
 	{
@@ -104,21 +278,122 @@ void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) co
 	else if( input == inPlug()->objectPlug() )
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
+		outputs.push_back( instanceDataPlug() );
+	}
+	else if(
+		input == orientationPlug() ||
+		input == scalePlug() ||
+		input == prototypeIndexPlug()
+	)
+	{
+		outputs.push_back( instanceDataPlug() );
+	}
+	else if( input == instanceDataPlug() )
+	{
 		outputs.push_back( outPlug()->boundPlug() );
 		outputs.push_back( outPlug()->transformPlug() );
+		outputs.push_back( outPlug()->attributesPlug() );
+		outputs.push_back( outPlug()->objectPlug() );
+		outputs.push_back( outPlug()->childNamesPlug() );
 	}
 }
 
+void Instancer::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	BranchCreator::hash( output, context, h );
+
+	if( output == instanceDataPlug() )
+	{
+		inPlug()->objectPlug()->hash( h );
+		orientationPlug()->hash( h );
+		scalePlug()->hash( h );
+		if( !prototypeIndexPlug()->getValue().empty() )
+		{
+			prototypeIndexPlug()->hash( h );
+			h.append( instancePlug()->childNamesHash( ScenePath() ) );
+		}
+	}
+}
+
+void Instancer::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
+{
+	if( output == instanceDataPlug() )
+	{
+		CompoundObjectPtr result = new CompoundObject;
+
+		ConstPrimitivePtr primitive = runTimeCast<const Primitive>( inPlug()->objectPlug()->getValue() );
+		const V3fVectorData *p = primitive ? primitive->variableData<V3fVectorData>( "P" ) : NULL;
+		if( p )
+		{
+			const size_t size = p->readable().size();
+
+			const std::string orientationName = orientationPlug()->getValue();
+			const QuatfVectorData *orientation = primitiveVariable<QuatfVectorData>( primitive.get(), orientationName, size );
+			if( !orientationName.empty() && !orientation )
+			{
+				throw IECore::Exception( boost::str( boost::format( "Primitive variable \"%s\" is not of type QuatfVectorData" ) % orientationName ) );
+			}
+
+			const std::string scaleName = scalePlug()->getValue();
+			const V3fVectorData *nonUniformScale = primitiveVariable<V3fVectorData>( primitive.get(), scaleName, size );
+			const FloatVectorData *uniformScale = nonUniformScale ? NULL : primitiveVariable<FloatVectorData>( primitive.get(), scaleName, size );
+			if( !scaleName.empty() && !nonUniformScale && !uniformScale )
+			{
+				throw IECore::Exception( boost::str( boost::format( "Primitive variable \"%s\" is not of type V3fVectorData or FloatVectorData" ) % scaleName ) );
+			}
+
+			M44fVectorDataPtr transformsData = new M44fVectorData;
+			transformsData->writable().resize( size );
+			parallel_for(
+				blocked_range<size_t>( 0, size ),
+				TransformBuilder( p->readable(), orientation, nonUniformScale, uniformScale, transformsData->writable() )
+			);
+			result->members()[g_transformsName] = transformsData;
+
+			const std::string prototypeIndexName = prototypeIndexPlug()->getValue();
+			const IntVectorData *indices = primitiveVariable<IntVectorData>( primitive.get(), prototypeIndexName, size );
+			if( !prototypeIndexName.empty() && !indices )
+			{
+				throw IECore::Exception( boost::str( boost::format( "Primitive variable \"%s\" is not of type IntVectorData" ) % prototypeIndexName ) );
+			}
+
+			if( indices )
+			{
+				ConstInternedStringVectorDataPtr names = instancePlug()->childNames( ScenePath() );
+				const int numNames = names->readable().size();
+				if( numNames )
+				{
+					// Wrap the indices so that every instance has a prototype.
+					IntVectorDataPtr wrappedIndicesData = new IntVectorData;
+					vector<int> &wrappedIndices = wrappedIndicesData->writable();
+					wrappedIndices.reserve( size );
+					for( vector<int>::const_iterator it = indices->readable().begin(), eIt = indices->readable().end(); it != eIt; ++it )
+					{
+						wrappedIndices.push_back( ( ( *it % numNames ) + numNames ) % numNames );
+					}
+					result->members()[g_prototypeIndicesName] = wrappedIndicesData;
+					result->members()[g_prototypeNamesName] = boost::const_pointer_cast<InternedStringVectorData>( names );
+				}
+			}
+		}
+
+		static_cast<ObjectPlug *>( output )->setValue( result );
+		return;
+	}
+
+	BranchCreator::compute( output, context );
+}
+
 struct Instancer::BoundHash
 {
 
-	BoundHash( const Instancer *instancer, const ScenePath &branchPath, const Context *c )
-		:	m_instancer( instancer ), m_branchPath( branchPath ), m_context( c ), m_hash()
+	BoundHash( const Instancer *instancer, const ScenePath &branchPath, const Context *c, const CompoundObject *instanceData )
+		:	m_instancer( instancer ), m_branchPath( branchPath ), m_context( c ), m_instanceData( instanceData ), m_hash()
 	{
 	}
 
 	BoundHash( const BoundHash &rhs, split )
-		:	m_instancer( rhs.m_instancer ), m_branchPath( rhs.m_branchPath ), m_context( rhs.m_context ), m_hash()
+		:	m_instancer( rhs.m_instancer ), m_branchPath( rhs.m_branchPath ), m_context( rhs.m_context ), m_instanceData( rhs.m_instanceData ), m_hash()
 	{
 	}
 
@@ -130,13 +405,19 @@ struct Instancer::BoundHash
 		ScenePath branchChildPath( m_branchPath );
 		branchChildPath.push_back( InternedString() ); // where we'll place the instance index
 
+		const bool hashTransform = prototypeNames( m_instanceData ) != NULL;
 		for( size_t i=r.begin(); i!=r.end(); ++i )
 		{
 			branchChildPath[branchChildPath.size()-1] = InternedString( i );
-			m_instancer->fillInstanceContext( ic.get(), branchChildPath, i );
+			m_instancer->fillInstanceContext( ic.get(), m_instanceData, branchChildPath, i );
 			m_instancer->instancePlug()->boundPlug()->hash( m_hash );
-			// no need to hash transform of instance because we know all
-			// root transforms are identity.
+			// we only need to hash the transform of the prototype if we're
+			// using multiple prototypes, because root transforms are always
+			// identity.
+			if( hashTransform )
+			{
+				m_instancer->instancePlug()->transformPlug()->hash( m_hash );
+			}
 		}
 	}
 
@@ -155,10 +436,101 @@ struct Instancer::BoundHash
 		const Instancer *m_instancer;
 		const ScenePath &m_branchPath;
 		const Context *m_context;
+		const CompoundObject *m_instanceData;
 		MurmurHash m_hash;
 
 };
 
+// Computes the bound hash (and when using multiple prototypes, the
+// prototype transform hash) of each instance individually, so that
+// instances sharing a bound can be identified.
+struct Instancer::InstanceBoundHashes
+{
+
+	InstanceBoundHashes( const Instancer *instancer, const ScenePath &branchPath, const Context *c, const CompoundObject *instanceData, vector<MurmurHash> &boundHashes, vector<MurmurHash> &transformHashes )
+		:	m_instancer( instancer ), m_branchPath( branchPath ), m_context( c ), m_instanceData( instanceData ), m_boundHashes( boundHashes ), m_transformHashes( transformHashes )
+	{
+	}
+
+	void operator() ( const blocked_range<size_t> &r ) const
+	{
+		ContextPtr ic = new Context( *m_context, Context::Borrowed );
+		Context::Scope scopedContext( ic.get() );
+
+		ScenePath branchChildPath( m_branchPath );
+		branchChildPath.push_back( InternedString() ); // where we'll place the instance index
+
+		const bool hashTransform = !m_transformHashes.empty();
+		for( size_t i=r.begin(); i!=r.end(); ++i )
+		{
+			branchChildPath[branchChildPath.size()-1] = InternedString( i );
+			m_instancer->fillInstanceContext( ic.get(), m_instanceData, branchChildPath, i );
+			m_boundHashes[i] = m_instancer->instancePlug()->boundPlug()->hash();
+			if( hashTransform )
+			{
+				m_transformHashes[i] = m_instancer->instancePlug()->transformPlug()->hash();
+			}
+		}
+	}
+
+	private :
+
+		const Instancer *m_instancer;
+		const ScenePath &m_branchPath;
+		const Context *m_context;
+		const CompoundObject *m_instanceData;
+		vector<MurmurHash> &m_boundHashes;
+		vector<MurmurHash> &m_transformHashes;
+
+};
+
+// Evaluates the bound and prototype transform for a single
+// representative of each group of instances with identical hashes.
+struct Instancer::UniqueBoundEvaluator
+{
+
+	UniqueBoundEvaluator( const Instancer *instancer, const ScenePath &branchPath, const Context *c, const CompoundObject *instanceData, const vector<size_t> &representatives, const vector<MurmurHash> &boundHashes, const vector<MurmurHash> &transformHashes, vector<Box3f> &bounds, vector<M44f> &transforms )
+		:	m_instancer( instancer ), m_branchPath( branchPath ), m_context( c ), m_instanceData( instanceData ), m_representatives( representatives ),
+			m_boundHashes( boundHashes ), m_transformHashes( transformHashes ), m_bounds( bounds ), m_transforms( transforms )
+	{
+	}
+
+	void operator() ( const blocked_range<size_t> &r ) const
+	{
+		ContextPtr ic = new Context( *m_context, Context::Borrowed );
+		Context::Scope scopedContext( ic.get() );
+
+		ScenePath branchChildPath( m_branchPath );
+		branchChildPath.push_back( InternedString() ); // where we'll place the instance index
+
+		const bool evaluateTransform = !m_transformHashes.empty();
+		for( size_t i=r.begin(); i!=r.end(); ++i )
+		{
+			const size_t id = m_representatives[i];
+			branchChildPath[branchChildPath.size()-1] = InternedString( id );
+			m_instancer->fillInstanceContext( ic.get(), m_instanceData, branchChildPath, id );
+			// We already have the hashes, so pass them to avoid hashing again.
+			m_bounds[i] = m_instancer->instancePlug()->boundPlug()->getValue( &m_boundHashes[id] );
+			// Root transforms are always identity, so we only need to
+			// evaluate the transform when using multiple prototypes.
+			m_transforms[i] = evaluateTransform ? m_instancer->instancePlug()->transformPlug()->getValue( &m_transformHashes[id] ) : M44f();
+		}
+	}
+
+	private :
+
+		const Instancer *m_instancer;
+		const ScenePath &m_branchPath;
+		const Context *m_context;
+		const CompoundObject *m_instanceData;
+		const vector<size_t> &m_representatives;
+		const vector<MurmurHash> &m_boundHashes;
+		const vector<MurmurHash> &m_transformHashes;
+		vector<Box3f> &m_bounds;
+		vector<M44f> &m_transforms;
+
+};
+
 void Instancer::hashBranchBound( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	if( branchPath.size() <= 1 )
@@ -167,10 +539,10 @@ void Instancer::hashBranchBound( const ScenePath &parentPath, const ScenePath &b
 
 		BranchCreator::hashBranchBound( parentPath, branchPath, context, h );
 
-		ConstV3fVectorDataPtr p = sourcePoints( parentPath );
-		if( p )
+		ConstCompoundObjectPtr data = instanceData( parentPath );
+		if( data->member<M44fVectorData>( g_transformsName ) )
 		{
-			p->hash( h );
+			h.append( instanceDataHash( parentPath ) );
 
 			ScenePath branchChildPath( branchPath );
 			if( branchChildPath.size() == 0 )
@@ -178,9 +550,9 @@ void Instancer::hashBranchBound( const ScenePath &parentPath, const ScenePath &b
 				branchChildPath.push_back( namePlug()->getValue() );
 			}
 
-			BoundHash hasher( this, branchChildPath, context );
+			BoundHash hasher( this, branchChildPath, context, data.get() );
 			parallel_deterministic_reduce(
-				blocked_range<size_t>( 0, p->readable().size(), 100 ),
+				blocked_range<size_t>( 0, instanceTransforms( data.get() ).size(), 100 ),
 				hasher
 			);
 
@@ -189,7 +561,7 @@ void Instancer::hashBranchBound( const ScenePath &parentPath, const ScenePath &b
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		h = instancePlug()->boundPlug()->hash();
 	}
@@ -198,32 +570,27 @@ void Instancer::hashBranchBound( const ScenePath &parentPath, const ScenePath &b
 struct Instancer::BoundUnion
 {
 
-	BoundUnion( const Instancer *instancer, const ScenePath &branchPath, const Context *c, const V3fVectorData *p )
-		:	m_instancer( instancer ), m_branchPath( branchPath ), m_context( c ), m_p( p ), m_union()
+	BoundUnion( const CompoundObject *instanceData, const vector<size_t> &boundIndices, const vector<Box3f> &bounds, const vector<M44f> &transforms )
+		:	m_instanceData( instanceData ), m_boundIndices( boundIndices ), m_bounds( bounds ), m_transforms( transforms ), m_union()
 	{
 	}
 
 	BoundUnion( const BoundUnion &rhs, split )
-		:	m_instancer( rhs.m_instancer ), m_branchPath( rhs.m_branchPath ), m_context( rhs.m_context ), m_p( rhs.m_p ), m_union()
+		:	m_instanceData( rhs.m_instanceData ), m_boundIndices( rhs.m_boundIndices ), m_bounds( rhs.m_bounds ), m_transforms( rhs.m_transforms ), m_union()
 	{
 	}
 
 	void operator() ( const blocked_range<size_t> &r )
 	{
-		ContextPtr ic = new Context( *m_context, Context::Borrowed );
-		Context::Scope scopedContext( ic.get() );
-
-		ScenePath branchChildPath( m_branchPath );
-		branchChildPath.push_back( InternedString() ); // where we'll place the instance index
-
+		const vector<M44f> &pointTransforms = instanceTransforms( m_instanceData );
 		for( size_t i=r.begin(); i!=r.end(); ++i )
 		{
-			branchChildPath[branchChildPath.size()-1] = InternedString( i );
-			m_instancer->fillInstanceContext( ic.get(), branchChildPath, i );
-
-			Box3f branchChildBound = m_instancer->instancePlug()->boundPlug()->getValue();
-			branchChildBound = transform( branchChildBound, m_instancer->instanceTransform( m_p, i ) );
-			m_union.extendBy( branchChildBound );
+			const size_t index = m_boundIndices[i];
+			const Box3f &bound = m_bounds[index];
+			if( !bound.isEmpty() )
+			{
+				m_union.extendBy( transform( bound, m_transforms[index] * pointTransforms[i] ) );
+			}
 		}
 	}
 
@@ -239,10 +606,10 @@ struct Instancer::BoundUnion
 
 	private :
 
-		const Instancer *m_instancer;
-		const ScenePath &m_branchPath;
-		const Context *m_context;
-		const V3fVectorData *m_p;
+		const CompoundObject *m_instanceData;
+		const vector<size_t> &m_boundIndices;
+		const vector<Box3f> &m_bounds;
+		const vector<M44f> &m_transforms;
 		Box3f m_union;
 
 };
@@ -253,8 +620,8 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &parentPath, const S
 	{
 		// "/" or "/name"
 		Box3f result;
-		ConstV3fVectorDataPtr p = sourcePoints( parentPath );
-		if( p )
+		ConstCompoundObjectPtr data = instanceData( parentPath );
+		if( data->member<M44fVectorData>( g_transformsName ) )
 		{
 			ScenePath branchChildPath( branchPath );
 			if( branchChildPath.size() == 0 )
@@ -262,9 +629,16 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &parentPath, const S
 				branchChildPath.push_back( namePlug()->getValue() );
 			}
 
-			BoundUnion unioner( this, branchChildPath, context, p.get() );
+			// We evaluate the bound just once for each group of instances
+			// which share it, and then merely transform it for each instance.
+			vector<size_t> boundIndices;
+			vector<Box3f> bounds;
+			vector<M44f> transforms;
+			uniqueInstanceBounds( context, branchChildPath, data.get(), boundIndices, bounds, transforms );
+
+			BoundUnion unioner( data.get(), boundIndices, bounds, transforms );
 			parallel_reduce(
-				blocked_range<size_t>( 0, p->readable().size() ),
+				blocked_range<size_t>( 0, boundIndices.size() ),
 				unioner
 			);
 
@@ -275,7 +649,7 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &parentPath, const S
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		return instancePlug()->boundPlug()->getValue();
 	}
@@ -292,12 +666,18 @@ void Instancer::hashBranchTransform( const ScenePath &parentPath, const ScenePat
 	{
 		// "/name/instanceNumber"
 		BranchCreator::hashBranchTransform( parentPath, branchPath, context, h );
-		h.append( inPlug()->objectHash( parentPath ) );
+		h.append( instanceDataHash( parentPath ) );
 		h.append( instanceIndex( branchPath ) );
+		if( !prototypeIndexPlug()->getValue().empty() )
+		{
+			ContextPtr ic = instanceContext( context, parentPath, branchPath );
+			Context::Scope scopedContext( ic.get() );
+			instancePlug()->transformPlug()->hash( h );
+		}
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		h = instancePlug()->transformPlug()->hash();
 	}
@@ -313,13 +693,21 @@ Imath::M44f Instancer::computeBranchTransform( const ScenePath &parentPath, cons
 	else if( branchPath.size() == 2 )
 	{
 		// "/name/instanceNumber"
-		int index = instanceIndex( branchPath );
-		ConstV3fVectorDataPtr p = sourcePoints( parentPath );
-		return instanceTransform( p.get(), index );
+		ConstCompoundObjectPtr data = instanceData( parentPath );
+		M44f result = instanceTransforms( data.get() )[instanceIndex( branchPath )];
+		if( prototypeNames( data.get() ) )
+		{
+			// The instance root is a child of the prototype scene,
+			// so must keep its own transform.
+			ContextPtr ic = instanceContext( context, parentPath, branchPath );
+			Context::Scope scopedContext( ic.get() );
+			result = instancePlug()->transformPlug()->getValue() * result;
+		}
+		return result;
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		return instancePlug()->transformPlug()->getValue();
 	}
@@ -334,7 +722,7 @@ void Instancer::hashBranchAttributes( const ScenePath &parentPath, const ScenePa
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		h = instancePlug()->attributesPlug()->hash();
 	}
@@ -349,7 +737,7 @@ IECore::ConstCompoundObjectPtr Instancer::computeBranchAttributes( const ScenePa
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		return instancePlug()->attributesPlug()->getValue();
 	}
@@ -364,7 +752,7 @@ void Instancer::hashBranchObject( const ScenePath &parentPath, const ScenePath &
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		h = instancePlug()->objectPlug()->hash();
 	}
@@ -379,7 +767,7 @@ IECore::ConstObjectPtr Instancer::computeBranchObject( const ScenePath &parentPa
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		return instancePlug()->objectPlug()->getValue();
 	}
@@ -402,7 +790,7 @@ void Instancer::hashBranchChildNames( const ScenePath &parentPath, const ScenePa
 	else
 	{
 		// "/name/..."
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		h = instancePlug()->childNamesPlug()->hash();
 	}
@@ -444,7 +832,7 @@ IECore::ConstInternedStringVectorDataPtr Instancer::computeBranchChildNames( con
 	}
 	else
 	{
-		ContextPtr ic = instanceContext( context, branchPath );
+		ContextPtr ic = instanceContext( context, parentPath, branchPath );
 		Context::Scope scopedContext( ic.get() );
 		return instancePlug()->childNamesPlug()->getValue();
 	}
@@ -461,42 +849,100 @@ ConstV3fVectorDataPtr Instancer::sourcePoints( const ScenePath &parentPath ) con
 	return primitive->variableData<V3fVectorData>( "P" );
 }
 
+IECore::ConstCompoundObjectPtr Instancer::instanceData( const ScenePath &parentPath ) const
+{
+	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
+	tmpContext->set( ScenePlug::scenePathContextName, parentPath );
+	Context::Scope scopedContext( tmpContext.get() );
+	return boost::static_pointer_cast<const CompoundObject>( instanceDataPlug()->getValue() );
+}
+
+IECore::MurmurHash Instancer::instanceDataHash( const ScenePath &parentPath ) const
+{
+	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
+	tmpContext->set( ScenePlug::scenePathContextName, parentPath );
+	Context::Scope scopedContext( tmpContext.get() );
+	return instanceDataPlug()->hash();
+}
+
 int Instancer::instanceIndex( const ScenePath &branchPath ) const
 {
 	return boost::lexical_cast<int>( branchPath[1].value() );
 }
 
-Gaffer::ContextPtr Instancer::instanceContext( const Gaffer::Context *parentContext, const ScenePath &branchPath ) const
+Gaffer::ContextPtr Instancer::instanceContext( const Gaffer::Context *parentContext, const ScenePath &parentPath, const ScenePath &branchPath ) const
 {
 	assert( branchPath.size() >= 2 );
 
 	ContextPtr result = new Context( *parentContext, Context::Borrowed );
-	fillInstanceContext( result.get(), branchPath );
+	if( prototypeIndexPlug()->getValue().empty() )
+	{
+		// We don't need the instance data to find the prototype, so
+		// avoid computing it.
+		fillInstanceContext( result.get(), g_noInstanceData.get(), branchPath, instanceIndex( branchPath ) );
+	}
+	else
+	{
+		ConstCompoundObjectPtr data = instanceData( parentPath );
+		fillInstanceContext( result.get(), data.get(), branchPath, instanceIndex( branchPath ) );
+	}
 
 	return result;
 }
 
-void Instancer::fillInstanceContext( Gaffer::Context *instanceContext, const ScenePath &branchPath ) const
-{
-	assert( branchPath.size() >= 2 );
-
-	fillInstanceContext( instanceContext, branchPath, instanceIndex( branchPath ) );
-}
-
-void Instancer::fillInstanceContext( Gaffer::Context *instanceContext, const ScenePath &branchPath, int instanceId ) const
+void Instancer::fillInstanceContext( Gaffer::Context *instanceContext, const IECore::CompoundObject *instanceData, const ScenePath &branchPath, int instanceId ) const
 {
 	assert( branchPath.size() >= 2 );
 
-	ScenePath instancePath;
+	ScenePath instancePath = prototypePath( instanceData, prototypeIndex( instanceData, instanceId ) );
 	instancePath.insert( instancePath.end(), branchPath.begin() + 2, branchPath.end() );
 	instanceContext->set( ScenePlug::scenePathContextName, instancePath );
 
-	instanceContext->set( "instancer:id", instanceId );
+	instanceContext->set( g_instancerIdContextName, instanceId );
 }
 
-Imath::M44f Instancer::instanceTransform( const IECore::V3fVectorData *p, int instanceId ) const
+void Instancer::uniqueInstanceBounds( const Gaffer::Context *context, const ScenePath &branchPath, const IECore::CompoundObject *instanceData, std::vector<size_t> &boundIndices, std::vector<Imath::Box3f> &bounds, std::vector<Imath::M44f> &transforms ) const
 {
-	M44f result;
-	result.translate( p->readable()[instanceId] );
-	return result;
+	// Nodes which use a context variable are required to include it in
+	// their hash, so instances with the same hashes are guaranteed to have
+	// the same bound. Because the bound of a location encompasses the entire
+	// hierarchy below it, this is sufficient to tell us that the bounds of
+	// the instances are identical. We can't know which ids an upstream
+	// network is sensitive to, so we must hash every instance.
+	const size_t numInstances = instanceTransforms( instanceData ).size();
+	const bool multiplePrototypes = prototypeNames( instanceData ) != NULL;
+	vector<MurmurHash> boundHashes( numInstances );
+	vector<MurmurHash> transformHashes( multiplePrototypes ? numInstances : 0 );
+	parallel_for(
+		blocked_range<size_t>( 0, numInstances, 100 ),
+		InstanceBoundHashes( this, branchPath, context, instanceData, boundHashes, transformHashes )
+	);
+
+	// Group the instances by hash, choosing the first instance in
+	// each group as the representative to evaluate the bound for.
+	typedef map<MurmurHash, size_t> HashToIndex;
+	HashToIndex hashToIndex;
+	vector<size_t> representatives;
+	boundIndices.resize( numInstances );
+	for( size_t i = 0; i < numInstances; ++i )
+	{
+		MurmurHash h = boundHashes[i];
+		if( multiplePrototypes )
+		{
+			h.append( transformHashes[i] );
+		}
+		std::pair<HashToIndex::iterator, bool> inserted = hashToIndex.insert( HashToIndex::value_type( h, representatives.size() ) );
+		if( inserted.second )
+		{
+			representatives.push_back( i );
+		}
+		boundIndices[i] = inserted.first->second;
+	}
+
+	bounds.resize( representatives.size() );
+	transforms.resize( representatives.size() );
+	parallel_for(
+		blocked_range<size_t>( 0, representatives.size() ),
+		UniqueBoundEvaluator( this, branchPath, context, instanceData, representatives, boundHashes, transformHashes, bounds, transforms )
+	);
 }
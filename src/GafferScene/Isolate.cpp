@@ -61,6 +61,8 @@ Isolate::Isolate( const std::string &name )
 	outPlug()->transformPlug()->setInput( inPlug()->transformPlug() );
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
 	outPlug()->objectPlug()->setInput( inPlug()->objectPlug() );
+	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
+	outPlug()->setNamesPlug()->setInput( inPlug()->setNamesPlug() );
 }
 
 Isolate::~Isolate()
@@ -99,7 +101,7 @@ void Isolate::affects( const Gaffer::Plug *input, AffectedPlugsContainer &output
 	else if( input == filterPlug() || input == fromPlug() )
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
-		outputs.push_back( outPlug()->globalsPlug() );
+		outputs.push_back( outPlug()->setPlug() );
 	}
 	else if( input == adjustBoundsPlug() )
 	{
@@ -162,15 +164,13 @@ IECore::ConstInternedStringVectorDataPtr Isolate::computeChildNames( const Scene
 		InternedStringVectorDataPtr outputChildNamesData = new InternedStringVectorData;
 		vector<InternedString> &outputChildNames = outputChildNamesData->writable();
 
-		ScenePath childPath = path;
-		childPath.push_back( InternedString() ); // for the child name
-		for( vector<InternedString>::const_iterator it = inputChildNames.begin(), eIt = inputChildNames.end(); it != eIt; it++ )
+		vector<unsigned> matches;
+		filterChildValues( context, path, inputChildNames, matches );
+		for( size_t i = 0, e = inputChildNames.size(); i < e; ++i )
 		{
-			childPath[path.size()] = *it;
-			tmpContext->set( ScenePlug::scenePathContextName, childPath );
-			if( filterPlug()->getValue() != Filter::NoMatch )
+			if( matches[i] != Filter::NoMatch )
 			{
-				outputChildNames.push_back( *it );
+				outputChildNames.push_back( inputChildNames[i] );
 			}
 		}
 
@@ -183,20 +183,20 @@ IECore::ConstInternedStringVectorDataPtr Isolate::computeChildNames( const Scene
 	}
 }
 
-void Isolate::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+void Isolate::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	FilteredSceneProcessor::hashGlobals( context, parent, h );
-	inPlug()->globalsPlug()->hash( h );
+	FilteredSceneProcessor::hashSet( setName, context, parent, h );
+	inPlug()->setPlug()->hash( h );
 	fromPlug()->hash( h );
 
-	// The globals themselves do not depend on the "scene:path"
+	// The sets themselves do not depend on the "scene:path"
 	// context entry - the whole point is that they're global.
 	// However, the PathFilter is dependent on scene:path, so
 	// we must remove the path before hashing in the filter in
 	// case we're computed from multiple contexts with different
 	// paths (from a SetFilter for instance). If we didn't do this,
 	// our different hashes would lead to huge numbers of redundant
-	// calls to computeGlobals() and a huge overhead in recomputing
+	// calls to computeSet() and a huge overhead in recomputing
 	// the same sets repeatedly.
 	//
 	// See further comments in FilteredSceneProcessor::affects().
@@ -206,18 +206,19 @@ void Isolate::hashGlobals( const Gaffer::Context *context, const ScenePlug *pare
 	filterPlug()->hash( h );
 }
 
-IECore::ConstCompoundObjectPtr Isolate::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+GafferScene::ConstPathMatcherDataPtr Isolate::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstCompoundObjectPtr inputGlobals = inPlug()->globalsPlug()->getValue();
-	const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets" );
-	if( !inputSets )
+	ConstPathMatcherDataPtr inputSetData = boost::static_pointer_cast<const PathMatcherData>( inPlug()->setPlug()->getValue() );
+	const PathMatcher &inputSet = inputSetData->readable();
+	if( inputSet.isEmpty() )
 	{
-		return inputGlobals;
+		return inputSetData;
 	}
 
-	CompoundObjectPtr outputGlobals = inputGlobals->copy();
-	CompoundDataPtr outputSets = new CompoundData;
-	outputGlobals->members()["gaffer:sets"] = outputSets;
+	// Copying the input set is cheap, because PathMatcher shares
+	// its tree between copies until they are modified.
+	PathMatcherDataPtr outputSetData = new PathMatcherData( inputSet );
+	PathMatcher &outputSet = outputSetData->writable();
 
 	ContextPtr tmpContext = filterContext( context );
 	Context::Scope scopedContext( tmpContext.get() );
@@ -226,34 +227,23 @@ IECore::ConstCompoundObjectPtr Isolate::computeGlobals( const Gaffer::Context *c
 	const std::string fromString = fromPlug()->getValue();
 	ScenePlug::ScenePath fromPath; ScenePlug::stringToPath( fromString, fromPath );
 
-	for( CompoundDataMap::const_iterator it = inputSets->readable().begin(), eIt = inputSets->readable().end(); it != eIt; ++it )
+	vector<string> inputPaths;
+	inputSet.paths( inputPaths );
+	for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
 	{
-		/// \todo This could be more efficient if PathMatcher exposed the internal nodes,
-		/// and allowed sharing between matchers. Then we could do a really lightweight copy
-		/// and just trim out the nodes we didn't want.
-		const PathMatcher &inputSet = static_cast<const PathMatcherData *>( it->second.get() )->readable();
-		PathMatcher &outputSet = outputSets->member<PathMatcherData>( it->first, /* throwExceptions = */ false, /* createIfMissing = */ true )->writable();
-
-		vector<string> inputPaths;
-		inputSet.paths( inputPaths );
-		for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
+		path.clear();
+		ScenePlug::stringToPath( *pIt, path );
+		if( boost::starts_with( path, fromPath ) )
 		{
-			path.clear();
-			ScenePlug::stringToPath( *pIt, path );
-			bool prune = false;
-			if( boost::starts_with( path, fromPath ) )
+			tmpContext->set( ScenePlug::scenePathContextName, path );
+			if( filterPlug()->getValue() == Filter::NoMatch )
 			{
-				tmpContext->set( ScenePlug::scenePathContextName, path );
-				prune = filterPlug()->getValue() == Filter::NoMatch;
-			}
-			if( !prune )
-			{
-				outputSet.addPath( path );
+				outputSet.removePath( path );
 			}
 		}
 	}
 
-	return outputGlobals;
+	return outputSetData;
 }
 
 bool Isolate::mayPruneChildren( const ScenePath &path, unsigned filterValue ) const
@@ -37,7 +37,6 @@
 #include "Gaffer/Context.h"
 
 #include "GafferScene/Light.h"
-#include "GafferScene/PathMatcherData.h"
 
 using namespace Gaffer;
 using namespace GafferScene;
@@ -71,38 +70,16 @@ void Light::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 {
 	ObjectSource::affects( input, outputs );
 
-	if( input == namePlug() )
-	{
-		outputs.push_back( outPlug()->globalsPlug() );
-	}
-	else if( parametersPlug()->isAncestorOf( input ) )
+	if( parametersPlug()->isAncestorOf( input ) )
 	{
 		outputs.push_back( sourcePlug() );
 	}
 }
 
-void Light::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
-{
-	ObjectSource::hashGlobals( context, parent, h );
-	namePlug()->hash( h );
-}
-
-IECore::ConstCompoundObjectPtr Light::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+IECore::InternedString Light::standardSetName() const
 {
-	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
-
-	IECore::CompoundDataPtr sets = result->member<IECore::CompoundData>(
-		"gaffer:sets",
-		/* throwExceptions = */ false,
-		/* createIfMissing = */ true
-	);
-
-	PathMatcherDataPtr lightSet = new PathMatcherData;
-	lightSet->writable().addPath( "/" + namePlug()->getValue() );
-
-	sets->writable()["__lights"] = lightSet;
-
-	return result;
+	static IECore::InternedString g_setName( "__lights" );
+	return g_setName;
 }
 
 void Light::hashSource( const Gaffer::Context *context, IECore::MurmurHash &h ) const
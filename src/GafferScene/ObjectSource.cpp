@@ -96,6 +96,7 @@ void ObjectSource::affects( const Gaffer::Plug *input, Gaffer::DependencyNode::A
 	else if( input == namePlug() )
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
+		outputs.push_back( outPlug()->setPlug() );
 	}
 	else if( transformPlug()->isAncestorOf( input ) )
 	{
@@ -267,3 +268,60 @@ IECore::ConstCompoundObjectPtr ObjectSource::computeGlobals( const Gaffer::Conte
 {
 	return parent->globalsPlug()->defaultValue();
 }
+
+void ObjectSource::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	const IECore::InternedString setName = standardSetName();
+	if( setName.string().empty() )
+	{
+		h = parent->setNamesPlug()->defaultValue()->Object::hash();
+		return;
+	}
+
+	SceneNode::hashSetNames( context, parent, h );
+	h.append( setName );
+}
+
+IECore::ConstInternedStringVectorDataPtr ObjectSource::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	const IECore::InternedString setName = standardSetName();
+	if( setName.string().empty() )
+	{
+		return parent->setNamesPlug()->defaultValue();
+	}
+
+	IECore::InternedStringVectorDataPtr result = new IECore::InternedStringVectorData;
+	result->writable().push_back( setName );
+	return result;
+}
+
+void ObjectSource::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	const IECore::InternedString ourSetName = standardSetName();
+	if( ourSetName.string().empty() || setName != ourSetName )
+	{
+		h = parent->setPlug()->defaultValue()->Object::hash();
+		return;
+	}
+
+	SceneNode::hashSet( setName, context, parent, h );
+	namePlug()->hash( h );
+}
+
+GafferScene::ConstPathMatcherDataPtr ObjectSource::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	const IECore::InternedString ourSetName = standardSetName();
+	if( ourSetName.string().empty() || setName != ourSetName )
+	{
+		return boost::static_pointer_cast<const PathMatcherData>( parent->setPlug()->defaultValue() );
+	}
+
+	PathMatcherDataPtr result = new PathMatcherData;
+	result->writable().addPath( "/" + namePlug()->getValue() );
+	return result;
+}
+
+IECore::InternedString ObjectSource::standardSetName() const
+{
+	return IECore::InternedString();
+}
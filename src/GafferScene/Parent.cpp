@@ -123,12 +123,22 @@ IECore::ConstInternedStringVectorDataPtr Parent::computeBranchChildNames( const
 	return childPlug()->childNames( branchPath );
 }
 
-void Parent::hashBranchGlobals( const ScenePath &parentPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+void Parent::hashBranchSetNames( const ScenePath &parentPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	h = childPlug()->globalsPlug()->hash();
+	h = childPlug()->setNamesPlug()->hash();
 }
 
-IECore::ConstCompoundObjectPtr Parent::computeBranchGlobals( const ScenePath &parentPath, const Gaffer::Context *context ) const
+IECore::ConstInternedStringVectorDataPtr Parent::computeBranchSetNames( const ScenePath &parentPath, const Gaffer::Context *context ) const
 {
-	return childPlug()->globalsPlug()->getValue();
+	return childPlug()->setNamesPlug()->getValue();
+}
+
+void Parent::hashBranchSet( const ScenePath &parentPath, const IECore::InternedString &setName, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	h = childPlug()->setPlug()->hash();
+}
+
+GafferScene::ConstPathMatcherDataPtr Parent::computeBranchSet( const ScenePath &parentPath, const IECore::InternedString &setName, const Gaffer::Context *context ) const
+{
+	return boost::static_pointer_cast<const PathMatcherData>( childPlug()->setPlug()->getValue() );
 }
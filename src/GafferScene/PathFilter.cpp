@@ -35,6 +35,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "Gaffer/Context.h"
 
 #include "GafferScene/ScenePlug.h"
@@ -143,3 +145,23 @@ unsigned PathFilter::computeMatch( const ScenePlug *scene, const Gaffer::Context
 	}
 	return NoMatch;
 }
+
+void PathFilter::computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	if( !enabledPlug()->getValue() )
+	{
+		std::fill( matches.begin(), matches.end(), (unsigned)NoMatch );
+		return;
+	}
+
+	ConstPathMatcherDataPtr pathMatcherData = boost::static_pointer_cast<const PathMatcherData>( pathMatcherPlug()->getValue() );
+	const PathMatcher &pathMatcher = pathMatcherData->readable();
+
+	ScenePlug::ScenePath childPath = parentPath;
+	childPath.push_back( InternedString() ); // for the child name
+	for( size_t i = 0, e = childNames.size(); i < e; ++i )
+	{
+		childPath.back() = childNames[i];
+		matches[i] = pathMatcher.match( childPath );
+	}
+}
@@ -58,6 +58,8 @@ Prune::Prune( const std::string &name )
 	outPlug()->transformPlug()->setInput( inPlug()->transformPlug() );
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
 	outPlug()->objectPlug()->setInput( inPlug()->objectPlug() );
+	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
+	outPlug()->setNamesPlug()->setInput( inPlug()->setNamesPlug() );
 }
 
 Prune::~Prune()
@@ -86,7 +88,7 @@ void Prune::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 	else if( input == filterPlug() )
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
-		outputs.push_back( outPlug()->globalsPlug() );
+		outputs.push_back( outPlug()->setPlug() );
 	}
 	else if( input == adjustBoundsPlug() )
 	{
@@ -155,15 +157,13 @@ IECore::ConstInternedStringVectorDataPtr Prune::computeChildNames( const ScenePa
 		InternedStringVectorDataPtr outputChildNamesData = new InternedStringVectorData;
 		vector<InternedString> &outputChildNames = outputChildNamesData->writable();
 
-		ScenePath childPath = path;
-		childPath.push_back( InternedString() ); // for the child name
-		for( vector<InternedString>::const_iterator it = inputChildNames.begin(), eIt = inputChildNames.end(); it != eIt; it++ )
+		vector<unsigned> matches;
+		filterChildValues( context, path, inputChildNames, matches );
+		for( size_t i = 0, e = inputChildNames.size(); i < e; ++i )
 		{
-			childPath[path.size()] = *it;
-			tmpContext->set( ScenePlug::scenePathContextName, childPath );
-			if( !(filterPlug()->getValue() & Filter::ExactMatch) )
+			if( !(matches[i] & Filter::ExactMatch) )
 			{
-				outputChildNames.push_back( *it );
+				outputChildNames.push_back( inputChildNames[i] );
 			}
 		}
 
@@ -176,19 +176,19 @@ IECore::ConstInternedStringVectorDataPtr Prune::computeChildNames( const ScenePa
 	}
 }
 
-void Prune::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+void Prune::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	FilteredSceneProcessor::hashGlobals( context, parent, h );
-	inPlug()->globalsPlug()->hash( h );
+	FilteredSceneProcessor::hashSet( setName, context, parent, h );
+	inPlug()->setPlug()->hash( h );
 
-	// The globals themselves do not depend on the "scene:path"
+	// The sets themselves do not depend on the "scene:path"
 	// context entry - the whole point is that they're global.
 	// However, the PathFilter is dependent on scene:path, so
 	// we must remove the path before hashing in the filter in
 	// case we're computed from multiple contexts with different
 	// paths (from a SetFilter for instance). If we didn't do this,
 	// our different hashes would lead to huge numbers of redundant
-	// calls to computeGlobals() and a huge overhead in recomputing
+	// calls to computeSet() and a huge overhead in recomputing
 	// the same sets repeatedly.
 	//
 	// See further comments in FilteredSceneProcessor::affects().
@@ -198,45 +198,37 @@ void Prune::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent
 	filterPlug()->hash( h );
 }
 
-IECore::ConstCompoundObjectPtr Prune::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+GafferScene::ConstPathMatcherDataPtr Prune::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstCompoundObjectPtr inputGlobals = inPlug()->globalsPlug()->getValue();
-	const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets" );
-	if( !inputSets )
+	ConstPathMatcherDataPtr inputSetData = boost::static_pointer_cast<const PathMatcherData>( inPlug()->setPlug()->getValue() );
+	const PathMatcher &inputSet = inputSetData->readable();
+	if( inputSet.isEmpty() )
 	{
-		return inputGlobals;
+		return inputSetData;
 	}
 
-	CompoundObjectPtr outputGlobals = inputGlobals->copy();
-	CompoundDataPtr outputSets = new CompoundData;
-	outputGlobals->members()["gaffer:sets"] = outputSets;
+	// Copying the input set is cheap, because PathMatcher shares
+	// its tree between copies until they are modified.
+	PathMatcherDataPtr outputSetData = new PathMatcherData( inputSet );
+	PathMatcher &outputSet = outputSetData->writable();
 
 	ContextPtr tmpContext = filterContext( context );
 	Context::Scope scopedContext( tmpContext.get() );
 	ScenePath path;
 
-	for( CompoundDataMap::const_iterator it = inputSets->readable().begin(), eIt = inputSets->readable().end(); it != eIt; ++it )
+	vector<string> inputPaths;
+	inputSet.paths( inputPaths );
+	for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
 	{
-		/// \todo This could be more efficient if PathMatcher exposed the internal nodes,
-		/// and allowed sharing between matchers. Then we could do a really lightweight copy
-		/// and just trim out the nodes we didn't want.
-		const PathMatcher &inputSet = static_cast<const PathMatcherData *>( it->second.get() )->readable();
-		PathMatcher &outputSet = outputSets->member<PathMatcherData>( it->first, /* throwExceptions = */ false, /* createIfMissing = */ true )->writable();
-
-		vector<string> inputPaths;
-		inputSet.paths( inputPaths );
-		for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
-		{
-			path.clear();
-			ScenePlug::stringToPath( *pIt, path );
+		path.clear();
+		ScenePlug::stringToPath( *pIt, path );
 
-			tmpContext->set( ScenePlug::scenePathContextName, path );
-			if( !(filterPlug()->getValue() & ( Filter::ExactMatch | Filter::AncestorMatch ) ) )
-			{
-				outputSet.addPath( *pIt );
-			}
+		tmpContext->set( ScenePlug::scenePathContextName, path );
+		if( filterPlug()->getValue() & ( Filter::ExactMatch | Filter::AncestorMatch ) )
+		{
+			outputSet.removePath( path );
 		}
 	}
 
-	return outputGlobals;
+	return outputSetData;
 }
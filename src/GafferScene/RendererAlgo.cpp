@@ -122,13 +122,8 @@ void outputOptions( const IECore::CompoundObject *globals, IECore::Renderer *ren
 
 void outputCameras( const ScenePlug *scene, const IECore::CompoundObject *globals, IECore::Renderer *renderer )
 {
-	const PathMatcherData *cameraSet = NULL;
-	if( const CompoundData *sets = globals->member<CompoundData>( "gaffer:sets" ) )
-	{
-		cameraSet = sets->member<PathMatcherData>( "__cameras" );
-	}
-
-	if( cameraSet )
+	ConstPathMatcherDataPtr cameraSet = scene->set( "__cameras" );
+	if( !cameraSet->readable().isEmpty() )
 	{
 		// Output all the cameras, skipping the primary one - we need to output this
 		// last, as that's how cortex determines the primary camera.
@@ -191,17 +186,7 @@ void outputGlobalAttributes( const IECore::CompoundObject *globals, IECore::Rend
 
 void outputLights( const ScenePlug *scene, const IECore::CompoundObject *globals, IECore::Renderer *renderer )
 {
-	const CompoundData *sets = globals->member<CompoundData>( "gaffer:sets" );
-	if( !sets )
-	{
-		return;
-	}
-
-	const PathMatcherData *lightSet = sets->member<PathMatcherData>( "__lights" );
-	if( !lightSet )
-	{
-		return;
-	}
+	ConstPathMatcherDataPtr lightSet = scene->set( "__lights" );
 
 	vector<string> paths;
 	lightSet->readable().paths( paths );
@@ -268,17 +253,7 @@ bool outputLight( const ScenePlug *scene, const ScenePlug::ScenePath &path, IECo
 
 void outputCoordinateSystems( const ScenePlug *scene, const IECore::CompoundObject *globals, IECore::Renderer *renderer )
 {
-	const CompoundData *sets = globals->member<CompoundData>( "gaffer:sets" );
-	if( !sets )
-	{
-		return;
-	}
-
-	const PathMatcherData *coordinateSystemSet = sets->member<PathMatcherData>( "__coordinateSystems" );
-	if( !coordinateSystemSet )
-	{
-		return;
-	}
+	ConstPathMatcherDataPtr coordinateSystemSet = scene->set( "__coordinateSystems" );
 
 	vector<string> paths;
 	coordinateSystemSet->readable().paths( paths );
@@ -324,17 +299,7 @@ bool outputCoordinateSystem( const ScenePlug *scene, const ScenePlug::ScenePath
 
 void outputClippingPlanes( const ScenePlug *scene, const IECore::CompoundObject *globals, IECore::Renderer *renderer )
 {
-	const CompoundData *sets = globals->member<CompoundData>( "gaffer:sets" );
-	if( !sets )
-	{
-		return;
-	}
-
-	const PathMatcherData *clippingPlanesSet = sets->member<PathMatcherData>( "__clippingPlanes" );
-	if( !clippingPlanesSet )
-	{
-		return;
-	}
+	ConstPathMatcherDataPtr clippingPlanesSet = scene->set( "__clippingPlanes" );
 
 	vector<string> paths;
 	clippingPlanesSet->readable().paths( paths );
@@ -41,6 +41,7 @@
 #include "IECore/Camera.h"
 
 #include "Gaffer/Context.h"
+#include "Gaffer/Canceller.h"
 
 #include "GafferScene/SceneAlgo.h"
 #include "GafferScene/Filter.h"
@@ -126,6 +127,7 @@ class MatchingPathsTask : public tbb::task
 
 		virtual task *execute()
 		{
+			Canceller::check( m_context->canceller() );
 
 			ContextPtr context = new Context( *m_context, Context::Borrowed );
 			context->set( ScenePlug::scenePathContextName, m_path );
@@ -55,11 +55,13 @@ SceneElementProcessor::SceneElementProcessor( const std::string &name, Filter::R
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	
-	// We don't ever want to change the scene hierarchy or globals, so we make
+	// We don't ever want to change the scene hierarchy, globals or sets, so we make
 	// pass-through connections for them. This is quicker than implementing a
 	// pass through of the input in hashChildNames()/computeChildNames().
 	outPlug()->childNamesPlug()->setInput( inPlug()->childNamesPlug() );
 	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
+	outPlug()->setNamesPlug()->setInput( inPlug()->setNamesPlug() );
+	outPlug()->setPlug()->setInput( inPlug()->setPlug() );
 }
 
 SceneElementProcessor::~SceneElementProcessor()
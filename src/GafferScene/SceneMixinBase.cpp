@@ -84,6 +84,16 @@ void SceneMixinBase::hashGlobals( const Gaffer::Context *context, const ScenePlu
 	throw Exception( "Unexpected call to SceneMixinBase::hashGlobals" );
 }
 
+void SceneMixinBase::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	throw Exception( "Unexpected call to SceneMixinBase::hashSetNames" );
+}
+
+void SceneMixinBase::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	throw Exception( "Unexpected call to SceneMixinBase::hashSet" );
+}
+
 Imath::Box3f SceneMixinBase::computeBound( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
 	throw Exception( "Unexpected call to SceneMixinBase::computeBound" );
@@ -113,3 +123,13 @@ IECore::ConstCompoundObjectPtr SceneMixinBase::computeGlobals( const Gaffer::Con
 {
 	throw Exception( "Unexpected call to SceneMixinBase::computeGlobals" );
 }
+
+IECore::ConstInternedStringVectorDataPtr SceneMixinBase::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	throw Exception( "Unexpected call to SceneMixinBase::computeSetNames" );
+}
+
+ConstPathMatcherDataPtr SceneMixinBase::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	throw Exception( "Unexpected call to SceneMixinBase::computeSet" );
+}
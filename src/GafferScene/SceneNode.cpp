@@ -161,6 +161,15 @@ void SceneNode::hash( const ValuePlug *output, const Context *context, IECore::M
 		{
 			hashGlobals( context, scenePlug, h );
 		}
+		else if( output == scenePlug->setNamesPlug() )
+		{
+			hashSetNames( context, scenePlug, h );
+		}
+		else if( output == scenePlug->setPlug() )
+		{
+			const IECore::InternedString &setName = context->get<IECore::InternedString>( ScenePlug::setNameContextName );
+			hashSet( setName, context, scenePlug, h );
+		}
 	}
 	else
 	{
@@ -198,6 +207,17 @@ void SceneNode::hashGlobals( const Gaffer::Context *context, const ScenePlug *pa
 	ComputeNode::hash( parent->globalsPlug(), context, h );
 }
 
+void SceneNode::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	ComputeNode::hash( parent->setNamesPlug(), context, h );
+}
+
+void SceneNode::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	ComputeNode::hash( parent->setPlug(), context, h );
+	h.append( setName );
+}
+
 void SceneNode::compute( ValuePlug *output, const Context *context ) const
 {
 	ScenePlug *scenePlug = output->parent<ScenePlug>();
@@ -261,6 +281,19 @@ void SceneNode::compute( ValuePlug *output, const Context *context ) const
 					computeGlobals( context, scenePlug )
 				);
 			}
+			else if( output == scenePlug->setNamesPlug() )
+			{
+				static_cast<InternedStringVectorDataPlug *>( output )->setValue(
+					computeSetNames( context, scenePlug )
+				);
+			}
+			else if( output == scenePlug->setPlug() )
+			{
+				const IECore::InternedString &setName = context->get<IECore::InternedString>( ScenePlug::setNameContextName );
+				static_cast<ObjectPlug *>( output )->setValue(
+					computeSet( setName, context, scenePlug )
+				);
+			}
 		}
 		else
 		{
@@ -300,6 +333,16 @@ IECore::ConstCompoundObjectPtr SceneNode::computeGlobals( const Gaffer::Context
 	throw IECore::NotImplementedException( string( typeName() ) + "::computeGlobals" );
 }
 
+IECore::ConstInternedStringVectorDataPtr SceneNode::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	throw IECore::NotImplementedException( string( typeName() ) + "::computeSetNames" );
+}
+
+ConstPathMatcherDataPtr SceneNode::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	throw IECore::NotImplementedException( string( typeName() ) + "::computeSet" );
+}
+
 IECore::MurmurHash SceneNode::hashOfTransformedChildBounds( const ScenePath &path, const ScenePlug *out ) const
 {
 	IECore::MurmurHash result;
@@ -51,6 +51,7 @@ using namespace GafferScene;
 IE_CORE_DEFINERUNTIMETYPED( ScenePlug );
 
 const IECore::InternedString ScenePlug::scenePathContextName( "scene:path" );
+const IECore::InternedString ScenePlug::setNameContextName( "scene:setName" );
 
 ScenePlug::ScenePlug( const std::string &name, Direction direction, unsigned flags )
 	:	CompoundPlug( name, direction, flags )
@@ -115,6 +116,24 @@ ScenePlug::ScenePlug( const std::string &name, Direction direction, unsigned fla
 		)
 	);
 
+	addChild(
+		new InternedStringVectorDataPlug(
+			"setNames",
+			direction,
+			new IECore::InternedStringVectorData(),
+			childFlags
+		)
+	);
+
+	addChild(
+		new ObjectPlug(
+			"set",
+			direction,
+			new PathMatcherData(),
+			childFlags
+		)
+	);
+
 }
 
 ScenePlug::~ScenePlug()
@@ -123,7 +142,7 @@ ScenePlug::~ScenePlug()
 
 bool ScenePlug::acceptsChild( const GraphComponent *potentialChild ) const
 {
-	return children().size() != 6;
+	return children().size() != 8;
 }
 
 Gaffer::PlugPtr ScenePlug::createCounterpart( const std::string &name, Direction direction ) const
@@ -204,6 +223,26 @@ const Gaffer::CompoundObjectPlug *ScenePlug::globalsPlug() const
 	return getChild<CompoundObjectPlug>( 5 );
 }
 
+Gaffer::InternedStringVectorDataPlug *ScenePlug::setNamesPlug()
+{
+	return getChild<InternedStringVectorDataPlug>( 6 );
+}
+
+const Gaffer::InternedStringVectorDataPlug *ScenePlug::setNamesPlug() const
+{
+	return getChild<InternedStringVectorDataPlug>( 6 );
+}
+
+Gaffer::ObjectPlug *ScenePlug::setPlug()
+{
+	return getChild<ObjectPlug>( 7 );
+}
+
+const Gaffer::ObjectPlug *ScenePlug::setPlug() const
+{
+	return getChild<ObjectPlug>( 7 );
+}
+
 Imath::Box3f ScenePlug::bound( const ScenePath &scenePath ) const
 {
 	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
@@ -362,6 +401,22 @@ IECore::MurmurHash ScenePlug::childNamesHash( const ScenePath &scenePath ) const
 	return childNamesPlug()->hash();
 }
 
+ConstPathMatcherDataPtr ScenePlug::set( const IECore::InternedString &setName ) const
+{
+	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
+	tmpContext->set( setNameContextName, setName );
+	Context::Scope scopedContext( tmpContext.get() );
+	return boost::static_pointer_cast<const PathMatcherData>( setPlug()->getValue() );
+}
+
+IECore::MurmurHash ScenePlug::setHash( const IECore::InternedString &setName ) const
+{
+	ContextPtr tmpContext = new Context( *Context::current(), Context::Borrowed );
+	tmpContext->set( setNameContextName, setName );
+	Context::Scope scopedContext( tmpContext.get() );
+	return setPlug()->hash();
+}
+
 void ScenePlug::stringToPath( const std::string &s, ScenePlug::ScenePath &path )
 {
 	path.clear();
@@ -160,6 +160,9 @@ SceneProcedural::SceneProcedural( ConstScenePlugPtr scenePlug, const Gaffer::Con
 	m_options.shutter = shutterData ? shutterData->readable() : V2f( -0.25, 0.25 );
 	m_options.shutter += V2f( m_context->getFrame() );
 
+	const BoolData *eagerExpansionData = globals->member<BoolData>( "option:render:eagerExpansion" );
+	m_options.eagerExpansion = eagerExpansionData ? eagerExpansionData->readable() : false;
+
 	// attributes
 
 	transformBlurData = globals->member<BoolData>( "attribute:gaffer:transformBlur" );
@@ -315,150 +318,261 @@ class SceneProcedural::SceneProceduralCreate
 };
 
 
-void SceneProcedural::render( Renderer *renderer ) const
-{
-	tbb::task_scheduler_init tsi( tbb::task_scheduler_init::deferred );
-	initializeTaskScheduler( tsi );
+//////////////////////////////////////////////////////////////////////////
+// Location implementation
+//////////////////////////////////////////////////////////////////////////
 
-	Context::Scope scopedContext( m_context.get() );
+struct SceneProcedural::Location
+{
 
-	/// \todo See above.
-	try
+	Location( const ScenePlug::ScenePath &path, const Attributes &attributes )
+		:	path( path ), attributes( attributes ), visible( true )
 	{
+	}
+
+	ScenePlug::ScenePath path;
+	// The motion blur attributes, inherited from the parent
+	// and then updated from sceneAttributes.
+	Attributes attributes;
+	bool visible;
+
+	ConstCompoundObjectPtr sceneAttributes;
+	std::set<float> transformTimes;
+	std::vector<M44f> transforms;
+	std::set<float> deformationTimes;
+	std::vector<ConstObjectPtr> objects;
+	ConstInternedStringVectorDataPtr childNames;
 
-		// get all the attributes, and early out if we're not visibile
+	// Only filled in when prefetching a whole subtree.
+	std::vector<LocationPtr> children;
 
-		ConstCompoundObjectPtr attributes = m_scenePlug->attributesPlug()->getValue();
-		const BoolData *visibilityData = attributes->member<BoolData>( "scene:visible" );
-		if( visibilityData && !visibilityData->readable() )
+};
+
+//////////////////////////////////////////////////////////////////////////
+// LocationPrefetch implementation
+//
+// This uses tbb::parallel_for to fill the children of a Location,
+// recursing to prefetch the whole subtree.
+//
+//////////////////////////////////////////////////////////////////////////
+
+class SceneProcedural::LocationPrefetch
+{
+
+	public :
+
+		LocationPrefetch( const SceneProcedural &procedural, Location &parent )
+			:	m_procedural( procedural ), m_parent( parent )
 		{
-		
-			if( !m_rendered )
+		}
+
+		void operator()( const tbb::blocked_range<int> &range ) const
+		{
+			const vector<InternedString> &childNames = m_parent.childNames->readable();
+			for( int i=range.begin(); i!=range.end(); ++i )
 			{
-				decrementPendingProcedurals();
+				ScenePlug::ScenePath childPath = m_parent.path;
+				childPath.push_back( childNames[i] );
+				LocationPtr child( new Location( childPath, m_parent.attributes ) );
+				m_procedural.computeLocation( *child, true );
+				m_parent.children[i] = child;
 			}
-			m_rendered = true;
-			return;
 		}
 
-		// if we are visible then make an attribute block to contain everything, set the name
-		// and get on with generating things.
+	private :
+
+		const SceneProcedural &m_procedural;
+		Location &m_parent;
+
+};
+
+void SceneProcedural::computeLocation( Location &location, bool recurse ) const
+{
+	ContextPtr context = new Context( *m_context, Context::Borrowed );
+	context->set( ScenePlug::scenePathContextName, location.path );
+	Context::Scope scopedContext( context.get() );
+
+	// get all the attributes, and early out if we're not visible
+
+	location.sceneAttributes = m_scenePlug->attributesPlug()->getValue();
+	const BoolData *visibilityData = location.sceneAttributes->member<BoolData>( "scene:visible" );
+	if( visibilityData && !visibilityData->readable() )
+	{
+		location.visible = false;
+		return;
+	}
+
+	updateAttributes( location.sceneAttributes.get(), location.attributes );
+	const Attributes &a = location.attributes;
+
+	// transform
+
+	motionTimes( ( m_options.transformBlur && a.transformBlur ) ? a.transformBlurSegments : 0, location.transformTimes );
+	for( std::set<float>::const_iterator it = location.transformTimes.begin(), eIt = location.transformTimes.end(); it != eIt; it++ )
+	{
+		context->setFrame( *it );
+		location.transforms.push_back( m_scenePlug->transformPlug()->getValue() );
+	}
 
-		AttributeBlock attributeBlock( renderer );
+	// object
 
-		std::string name = "";
-		for( ScenePlug::ScenePath::const_iterator it = m_scenePath.begin(), eIt = m_scenePath.end(); it != eIt; it++ )
+	motionTimes( ( m_options.deformationBlur && a.deformationBlur ) ? a.deformationBlurSegments : 0, location.deformationTimes );
+	for( std::set<float>::const_iterator it = location.deformationTimes.begin(), eIt = location.deformationTimes.end(); it != eIt; it++ )
+	{
+		context->setFrame( *it );
+		location.objects.push_back( m_scenePlug->objectPlug()->getValue() );
+		if( !runTimeCast<const Primitive>( location.objects.back().get() ) )
 		{
-			name += "/" + it->string();
+			break; // no motion blur for anything but primitives
 		}
-		renderer->setAttribute( "name", new StringData( name ) );
+	}
 
-		// transform
+	// children
 
-		std::set<float> transformTimes;
-		motionTimes( ( m_options.transformBlur && m_attributes.transformBlur ) ? m_attributes.transformBlurSegments : 0, transformTimes );
-		{
-			ContextPtr timeContext = new Context( *m_context, Context::Borrowed );
-			Context::Scope scopedTimeContext( timeContext.get() );
+	context->setFrame( m_context->getFrame() );
+	location.childNames = m_scenePlug->childNamesPlug()->getValue();
+
+	if( recurse && location.childNames->readable().size() )
+	{
+		location.children.resize( location.childNames->readable().size() );
+		LocationPrefetch prefetch( *this, location );
+		tbb::parallel_for( tbb::blocked_range<int>( 0, location.childNames->readable().size() ), prefetch );
+	}
+}
 
-			MotionBlock motionBlock( renderer, transformTimes, transformTimes.size() > 1 );
+void SceneProcedural::renderLocation( const Location &location, Renderer *renderer ) const
+{
+	if( !location.visible )
+	{
+		return;
+	}
 
-			for( std::set<float>::const_iterator it = transformTimes.begin(), eIt = transformTimes.end(); it != eIt; it++ )
-			{
-				timeContext->setFrame( *it );
-				renderer->concatTransform( m_scenePlug->transformPlug()->getValue() );
-			}
+	// make an attribute block to contain everything, set the name
+	// and get on with generating things.
+
+	AttributeBlock attributeBlock( renderer );
+
+	std::string name = "";
+	for( ScenePlug::ScenePath::const_iterator it = location.path.begin(), eIt = location.path.end(); it != eIt; it++ )
+	{
+		name += "/" + it->string();
+	}
+	renderer->setAttribute( "name", new StringData( name ) );
+
+	// transform
+
+	{
+		MotionBlock motionBlock( renderer, location.transformTimes, location.transformTimes.size() > 1 );
+
+		for( std::vector<M44f>::const_iterator it = location.transforms.begin(), eIt = location.transforms.end(); it != eIt; it++ )
+		{
+			renderer->concatTransform( *it );
 		}
+	}
 
-		// attributes
+	// attributes
 
-		for( CompoundObject::ObjectMap::const_iterator it = attributes->members().begin(), eIt = attributes->members().end(); it != eIt; it++ )
+	for( CompoundObject::ObjectMap::const_iterator it = location.sceneAttributes->members().begin(), eIt = location.sceneAttributes->members().end(); it != eIt; it++ )
+	{
+		if( const StateRenderable *s = runTimeCast<const StateRenderable>( it->second.get() ) )
 		{
-			if( const StateRenderable *s = runTimeCast<const StateRenderable>( it->second.get() ) )
-			{
-				s->render( renderer );
-			}
-			else if( const ObjectVector *o = runTimeCast<const ObjectVector>( it->second.get() ) )
+			s->render( renderer );
+		}
+		else if( const ObjectVector *o = runTimeCast<const ObjectVector>( it->second.get() ) )
+		{
+			for( ObjectVector::MemberContainer::const_iterator it = o->members().begin(), eIt = o->members().end(); it != eIt; it++ )
 			{
-				for( ObjectVector::MemberContainer::const_iterator it = o->members().begin(), eIt = o->members().end(); it != eIt; it++ )
+				const StateRenderable *s = runTimeCast<const StateRenderable>( it->get() );
+				if( s )
 				{
-					const StateRenderable *s = runTimeCast<const StateRenderable>( it->get() );
-					if( s )
-					{
-						s->render( renderer );
-					}
+					s->render( renderer );
 				}
 			}
-			else if( const Data *d = runTimeCast<const Data>( it->second.get() ) )
-			{
-				renderer->setAttribute( it->first, d );
-			}
 		}
+		else if( const Data *d = runTimeCast<const Data>( it->second.get() ) )
+		{
+			renderer->setAttribute( it->first, d );
+		}
+	}
 
-		// object
+	// object
 
-		std::set<float> deformationTimes;
-		motionTimes( ( m_options.deformationBlur && m_attributes.deformationBlur ) ? m_attributes.deformationBlurSegments : 0, deformationTimes );
+	const std::set<float> &deformationTimes = location.deformationTimes;
+	unsigned timeIndex = 0;
+	for( std::vector<ConstObjectPtr>::const_iterator it = location.objects.begin(), eIt = location.objects.end(); it != eIt; it++, timeIndex++ )
+	{
+		if( const Primitive *primitive = runTimeCast<const Primitive>( it->get() ) )
 		{
-			ContextPtr timeContext = new Context( *m_context, Context::Borrowed );
-			Context::Scope scopedTimeContext( timeContext.get() );
-
-			unsigned timeIndex = 0;
-			for( std::set<float>::const_iterator it = deformationTimes.begin(), eIt = deformationTimes.end(); it != eIt; it++, timeIndex++ )
+			if( deformationTimes.size() > 1 && timeIndex == 0 )
 			{
-				timeContext->setFrame( *it );
-				ConstObjectPtr object = m_scenePlug->objectPlug()->getValue();
-				if( const Primitive *primitive = runTimeCast<const Primitive>( object.get() ) )
-				{
-					if( deformationTimes.size() > 1 && timeIndex == 0 )
-					{
-						renderer->motionBegin( deformationTimes );
-					}
-
-						primitive->render( renderer );
+				renderer->motionBegin( deformationTimes );
+			}
 
-					if( deformationTimes.size() > 1 && timeIndex == deformationTimes.size() - 1 )
-					{
-						renderer->motionEnd();
-					}
-				}
-				else if( const VisibleRenderable* renderable = runTimeCast< const VisibleRenderable >( object.get() ) )
-				{
-					renderable->render( renderer );
-					break; // no motion blur for these chappies.
-				}
+				primitive->render( renderer );
 
+			if( deformationTimes.size() > 1 && timeIndex == deformationTimes.size() - 1 )
+			{
+				renderer->motionEnd();
 			}
 		}
+		else if( const VisibleRenderable* renderable = runTimeCast< const VisibleRenderable >( it->get() ) )
+		{
+			renderable->render( renderer );
+			break; // no motion blur for these chappies.
+		}
+	}
 
-		// children
+	// children
 
-		ConstInternedStringVectorDataPtr childNames = m_scenePlug->childNamesPlug()->getValue();
-		if( childNames->readable().size() )
+	if( m_options.eagerExpansion )
+	{
+		// the children have already been prefetched, so
+		// we just need to output them in order.
+		for( std::vector<LocationPtr>::const_iterator it = location.children.begin(), eIt = location.children.end(); it != eIt; ++it )
 		{
-			// Creating a SceneProcedural involves an attribute/bound evaluation, which are
-			// potentially expensive, so we're parallelizing them.
+			renderLocation( **it, renderer );
+		}
+	}
+	else if( location.childNames->readable().size() )
+	{
+		// Creating a SceneProcedural involves an attribute/bound evaluation, which are
+		// potentially expensive, so we're parallelizing them.
 
-			// allocate space for child procedurals:
-			SceneProceduralCreate::SceneProceduralContainer childProcedurals( childNames->readable().size() );
+		// allocate space for child procedurals:
+		SceneProceduralCreate::SceneProceduralContainer childProcedurals( location.childNames->readable().size() );
 
-			// create procedurals in parallel:
-			SceneProceduralCreate s(
-				childProcedurals,
-				*this,
-				childNames->readable()
-			);
-			tbb::parallel_for( tbb::blocked_range<int>( 0, childNames->readable().size() ), s );
+		// create procedurals in parallel:
+		SceneProceduralCreate s(
+			childProcedurals,
+			*this,
+			location.childNames->readable()
+		);
+		tbb::parallel_for( tbb::blocked_range<int>( 0, location.childNames->readable().size() ), s );
 
-			// send to the renderer in series:
+		// send to the renderer in series:
 
-			std::vector<SceneProceduralPtr>::const_iterator procIt = childProcedurals.begin(), procEit = childProcedurals.end();
-			for( ; procIt != procEit; ++procIt )
-			{
-				renderer->procedural( *procIt );
-			}
+		std::vector<SceneProceduralPtr>::const_iterator procIt = childProcedurals.begin(), procEit = childProcedurals.end();
+		for( ; procIt != procEit; ++procIt )
+		{
+			renderer->procedural( *procIt );
 		}
 	}
+}
+
+void SceneProcedural::render( Renderer *renderer ) const
+{
+	tbb::task_scheduler_init tsi( tbb::task_scheduler_init::deferred );
+	initializeTaskScheduler( tsi );
+
+	Context::Scope scopedContext( m_context.get() );
+
+	/// \todo See above.
+	try
+	{
+		Location location( m_scenePath, m_attributes );
+		computeLocation( location, m_options.eagerExpansion );
+		renderLocation( location, renderer );
+	}
 	catch( const std::exception &e )
 	{
 		IECore::msg( IECore::Msg::Error, "SceneProcedural::render()", e.what() );
@@ -508,24 +622,29 @@ void SceneProcedural::updateAttributes( bool full )
 		attributes = m_scenePlug->attributesPlug()->getValue();
 	}
 
+	updateAttributes( attributes.get(), m_attributes );
+}
+
+void SceneProcedural::updateAttributes( const IECore::CompoundObject *attributes, Attributes &result )
+{
 	if( const BoolData *transformBlurData = attributes->member<BoolData>( "gaffer:transformBlur" ) )
 	{
-		m_attributes.transformBlur = transformBlurData->readable();
+		result.transformBlur = transformBlurData->readable();
 	}
 
 	if( const IntData *transformBlurSegmentsData = attributes->member<IntData>( "gaffer:transformBlurSegments" ) )
 	{
-		m_attributes.transformBlurSegments = transformBlurSegmentsData->readable();
+		result.transformBlurSegments = transformBlurSegmentsData->readable();
 	}
 
 	if( const BoolData *deformationBlurData = attributes->member<BoolData>( "gaffer:deformationBlur" ) )
 	{
-		m_attributes.deformationBlur = deformationBlurData->readable();
+		result.deformationBlur = deformationBlurData->readable();
 	}
 
 	if( const IntData *deformationBlurSegmentsData = attributes->member<IntData>( "gaffer:deformationBlurSegments" ) )
 	{
-		m_attributes.deformationBlurSegments = deformationBlurSegmentsData->readable();
+		result.deformationBlurSegments = deformationBlurSegmentsData->readable();
 	}
 }
 
@@ -39,6 +39,9 @@
 #include "IECore/SharedSceneInterfaces.h"
 #include "IECore/InternedString.h"
 #include "IECore/SceneCache.h"
+#include "IECore/MeshPrimitive.h"
+#include "IECore/NullObject.h"
+#include "IECore/ObjectInterpolator.h"
 
 #include "Gaffer/Context.h"
 #include "Gaffer/StringAlgo.h"
@@ -63,6 +66,7 @@ IE_CORE_DEFINERUNTIMETYPED( SceneReader );
 /// \todo hard coded framerate should be replaced with a getTime() method on Gaffer::Context or something
 const double SceneReader::g_frameRate( 24 );
 size_t SceneReader::g_firstPlugIndex = 0;
+const IECore::InternedString SceneReader::g_objectSampleContextName( "sceneReader:objectSample" );
 
 static IECore::BoolDataPtr g_trueBoolData = new IECore::BoolData( true );
 
@@ -74,6 +78,9 @@ SceneReader::SceneReader( const std::string &name )
 	addChild( new IntPlug( "refreshCount" ) );
 	addChild( new StringPlug( "tags" ) );
 	addChild( new StringPlug( "sets" ) );
+	addChild( new BoolPlug( "cacheObjectSamples" ) );
+	addChild( new ObjectPlug( "__tagIndex", Plug::Out, new CompoundObject() ) );
+	addChild( new ObjectPlug( "__objectSample", Plug::Out, NullObject::defaultNullObject() ) );
 	plugSetSignal().connect( boost::bind( &SceneReader::plugSet, this, ::_1 ) );
 }
 
@@ -121,6 +128,36 @@ const Gaffer::StringPlug *SceneReader::setsPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::BoolPlug *SceneReader::cacheObjectSamplesPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::BoolPlug *SceneReader::cacheObjectSamplesPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::ObjectPlug *SceneReader::tagIndexPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::ObjectPlug *SceneReader::tagIndexPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+Gaffer::ObjectPlug *SceneReader::objectSamplePlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 6 );
+}
+
+const Gaffer::ObjectPlug *SceneReader::objectSamplePlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 6 );
+}
+
 void SceneReader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneNode::affects( input, outputs );
@@ -131,15 +168,29 @@ void SceneReader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &ou
 		{
 			outputs.push_back( it->get() );
 		}
+		outputs.push_back( tagIndexPlug() );
+		outputs.push_back( objectSamplePlug() );
 	}
 
 	if( input == tagsPlug() )
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
+		outputs.push_back( tagIndexPlug() );
 	}
 	else if( input == setsPlug() )
 	{
-		outputs.push_back( outPlug()->globalsPlug() );
+		outputs.push_back( outPlug()->setNamesPlug() );
+		outputs.push_back( outPlug()->setPlug() );
+		outputs.push_back( tagIndexPlug() );
+	}
+	else if( input == tagIndexPlug() )
+	{
+		outputs.push_back( outPlug()->childNamesPlug() );
+		outputs.push_back( outPlug()->setPlug() );
+	}
+	else if( input == cacheObjectSamplesPlug() || input == objectSamplePlug() )
+	{
+		outputs.push_back( outPlug()->objectPlug() );
 	}
 }
 
@@ -280,6 +331,31 @@ void SceneReader::hashObject( const ScenePath &path, const Gaffer::Context *cont
 		return;
 	}
 
+	if( cacheObjectSamplesPlug()->getValue() )
+	{
+		// when the time coincides with a stored sample, we use the hash
+		// of the sample itself, so that the result shares its entry in the
+		// cache with the sample.
+		size_t floorIndex, ceilIndex;
+		const double x = s->objectSampleInterval( context->getFrame() / g_frameRate, floorIndex, ceilIndex );
+		if( x == 0.0 || floorIndex == ceilIndex )
+		{
+			h = objectSampleHash( context, floorIndex );
+		}
+		else if( x == 1.0 )
+		{
+			h = objectSampleHash( context, ceilIndex );
+		}
+		else
+		{
+			SceneNode::hashObject( path, context, parent, h );
+			h.append( objectSampleHash( context, floorIndex ) );
+			h.append( objectSampleHash( context, ceilIndex ) );
+			h.append( x );
+		}
+		return;
+	}
+
 	SceneNode::hashObject( path, context, parent, h );
 
 	fileNamePlug()->hash( h );
@@ -296,6 +372,31 @@ IECore::ConstObjectPtr SceneReader::computeObject( const ScenePath &path, const
 		return parent->objectPlug()->defaultValue();
 	}
 
+	if( cacheObjectSamplesPlug()->getValue() )
+	{
+		size_t floorIndex, ceilIndex;
+		const double x = s->objectSampleInterval( context->getFrame() / g_frameRate, floorIndex, ceilIndex );
+		if( x == 0.0 || floorIndex == ceilIndex )
+		{
+			return objectSample( context, floorIndex );
+		}
+		else if( x == 1.0 )
+		{
+			return objectSample( context, ceilIndex );
+		}
+
+		ConstObjectPtr floorObject = objectSample( context, floorIndex );
+		ConstObjectPtr ceilObject = objectSample( context, ceilIndex );
+		ObjectPtr result = linearObjectInterpolation( floorObject.get(), ceilObject.get(), x );
+		if( !result )
+		{
+			// not interpolable, so we behave as SceneInterface::readObject()
+			// does, and return the earlier sample.
+			return floorObject;
+		}
+		return result;
+	}
+
 	return s->readObject( context->getFrame() / g_frameRate );
 }
 
@@ -333,28 +434,37 @@ IECore::ConstInternedStringVectorDataPtr SceneReader::computeChildNames( const S
 	vector<InternedString> &result = resultData->writable();
 	s->childNames( result );
 
-	// filter out any which don't have the right tags
+	// filter out any which don't have the right tags. rather than reading the
+	// tags from each child in turn, we look them up in the tag index - a child
+	// has a tag if it or any of its ancestors or descendants has it locally,
+	// which corresponds to any sort of match against the paths in the index.
 
 	std::string tagsString = tagsPlug()->getValue();
 	if( !tagsString.empty() )
 	{
 		Tokenizer tagsTokenizer( tagsString, boost::char_separator<char>( " " ) );
 
-		vector<InternedString> tags;
-		std::copy( tagsTokenizer.begin(), tagsTokenizer.end(), back_inserter( tags ) );
+		ConstCompoundObjectPtr index = tagIndex( context );
+		vector<const PathMatcher *> tagPaths;
+		for( Tokenizer::const_iterator tIt = tagsTokenizer.begin(), tEIt = tagsTokenizer.end(); tIt != tEIt; ++tIt )
+		{
+			if( const PathMatcherData *d = index->member<PathMatcherData>( *tIt ) )
+			{
+				tagPaths.push_back( &(d->readable()) );
+			}
+		}
 
 		vector<InternedString>::iterator newResultEnd = result.begin();
-		SceneInterface::NameList childTags;
+		vector<InternedString> childPath( path );
+		childPath.push_back( InternedString() ); // room for the child name
 		for( vector<InternedString>::const_iterator cIt = result.begin(), cEIt = result.end(); cIt != cEIt; ++cIt )
 		{
-			ConstSceneInterfacePtr child = s->child( *cIt );
-			childTags.clear();
-			child->readTags( childTags, IECore::SceneInterface::EveryTag );
+			childPath.back() = *cIt;
 
 			bool childMatches = false;
-			for( SceneInterface::NameList::const_iterator tIt = childTags.begin(), tEIt = childTags.end(); tIt != tEIt; ++tIt )
+			for( vector<const PathMatcher *>::const_iterator tIt = tagPaths.begin(), tEIt = tagPaths.end(); tIt != tEIt; ++tIt )
 			{
-				if( find( tags.begin(), tags.end(), *tIt ) != tags.end() )
+				if( (*tIt)->match( childPath ) != PathMatcher::NoMatch )
 				{
 					childMatches = true;
 					break;
@@ -375,7 +485,22 @@ IECore::ConstInternedStringVectorDataPtr SceneReader::computeChildNames( const S
 
 void SceneReader::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	SceneNode::hashGlobals( context, parent, h );
+	h = parent->globalsPlug()->defaultValue()->Object::hash();
+}
+
+void SceneReader::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneNode::hashSetNames( context, parent, h );
+
+	fileNamePlug()->hash( h );
+	refreshCountPlug()->hash( h );
+
+	setsPlug()->hash( h );
+}
+
+void SceneReader::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneNode::hashSet( setName, context, parent, h );
 
 	fileNamePlug()->hash( h );
 	refreshCountPlug()->hash( h );
@@ -383,6 +508,50 @@ void SceneReader::hashGlobals( const Gaffer::Context *context, const ScenePlug *
 	setsPlug()->hash( h );
 }
 
+// Returns a copy of object in which any primitive variables and mesh topology
+// which are identical to those in referenceObject refer to the same data, so
+// that memory isn't wasted holding duplicates of the data which doesn't vary
+// between samples.
+static ConstObjectPtr shareSampleData( ConstObjectPtr object, const Object *referenceObject )
+{
+	const Primitive *primitive = runTimeCast<const Primitive>( object.get() );
+	const Primitive *referencePrimitive = runTimeCast<const Primitive>( referenceObject );
+	if( !primitive || !referencePrimitive || primitive->typeId() != referencePrimitive->typeId() )
+	{
+		return object;
+	}
+
+	PrimitivePtr result = primitive->copy();
+	for( PrimitiveVariableMap::iterator it = result->variables.begin(), eIt = result->variables.end(); it != eIt; ++it )
+	{
+		PrimitiveVariableMap::const_iterator rIt = referencePrimitive->variables.find( it->first );
+		if(
+			rIt != referencePrimitive->variables.end() &&
+			rIt->second.interpolation == it->second.interpolation &&
+			it->second.data && rIt->second.data &&
+			it->second.data != rIt->second.data &&
+			*(it->second.data) == *(rIt->second.data)
+		)
+		{
+			it->second.data = rIt->second.data;
+		}
+	}
+
+	if( MeshPrimitive *mesh = runTimeCast<MeshPrimitive>( result.get() ) )
+	{
+		const MeshPrimitive *referenceMesh = static_cast<const MeshPrimitive *>( referencePrimitive );
+		if(
+			*(mesh->verticesPerFace()) == *(referenceMesh->verticesPerFace()) &&
+			*(mesh->vertexIds()) == *(referenceMesh->vertexIds())
+		)
+		{
+			mesh->setTopology( referenceMesh->verticesPerFace(), referenceMesh->vertexIds(), mesh->interpolation() );
+		}
+	}
+
+	return result;
+}
+
 static void loadSetsWalk( const SceneInterface *s, const vector<InternedString> &tags, const vector<PathMatcher *> &sets, const vector<InternedString> &path )
 {
 	// For each tag we wish to load, we need to determine if it exists at the current
@@ -448,15 +617,18 @@ static void loadSetsWalk( const SceneInterface *s, const vector<InternedString>
 }
 
 IECore::ConstCompoundObjectPtr SceneReader::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return parent->globalsPlug()->defaultValue();
+}
+
+IECore::ConstInternedStringVectorDataPtr SceneReader::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
 {
 	ConstSceneInterfacePtr s = scene( ScenePath() );
 	if( !s )
 	{
-		return parent->globalsPlug()->defaultValue();
+		return parent->setNamesPlug()->defaultValue();
 	}
 
-	CompoundObjectPtr result = new CompoundObject;
-
 	// figure out which tags we want to convert into sets
 
 	vector<InternedString> allTags;
@@ -465,44 +637,197 @@ IECore::ConstCompoundObjectPtr SceneReader::computeGlobals( const Gaffer::Contex
 	const std::string setsString = setsPlug()->getValue();
 	Tokenizer setsTokenizer( setsString, boost::char_separator<char>( " " ) );
 
-	vector<InternedString> tagsToLoadAsSets;
+	InternedStringVectorDataPtr resultData = new InternedStringVectorData;
+	vector<InternedString> &result = resultData->writable();
 	for( vector<InternedString>::const_iterator tIt = allTags.begin(), tEIt = allTags.end(); tIt != tEIt; ++tIt )
 	{
 		for( Tokenizer::const_iterator sIt = setsTokenizer.begin(), sEIt = setsTokenizer.end(); sIt != sEIt; ++sIt )
 		{
 			if( match( tIt->value(), *sIt ) )
 			{
-				tagsToLoadAsSets.push_back( *tIt );
+				result.push_back( *tIt );
+				break;
 			}
 		}
 	}
 
-	// sort so that we can use lower_bound() in loadSetsWalk().
-	sort( tagsToLoadAsSets.begin(), tagsToLoadAsSets.end() );
+	return resultData;
+}
 
-	// make sets for each of them, and then defer to loadSetsWalk()
-	// to do the work.
+GafferScene::ConstPathMatcherDataPtr SceneReader::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	ConstSceneInterfacePtr s = scene( ScenePath() );
+	if( !s )
+	{
+		return boost::static_pointer_cast<const PathMatcherData>( parent->setPlug()->defaultValue() );
+	}
 
-	IECore::CompoundDataPtr sets = result->member<IECore::CompoundData>(
-		"gaffer:sets",
-		/* throwExceptions = */ false,
-		/* createIfMissing = */ true
-	);
+	// check that the set is one we've been asked to load
 
-	vector<PathMatcher *> pathMatchers;
-	for( vector<InternedString>::const_iterator it = tagsToLoadAsSets.begin(), eIt = tagsToLoadAsSets.end(); it != eIt; ++it )
+	const std::string setsString = setsPlug()->getValue();
+	Tokenizer setsTokenizer( setsString, boost::char_separator<char>( " " ) );
+
+	bool load = false;
+	for( Tokenizer::const_iterator sIt = setsTokenizer.begin(), sEIt = setsTokenizer.end(); sIt != sEIt; ++sIt )
+	{
+		if( match( setName.value(), *sIt ) )
+		{
+			load = true;
+			break;
+		}
+	}
+
+	if( !load )
 	{
-		PathMatcherDataPtr d = sets->member<PathMatcherData>(
-			*it,
-			/* throwExceptions = */ false,
-			/* createIfMissing = */ true
-		);
-		pathMatchers.push_back( &(d->writable()) );
+		return boost::static_pointer_cast<const PathMatcherData>( parent->setPlug()->defaultValue() );
 	}
 
-	loadSetsWalk( s.get(), tagsToLoadAsSets, pathMatchers, vector<InternedString>() );
+	// the set will have been loaded into the tag index along with all the
+	// others. if the tag doesn't exist in the file, it won't be in the
+	// index, and we just return an empty set.
 
-	return result;
+	ConstCompoundObjectPtr index = tagIndex( context );
+	if( const PathMatcherData *result = index->member<PathMatcherData>( setName ) )
+	{
+		return result;
+	}
+
+	return new PathMatcherData;
+}
+
+void SceneReader::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	SceneNode::hash( output, context, h );
+
+	if( output == tagIndexPlug() )
+	{
+		fileNamePlug()->hash( h );
+		refreshCountPlug()->hash( h );
+		tagsPlug()->hash( h );
+		setsPlug()->hash( h );
+	}
+	else if( output == objectSamplePlug() )
+	{
+		fileNamePlug()->hash( h );
+		refreshCountPlug()->hash( h );
+
+		// the hash for the exact time of the sample identifies the sample,
+		// independent of the time in the context.
+		const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+		const size_t sampleIndex = context->get<int>( g_objectSampleContextName );
+		ConstSceneInterfacePtr s = scene( path );
+		s->hash( SceneInterface::ObjectHash, s->objectSampleTime( sampleIndex ), h );
+	}
+}
+
+void SceneReader::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
+{
+	if( output == tagIndexPlug() )
+	{
+		CompoundObjectPtr result = new CompoundObject;
+
+		ConstSceneInterfacePtr s = scene( ScenePath() );
+		if( !s )
+		{
+			static_cast<ObjectPlug *>( output )->setValue( result );
+			return;
+		}
+
+		// gather the tags we need - those used to filter the hierarchy, and
+		// those matching the patterns for the sets we're loading.
+
+		vector<InternedString> tags;
+
+		const std::string tagsString = tagsPlug()->getValue();
+		Tokenizer tagsTokenizer( tagsString, boost::char_separator<char>( " " ) );
+		std::copy( tagsTokenizer.begin(), tagsTokenizer.end(), back_inserter( tags ) );
+
+		const std::string setsString = setsPlug()->getValue();
+		if( !setsString.empty() )
+		{
+			vector<InternedString> allTags;
+			s->readTags( allTags, SceneInterface::LocalTag | SceneInterface::DescendantTag );
+
+			Tokenizer setsTokenizer( setsString, boost::char_separator<char>( " " ) );
+			for( vector<InternedString>::const_iterator tIt = allTags.begin(), tEIt = allTags.end(); tIt != tEIt; ++tIt )
+			{
+				for( Tokenizer::const_iterator sIt = setsTokenizer.begin(), sEIt = setsTokenizer.end(); sIt != sEIt; ++sIt )
+				{
+					if( match( tIt->value(), *sIt ) )
+					{
+						tags.push_back( *tIt );
+						break;
+					}
+				}
+			}
+		}
+
+		// loadSetsWalk() requires the tags to be sorted, and then loads
+		// them all in a single pass over the file.
+
+		sort( tags.begin(), tags.end() );
+		tags.erase( unique( tags.begin(), tags.end() ), tags.end() );
+
+		vector<PathMatcher *> pathMatchers;
+		for( vector<InternedString>::const_iterator it = tags.begin(), eIt = tags.end(); it != eIt; ++it )
+		{
+			PathMatcherDataPtr d = new PathMatcherData;
+			pathMatchers.push_back( &(d->writable()) );
+			result->members()[*it] = d;
+		}
+
+		if( tags.size() )
+		{
+			loadSetsWalk( s.get(), tags, pathMatchers, vector<InternedString>() );
+		}
+
+		static_cast<ObjectPlug *>( output )->setValue( result );
+		return;
+	}
+	else if( output == objectSamplePlug() )
+	{
+		const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+		const size_t sampleIndex = context->get<int>( g_objectSampleContextName );
+
+		ConstSceneInterfacePtr s = scene( path );
+		ConstObjectPtr result = s->readObjectAtSample( sampleIndex );
+		if( sampleIndex > 0 )
+		{
+			// share the unchanging data with the first sample
+			ConstObjectPtr firstSample = objectSample( context, 0 );
+			result = shareSampleData( result, firstSample.get() );
+		}
+
+		static_cast<ObjectPlug *>( output )->setValue( result );
+		return;
+	}
+
+	SceneNode::compute( output, context );
+}
+
+IECore::ConstCompoundObjectPtr SceneReader::tagIndex( const Gaffer::Context *context ) const
+{
+	ContextPtr tmpContext = new Context( *context, Context::Borrowed );
+	tmpContext->remove( ScenePlug::scenePathContextName );
+	tmpContext->remove( ScenePlug::setNameContextName );
+	Context::Scope scopedContext( tmpContext.get() );
+	return boost::static_pointer_cast<const CompoundObject>( tagIndexPlug()->getValue() );
+}
+
+IECore::ConstObjectPtr SceneReader::objectSample( const Gaffer::Context *context, size_t sampleIndex ) const
+{
+	ContextPtr tmpContext = new Context( *context, Context::Borrowed );
+	tmpContext->set( g_objectSampleContextName, (int)sampleIndex );
+	Context::Scope scopedContext( tmpContext.get() );
+	return objectSamplePlug()->getValue();
+}
+
+IECore::MurmurHash SceneReader::objectSampleHash( const Gaffer::Context *context, size_t sampleIndex ) const
+{
+	ContextPtr tmpContext = new Context( *context, Context::Borrowed );
+	tmpContext->set( g_objectSampleContextName, (int)sampleIndex );
+	Context::Scope scopedContext( tmpContext.get() );
+	return objectSamplePlug()->hash();
 }
 
 void SceneReader::plugSet( Gaffer::Plug *plug )
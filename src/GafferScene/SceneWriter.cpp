@@ -34,7 +34,11 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include "tbb/pipeline.h"
+#include "tbb/task_scheduler_init.h"
+
 #include "boost/filesystem.hpp"
+#include "boost/shared_ptr.hpp"
 
 #include "IECore/SceneInterface.h"
 #include "IECore/Transform.h"
@@ -48,6 +52,194 @@ using namespace IECore;
 using namespace Gaffer;
 using namespace GafferScene;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Everything we need to write for a single location.
+struct Location
+{
+	ScenePlug::ScenePath path;
+	ConstInternedStringVectorDataPtr childNames;
+	ConstCompoundObjectPtr attributes;
+	ConstCompoundObjectPtr globals;
+	ConstObjectPtr object;
+	Imath::Box3f bound;
+	Imath::M44f transform;
+};
+
+typedef boost::shared_ptr<Location> LocationPtr;
+
+// First stage of the pipeline. Generates the locations serially, in
+// depth-first order. Only the child names are computed here, because
+// they are needed to continue the traversal.
+class LocationGenerator
+{
+
+	public :
+
+		LocationGenerator( const ScenePlug *scene, const Context *context )
+			:	m_scene( scene ), m_context( context ), m_pending( new vector<ScenePlug::ScenePath> )
+		{
+			m_pending->push_back( ScenePlug::ScenePath() );
+		}
+
+		LocationPtr operator()( tbb::flow_control &flowControl ) const
+		{
+			if( m_pending->empty() )
+			{
+				flowControl.stop();
+				return LocationPtr();
+			}
+
+			LocationPtr location( new Location );
+			location->path = m_pending->back();
+			m_pending->pop_back();
+
+			ContextPtr context = new Context( *m_context, Context::Borrowed );
+			context->set( ScenePlug::scenePathContextName, location->path );
+			Context::Scope scopedContext( context.get() );
+
+			location->childNames = m_scene->childNamesPlug()->getValue();
+
+			// Push the children in reverse, so they're popped in order.
+			const vector<InternedString> &childNames = location->childNames->readable();
+			ScenePlug::ScenePath childPath = location->path;
+			childPath.push_back( InternedString() );
+			for( vector<InternedString>::const_reverse_iterator it = childNames.rbegin(), eIt = childNames.rend(); it != eIt; ++it )
+			{
+				childPath.back() = *it;
+				m_pending->push_back( childPath );
+			}
+
+			return location;
+		}
+
+	private :
+
+		const ScenePlug *m_scene;
+		const Context *m_context;
+		// Filters are copied by tbb, so we share the traversal
+		// state between copies.
+		boost::shared_ptr<vector<ScenePlug::ScenePath> > m_pending;
+
+};
+
+// Second stage of the pipeline. Computes everything else for
+// a location. This stage runs in parallel, ahead of the writer.
+class LocationComputer
+{
+
+	public :
+
+		LocationComputer( const ScenePlug *scene, const Context *context )
+			:	m_scene( scene ), m_context( context )
+		{
+		}
+
+		LocationPtr operator()( LocationPtr location ) const
+		{
+			ContextPtr context = new Context( *m_context, Context::Borrowed );
+			context->set( ScenePlug::scenePathContextName, location->path );
+			Context::Scope scopedContext( context.get() );
+
+			location->attributes = m_scene->attributesPlug()->getValue();
+			location->object = m_scene->objectPlug()->getValue();
+			location->bound = m_scene->boundPlug()->getValue();
+			if( location->path.empty() )
+			{
+				location->globals = m_scene->globalsPlug()->getValue();
+			}
+			else
+			{
+				location->transform = m_scene->transformPlug()->getValue();
+			}
+
+			return location;
+		}
+
+	private :
+
+		const ScenePlug *m_scene;
+		const Context *m_context;
+
+};
+
+// Final stage of the pipeline. Receives the locations in the order
+// they were generated, and writes them serially.
+class LocationWriter
+{
+
+	public :
+
+		LocationWriter( SceneInterface *root, double time )
+			:	m_outputs( new vector<SceneInterfacePtr>( 1, root ) ), m_time( time )
+		{
+		}
+
+		void operator()( LocationPtr location ) const
+		{
+			// Because locations arrive in depth-first order, the parent
+			// of this location is always at the top of the stack.
+			const ScenePlug::ScenePath &path = location->path;
+			SceneInterface *output = m_outputs->front().get();
+			if( path.size() )
+			{
+				m_outputs->resize( path.size() );
+				SceneInterfacePtr child = m_outputs->back()->child( path.back(), SceneInterface::CreateIfMissing );
+				m_outputs->push_back( child );
+				output = child.get();
+			}
+
+			for( CompoundObject::ObjectMap::const_iterator it = location->attributes->members().begin(), eIt = location->attributes->members().end(); it != eIt; it++ )
+			{
+				output->writeAttribute( it->first, it->second.get(), m_time );
+			}
+
+			if( location->globals )
+			{
+				output->writeAttribute( "gaffer:globals", location->globals.get(), m_time );
+			}
+
+			if( location->object->typeId() != IECore::NullObjectTypeId && path.size() > 0 )
+			{
+				output->writeObject( location->object.get(), m_time );
+			}
+
+			const Imath::Box3f &b = location->bound;
+			output->writeBound( Imath::Box3d( Imath::V3f( b.min ), Imath::V3f( b.max ) ), m_time );
+
+			if( path.size() )
+			{
+				const Imath::M44f &t = location->transform;
+				Imath::M44d transform(
+					t[0][0], t[0][1], t[0][2], t[0][3],
+					t[1][0], t[1][1], t[1][2], t[1][3],
+					t[2][0], t[2][1], t[2][2], t[2][3],
+					t[3][0], t[3][1], t[3][2], t[3][3]
+				);
+
+				output->writeTransform( new IECore::M44dData( transform ), m_time );
+			}
+		}
+
+	private :
+
+		// The output for each ancestor of the current location.
+		boost::shared_ptr<vector<SceneInterfacePtr> > m_outputs;
+		double m_time;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// SceneWriter
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( SceneWriter );
 
 /// \todo hard coded framerate should be replaced with a getTime() method on Gaffer::Context or something
@@ -142,7 +334,7 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 	{
 		context->setFrame( *it );
 		double time = *it / g_frameRate;
-		writeLocation( scene, ScenePlug::ScenePath(), context.get(), output.get(), time );
+		writeScene( scene, context.get(), output.get(), time );
 	}
 }
 
@@ -151,58 +343,19 @@ bool SceneWriter::requiresSequenceExecution() const
 	return true;
 }
 
-void SceneWriter::writeLocation( const GafferScene::ScenePlug *scene, const ScenePlug::ScenePath &scenePath, Context *context, IECore::SceneInterface *output, double time ) const
+void SceneWriter::writeScene( const GafferScene::ScenePlug *scene, const Gaffer::Context *context, IECore::SceneInterface *output, double time ) const
 {
-	context->set( ScenePlug::scenePathContextName, scenePath );
-
-	ConstCompoundObjectPtr attributes = scene->attributesPlug()->getValue();
-	for( CompoundObject::ObjectMap::const_iterator it = attributes->members().begin(), eIt = attributes->members().end(); it != eIt; it++ )
-	{
-		output->writeAttribute( it->first, it->second.get(), time );
-	}
-
-	if( scenePath.empty() )
-	{
-		ConstCompoundObjectPtr globals = scene->globalsPlug()->getValue();
-		output->writeAttribute( "gaffer:globals", globals.get(), time );
-	}
-
-	ConstObjectPtr object = scene->objectPlug()->getValue();
-
-	if( object->typeId() != IECore::NullObjectTypeId && scenePath.size() > 0 )
-	{
-		output->writeObject( object.get(), time );
-	}
-
-	Imath::Box3f b = scene->boundPlug()->getValue();
-
-	output->writeBound( Imath::Box3d( Imath::V3f( b.min ), Imath::V3f( b.max ) ), time );
-
-	if( scenePath.size() )
-	{
-		Imath::M44f t = scene->transformPlug()->getValue();
-		Imath::M44d transform(
-			t[0][0], t[0][1], t[0][2], t[0][3],
-			t[1][0], t[1][1], t[1][2], t[1][3],
-			t[2][0], t[2][1], t[2][2], t[2][3],
-			t[3][0], t[3][1], t[3][2], t[3][3]
-		);
-
-		output->writeTransform( new IECore::M44dData( transform ), time );
-	}
-
-	ConstInternedStringVectorDataPtr childNames = scene->childNamesPlug()->getValue();
-
-	ScenePlug::ScenePath childScenePath = scenePath;
-	childScenePath.push_back( InternedString() );
-	for( vector<InternedString>::const_iterator it=childNames->readable().begin(); it!=childNames->readable().end(); it++ )
-	{
-		childScenePath[scenePath.size()] = *it;
-
-		SceneInterfacePtr outputChild = output->child( *it, SceneInterface::CreateIfMissing );
-
-		writeLocation( scene, childScenePath, context, outputChild.get(), time );
-	}
+	// The locations are computed in parallel, ahead of the writer,
+	// and written in the same order as a serial depth-first traversal.
+	// The number of locations in flight is limited to bound the memory
+	// used by computed results which are waiting to be written.
+	const size_t maxLocationsInFlight = 4 * tbb::task_scheduler_init::default_num_threads();
+	tbb::parallel_pipeline(
+		maxLocationsInFlight,
+		tbb::make_filter<void, LocationPtr>( tbb::filter::serial_in_order, LocationGenerator( scene, context ) ) &
+		tbb::make_filter<LocationPtr, LocationPtr>( tbb::filter::parallel, LocationComputer( scene, context ) ) &
+		tbb::make_filter<LocationPtr, void>( tbb::filter::serial_in_order, LocationWriter( output, time ) )
+	);
 }
 
 void SceneWriter::createDirectories( std::string &fileName ) const
@@ -34,9 +34,12 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "GafferScene/Set.h"
 #include "GafferScene/PathMatcherData.h"
 
+using namespace std;
 using namespace IECore;
 using namespace GafferScene;
 
@@ -45,13 +48,21 @@ IE_CORE_DEFINERUNTIMETYPED( Set );
 size_t Set::g_firstPlugIndex = 0;
 
 Set::Set( const std::string &name )
-	:	GlobalsProcessor( name )
+	:	SceneProcessor( name )
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new Gaffer::IntPlug( "mode", Gaffer::Plug::In, Create, Create, Remove ) );
 	addChild( new Gaffer::StringPlug( "name", Gaffer::Plug::In, "set" ) );
 	addChild( new Gaffer::StringVectorDataPlug( "paths", Gaffer::Plug::In, new StringVectorData ) );
 	addChild( new Gaffer::ObjectPlug( "__pathMatcher", Gaffer::Plug::Out, new PathMatcherData ) );
+
+	// Fast pass-throughs for everything except the sets
+	outPlug()->boundPlug()->setInput( inPlug()->boundPlug() );
+	outPlug()->transformPlug()->setInput( inPlug()->transformPlug() );
+	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
+	outPlug()->objectPlug()->setInput( inPlug()->objectPlug() );
+	outPlug()->childNamesPlug()->setInput( inPlug()->childNamesPlug() );
+	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
 }
 
 Set::~Set()
@@ -100,25 +111,30 @@ const Gaffer::ObjectPlug *Set::pathMatcherPlug() const
 
 void Set::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
-	GlobalsProcessor::affects( input, outputs );
+	SceneProcessor::affects( input, outputs );
 
-	if( pathsPlug() == input )
+	if( input->parent<ScenePlug>() == inPlug() )
+	{
+		outputs.push_back( outPlug()->getChild<Gaffer::ValuePlug>( input->getName() ) );
+	}
+	else if( pathsPlug() == input )
 	{
 		outputs.push_back( pathMatcherPlug() );
 	}
-	else if(
-		modePlug() == input ||
-		namePlug() == input ||
-		pathMatcherPlug() == input
-	)
+	else if( modePlug() == input || namePlug() == input )
 	{
-		outputs.push_back( outPlug()->globalsPlug() );
+		outputs.push_back( outPlug()->setNamesPlug() );
+		outputs.push_back( outPlug()->setPlug() );
+	}
+	else if( pathMatcherPlug() == input )
+	{
+		outputs.push_back( outPlug()->setPlug() );
 	}
 }
 
 void Set::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	GlobalsProcessor::hash( output, context, h );
+	SceneProcessor::hash( output, context, h );
 
 	if( output == pathMatcherPlug() )
 	{
@@ -137,76 +153,84 @@ void Set::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) c
 		return;
 	}
 
-	GlobalsProcessor::compute( output, context );
+	SceneProcessor::compute( output, context );
 }
 
-void Set::hashProcessedGlobals( const Gaffer::Context *context, IECore::MurmurHash &h ) const
+void Set::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	modePlug()->hash( h );
-	namePlug()->hash( h );
-	pathMatcherPlug()->hash( h );
+	const std::string name = namePlug()->getValue();
+	if( !name.size() || modePlug()->getValue() == Remove )
+	{
+		h = inPlug()->setNamesPlug()->hash();
+		return;
+	}
+
+	SceneProcessor::hashSetNames( context, parent, h );
+	inPlug()->setNamesPlug()->hash( h );
+	h.append( name );
 }
 
-IECore::ConstCompoundObjectPtr Set::computeProcessedGlobals( const Gaffer::Context *context, IECore::ConstCompoundObjectPtr inputGlobals ) const
+IECore::ConstInternedStringVectorDataPtr Set::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	std::string name = namePlug()->getValue();
-	if( !name.size() )
+	ConstInternedStringVectorDataPtr inNamesData = inPlug()->setNamesPlug()->getValue();
+
+	const std::string name = namePlug()->getValue();
+	if( !name.size() || modePlug()->getValue() == Remove )
 	{
-		return inputGlobals;
+		return inNamesData;
 	}
 
-	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
-	// Since we're not going to modify any existing members other than the sets,
-	// and our result becomes const on returning it, we can directly reference
-	// the input members in our result without copying. We have to be careful not
-	// to modify the input sets though.
-	result->members() = inputGlobals->members();
+	const vector<InternedString> &inNames = inNamesData->readable();
+	if( std::find( inNames.begin(), inNames.end(), InternedString( name ) ) != inNames.end() )
+	{
+		return inNamesData;
+	}
+
+	InternedStringVectorDataPtr resultData = inNamesData->copy();
+	resultData->writable().push_back( name );
+	return resultData;
+}
 
-	CompoundDataPtr sets = new CompoundData;
-	if( const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets" ) )
+void Set::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	if( setName.string() != namePlug()->getValue() )
+	{
+		h = inPlug()->setPlug()->hash();
+		return;
+	}
+
+	SceneProcessor::hashSet( setName, context, parent, h );
+	inPlug()->setPlug()->hash( h );
+	modePlug()->hash( h );
+	pathMatcherPlug()->hash( h );
+}
+
+GafferScene::ConstPathMatcherDataPtr Set::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	ConstPathMatcherDataPtr inputSet = boost::static_pointer_cast<const PathMatcherData>( inPlug()->setPlug()->getValue() );
+	if( setName.string() != namePlug()->getValue() )
 	{
-		sets->writable() = inputSets->readable();
+		return inputSet;
 	}
-	result->members()["gaffer:sets"] = sets;
 
 	ConstPathMatcherDataPtr pathMatcher = boost::static_pointer_cast<const PathMatcherData>(
 		pathMatcherPlug()->getValue()
 	);
 
-	PathMatcherDataPtr set;
 	switch( modePlug()->getValue() )
 	{
 		case Add : {
-			const PathMatcherData *inputSet = sets->member<PathMatcherData>( name );
-			if( inputSet )
-			{
-				set = inputSet->copy();
-				set->writable().addPaths( pathMatcher->readable() );
-				break;
-			}
-			// no input set with this name - fall through to create mode
-		}
-		case Create : {
-			// const cast is acceptable because we're just using it to place a const object into a
-			// container that will be treated as const everywhere immediately after return from this method.
-			set = boost::const_pointer_cast<PathMatcherData>( pathMatcher );
-			break;
+			PathMatcherDataPtr result = inputSet->copy();
+			result->writable().addPaths( pathMatcher->readable() );
+			return result;
 		}
 		case Remove : {
-			const PathMatcherData *inputSet = sets->member<PathMatcherData>( name );
-			if( inputSet )
-			{
-				set = inputSet->copy();
-				set->writable().removePaths( pathMatcher->readable() );
-			}
-			break;
+			PathMatcherDataPtr result = inputSet->copy();
+			result->writable().removePaths( pathMatcher->readable() );
+			return result;
+		}
+		default : {
+			return pathMatcher;
 		}
 	}
-
-	if( set )
-	{
-		sets->writable()[name] = set;
-	}
-
-	return result;
 }
@@ -34,6 +34,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "Gaffer/Context.h"
 
 #include "GafferScene/ScenePlug.h"
@@ -88,7 +90,7 @@ bool SetFilter::sceneAffectsMatch( const ScenePlug *scene, const Gaffer::ValuePl
 		return true;
 	}
 
-	return child == scene->globalsPlug();
+	return child == scene->setPlug();
 }
 
 void SetFilter::hashMatch( const ScenePlug *scene, const Gaffer::Context *context, IECore::MurmurHash &h ) const
@@ -101,8 +103,7 @@ void SetFilter::hashMatch( const ScenePlug *scene, const Gaffer::Context *contex
 	/// \todo It would be preferable to throw an exception if the scene path isn't
 	/// available, as we really do require it for computing a match. Currently we
 	/// can't do that because the Isolate and Prune must include the filter hash when
-	/// hashing their globals, because they will use the filter to remap sets when
-	/// computing those globals. In this case, we're lucky that the hash (minus the scene path)
+	/// hashing their sets, because they will use the filter to remap those sets. In this case, we're lucky that the hash (minus the scene path)
 	/// of the SetFilter is sufficient to uniquely identify the remapping that will occur - filters
 	/// which access scene data using the path would not have a valid hash in this scenario,
 	/// which is the reason we don't yet have AttributeFilter etc. If we had a hierarchyHash for
@@ -117,8 +118,12 @@ void SetFilter::hashMatch( const ScenePlug *scene, const Gaffer::Context *contex
 		h.append( &(path[0]), path.size() );
 	}
 
-	scene->globalsPlug()->hash( h );
-	setPlug()->hash( h );
+	const std::string setName = setPlug()->getValue();
+	h.append( setName );
+	if( !setName.empty() )
+	{
+		h.append( scene->setHash( setName ) );
+	}
 }
 
 unsigned SetFilter::computeMatch( const ScenePlug *scene, const Gaffer::Context *context ) const
@@ -128,19 +133,41 @@ unsigned SetFilter::computeMatch( const ScenePlug *scene, const Gaffer::Context
 		return NoMatch;
 	}
 
-	ConstCompoundObjectPtr globals = scene->globalsPlug()->getValue();
-	const CompoundData *sets = globals->member<CompoundData>( "gaffer:sets" );
-	if( !sets )
+	const std::string setName = setPlug()->getValue();
+	if( setName.empty() )
 	{
 		return NoMatch;
 	}
 
-	const PathMatcherData *set = sets->member<PathMatcherData>( setPlug()->getValue() );
-	if( !set )
-	{
-		return NoMatch;
-	}
+	ConstPathMatcherDataPtr set = scene->set( setName );
 
 	const ScenePlug::ScenePath &path = context->get<ScenePlug::ScenePath>( ScenePlug::scenePathContextName );
 	return set->readable().match( path );
 }
+
+void SetFilter::computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	if( !enabledPlug()->getValue() )
+	{
+		std::fill( matches.begin(), matches.end(), (unsigned)NoMatch );
+		return;
+	}
+
+	const std::string setName = scene ? setPlug()->getValue() : "";
+	if( setName.empty() )
+	{
+		std::fill( matches.begin(), matches.end(), (unsigned)NoMatch );
+		return;
+	}
+
+	ConstPathMatcherDataPtr set = scene->set( setName );
+	const PathMatcher &pathMatcher = set->readable();
+
+	ScenePlug::ScenePath childPath = parentPath;
+	childPath.push_back( InternedString() ); // for the child name
+	for( size_t i = 0, e = childNames.size(); i < e; ++i )
+	{
+		childPath.back() = childNames[i];
+		matches[i] = pathMatcher.match( childPath );
+	}
+}
@@ -54,7 +54,7 @@ IE_CORE_DEFINERUNTIMETYPED( Shader );
 size_t Shader::g_firstPlugIndex = 0;
 
 Shader::Shader( const std::string &name )
-	:	DependencyNode( name )
+	:	ComputeNode( name )
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new StringPlug( "name" ) );
@@ -62,6 +62,7 @@ Shader::Shader( const std::string &name )
 	addChild( new CompoundPlug( "parameters", Plug::In, Plug::Default & ~Plug::AcceptsInputs ) );
 	addChild( new BoolPlug( "enabled", Gaffer::Plug::In, true ) );
 	addChild( new StringPlug( "__nodeName", Gaffer::Plug::In, name, Plug::Default & ~(Plug::Serialisable | Plug::AcceptsInputs | Plug::PerformsSubstitutions ) ) );
+	addChild( new ObjectPlug( "__state", Gaffer::Plug::Out, new IECore::ObjectVector ) );
 
 	nameChangedSignal().connect( boost::bind( &Shader::nameChanged, this ) );
 }
@@ -132,10 +133,19 @@ const Gaffer::StringPlug *Shader::nodeNamePlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 4 );
 }
 
+Gaffer::ObjectPlug *Shader::statePlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::ObjectPlug *Shader::statePlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 5 );
+}
+
 IECore::MurmurHash Shader::stateHash() const
 {
-	NetworkBuilder networkBuilder( this );
-	return networkBuilder.stateHash();
+	return statePlug()->hash();
 }
 
 void Shader::stateHash( IECore::MurmurHash &h ) const
@@ -145,13 +155,12 @@ void Shader::stateHash( IECore::MurmurHash &h ) const
 
 IECore::ConstObjectVectorPtr Shader::state() const
 {
-	NetworkBuilder networkBuilder( this );
-	return networkBuilder.state();
+	return boost::static_pointer_cast<const IECore::ObjectVector>( statePlug()->getValue() );
 }
 
 void Shader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
-	DependencyNode::affects( input, outputs );
+	ComputeNode::affects( input, outputs );
 
 	if(
 		parametersPlug()->isAncestorOf( input ) ||
@@ -161,6 +170,8 @@ void Shader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 		input == typePlug()
 	)
 	{
+		outputs.push_back( statePlug() );
+
 		const Plug *out = outPlug();
 		if( out )
 		{
@@ -182,6 +193,29 @@ void Shader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 	}
 }
 
+void Shader::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	ComputeNode::hash( output, context, h );
+
+	if( output == statePlug() )
+	{
+		NetworkBuilder networkBuilder( this );
+		h.append( networkBuilder.stateHash() );
+	}
+}
+
+void Shader::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
+{
+	if( output == statePlug() )
+	{
+		NetworkBuilder networkBuilder( this );
+		static_cast<ObjectPlug *>( output )->setValue( networkBuilder.state() );
+		return;
+	}
+
+	output->setToDefault();
+}
+
 void Shader::parameterHash( const Gaffer::Plug *parameterPlug, NetworkBuilder &network, IECore::MurmurHash &h ) const
 {
 	const Plug *inputPlug = parameterPlug->source<Plug>();
@@ -36,6 +36,7 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "Gaffer/Box.h"
+#include "Gaffer/Context.h"
 #include "Gaffer/Dot.h"
 
 #include "GafferScene/ShaderAssignment.h"
@@ -141,6 +142,8 @@ void ShaderAssignment::hashProcessedAttributes( const ScenePath &path, const Gaf
 	const Shader *shader = shaderPlug()->source<Plug>()->ancestor<Shader>();
 	if( shader )
 	{
+		ContextPtr shaderContext = stateContext( context );
+		Context::Scope scopedContext( shaderContext.get() );
 		shader->stateHash( h );
 	}
 }
@@ -153,7 +156,13 @@ IECore::ConstCompoundObjectPtr ShaderAssignment::computeProcessedAttributes( con
 		return inputAttributes;
 	}
 
-	ConstObjectVectorPtr state = shader->state();
+	ConstObjectVectorPtr state;
+	{
+		ContextPtr shaderContext = stateContext( context );
+		Context::Scope scopedContext( shaderContext.get() );
+		state = shader->state();
+	}
+
 	if( !state->members().size() )
 	{
 		return inputAttributes;
@@ -180,3 +189,17 @@ IECore::ConstCompoundObjectPtr ShaderAssignment::computeProcessedAttributes( con
 
 	return result;
 }
+
+Gaffer::ContextPtr ShaderAssignment::stateContext( const Gaffer::Context *context ) const
+{
+	// We remove the scene path from the context before evaluating the
+	// shader state, so that the state is evaluated in the same context
+	// for every location we assign it to. Within a single computation
+	// the state hash is then computed only once, and reused from the
+	// per-thread hash cache for all subsequent locations, and the state
+	// itself is computed once and shared via the compute cache. The
+	// Shader's own hash() and compute() are unaffected.
+	ContextPtr result = new Context( *context, Context::Borrowed );
+	result->remove( ScenePlug::scenePathContextName );
+	return result;
+}
@@ -68,6 +68,10 @@ StandardOptions::StandardOptions( const std::string &name )
 	options->addOptionalMember( "render:deformationBlur", new IECore::BoolData( false ), "deformationBlur", Gaffer::Plug::Default, false );
 	options->addOptionalMember( "render:shutter", new IECore::V2fData( Imath::V2f( -0.25, 0.25 ) ), "shutter", Gaffer::Plug::Default, false );
 
+	// procedural expansion
+
+	options->addOptionalMember( "render:eagerExpansion", new IECore::BoolData( false ), "eagerExpansion", Gaffer::Plug::Default, false );
+
 }
 
 StandardOptions::~StandardOptions()
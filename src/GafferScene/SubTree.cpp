@@ -208,27 +208,46 @@ IECore::ConstInternedStringVectorDataPtr SubTree::computeChildNames( const Scene
 
 void SubTree::hashGlobals( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
 {
-	SceneProcessor::hashGlobals( context, parent, h );
-	inPlug()->globalsPlug()->hash( h );
+	h = inPlug()->globalsPlug()->hash();
+}
+
+IECore::ConstCompoundObjectPtr SubTree::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return inPlug()->globalsPlug()->getValue();
+}
+
+void SubTree::hashSetNames( const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = inPlug()->setNamesPlug()->hash();
+}
+
+IECore::ConstInternedStringVectorDataPtr SubTree::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
+{
+	return inPlug()->setNamesPlug()->getValue();
+}
+
+void SubTree::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	SceneProcessor::hashSet( setName, context, parent, h );
+	inPlug()->setPlug()->hash( h );
 	rootPlug()->hash( h );
 	includeRootPlug()->hash( h );
 }
 
-IECore::ConstCompoundObjectPtr SubTree::computeGlobals( const Gaffer::Context *context, const ScenePlug *parent ) const
+GafferScene::ConstPathMatcherDataPtr SubTree::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstCompoundObjectPtr inputGlobals = inPlug()->globalsPlug()->getValue();
-	const CompoundData *inputSets = inputGlobals->member<CompoundData>( "gaffer:sets" );
-	if( !inputSets )
+	ConstPathMatcherDataPtr inputSetData = boost::static_pointer_cast<const PathMatcherData>( inPlug()->setPlug()->getValue() );
+	const PathMatcher &inputSet = inputSetData->readable();
+	if( inputSet.isEmpty() )
 	{
-		return inputGlobals;
+		return inputSetData;
 	}
 
-	CompoundObjectPtr outputGlobals = inputGlobals->copy();
-	CompoundDataPtr outputSets = new CompoundData;
-	outputGlobals->members()["gaffer:sets"] = outputSets;
+	PathMatcherDataPtr outputSetData = new PathMatcherData;
+	PathMatcher &outputSet = outputSetData->writable();
 
 	std::string root = rootPlug()->getValue();
-	
+
 	// append/prepend slashes if required:
 	if( !root.size() || root[root.size()-1] != '/' )
 	{
@@ -249,28 +268,22 @@ IECore::ConstCompoundObjectPtr SubTree::computeGlobals( const Gaffer::Context *c
 		}
 	}
 
-	for( CompoundDataMap::const_iterator it = inputSets->readable().begin(), eIt = inputSets->readable().end(); it != eIt; ++it )
+	/// \todo This could be more efficient if PathMatcher exposed the internal nodes,
+	/// and allowed sharing between matchers. Then we could just pick the subtree within
+	/// the matcher that we wanted.
+	vector<string> inputPaths;
+	inputSet.paths( inputPaths );
+	for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
 	{
-		/// \todo This could be more efficient if PathMatcher exposed the internal nodes,
-		/// and allowed sharing between matchers. Then we could just pick the subtree within
-		/// the matcher that we wanted.
-		const PathMatcher &inputSet = static_cast<const PathMatcherData *>( it->second.get() )->readable();
-		PathMatcher &outputSet = outputSets->member<PathMatcherData>( it->first, /* throwExceptions = */ false, /* createIfMissing = */ true )->writable();
-
-		vector<string> inputPaths;
-		inputSet.paths( inputPaths );
-		for( vector<string>::const_iterator pIt = inputPaths.begin(), peIt = inputPaths.end(); pIt != peIt; ++pIt )
+		const string &inputPath = *pIt;
+		if( inputPath.compare( 0, root.size(), root ) == 0 )
 		{
-			const string &inputPath = *pIt;
-			if( inputPath.compare( 0, root.size(), root ) == 0 )
-			{
-				std::string outputPath( inputPath, prefixSize );
-				outputSet.addPath( outputPath );
-			}
+			std::string outputPath( inputPath, prefixSize );
+			outputSet.addPath( outputPath );
 		}
 	}
 
-	return outputGlobals;
+	return outputSetData;
 }
 
 SceneNode::ScenePath SubTree::sourcePath( const ScenePath &outputPath, bool &createRoot ) const
@@ -34,6 +34,8 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+
 #include "Gaffer/ArrayPlug.h"
 #include "Gaffer/Box.h"
 #include "Gaffer/Dot.h"
@@ -130,3 +132,36 @@ unsigned UnionFilter::computeMatch( const ScenePlug *scene, const Gaffer::Contex
 	return result;
 }
 
+void UnionFilter::computeChildMatches( const ScenePlug *scene, const Gaffer::Context *context, const std::vector<IECore::InternedString> &parentPath, const std::vector<IECore::InternedString> &childNames, std::vector<unsigned> &matches ) const
+{
+	std::fill( matches.begin(), matches.end(), (unsigned)NoMatch );
+	if( !enabledPlug()->getValue() )
+	{
+		return;
+	}
+
+	std::vector<unsigned> inputMatches;
+	for( InputIntPlugIterator it( inPlug() ); it != it.end(); ++it )
+	{
+		if( (*it)->source<Plug>()->node() == this )
+		{
+			// An unconnected input - the ArrayPlug always keeps a spare
+			// one at the end. Its value doesn't vary from child to child,
+			// and passing it to plugChildMatches() would just recurse
+			// back into this method.
+			const unsigned inputMatch = (*it)->getValue();
+			for( size_t i = 0, e = matches.size(); i < e; ++i )
+			{
+				matches[i] |= inputMatch;
+			}
+			continue;
+		}
+
+		Filter::plugChildMatches( it->get(), context, parentPath, childNames, inputMatches );
+		for( size_t i = 0, e = matches.size(); i < e; ++i )
+		{
+			matches[i] |= inputMatches[i];
+		}
+	}
+}
+
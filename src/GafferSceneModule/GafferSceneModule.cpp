@@ -69,7 +69,6 @@
 
 #include "GafferSceneBindings/ScenePlugBinding.h"
 #include "GafferSceneBindings/OutputsBinding.h"
-#include "GafferSceneBindings/PathMatcherBinding.h"
 #include "GafferSceneBindings/SceneProceduralBinding.h"
 #include "GafferSceneBindings/PathMatcherDataBinding.h"
 #include "GafferSceneBindings/RenderBinding.h"
@@ -123,7 +122,6 @@ BOOST_PYTHON_MODULE( _GafferScene )
 
 	bindDeleteGlobals();
 	bindOutputs();
-	bindPathMatcher();
 	bindPathMatcherData();
 	bindSceneProcedural();
 	bindShader();
@@ -118,6 +118,16 @@ void CompoundObjectSource::hashGlobals( const Gaffer::Context *context, const Ga
 	inPlug()->hash( h );
 }
 
+void CompoundObjectSource::hashSetNames( const Gaffer::Context *context, const GafferScene::ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = parent->setNamesPlug()->defaultValue()->Object::hash();
+}
+
+void CompoundObjectSource::hashSet( const IECore::InternedString &setName, const Gaffer::Context *context, const GafferScene::ScenePlug *parent, IECore::MurmurHash &h ) const
+{
+	h = parent->setPlug()->defaultValue()->Object::hash();
+}
+
 Imath::Box3f CompoundObjectSource::computeBound( const ScenePath &path, const Gaffer::Context *context, const GafferScene::ScenePlug *parent ) const
 {
 	return entryForPath( path )->member<Box3fData>( "bound", true /* throw exceptions */ )->readable();
@@ -180,6 +190,16 @@ IECore::ConstCompoundObjectPtr CompoundObjectSource::computeGlobals( const Gaffe
 	return outPlug()->globalsPlug()->defaultValue();
 }
 
+IECore::ConstInternedStringVectorDataPtr CompoundObjectSource::computeSetNames( const Gaffer::Context *context, const GafferScene::ScenePlug *parent ) const
+{
+	return outPlug()->setNamesPlug()->defaultValue();
+}
+
+GafferScene::ConstPathMatcherDataPtr CompoundObjectSource::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const GafferScene::ScenePlug *parent ) const
+{
+	return boost::static_pointer_cast<const GafferScene::PathMatcherData>( outPlug()->setPlug()->defaultValue() );
+}
+
 IECore::ConstCompoundObjectPtr CompoundObjectSource::entryForPath( const ScenePath &path ) const
 {
 	ConstCompoundObjectPtr result = runTimeCast<const CompoundObject>( inPlug()->getValue() );
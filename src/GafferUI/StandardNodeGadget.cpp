@@ -40,6 +40,7 @@
 
 #include "OpenEXR/ImathBoxAlgo.h"
 
+#include "IECoreGL/GL.h"
 #include "IECoreGL/Selector.h"
 
 #include "Gaffer/TypedObjectPlug.h"
@@ -171,7 +172,8 @@ StandardNodeGadget::StandardNodeGadget( Gaffer::NodePtr node, LinearContainer::O
 		m_nodeEnabled( true ),
 		m_labelsVisibleOnHover( true ),
 		m_dragDestinationProxy( 0 ),
-		m_userColor( 0 )
+		m_userColor( 0 ),
+		m_overlayColor( 0 )
 {
 
 	// build our ui structure
@@ -349,6 +351,27 @@ void StandardNodeGadget::doRender( const Style *style ) const
 		/// so that styles can do customised drawing based on knowledge of what is being drawn.
 		style->renderLine( IECore::LineSegment3f( V3f( b.min.x, b.min.y, 0 ), V3f( b.max.x, b.max.y, 0 ) ) );
 	}
+
+	// draw the overlay if we have one
+	if( IECoreGL::Selector::currentSelector() )
+	{
+		return;
+	}
+
+	if( m_overlayColor[3] > 0.0f )
+	{
+		glColor( m_overlayColor );
+		style->renderSolidRectangle( Box2f( V2f( b.min.x, b.min.y ), V2f( b.max.x, b.max.y ) ) );
+	}
+
+	if( m_overlayLabel.size() )
+	{
+		const Box3f textBound = style->textBound( Style::LabelText, m_overlayLabel );
+		glPushMatrix();
+			glTranslatef( b.center().x - textBound.size().x / 2.0f, b.min.y - textBound.max.y - g_borderWidth, 0.0f );
+			style->renderText( Style::LabelText, m_overlayLabel );
+		glPopMatrix();
+	}
 }
 
 const Imath::Color3f *StandardNodeGadget::userColor() const
@@ -578,6 +601,28 @@ bool StandardNodeGadget::getLabelsVisibleOnHover() const
 	return m_labelsVisibleOnHover;
 }
 
+void StandardNodeGadget::setOverlay( const Imath::Color4f &color, const std::string &label )
+{
+	if( color == m_overlayColor && label == m_overlayLabel )
+	{
+		return;
+	}
+
+	m_overlayColor = color;
+	m_overlayLabel = label;
+	requestRender();
+}
+
+const Imath::Color4f &StandardNodeGadget::getOverlayColor() const
+{
+	return m_overlayColor;
+}
+
+const std::string &StandardNodeGadget::getOverlayLabel() const
+{
+	return m_overlayLabel;
+}
+
 void StandardNodeGadget::plugDirtied( const Gaffer::Plug *plug )
 {
 	const DependencyNode *dependencyNode = IECore::runTimeCast<const DependencyNode>( plug->node() );
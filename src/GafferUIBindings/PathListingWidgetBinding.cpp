@@ -45,6 +45,7 @@
 #include "QtCore/QVariant"
 #include "QtCore/QDateTime"
 #include "QtGui/QTreeView"
+#include "QtGui/QItemSelectionModel"
 #include "QtGui/QFileIconProvider"
 
 #include "IECore/MessageHandler.h"
@@ -57,6 +58,8 @@
 #include "IECorePython/ScopedGILLock.h"
 
 #include "Gaffer/Path.h"
+#include "Gaffer/PathMatcher.h"
+#include "Gaffer/StringAlgo.h"
 
 #include "GafferUIBindings/PathListingWidgetBinding.h"
 
@@ -362,11 +365,18 @@ class PathModel : public QAbstractItemModel
 			return m_rootItem->path();
 		}
 
-		void setRoot( PathPtr root )
+		/// If children is specified, it is used to provide the children
+		/// of the root, rather than calling root->children(). This allows
+		/// them to be computed in advance on a background thread.
+		void setRoot( PathPtr root, const std::vector<PathPtr> *children = NULL )
 		{
 			beginResetModel();
 			delete m_rootItem;
 			m_rootItem = new Item( root, 0, NULL );
+			if( children )
+			{
+				m_rootItem->setChildItems( *children, this );
+			}
 			endResetModel();
 		}
 
@@ -397,6 +407,11 @@ class PathModel : public QAbstractItemModel
 		}
 
 		QModelIndex indexForPath( const Path *path )
+		{
+			return indexForPath( path->names() );
+		}
+
+		QModelIndex indexForPath( const std::vector<IECore::InternedString> &names )
 		{
 			const Path *rootPath = m_rootItem->path();
 
@@ -405,25 +420,25 @@ class PathModel : public QAbstractItemModel
 				return QModelIndex();
 			}
 
-			if( path->names().size() <= rootPath->names().size() )
+			if( names.size() <= rootPath->names().size() )
 			{
 				return QModelIndex();
 			}
 
-			if( !equal( rootPath->names().begin(), rootPath->names().end(), path->names().begin() ) )
+			if( !equal( rootPath->names().begin(), rootPath->names().end(), names.begin() ) )
 			{
 				return QModelIndex();
 			}
 
 			QModelIndex result;
 			Item *item = m_rootItem;
-			for( size_t i = rootPath->names().size(); i < path->names().size(); ++i )
+			for( size_t i = rootPath->names().size(); i < names.size(); ++i )
 			{
 				bool foundNextItem = false;
 				const std::vector<Item *> &childItems = item->childItems( this );
 				for( std::vector<Item *>::const_iterator it = childItems.begin(), eIt = childItems.end(); it != eIt; ++it )
 				{
-					if( (*it)->path()->names()[i] == path->names()[i] )
+					if( (*it)->path()->names()[i] == names[i] )
 					{
 						result = index( it - childItems.begin(), 0, result );
 						item = *it;
@@ -597,18 +612,26 @@ class PathModel : public QAbstractItemModel
 						IECore::msg( IECore::Msg::Error, "PathListingWidget", e.what() );
 					}
 
-					for( std::vector<Gaffer::PathPtr>::const_iterator it = children.begin(), eIt = children.end(); it != eIt; ++it )
-					{
-						m_childItems.push_back( new Item( *it, it - children.begin(), this ) );
-					}
-					// If the model is sorted, then we need to apply that same
-					// sorting to the new items - see comment for PathModel::sort().
-					sort( model );
+					setChildItems( children, model );
 				}
 				m_childItemsDone = true;
 				return m_childItems;
 			}
 
+			// Creates the child items from children which have already
+			// been computed.
+			void setChildItems( const std::vector<Gaffer::PathPtr> &children, const PathModel *model )
+			{
+				for( std::vector<Gaffer::PathPtr>::const_iterator it = children.begin(), eIt = children.end(); it != eIt; ++it )
+				{
+					m_childItems.push_back( new Item( *it, it - children.begin(), this ) );
+				}
+				// If the model is sorted, then we need to apply that same
+				// sorting to the new items - see comment for PathModel::sort().
+				sort( model );
+				m_childItemsDone = true;
+			}
+
 			void sort( const PathModel *model )
 			{
 				if( model->m_sortColumn < 0 || model->m_sortColumn >= model->columnCount() )
@@ -783,7 +806,7 @@ list getColumns( uint64_t treeViewAddress )
 	return result;
 }
 
-void updateModel( uint64_t treeViewAddress, Gaffer::PathPtr path )
+void updateModel( uint64_t treeViewAddress, Gaffer::PathPtr path, object pythonChildren )
 {
 	QTreeView *treeView = reinterpret_cast<QTreeView *>( treeViewAddress );
 	PathModel *model = dynamic_cast<PathModel *>( treeView->model() );
@@ -792,7 +815,17 @@ void updateModel( uint64_t treeViewAddress, Gaffer::PathPtr path )
 		model = new PathModel( treeView );
 		treeView->setModel( model );
 	}
-	model->setRoot( path );
+
+	if( pythonChildren == object() )
+	{
+		model->setRoot( path );
+	}
+	else
+	{
+		std::vector<PathPtr> children;
+		boost::python::container_utils::extend_container( children, pythonChildren );
+		model->setRoot( path, &children );
+	}
 }
 
 void setFlat( uint64_t treeViewAddress, bool flat )
@@ -837,6 +870,149 @@ list getExpandedPaths( uint64_t treeViewAddress )
 	return result;
 }
 
+void getExpansionWalk( QTreeView *treeView, PathModel *model, QModelIndex index, PathMatcher &expanded )
+{
+	for( int i = 0, e = model->rowCount( index ); i < e; ++i )
+	{
+		QModelIndex childIndex = model->index( i, 0, index );
+		if( treeView->isExpanded( childIndex ) )
+		{
+			expanded.addPath( model->pathForIndex( childIndex )->names() );
+			getExpansionWalk( treeView, model, childIndex, expanded );
+		}
+	}
+}
+
+PathMatcher getExpansion( uint64_t treeViewAddress )
+{
+	QTreeView *treeView = reinterpret_cast<QTreeView *>( treeViewAddress );
+	PathModel *model = dynamic_cast<PathModel *>( treeView->model() );
+
+	PathMatcher result;
+	if( !model )
+	{
+		return result;
+	}
+
+	getExpansionWalk( treeView, model, QModelIndex(), result );
+	return result;
+}
+
+void setExpanded( QTreeView *treeView, PathModel *model, const PathMatcher &paths, bool expanded )
+{
+	std::vector<std::string> pathStrings;
+	paths.paths( pathStrings );
+
+	std::vector<IECore::InternedString> names;
+	for( std::vector<std::string>::const_iterator it = pathStrings.begin(), eIt = pathStrings.end(); it != eIt; ++it )
+	{
+		names.clear();
+		Gaffer::tokenize( *it, '/', names );
+		const QModelIndex index = model->indexForPath( names );
+		if( index.isValid() )
+		{
+			treeView->setExpanded( index, expanded );
+		}
+	}
+}
+
+// Rather than collapsing everything and then expanding the new paths,
+// we compute the difference between the current and requested expansion,
+// and only touch the items which are actually changing. This keeps the
+// cost of small edits to large expansions proportional to the size of
+// the edit.
+void setExpansion( uint64_t treeViewAddress, const PathMatcher &paths )
+{
+	QTreeView *treeView = reinterpret_cast<QTreeView *>( treeViewAddress );
+	PathModel *model = dynamic_cast<PathModel *>( treeView->model() );
+	if( !model )
+	{
+		return;
+	}
+
+	const PathMatcher current = getExpansion( treeViewAddress );
+
+	PathMatcher toCollapse( current );
+	toCollapse.removePaths( paths );
+
+	PathMatcher toExpand( paths );
+	toExpand.removePaths( current );
+
+	setExpanded( treeView, model, toCollapse, false );
+	setExpanded( treeView, model, toExpand, true );
+}
+
+PathMatcher getSelection( uint64_t treeViewAddress )
+{
+	QTreeView *treeView = reinterpret_cast<QTreeView *>( treeViewAddress );
+	PathModel *model = dynamic_cast<PathModel *>( treeView->model() );
+
+	PathMatcher result;
+	if( !model )
+	{
+		return result;
+	}
+
+	const QModelIndexList selectedRows = treeView->selectionModel()->selectedRows();
+	for( QModelIndexList::const_iterator it = selectedRows.begin(), eIt = selectedRows.end(); it != eIt; ++it )
+	{
+		result.addPath( model->pathForIndex( *it )->names() );
+	}
+
+	return result;
+}
+
+// Builds a single QItemSelection and applies it in one call, which is
+// far quicker than selecting large non-contiguous sets of rows one at
+// a time.
+void setSelection( uint64_t treeViewAddress, const PathMatcher &paths, bool scrollToFirst, bool expandNonLeaf )
+{
+	QTreeView *treeView = reinterpret_cast<QTreeView *>( treeViewAddress );
+	PathModel *model = dynamic_cast<PathModel *>( treeView->model() );
+	if( !model )
+	{
+		return;
+	}
+
+	std::vector<std::string> pathStrings;
+	paths.paths( pathStrings );
+
+	QItemSelection selection;
+	QModelIndex firstIndex;
+	std::vector<IECore::InternedString> names;
+	const int lastColumn = std::max( model->columnCount() - 1, 0 );
+	for( std::vector<std::string>::const_iterator it = pathStrings.begin(), eIt = pathStrings.end(); it != eIt; ++it )
+	{
+		names.clear();
+		Gaffer::tokenize( *it, '/', names );
+		const QModelIndex index = model->indexForPath( names );
+		if( !index.isValid() )
+		{
+			continue;
+		}
+
+		selection.select( index, index.sibling( index.row(), lastColumn ) );
+		if( !firstIndex.isValid() )
+		{
+			firstIndex = index;
+		}
+
+		if( expandNonLeaf && !model->pathForIndex( index )->isLeaf() )
+		{
+			treeView->setExpanded( index, true );
+		}
+	}
+
+	QItemSelectionModel *selectionModel = treeView->selectionModel();
+	selectionModel->select( selection, QItemSelectionModel::ClearAndSelect | QItemSelectionModel::Rows );
+
+	if( scrollToFirst && firstIndex.isValid() )
+	{
+		treeView->scrollTo( firstIndex, QTreeView::EnsureVisible );
+		selectionModel->setCurrentIndex( firstIndex, QItemSelectionModel::Current );
+	}
+}
+
 void propagateExpandedWalk( QTreeView *treeView, PathModel *model, QModelIndex index, bool expanded, int numLevels )
 {
 	for( int i = 0, e = model->rowCount( index ); i < e; ++i )
@@ -900,10 +1076,14 @@ void GafferUIBindings::bindPathListingWidget()
 
 	def( "_pathListingWidgetSetColumns", &setColumns );
 	def( "_pathListingWidgetGetColumns", &getColumns );
-	def( "_pathListingWidgetUpdateModel", &updateModel );
+	def( "_pathListingWidgetUpdateModel", &updateModel, ( arg( "treeViewAddress" ), arg( "path" ), arg( "children" ) = object() ) );
 	def( "_pathListingWidgetSetFlat", &setFlat );
 	def( "_pathListingWidgetGetFlat", &getFlat );
 	def( "_pathListingWidgetGetExpandedPaths", &getExpandedPaths );
+	def( "_pathListingWidgetGetExpansion", &getExpansion );
+	def( "_pathListingWidgetSetExpansion", &setExpansion );
+	def( "_pathListingWidgetGetSelection", &getSelection );
+	def( "_pathListingWidgetSetSelection", &setSelection );
 	def( "_pathListingWidgetPropagateExpanded", &propagateExpanded );
 	def( "_pathListingWidgetPathForIndex", &pathForIndex );
 	def( "_pathListingWidgetIndexForPath", &indexForPath );
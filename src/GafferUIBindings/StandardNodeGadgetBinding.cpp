@@ -79,6 +79,9 @@ void GafferUIBindings::bindStandardNodeGadget()
 		.def( "getContents", &getContents )
 		.def( "setEdgeGadget", &StandardNodeGadget::setEdgeGadget )
 		.def( "getEdgeGadget", &getEdgeGadget )
+		.def( "setOverlay", &StandardNodeGadget::setOverlay, ( arg( "color" ), arg( "label" ) = "" ) )
+		.def( "getOverlayColor", &StandardNodeGadget::getOverlayColor, return_value_policy<copy_const_reference>() )
+		.def( "getOverlayLabel", &StandardNodeGadget::getOverlayLabel, return_value_policy<copy_const_reference>() )
 	;
 
 	enum_<StandardNodeGadget::Edge>( "Edge" )
@@ -105,6 +105,7 @@ def __nodeContextMenu( nodeGraph, node, menuDefinition ) :
 	GafferUI.UIEditor.appendNodeContextMenuDefinitions( nodeGraph, node, menuDefinition )
 	GafferSceneUI.FilteredSceneProcessorUI.appendNodeContextMenuDefinitions( nodeGraph, node, menuDefinition )
 	GafferUI.GraphBookmarksUI.appendNodeContextMenuDefinitions( nodeGraph, node, menuDefinition )
+	GafferUI.NodeGraph.appendPerformanceOverlayMenuDefinitions( nodeGraph, node, menuDefinition )
 
 __nodeContextMenuConnection = GafferUI.NodeGraph.nodeContextMenuSignal().connect( __nodeContextMenu )
 